@@ -18,6 +18,7 @@ from ..const import (
     CONF_ENABLE_DEVICE_SCAN,
     CONF_FORCE_FULL_REGISTER_LIST,
     CONF_LOG_LEVEL,
+    CONF_MAX_INFLIGHT_REQUESTS,
     CONF_MAX_REGISTERS_PER_REQUEST,
     CONF_PARITY,
     CONF_RETRY,
@@ -41,6 +42,7 @@ from ..const import (
     DEFAULT_DEEP_SCAN,
     DEFAULT_ENABLE_DEVICE_SCAN,
     DEFAULT_LOG_LEVEL,
+    DEFAULT_MAX_INFLIGHT_REQUESTS,
     DEFAULT_MAX_REGISTERS_PER_REQUEST,
     DEFAULT_PARITY,
     DEFAULT_PORT,
@@ -58,6 +60,7 @@ from ..const import (
     DEFAULT_TIMEOUT,
     DOMAIN,
     MAX_BATCH_REGISTERS,
+    MAX_INFLIGHT_REQUESTS,
     MIN_SCAN_INTERVAL,
 )
 from ..utils import resolve_connection_settings
@@ -87,6 +90,9 @@ def build_options_defaults(
         CONF_MAX_REGISTERS_PER_REQUEST: entry_options.get(
             CONF_MAX_REGISTERS_PER_REQUEST, DEFAULT_MAX_REGISTERS_PER_REQUEST
         ),
+        CONF_MAX_INFLIGHT_REQUESTS: entry_options.get(
+            CONF_MAX_INFLIGHT_REQUESTS, DEFAULT_MAX_INFLIGHT_REQUESTS
+        ),
         CONF_SAFE_SCAN: entry_options.get(CONF_SAFE_SCAN, DEFAULT_SAFE_SCAN),
         CONF_LOG_LEVEL: entry_options.get(CONF_LOG_LEVEL, DEFAULT_LOG_LEVEL),
         CONF_SYNC_DEVICE_CLOCK_ENABLED: entry_options.get(
@@ -196,6 +202,14 @@ def build_options_schema(values: dict[str, Any]) -> vol.Schema:
                     "selector": {"number": {"min": 1, "max": MAX_BATCH_REGISTERS, "step": 1}},
                 },
             ): int,
+            vol.Optional(
+                CONF_MAX_INFLIGHT_REQUESTS,
+                default=values[CONF_MAX_INFLIGHT_REQUESTS],
+                description={
+                    "advanced": True,
+                    "selector": {"number": {"min": 1, "max": MAX_INFLIGHT_REQUESTS, "step": 1}},
+                },
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_INFLIGHT_REQUESTS)),
             vol.Optional(
                 CONF_SYNC_DEVICE_CLOCK_ENABLED,
                 default=values[CONF_SYNC_DEVICE_CLOCK_ENABLED],
@@ -49,6 +49,10 @@ class SyncDeviceClockButton(ThesslaGreenEntity, ButtonEntity):
         super().__init__(coordinator, "sync_device_clock", None)
         self._entry = entry
 
+    def _source_keys(self) -> frozenset[str] | None:
+        """The button only reflects availability, which wakes every listener."""
+        return frozenset()
+
     @property
     def available(self) -> bool:
         """Return True whenever the coordinator is connected."""
@@ -144,6 +144,10 @@ class ThesslaGreenClimate(ThesslaGreenEntity, ClimateEntity):
         self._attr_preset_modes = PRESET_MODES
         self._optimistic = OptimisticState()
 
+    def _source_keys(self) -> frozenset[str] | None:
+        """Climate state combines many registers; wake on every update."""
+        return None
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Drop optimistic command fields once the confirmed state matches."""
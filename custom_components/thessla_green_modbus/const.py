@@ -32,6 +32,49 @@ MAX_REGISTERS_PER_REQUEST = 16
 MAX_REGS_PER_REQUEST = MAX_REGISTERS_PER_REQUEST
 MAX_BATCH_REGISTERS = MAX_REGISTERS_PER_REQUEST
 
+# Upper bound for pipelined chunk reads kept in flight on one connection.
+# Only transports that match responses by transaction ID can use a window
+# larger than one; serial lines and pymodbus-backed clients stay at one.
+MAX_INFLIGHT_REQUESTS = 8
+
+# Default read cost model used to decide when bridging a hole between polled
+# registers is cheaper than an extra request (9600 baud RTU: ~2 ms per word
+# against ~50 ms of framing and device turnaround).  Replaced by measured
+# values once enough batch reads have been timed.
+DEFAULT_READ_REQUEST_LATENCY = 0.05
+DEFAULT_READ_WORD_TIME = 0.002
+
+# Register quarantine: registers the device keeps failing to read are left out
+# of the poll plan and re-probed after a delay that doubles on every failed
+# probe.  Rejected reads (Modbus exception responses) quarantine at once; other
+# failures only after several consecutive cycles in which other reads worked.
+QUARANTINE_BASE_DELAY = 300.0  # seconds
+QUARANTINE_MAX_DELAY = 86400.0  # seconds
+QUARANTINE_STRIKES = 3
+QUARANTINE_SAVE_DELAY = 30.0  # seconds
+QUARANTINE_STORAGE_VERSION = 1
+QUARANTINE_REASON_REJECTED = "rejected"
+QUARANTINE_REASON_NO_DATA = "no_data"
+QUARANTINE_REASON_ERROR = "error"
+# Left unread because the cycle's retry budget ran out; never quarantines.
+QUARANTINE_REASON_SKIPPED = "skipped"
+
+# Device circuit breaker: after this many consecutive update cycles in which
+# the unit answered no read, cycles only send one probe read until the unit
+# answers again.
+CIRCUIT_BREAKER_THRESHOLD = 3
+
+# Per-cycle retry budget shared by all chunks of an update cycle: at most
+# this many retried requests, taking at most this share of the cycle's read
+# time.  Once a retry is refused, the chunks not yet read fail at once.
+RETRY_BUDGET_ATTEMPTS = 6
+RETRY_BUDGET_FRACTION = 0.25
+
+# Update-cycle deadline: a cycle may spend this share of the scan interval on
+# reads.  When it runs out, the cycle returns what it has read; the remaining
+# registers keep their last value and are reported stale.
+CYCLE_DEADLINE_FRACTION = 0.8
+
 # Holding register addresses where a new batch must start.
 #
 # addr 16: FW 3.11 rejects FC03 batches that cross from system registers
@@ -57,11 +100,29 @@ DEFAULT_PORT = 502  # Standard Modbus TCP port
 DEFAULT_SLAVE_ID = 10
 DEFAULT_SCAN_INTERVAL = 30
 DEFAULT_TIMEOUT = 10
+# Shortest response timeout the round-trip estimator may derive; the
+# configured timeout is the longest.
+RESPONSE_TIMEOUT_FLOOR = 0.5
 DEFAULT_RETRY = 3
 DEFAULT_BACKOFF = 0.0
 DEFAULT_BACKOFF_JITTER = 0.0
 DEFAULT_MAX_BACKOFF = 30.0
 MIN_SCAN_INTERVAL = 5
+
+# Refresh classes decide how often the poll cycle re-reads a register.  The
+# scan interval is the base tick: a class whose interval does not exceed it is
+# read on every cycle.  ``None`` means once per session (after each scan).
+REFRESH_FAST = "fast"
+REFRESH_NORMAL = "normal"
+REFRESH_SLOW = "slow"
+REFRESH_ONCE = "once"
+REFRESH_CLASSES = (REFRESH_FAST, REFRESH_NORMAL, REFRESH_SLOW, REFRESH_ONCE)
+REFRESH_CLASS_INTERVALS: dict[str, int | None] = {
+    REFRESH_FAST: 0,
+    REFRESH_NORMAL: DEFAULT_SCAN_INTERVAL,
+    REFRESH_SLOW: 600,
+    REFRESH_ONCE: None,
+}
 TEMPERATURE_MIN_C = 15.0
 TEMPERATURE_MAX_C = 35.0
 TEMPERATURE_STEP_C = 0.5
@@ -149,6 +210,7 @@ CONF_SAFE_SCAN = "safe_scan"
 CONF_AIRFLOW_UNIT = "airflow_unit"
 CONF_DEEP_SCAN = "deep_scan"  # Perform exhaustive raw register scan for diagnostics
 CONF_MAX_REGISTERS_PER_REQUEST = "max_registers_per_request"
+CONF_MAX_INFLIGHT_REQUESTS = "max_inflight_requests"
 CONF_LOG_LEVEL = "log_level"
 CONF_SYNC_DEVICE_CLOCK_ENABLED = "sync_device_clock_enabled"
 CONF_SYNC_DEVICE_CLOCK_ON_START = "sync_device_clock_on_start"
@@ -172,6 +234,7 @@ DEFAULT_SKIP_MISSING_REGISTERS = False
 DEFAULT_ENABLE_DEVICE_SCAN = True
 DEFAULT_DEEP_SCAN = False
 DEFAULT_MAX_REGISTERS_PER_REQUEST = MAX_BATCH_REGISTERS
+DEFAULT_MAX_INFLIGHT_REQUESTS = 1
 DEFAULT_SAFE_SCAN = False
 DEFAULT_LOG_LEVEL = "info"
 
@@ -6,10 +6,11 @@ import inspect
 import logging
 from collections.abc import Callable
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, cast
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as _dt_util
 
@@ -19,6 +20,7 @@ from ..const import (
     DEFAULT_BACKOFF_JITTER,
     DEFAULT_BAUD_RATE,
     DEFAULT_CONNECTION_TYPE,
+    DEFAULT_MAX_INFLIGHT_REQUESTS,
     DEFAULT_MAX_REGISTERS_PER_REQUEST,
     DEFAULT_NAME,
     DEFAULT_PARITY,
@@ -68,6 +70,7 @@ from .factory import build_config_from_params as _build_config_from_params_impl
 from .init_config import apply_coordinator_config as _apply_coordinator_config_impl
 from .init_config import normalize_runtime_config as _normalize_runtime_config_impl
 from .lifecycle import async_setup as _async_setup_impl
+from .listeners import KeyedListeners
 from .runtime import normalize_backoff as _normalize_backoff_impl
 from .runtime import parse_backoff_jitter as _parse_backoff_jitter_impl
 from .scan import (
@@ -134,6 +137,8 @@ class ThesslaGreenModbusCoordinator(
     """
 
     _device_client: ThesslaGreenDeviceClient
+    _keyed_listeners: KeyedListeners
+    _quarantine_store: Store[dict[str, Any]] | None
     _reauth_scheduled: bool
     _shutting_down: bool
     _stop_listener: Callable[..., Any] | None
@@ -232,6 +237,7 @@ class ThesslaGreenModbusCoordinator(
         baud_rate: int = DEFAULT_BAUD_RATE,
         parity: str = DEFAULT_PARITY,
         stop_bits: int = DEFAULT_STOP_BITS,
+        max_inflight_requests: int = DEFAULT_MAX_INFLIGHT_REQUESTS,
     ) -> ThesslaGreenModbusCoordinator:
         """Construct coordinator from explicit parameters."""
         return cls(
@@ -258,6 +264,7 @@ class ThesslaGreenModbusCoordinator(
                 baud_rate=baud_rate,
                 parity=parity,
                 stop_bits=stop_bits,
+                max_inflight_requests=max_inflight_requests,
             ),
             entry=entry,
         )
@@ -393,6 +400,45 @@ class ThesslaGreenModbusCoordinator(
         """
         return await _async_update_data_impl(self)
 
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, indexed by the data keys named in ``context``.
+
+        A ``frozenset`` of data keys as ``context`` limits wake-ups to updates
+        that change one of those keys; any other context wakes on every update.
+        """
+        remove_listener = super().async_add_listener(update_callback, context)
+        token = object()
+        self._keyed_listeners.add(token, update_callback, context)
+
+        @callback
+        def remove_keyed_listener() -> None:
+            self._keyed_listeners.discard(token)
+            remove_listener()
+
+        return cast(Callable[[], None], remove_keyed_listener)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Wake only the listeners whose data keys changed since the last dispatch."""
+        listeners = self._keyed_listeners.due(
+            self.data,
+            (self.last_update_success, bool(self._device_client.offline_state)),
+        )
+        if listeners is None:
+            super().async_update_listeners()
+            return
+        for update_callback in listeners:
+            update_callback()
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Push data outside a poll cycle and wake every listener."""
+        self._keyed_listeners.invalidate()
+        super().async_set_updated_data(data)
+
     async def _disconnect_locked(self) -> None:
         """HA-boundary adapter — passed as a callback to core.connection_lifecycle.
 
@@ -429,6 +475,15 @@ class ThesslaGreenModbusCoordinator(
                 await result
         await self._disconnect()
 
+    @property
+    def stale_keys(self) -> frozenset[str]:
+        """Return registers holding a value the last cycle ran out of time to refresh."""
+        return frozenset(getattr(self.device_client, "_stale_registers", ()))
+
+    def is_stale(self, key: str) -> bool:
+        """Return True when ``key`` was carried over because the last cycle ran out of time."""
+        return key in self.stale_keys
+
     @property
     def status_overview(self) -> dict[str, Any]:
         """Return a concise online/offline status summary."""
@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from typing import Any, cast
 
 from homeassistant.helpers.device_registry import DeviceInfo
 
-from ..const import CONNECTION_TYPE_TCP, DOMAIN, MANUFACTURER, UNKNOWN_MODEL
+from ..const import (
+    CONNECTION_TYPE_RTU,
+    CONNECTION_TYPE_TCP,
+    CONNECTION_TYPE_TCP_RTU,
+    DEFAULT_PARITY,
+    DEFAULT_STOP_BITS,
+    DOMAIN,
+    MANUFACTURER,
+    SERIAL_PARITY_MAP,
+    SERIAL_STOP_BITS_MAP,
+    UNKNOWN_MODEL,
+)
+from ..core.circuit_breaker import DeviceCircuitBreaker
+from ..core.cycle_timing import phase_timings
+from ..core.quarantine import RegisterQuarantine
+from ..core.read_cost import ReadCostEstimator
+from ..core.request_scheduler import RequestScheduler
+from ..core.retry_budget import CycleRetryBudget
 from ..register_map import REGISTER_MAP_VERSION
 from ..registers.loader import get_all_registers
+from ..transport.bus import SharedBusTransport
+from ..transport.capture import frame_capture
+from ..transport.health import ConnectionHealth
+from ..transport.rtt import RttEstimator
+from ..transport.rtu_timing import InterFrameGate, throughput_table
 from ..utils import utcnow
 
 
@@ -26,17 +49,24 @@ def status_overview(coordinator: Any) -> dict[str, Any]:
     error_count += int(dc.statistics.get("connection_errors", 0))
     error_count += int(dc.statistics.get("timeout_errors", 0))
 
+    breaker = circuit_breaker_stats(coordinator)
     return {
         "online": is_connected and recent_update,
         "last_successful_read": last_update_iso,
         "error_count": error_count,
         "scan_interval": coordinator.scan_interval,
+        "circuit_breaker": breaker["state"] if breaker else None,
     }
 
 
 def performance_stats(coordinator: Any) -> dict[str, Any]:
-    """Return performance statistics."""
+    """Return performance statistics.
+
+    ``phase_timings`` holds p50/p95/p99 (ms) of each update-cycle phase and
+    of single chunk requests.
+    """
     dc = coordinator.device_client
+    timings = phase_timings(dc)
     return {
         "total_reads": dc.statistics["successful_reads"],
         "failed_reads": dc.statistics["failed_reads"],
@@ -53,9 +83,115 @@ def performance_stats(coordinator: Any) -> dict[str, Any]:
         "last_error": dc.statistics["last_error"],
         "registers_available": sum(len(regs) for regs in dc.available_registers.values()),
         "registers_read": dc.statistics["total_registers_read"],
+        "phase_timings": timings.percentiles() if timings is not None else None,
+    }
+
+
+def read_plan_stats(coordinator: Any) -> dict[str, Any]:
+    """Return requests and wasted words per poll cycle plus the read cost model."""
+    dc = coordinator.device_client
+    quality = getattr(dc, "_read_plan_quality", None)
+    estimator = getattr(dc, "_read_cost", None)
+    if not isinstance(quality, dict) or not isinstance(estimator, ReadCostEstimator):
+        return {}
+    model = estimator.model()
+    return {
+        "requests_per_cycle": sum(plan.requests for plan in quality.values()),
+        "wasted_words_per_cycle": sum(plan.wasted_words for plan in quality.values()),
+        "register_types": {key: plan._asdict() for key, plan in quality.items()},
+        "cost_model": {
+            "calibrated": estimator.calibrated,
+            "samples": estimator.samples,
+            "request_latency": round(model.request_latency, 6),
+            "word_time": round(model.word_time, 6),
+            "max_bridge_gap": model.max_bridge_gap,
+        },
+    }
+
+
+def quarantine_stats(coordinator: Any) -> dict[str, Any]:
+    """Return quarantined registers with failure reason and next re-probe time."""
+    quarantine = getattr(coordinator.device_client, "_quarantine", None)
+    if not isinstance(quarantine, RegisterQuarantine):
+        return {}
+    return {
+        name: {
+            "reason": entry.reason,
+            "failures": entry.failures,
+            "next_probe": datetime.fromtimestamp(entry.next_probe, UTC).isoformat(),
+        }
+        for name, entry in sorted(quarantine.entries.items())
+    }
+
+
+def shared_bus_stats(coordinator: Any) -> dict[str, Any] | None:
+    """Return utilisation of the bus this unit shares with others, if any."""
+    transport = coordinator.device_client._transport
+    if not isinstance(transport, SharedBusTransport):
+        return None
+    return transport.bus_statistics()
+
+
+def _line_transport(coordinator: Any) -> Any:
+    """Return the transport owning the connection, past a shared-bus handle."""
+    transport = coordinator.device_client._transport
+    if isinstance(transport, SharedBusTransport):
+        return transport.bus.transport if transport.bus is not None else None
+    return transport
+
+
+def rtu_timing_stats(coordinator: Any) -> dict[str, Any] | None:
+    """Return RTU line timing and best-case read rates at 9600 and 19200 baud.
+
+    The measured ``line`` statistics are only available on a serial
+    transport; behind an RTU-over-TCP gateway its serial side is not visible.
+    """
+    dc = coordinator.device_client
+    if dc.config.connection_type not in (CONNECTION_TYPE_RTU, CONNECTION_TYPE_TCP_RTU):
+        return None
+    parity = SERIAL_PARITY_MAP.get(dc.config.parity, SERIAL_PARITY_MAP[DEFAULT_PARITY])
+    stop_bits = SERIAL_STOP_BITS_MAP.get(dc.config.stop_bits, DEFAULT_STOP_BITS)
+    count = max(1, int(dc.effective_batch))
+    gate = getattr(_line_transport(coordinator), "gate", None)
+    return {
+        "registers_per_request": count,
+        "throughput": throughput_table(count, parity=parity, stopbits=stop_bits),
+        "line": gate.statistics() if isinstance(gate, InterFrameGate) else None,
     }
 
 
+def response_timeout_stats(coordinator: Any) -> dict[str, Any] | None:
+    """Return the smoothed round-trip time and the response timeout derived from it."""
+    rtt = getattr(_line_transport(coordinator), "rtt", None)
+    return rtt.statistics() if isinstance(rtt, RttEstimator) else None
+
+
+def connection_health_stats(coordinator: Any) -> dict[str, Any] | None:
+    """Return the connections kept and dropped after failed requests."""
+    health = getattr(_line_transport(coordinator), "health", None)
+    return health.statistics() if isinstance(health, ConnectionHealth) else None
+
+
+def circuit_breaker_stats(coordinator: Any) -> dict[str, Any] | None:
+    """Return the state and counters of the device circuit breaker."""
+    breaker = getattr(coordinator.device_client, "_circuit_breaker", None)
+    return breaker.statistics() if isinstance(breaker, DeviceCircuitBreaker) else None
+
+
+def retry_budget_stats(coordinator: Any) -> dict[str, Any] | None:
+    """Return retries spent versus the per-cycle retry budget."""
+    budget = getattr(coordinator.device_client, "_retry_budget", None)
+    return budget.statistics() if isinstance(budget, CycleRetryBudget) else None
+
+
+def request_scheduler_stats(coordinator: Any) -> dict[str, Any] | None:
+    """Return write-to-ack latency and preemptions of the request scheduler."""
+    lock = getattr(coordinator.device_client, "_write_lock", None)
+    if not isinstance(lock, RequestScheduler):
+        return None
+    return lock.statistics()
+
+
 def get_diagnostic_data(coordinator: Any) -> dict[str, Any]:
     """Return diagnostic information for Home Assistant."""
     dc = coordinator.device_client
@@ -77,6 +213,8 @@ def get_diagnostic_data(coordinator: Any) -> dict[str, Any]:
     statistics = dc.statistics.copy()
     if statistics.get("last_successful_update"):
         statistics["last_successful_update"] = statistics["last_successful_update"].isoformat()
+    if timings := phase_timings(dc):
+        statistics["phase_timings"] = timings.summary()
     total_registers = sum(len(v) for v in dc.available_registers.values())
     total_registers_json = len(get_all_registers())
     registers_discovered = {key: len(value) for key, value in dc.available_registers.items()}
@@ -108,6 +246,17 @@ def get_diagnostic_data(coordinator: Any) -> dict[str, Any]:
         "autoscan": not dc.force_full_register_list,
         "registers_discovered": registers_discovered,
         "error_statistics": error_stats,
+        "read_plan": read_plan_stats(coordinator),
+        "quarantined_registers": quarantine_stats(coordinator),
+        "stale_registers": sorted(getattr(dc, "_stale_registers", ())),
+        "shared_bus": shared_bus_stats(coordinator),
+        "request_scheduler": request_scheduler_stats(coordinator),
+        "rtu_timing": rtu_timing_stats(coordinator),
+        "response_timeout": response_timeout_stats(coordinator),
+        "connection_health": connection_health_stats(coordinator),
+        "circuit_breaker": circuit_breaker_stats(coordinator),
+        "retry_budget": retry_budget_stats(coordinator),
+        "frame_capture": frame_capture.dump(),
         "register_map_version": REGISTER_MAP_VERSION,
     }
 
@@ -9,6 +9,7 @@ from ..const import (
     DEFAULT_BACKOFF_JITTER,
     DEFAULT_BAUD_RATE,
     DEFAULT_CONNECTION_TYPE,
+    DEFAULT_MAX_INFLIGHT_REQUESTS,
     DEFAULT_MAX_REGISTERS_PER_REQUEST,
     DEFAULT_NAME,
     DEFAULT_PARITY,
@@ -43,6 +44,7 @@ def build_config_from_params(
     baud_rate: int = DEFAULT_BAUD_RATE,
     parity: str = DEFAULT_PARITY,
     stop_bits: int = DEFAULT_STOP_BITS,
+    max_inflight_requests: int = DEFAULT_MAX_INFLIGHT_REQUESTS,
 ) -> CoordinatorConfig:
     """Build CoordinatorConfig from explicit constructor parameters."""
 
@@ -68,4 +70,5 @@ def build_config_from_params(
         baud_rate=baud_rate,
         parity=parity,
         stop_bits=stop_bits,
+        max_inflight_requests=max_inflight_requests,
     )
@@ -6,7 +6,7 @@ from collections.abc import Callable
 from datetime import timedelta
 from typing import Any
 
-from ..const import CONNECTION_MODE_AUTO
+from ..const import CONNECTION_MODE_AUTO, MAX_INFLIGHT_REQUESTS
 from ..core.models import CoordinatorConfig
 
 
@@ -58,6 +58,7 @@ def normalize_runtime_config(
         baud_rate=normalized_baud_rate,
         parity=parity_norm,
         stop_bits=normalized_stop_bits,
+        max_inflight_requests=cfg.max_inflight_requests,
     )
     resolved_connection_mode = resolved_mode if resolved_mode != CONNECTION_MODE_AUTO else None
     return normalized_cfg, resolved_connection_mode, interval_seconds
@@ -89,6 +90,9 @@ def apply_coordinator_config(
     coordinator.device_client.safe_scan = normalized_cfg.safe_scan
     coordinator.entry = entry
     coordinator.device_client.skip_missing_registers = normalized_cfg.skip_missing_registers
+    coordinator.device_client.max_inflight_requests = max(
+        1, min(int(normalized_cfg.max_inflight_requests), MAX_INFLIGHT_REQUESTS)
+    )
 
     effective_batch = resolve_effective_batch_fn(entry, normalized_cfg.max_registers_per_request)
     coordinator.device_client.effective_batch = effective_batch
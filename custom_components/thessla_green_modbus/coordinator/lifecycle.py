@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 
 from ..const import CONNECTION_TYPE_RTU
+from .quarantine_store import async_load_quarantine
 
 if TYPE_CHECKING:
     from .coordinator import ThesslaGreenModbusCoordinator
@@ -33,6 +34,7 @@ async def async_setup(coordinator: ThesslaGreenModbusCoordinator) -> bool:
 
     await coordinator._prepare_registers_for_setup()
     coordinator._warn_missing_device_info()
+    await async_load_quarantine(coordinator)
     coordinator.device_client.compute_register_groups()
     await coordinator._test_connection()
 
@@ -0,0 +1,123 @@
+"""Change-aware listener dispatch for the coordinator.
+
+``DataUpdateCoordinator`` wakes every listener after each refresh.  Entities
+register the coordinator data keys their state is derived from as their
+listener context (see ``ThesslaGreenEntity._source_keys``); the coordinator
+diffs each new payload against the last dispatched one and only wakes the
+listeners of keys whose value changed.  Listeners without keys, and all
+listeners whenever availability flips, are still woken on every update.
+
+Keys that were just written are *touched*: their listeners keep being woken
+until a hold time has passed, so entities can drop an optimistic value even
+when the polled value never changes.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__.rsplit(".", maxsplit=1)[0])
+
+ListenerCallback = Callable[[], None]
+
+
+def listener_keys(context: Any) -> frozenset[str] | None:
+    """Return the data keys a listener context subscribes to, or ``None`` for all."""
+    if isinstance(context, frozenset) and all(isinstance(key, str) for key in context):
+        return context
+    return None
+
+
+def changed_keys(previous: Mapping[str, Any], current: Mapping[str, Any]) -> set[str]:
+    """Return keys added, removed or changed between two data payloads."""
+    missing = object()
+    changed = {key for key, value in current.items() if previous.get(key, missing) != value}
+    changed.update(key for key in previous if key not in current)
+    return changed
+
+
+class KeyedListeners:
+    """Index of coordinator listeners by the data keys they depend on."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._by_key: dict[str, dict[object, ListenerCallback]] = {}
+        self._unkeyed: dict[object, ListenerCallback] = {}
+        self._keys: dict[object, frozenset[str] | None] = {}
+        self._snapshot: dict[str, Any] | None = None
+        self._status: tuple[bool, bool] | None = None
+        #: Touched key -> monotonic time until which its listeners are woken.
+        self._touched: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed listeners."""
+        return len(self._keys)
+
+    def add(self, token: object, update_callback: ListenerCallback, context: Any) -> None:
+        """Index ``update_callback`` under the keys named by ``context``."""
+        keys = listener_keys(context)
+        self._keys[token] = keys
+        if keys is None:
+            self._unkeyed[token] = update_callback
+            return
+        for key in keys:
+            self._by_key.setdefault(key, {})[token] = update_callback
+
+    def discard(self, token: object) -> None:
+        """Drop the listener registered under ``token``."""
+        keys = self._keys.pop(token, None)
+        self._unkeyed.pop(token, None)
+        for key in keys or ():
+            listeners = self._by_key.get(key)
+            if listeners is None:
+                continue
+            listeners.pop(token, None)
+            if not listeners:
+                del self._by_key[key]
+
+    def touch(self, keys: Iterable[str], hold: float) -> None:
+        """Wake the listeners of ``keys`` on every dispatch for ``hold`` seconds.
+
+        The first dispatch after the hold time still wakes them once more.
+        """
+        until = time.monotonic() + hold
+        for key in keys:
+            self._touched[key] = max(self._touched.get(key, until), until)
+
+    def invalidate(self) -> None:
+        """Forget the last dispatched payload so the next dispatch wakes everyone."""
+        self._snapshot = None
+
+    def due(
+        self, data: Mapping[str, Any] | None, status: tuple[bool, bool]
+    ) -> list[ListenerCallback] | None:
+        """Return the listeners to wake for ``data``; ``None`` means all of them.
+
+        Everyone is woken on the first dispatch, after :meth:`invalidate`, when
+        there is no data, or when ``status`` (last update success, offline
+        state) differs from the previous dispatch.
+        """
+        previous, previous_status = self._snapshot, self._status
+        self._snapshot = dict(data) if data is not None else None
+        self._status = status
+        if previous is None or data is None or status != previous_status:
+            return None
+
+        changed = changed_keys(previous, data)
+        if self._touched:
+            now = time.monotonic()
+            changed.update(self._touched)
+            self._touched = {key: until for key, until in self._touched.items() if until > now}
+        woken = dict(self._unkeyed)
+        for key in changed:
+            woken.update(self._by_key.get(key, {}))
+        _LOGGER.debug(
+            "%d data keys changed; waking %d of %d listeners",
+            len(changed),
+            len(woken),
+            len(self._keys),
+        )
+        return list(woken.values())
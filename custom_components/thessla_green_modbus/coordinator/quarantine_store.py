@@ -0,0 +1,65 @@
+"""Persist the register quarantine across Home Assistant restarts."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from ..const import DOMAIN, QUARANTINE_SAVE_DELAY, QUARANTINE_STORAGE_VERSION
+from ..core.quarantine import RegisterQuarantine
+
+if TYPE_CHECKING:
+    from .coordinator import ThesslaGreenModbusCoordinator
+
+_LOGGER = logging.getLogger(__name__.rsplit(".", maxsplit=1)[0])
+
+
+def _quarantine_store(coordinator: ThesslaGreenModbusCoordinator) -> Store[dict[str, Any]] | None:
+    """Return the storage for the entry's quarantine, or ``None`` without an entry."""
+    if coordinator.entry is None:
+        return None
+    store: Store[dict[str, Any]] | None = getattr(coordinator, "_quarantine_store", None)
+    if store is None:
+        store = Store(
+            coordinator.hass,
+            QUARANTINE_STORAGE_VERSION,
+            f"{DOMAIN}.quarantine.{coordinator.entry.entry_id}",
+        )
+        coordinator._quarantine_store = store
+    return store
+
+
+def _device_quarantine(coordinator: ThesslaGreenModbusCoordinator) -> RegisterQuarantine | None:
+    quarantine = getattr(coordinator.device_client, "_quarantine", None)
+    return quarantine if isinstance(quarantine, RegisterQuarantine) else None
+
+
+async def async_load_quarantine(coordinator: ThesslaGreenModbusCoordinator) -> None:
+    """Restore quarantined registers saved by a previous run."""
+    quarantine = _device_quarantine(coordinator)
+    store = _quarantine_store(coordinator) if quarantine is not None else None
+    if quarantine is None or store is None:
+        return
+    try:
+        data = await store.async_load()
+    except (HomeAssistantError, OSError, ValueError) as err:
+        _LOGGER.warning("Could not load register quarantine: %s", err)
+        return
+    quarantine.load(data)
+    if quarantine:
+        _LOGGER.debug("Restored %d quarantined register(s)", len(quarantine))
+
+
+def schedule_quarantine_save(coordinator: ThesslaGreenModbusCoordinator) -> None:
+    """Save the quarantine shortly after it changed."""
+    quarantine = _device_quarantine(coordinator)
+    if quarantine is None or not quarantine.dirty:
+        return
+    store = _quarantine_store(coordinator)
+    if store is None:
+        return
+    quarantine.dirty = False
+    store.async_delay_save(quarantine.as_dict, QUARANTINE_SAVE_DELAY)
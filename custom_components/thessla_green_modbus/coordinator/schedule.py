@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from pymodbus.exceptions import ConnectionException, ModbusException
 
 from ..const import MAX_REGS_PER_REQUEST
+from ..core.request_scheduler import (
+    RequestPriority,
+    RequestScheduler,
+    record_write_latency,
+    request_checkpoint,
+    request_slot,
+)
 from ..core.write_path import SingleWritePlan, encode_write_value
+from ..optimistic import DEFAULT_OPTIMISTIC_TTL
 from ..registers import REG_TEMPORARY_FLOW_START, REG_TEMPORARY_TEMP_START
 from ..registers.read_planner import chunk_register_values
+from .update_state import note_cycle_write
 from .write_path import (
     finalize_write_result,
     run_multi_register_write_attempts,
@@ -151,7 +160,7 @@ class _CoordinatorScheduleMixin:
     slave_id: int
     retry: int
     effective_batch: int
-    _write_lock: asyncio.Lock
+    _write_lock: RequestScheduler
 
     async def _ensure_connection(self) -> None: ...
 
@@ -458,7 +467,9 @@ class _CoordinatorScheduleMixin:
         _raw_readback: list[int] | None = None
         _readback_definition: Any = None
 
-        async with self._device_client._write_lock:
+        lock = self._device_client._write_lock
+        queued_at = time.monotonic()
+        async with request_slot(lock, RequestPriority.WRITE):
             try:
                 success, refresh_after_write = await self._locked_single_register_write(
                     register_name=register_name,
@@ -468,9 +479,16 @@ class _CoordinatorScheduleMixin:
                 )
                 if not success:
                     return False
+                record_write_latency(lock, queued_at)
+
+                # Entities may show an optimistic value for this register until
+                # it expires; keep waking them even if the polled value is stable.
+                keyed_listeners = getattr(self, "_keyed_listeners", None)
+                if keyed_listeners is not None:
+                    keyed_listeners.touch((register_name,), DEFAULT_OPTIMISTIC_TTL)
 
                 # Targeted read-back while still holding the write lock so no
-                # concurrent Modbus operation can interleave between write and
+                # poll chunk or service read can interleave between write and
                 # read-back, preventing transaction-ID mismatches.
                 _definition = self._resolve_write_definition(register_name)
                 if (
@@ -519,6 +537,7 @@ class _CoordinatorScheduleMixin:
             else:
                 _updated_data = dict(self.data) if self.data else {}
                 _updated_data[register_name] = _decoded
+                note_cycle_write(self, register_name, _decoded)
                 try:
                     self.async_set_updated_data(_updated_data)
                 except (TypeError, AttributeError):
@@ -544,7 +563,9 @@ class _CoordinatorScheduleMixin:
         ):
             return False
         refresh_after_write = False
-        async with self._device_client._write_lock:
+        lock = self._device_client._write_lock
+        queued_at = time.monotonic()
+        async with request_slot(lock, RequestPriority.WRITE):
             try:
                 await self._ensure_connection()
                 self._assert_write_connection_ready()
@@ -554,6 +575,7 @@ class _CoordinatorScheduleMixin:
                 )
                 if not success:
                     return False
+                record_write_latency(lock, queued_at)
 
             except (ModbusException, ConnectionException):  # pragma: no cover - safety
                 _LOGGER.exception("Failed to write registers at %s", start_address)
@@ -569,7 +591,10 @@ class _CoordinatorScheduleMixin:
         """Read holding registers without acquiring _write_lock.
 
         Caller MUST already hold _write_lock. Returns None on any failure.
+        A user write queued meanwhile runs first: the read-back only confirms
+        a write that was already acknowledged.
         """
+        await request_checkpoint(self._device_client._write_lock, RequestPriority.READBACK)
         try:
             if self._device_client._transport is not None:
                 response = await self._device_client._transport.read_holding_registers(
@@ -625,7 +650,9 @@ class _CoordinatorScheduleMixin:
         ):
             return False, None
 
-        async with self._device_client._write_lock:
+        lock = self._device_client._write_lock
+        queued_at = time.monotonic()
+        async with request_slot(lock, RequestPriority.WRITE):
             try:
                 await self._ensure_connection()
                 self._assert_write_connection_ready()
@@ -635,6 +662,7 @@ class _CoordinatorScheduleMixin:
                 )
                 if not success:
                     return False, None
+                record_write_latency(lock, queued_at)
 
                 readback = await self._locked_read_holding_registers(start_address, readback_count)
                 return True, readback
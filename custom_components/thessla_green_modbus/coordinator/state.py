@@ -20,6 +20,9 @@ from ..const import (
     SERIAL_PARITY_MAP,
     SERIAL_STOP_BITS_MAP,
 )
+from ..core.cycle_timing import PhaseTimings
+from ..core.refresh_schedule import RefreshSchedule
+from ..core.request_scheduler import RequestScheduler
 from ..registers.maps import (
     coil_registers,
     discrete_input_registers,
@@ -27,6 +30,7 @@ from ..registers.maps import (
     input_registers,
 )
 from ..scanner import DeviceCapabilities
+from .listeners import KeyedListeners
 
 
 def normalize_serial_settings(
@@ -81,6 +85,8 @@ def _initialize_runtime_flags(coordinator: Any, *, entry: ConfigEntry | None) ->
     coordinator._reauth_scheduled = False
     coordinator._shutting_down = False
     coordinator._stop_listener = None
+    coordinator._keyed_listeners = KeyedListeners()
+    coordinator._quarantine_store = None
     coordinator.device_client.offline_state = False
 
 
@@ -89,7 +95,7 @@ def _initialize_connection_state(coordinator: Any) -> None:
     coordinator.device_client.client = None
     coordinator.device_client._transport = None
     coordinator.device_client._client_lock = asyncio.Lock()
-    coordinator.device_client._write_lock = asyncio.Lock()
+    coordinator.device_client._write_lock = RequestScheduler()
     coordinator.device_client._update_in_progress = False
 
 
@@ -134,6 +140,13 @@ def _initialize_device_state(coordinator: Any, *, entry: ConfigEntry | None) ->
         "discrete_inputs"
     ]
     coordinator.device_client._register_groups = {}
+    coordinator.device_client._register_group_refresh = {}
+    coordinator.device_client._register_refresh = {}
+    coordinator.device_client._read_plan_quality = {}
+    coordinator.device_client._refresh_schedule = RefreshSchedule(
+        scan_interval=coordinator.scan_interval
+    )
+    coordinator.device_client._poll_plans = {}
     coordinator.device_client._consecutive_failures = 0
     coordinator.device_client._max_failures = 5
 
@@ -153,6 +166,7 @@ def _initialize_scan_state(coordinator: Any) -> None:
         "last_successful_update": None,
         "average_response_time": 0.0,
         "total_registers_read": 0,
+        "phase_timings": PhaseTimings(),
     }
 
     coordinator.device_client.last_scan = None
@@ -5,16 +5,22 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from pymodbus.exceptions import ConnectionException, ModbusException
 
+from ..const import CYCLE_DEADLINE_FRACTION
+from ..core.circuit_breaker import DeviceCircuitBreaker
+from ..core.cycle_timing import PHASE_CONNECT, phase_timings
+from ..core.request_scheduler import RequestPriority, request_slot
+from ..repairs import clear_device_unreachable_issue, create_device_unreachable_issue
 from ..utils import utcnow as _utcnow
 from .errors import handle_update_error
 from .update_result import apply_success_result
-from .update_state import begin_update_cycle, finish_update_cycle
+from .update_state import begin_update_cycle, finish_update_cycle, keep_written_values
 
 if TYPE_CHECKING:
     from .coordinator import ThesslaGreenModbusCoordinator
@@ -22,19 +28,54 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__.rsplit(".", maxsplit=1)[0])
 
 
+def cycle_deadline(coordinator: ThesslaGreenModbusCoordinator) -> float | None:
+    """Return the ``time.monotonic()`` deadline for a cycle's reads starting now.
+
+    The reads get a share of the scan interval so a slow link can neither
+    make cycles overlap nor hold the write lock for the whole interval.
+    """
+    scan_interval = getattr(coordinator, "scan_interval", None)
+    if not scan_interval:
+        return None
+    return time.monotonic() + float(scan_interval) * CYCLE_DEADLINE_FRACTION
+
+
+def _breaker_open(coordinator: ThesslaGreenModbusCoordinator) -> bool:
+    breaker = getattr(coordinator.device_client, "_circuit_breaker", None)
+    return isinstance(breaker, DeviceCircuitBreaker) and breaker.is_open
+
+
+def sync_unreachable_repair(coordinator: ThesslaGreenModbusCoordinator, was_open: bool) -> None:
+    """Raise or clear the unreachable-device repair issue when the breaker flipped."""
+    is_open = _breaker_open(coordinator)
+    hass = getattr(coordinator, "hass", None)
+    if is_open == was_open or hass is None:
+        return
+    entry = getattr(coordinator, "entry", None)
+    try:
+        if is_open:
+            create_device_unreachable_issue(hass, entry)
+        else:
+            clear_device_unreachable_issue(hass, entry)
+    except (AttributeError, KeyError, TypeError, RuntimeError) as exc:
+        _LOGGER.debug("Could not update unreachable-device repair issue: %s", exc)
+
+
 async def run_update_cycle(
     coordinator: ThesslaGreenModbusCoordinator,
     start_time: datetime,
 ) -> dict[str, Any]:
     """Run a single successful update read cycle and update statistics."""
-    await coordinator._ensure_connection()
+    timings = phase_timings(coordinator.device_client)
+    with timings.measure(PHASE_CONNECT) if timings is not None else contextlib.nullcontext():
+        await coordinator._ensure_connection()
     transport = coordinator.device_client._transport
     if transport is not None and not transport.is_connected():
         raise ConnectionException("Modbus transport is not connected")
     if transport is None and coordinator.device_client.client is None:
         raise ConnectionException("Modbus client is not connected")
 
-    data = await coordinator.device_client._read_all_register_data()
+    data = await coordinator.device_client._read_all_register_data(cycle_deadline(coordinator))
 
     if transport is not None and not transport.is_connected():
         _LOGGER.debug("Modbus client disconnected during update; attempting reconnection")
@@ -43,6 +84,7 @@ async def run_update_cycle(
         if transport is None or not transport.is_connected():
             raise ConnectionException("Modbus transport is not connected")
 
+    keep_written_values(coordinator, data)
     return apply_success_result(coordinator, start_time=start_time, data=data)
 
 
@@ -57,8 +99,9 @@ async def async_update_data(coordinator: ThesslaGreenModbusCoordinator) -> dict[
     prepared_data = begin_update_cycle(coordinator)
     if prepared_data is not None:
         return prepared_data
+    breaker_was_open = _breaker_open(coordinator)
 
-    async with coordinator.device_client._write_lock:
+    async with request_slot(coordinator.device_client._write_lock, RequestPriority.POLL):
         try:
             return await run_update_cycle(coordinator, start_time)
 
@@ -100,3 +143,4 @@ async def async_update_data(coordinator: ThesslaGreenModbusCoordinator) -> dict[
             ) from exc
         finally:
             finish_update_cycle(coordinator)
+            sync_unreachable_repair(coordinator, breaker_was_open)
@@ -6,6 +6,7 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from ..core.cycle_timing import PHASE_CYCLE, phase_timings
 from ..utils import utcnow as _utcnow
 
 if TYPE_CHECKING:
@@ -32,6 +33,9 @@ def apply_success_result(
         * (coordinator.device_client.statistics["successful_reads"] - 1)
         + response_time
     ) / coordinator.device_client.statistics["successful_reads"]
+    timings = phase_timings(coordinator.device_client)
+    if timings is not None:
+        timings.observe(PHASE_CYCLE, response_time)
 
     _LOGGER.debug("Data update successful: %d values read in %.2fs", len(data), response_time)
     return data
@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
+from ..core.refresh_schedule import RefreshSchedule
+from .quarantine_store import schedule_quarantine_save
+
 if TYPE_CHECKING:
     from .coordinator import ThesslaGreenModbusCoordinator
 
@@ -19,9 +24,50 @@ def begin_update_cycle(coordinator: ThesslaGreenModbusCoordinator) -> dict[str,
 
     coordinator.device_client._update_in_progress = True
     coordinator.device_client._failed_registers = set()
+    coordinator.device_client._failure_reasons = {}
+    coordinator.device_client._stale_registers = set()
+    coordinator.device_client._written_during_cycle = {}
     return None
 
 
+def note_cycle_write(coordinator: Any, register_name: str, value: Any) -> None:
+    """Remember a value confirmed by a write that preempted the running cycle.
+
+    The cycle may have polled the register before the write went out; its
+    result must not overwrite the read-back value.
+    """
+    device_client = coordinator._device_client
+    if getattr(device_client, "_update_in_progress", False) is True:
+        device_client._written_during_cycle[register_name] = value
+
+
+def forget_written_registers(coordinator: Any, names: Iterable[str]) -> None:
+    """Make the poll schedule read registers again after a successful write.
+
+    Slow and once-per-session classes are skipped by most cycles, which would
+    otherwise keep serving the value from before the write.
+    """
+    device_client = coordinator._device_client
+    schedule = getattr(device_client, "_refresh_schedule", None)
+    if isinstance(schedule, RefreshSchedule):
+        schedule.invalidate(
+            names,
+            register_refresh=getattr(device_client, "_register_refresh", {}),
+            now=time.monotonic(),
+        )
+
+
+def keep_written_values(coordinator: ThesslaGreenModbusCoordinator, data: dict[str, Any]) -> None:
+    """Overlay values confirmed by writes during the cycle onto its polled ``data``."""
+    written = getattr(coordinator.device_client, "_written_during_cycle", None)
+    if written:
+        data.update(written)
+
+
 def finish_update_cycle(coordinator: ThesslaGreenModbusCoordinator) -> None:
-    """Reset runtime update flag after a cycle completes or fails."""
+    """Reset runtime update flag after a cycle completes or fails.
+
+    Also schedules saving the register quarantine when the cycle changed it.
+    """
     coordinator.device_client._update_in_progress = False
+    schedule_quarantine_save(coordinator)
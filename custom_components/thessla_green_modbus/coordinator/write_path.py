@@ -7,8 +7,10 @@ from typing import Any
 
 from pymodbus.exceptions import ConnectionException, ModbusException
 
+from ..core.request_scheduler import RequestPriority, RequestScheduler
 from ..core.write_path import SingleWritePlan
 from ..repairs import clear_write_failure_issue, create_write_failure_issue
+from .update_state import forget_written_registers
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -71,6 +73,7 @@ async def run_single_write_attempts(
                 original_value=plan.original_value,
                 refresh=refresh,
             )
+            forget_written_registers(coordinator, (plan.register_name,))
             _clear_write_repair(coordinator)
             break
         except (ModbusException, ConnectionException, TimeoutError, OSError) as exc:
@@ -121,6 +124,15 @@ async def run_multi_register_write_attempts(
                 await coordinator._disconnect()
                 continue
             refresh_after_write = refresh
+            names = getattr(coordinator.device_client, "_holding_registers_rev", {})
+            forget_written_registers(
+                coordinator,
+                (
+                    names[address]
+                    for address in range(start_address, start_address + len(values))
+                    if address in names
+                ),
+            )
             _clear_write_repair(coordinator)
             _LOGGER.info(
                 "Successfully wrote %s to registers starting at %s",
@@ -146,8 +158,24 @@ async def run_multi_register_write_attempts(
     return True, refresh_after_write
 
 
+async def _wait_for_update_cycle(coordinator: Any) -> None:
+    """Wait for an update cycle the write preempted to finish.
+
+    A refresh requested while that cycle still runs would be skipped as a
+    duplicate, leaving the values it polled before the write on display.
+    """
+    device_client = getattr(coordinator, "_device_client", None)
+    if device_client is None or getattr(device_client, "_update_in_progress", False) is not True:
+        return
+    lock = device_client._write_lock
+    if isinstance(lock, RequestScheduler):
+        async with lock.slot(RequestPriority.POLL):
+            pass
+
+
 async def finalize_write_result(coordinator: Any, refresh_after_write: bool) -> bool:
     """Finish write operation with optional refresh."""
     if refresh_after_write:
+        await _wait_for_update_cycle(coordinator)
         await coordinator._safe_request_refresh()
     return True
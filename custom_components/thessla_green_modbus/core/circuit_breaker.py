@@ -0,0 +1,80 @@
+"""Circuit breaker for a unit that stopped answering.
+
+A unit that is unplugged or powered down behind a gateway still gets the
+full read plan every cycle: each chunk times out, is retried with backoff
+and reconnects, keeping the event loop and the gateway busy with hopeless
+traffic.  :class:`DeviceCircuitBreaker` counts cycles in which the unit
+answered no read.  After ``threshold`` of them it opens, and a cycle costs
+one probe read instead of the plan.  A probe that gets an answer half-opens
+the breaker: that cycle reads the full plan again and closes the breaker
+when the unit answers, or reopens it at once when it does not.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ..const import CIRCUIT_BREAKER_THRESHOLD
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class DeviceCircuitBreaker:
+    """Closed, open and half-open state of the device read path."""
+
+    def __init__(self, *, threshold: int = CIRCUIT_BREAKER_THRESHOLD) -> None:
+        """Initialize a closed breaker."""
+        self.threshold = max(1, int(threshold))
+        self.state = BREAKER_CLOSED
+        #: Consecutive cycles in which the unit answered no read.
+        self.failures = 0
+        #: Times the breaker opened from closed.
+        self.trips = 0
+        #: Probe reads sent while open.
+        self.probes = 0
+        #: Probe reads the unit did not answer, i.e. cycles the plan was skipped.
+        self.skipped_cycles = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == BREAKER_OPEN
+
+    def probe_answered(self, answered: bool) -> None:
+        """Record the outcome of a probe read sent while open."""
+        self.probes += 1
+        if answered:
+            self.state = BREAKER_HALF_OPEN
+        else:
+            self.skipped_cycles += 1
+            self.failures += 1
+
+    def record_cycle(self, answered: bool) -> None:
+        """Record whether the unit answered any read of a full cycle."""
+        if answered:
+            self.failures = 0
+            self.state = BREAKER_CLOSED
+            return
+        self.failures += 1
+        if self.state == BREAKER_HALF_OPEN or self.failures >= self.threshold:
+            if self.state == BREAKER_CLOSED:
+                self.trips += 1
+            self.state = BREAKER_OPEN
+
+    def statistics(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failed_cycles": self.failures,
+            "trips": self.trips,
+            "probes": self.probes,
+            "skipped_cycles": self.skipped_cycles,
+        }
+
+
+__all__ = [
+    "BREAKER_CLOSED",
+    "BREAKER_HALF_OPEN",
+    "BREAKER_OPEN",
+    "DeviceCircuitBreaker",
+]
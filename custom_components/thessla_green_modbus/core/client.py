@@ -22,14 +22,23 @@ from ..registers.maps import (
     holding_registers,
     input_registers,
 )
+from ..registers.read_planner import ReadPlanQuality
 from ..scanner import DeviceCapabilities
 from ..transport.base import BaseModbusTransport
 from .capabilities_mixin import _CoordinatorCapabilitiesMixin
+from .circuit_breaker import DeviceCircuitBreaker
 from .client_connection import _DeviceClientConnectionMixin
 from .client_registers import _DeviceClientRegistersMixin
 from .client_scanner import _DeviceClientScannerMixin
+from .cycle_timing import PhaseTimings
 from .io_mixin import _ModbusIOMixin
 from .models import CoordinatorConfig
+from .poll_plan import PollPlan
+from .quarantine import RegisterQuarantine
+from .read_cost import ReadCostEstimator
+from .refresh_schedule import RefreshSchedule
+from .request_scheduler import RequestScheduler
+from .retry_budget import CycleRetryBudget
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -60,7 +69,7 @@ class ThesslaGreenDeviceClient(
 
     #: Asyncio locks owned by this client.
     _client_lock: asyncio.Lock
-    _write_lock: asyncio.Lock
+    _write_lock: RequestScheduler
 
     @property
     def device_client(self) -> ThesslaGreenDeviceClient:
@@ -95,6 +104,7 @@ class ThesslaGreenDeviceClient(
         self.skip_missing_registers = config.skip_missing_registers
         self.effective_batch = effective_batch
         self.max_registers_per_request = effective_batch
+        self.max_inflight_requests = config.max_inflight_requests
         self._resolved_connection_mode = resolved_connection_mode
         self._device_name: str = config.name
 
@@ -102,7 +112,9 @@ class ThesslaGreenDeviceClient(
         self.client: Any | None = None
         self._transport: BaseModbusTransport | None = None
         self._client_lock = asyncio.Lock()
-        self._write_lock = asyncio.Lock()
+        #: Lets one of the chunk reads in flight reconnect after a failure.
+        self._reconnect_lock = asyncio.Lock()
+        self._write_lock = RequestScheduler()
         self._update_in_progress: bool = False
         self.offline_state: bool = False
 
@@ -136,7 +148,28 @@ class ThesslaGreenDeviceClient(
         self._coil_registers_rev = self._reverse_maps["coil_registers"]
         self._discrete_inputs_rev = self._reverse_maps["discrete_inputs"]
         self._register_groups: dict[str, list[tuple[int, int]]] = {}
+        self._register_group_refresh: dict[str, list[str]] = {}
+        self._register_refresh: dict[str, str] = {}
+        self._refresh_schedule = RefreshSchedule()
+        self._read_cost = ReadCostEstimator()
+        self._read_cost_gap = 0
+        self._read_plan_quality: dict[str, ReadPlanQuality] = {}
+        self._poll_plans: dict[str, PollPlan] = {}
         self._failed_registers: set[str] = set()
+        self._failure_reasons: dict[str, str] = {}
+        self._stale_registers: set[str] = set()
+        #: Values confirmed by writes that preempted the running update cycle.
+        self._written_during_cycle: dict[str, Any] = {}
+        #: ``time.monotonic()`` deadline of the running update cycle's reads.
+        self._cycle_deadline: float | None = None
+        #: Seconds the running update cycle spent decoding chunk responses.
+        self._decode_seconds = 0.0
+        self._quarantine = RegisterQuarantine()
+        #: Cuts cycles down to one probe read while the unit does not answer.
+        self._circuit_breaker = DeviceCircuitBreaker()
+        #: Retries all chunks of an update cycle share.
+        self._retry_budget = CycleRetryBudget()
+        self._quarantine_blocked: frozenset[str] = frozenset()
 
         # Scan state.
         self.device_scan_result: dict[str, Any] | None = None
@@ -154,6 +187,7 @@ class ThesslaGreenDeviceClient(
             "last_successful_update": None,
             "average_response_time": 0.0,
             "total_registers_read": 0,
+            "phase_timings": PhaseTimings(),
         }
         self._consecutive_failures: int = 0
         self._max_failures: int = 5
@@ -14,7 +14,6 @@ from ..const import (
     CONNECTION_MODE_TCP,
     CONNECTION_MODE_TCP_RTU,
     CONNECTION_TYPE_RTU,
-    CONNECTION_TYPE_TCP,
     DEFAULT_MAX_BACKOFF,
     DEFAULT_PARITY,
     DEFAULT_STOP_BITS,
@@ -24,6 +23,7 @@ from ..const import (
 from ..registers.maps import input_registers
 from ..scanner import is_request_cancelled_error
 from ..transport.base import BaseModbusTransport
+from ..transport.bus import SharedBusTransport, serial_bus_key, tcp_bus_key
 from .connection import (
     build_rtu_transport as _build_rtu_transport_impl,
 )
@@ -168,18 +168,29 @@ class _DeviceClientConnectionMixin:
     # ------------------------------------------------------------------
 
     def _build_tcp_transport(self, mode: str) -> BaseModbusTransport:
-        """Build a TCP (or RTU-over-TCP) transport for the given mode."""
-        return _build_tcp_transport_impl(
-            mode=mode,
-            host=self.config.host,
-            port=self.config.port,
-            retry=self.retry,
-            backoff=self.backoff,
-            max_backoff=DEFAULT_MAX_BACKOFF,
-            timeout=self.timeout,
-            offline_state=self.offline_state,
-            connection_type_tcp=CONNECTION_TYPE_TCP,
-            connection_mode_tcp_rtu=CONNECTION_MODE_TCP_RTU,
+        """Build a handle on the shared TCP (or RTU-over-TCP) bus for the given mode."""
+        return SharedBusTransport(
+            tcp_bus_key(self.config.host, self.config.port, mode),
+            lambda: _build_tcp_transport_impl(
+                mode=mode,
+                host=self.config.host,
+                port=self.config.port,
+                retry=self.retry,
+                backoff=self.backoff,
+                max_backoff=DEFAULT_MAX_BACKOFF,
+                timeout=self.timeout,
+                offline_state=self.offline_state,
+                connection_mode_tcp_rtu=CONNECTION_MODE_TCP_RTU,
+            ),
+            slave_id=self.config.slave_id,
+        )
+
+    def _build_rtu_transport(self, **settings: Any) -> BaseModbusTransport:
+        """Build a handle on the shared serial bus for the configured port."""
+        return SharedBusTransport(
+            serial_bus_key(settings["serial_port"]),
+            lambda: _build_rtu_transport_impl(**settings),
+            slave_id=self.config.slave_id,
         )
 
     async def _try_direct_client_connect(self, *, allow_parameterless_ctor: bool) -> bool:
@@ -228,7 +239,7 @@ class _DeviceClientConnectionMixin:
                 connection_type_rtu=CONNECTION_TYPE_RTU,
                 connection_mode_auto=CONNECTION_MODE_AUTO,
                 connection_mode_tcp=CONNECTION_MODE_TCP,
-                build_rtu_transport_fn=_build_rtu_transport_impl,
+                build_rtu_transport_fn=self._build_rtu_transport,
                 build_tcp_transport_fn=self._build_tcp_transport,
                 select_auto_transport_fn=lambda: _select_auto_transport_impl(
                     resolved_connection_mode=self._resolved_connection_mode,
@@ -4,18 +4,30 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable, Iterable
+from functools import partial
 from typing import Any, cast
 
-from ..const import HOLDING_BATCH_BOUNDARIES
+from ..const import (
+    HOLDING_BATCH_BOUNDARIES,
+    KNOWN_MISSING_REGISTERS,
+    QUARANTINE_REASON_ERROR,
+)
 from ..register_defs_cache import get_register_definitions
-from ..registers.read_planner import group_reads
+from ..registers.read_planner import coalesce_reads
 from ..registers.register_def import RegisterDef
+from .poll_plan import refresh_poll_plans as _refresh_poll_plans_impl
+from .quarantine import RegisterQuarantine
+from .read_cost import ReadCostEstimator
+from .refresh_schedule import RefreshSchedule
 from .register_groups import (
     compute_register_groups as _compute_register_groups_impl,
 )
 from .register_processing import (
     find_register_name as _find_register_name_impl,
 )
+from .register_processing import (
+    get_register_decoders as _get_register_decoders_impl,
+)
 from .register_processing import (
     process_register_value as _process_register_value_impl,
 )
@@ -26,11 +38,31 @@ _LOGGER = logging.getLogger(__name__)
 def mark_registers_failed(
     owner: Any,
     names: Iterable[str | None],
+    reason: str = QUARANTINE_REASON_ERROR,
 ) -> None:
-    """Record registers that failed to read in current runtime state."""
+    """Record registers that failed to read in current runtime state.
+
+    ``reason`` (one of the ``QUARANTINE_REASON_*`` constants) is kept per
+    register for the quarantine bookkeeping at the end of the cycle.
+    """
     failed: set[str] = getattr(owner, "_failed_registers", set())
-    failed.update(name for name in names if name)
+    named = [name for name in names if name]
+    failed.update(named)
     owner._failed_registers = failed
+    reasons = getattr(owner, "_failure_reasons", None)
+    if isinstance(reasons, dict):
+        reasons.update(dict.fromkeys(named, reason))
+
+
+def mark_registers_stale(owner: Any, names: Iterable[str | None]) -> None:
+    """Record registers left unread because the update cycle ran out of time.
+
+    Stale registers are not failures: they keep their last value and are read
+    again next cycle.
+    """
+    stale: set[str] = getattr(owner, "_stale_registers", set())
+    stale.update(name for name in names if name)
+    owner._stale_registers = stale
 
 
 def clear_register_failure(
@@ -40,6 +72,12 @@ def clear_register_failure(
     """Remove register from failed list after successful read/write."""
     if hasattr(owner, "_failed_registers"):
         owner._failed_registers.discard(name)
+    reasons = getattr(owner, "_failure_reasons", None)
+    if isinstance(reasons, dict):
+        reasons.pop(name, None)
+    quarantine = getattr(owner, "_quarantine", None)
+    if isinstance(quarantine, RegisterQuarantine):
+        quarantine.release(name)
 
 
 def _get_register_definition(name: str) -> RegisterDef:
@@ -57,7 +95,17 @@ class _DeviceClientRegistersMixin:
     _register_maps: dict[str, Any]
     _reverse_maps: dict[str, Any]
     _failed_registers: set[str]
+    _stale_registers: set[str]
     _register_groups: dict[str, Any]
+    _refresh_schedule: RefreshSchedule
+    _read_cost: ReadCostEstimator
+    _read_cost_gap: int
+    _quarantine: RegisterQuarantine
+    _quarantine_blocked: frozenset[str]
+    _failure_reasons: dict[str, str]
+    available_registers: dict[str, set[str]]
+    effective_batch: int
+    safe_scan: bool
     client: Any
     _transport: Any
 
@@ -66,13 +114,98 @@ class _DeviceClientRegistersMixin:
     # ------------------------------------------------------------------
 
     def compute_register_groups(self) -> None:
-        """Pre-compute register groups for optimized batch reading."""
+        """Pre-compute register groups and poll plans for optimized batch reading."""
+        self._plan_register_groups()
+        self._refresh_schedule.reset()
+
+    def _plan_register_groups(self) -> None:
+        """Group registers into reads using the current read cost model."""
+        cost_model = self._read_cost.model()
+        self._read_cost_gap = min(cost_model.max_bridge_gap, self.effective_batch)
         _compute_register_groups_impl(
             self,
             get_register_definition=_get_register_definition,
-            group_reads=group_reads,
+            group_reads=partial(coalesce_reads, cost_model=cost_model),
             holding_batch_boundaries=HOLDING_BATCH_BOUNDARIES,
+            group_read_options=self._group_read_options,
+        )
+        _refresh_poll_plans_impl(self)
+
+    def _group_read_options(self, register_type: str) -> dict[str, Any]:
+        """Return the addresses reads of ``register_type`` may bridge or split.
+
+        Only words of registers found available (and neither known to be
+        missing nor quarantined) are safe to bridge: the firmware answers other
+        addresses with ILLEGAL DATA ADDRESS, which would fail the whole batch.
+        Blocks never start inside a multi-word register, so it is decoded from
+        one response.
+        """
+        missing = KNOWN_MISSING_REGISTERS.get(register_type, set())
+        mapping = self._register_maps.get(register_type, {})
+        readable: set[int] = set()
+        continuations: set[int] = set()
+        for name in self.available_registers.get(register_type, ()):
+            addr = mapping.get(name)
+            if addr is None or name in missing or name in self._quarantine_blocked:
+                continue
+            try:
+                length = max(1, _get_register_definition(name).length)
+            except (KeyError, AttributeError, TypeError):
+                length = 1
+            readable.update(range(addr, addr + length))
+            continuations.update(range(addr + 1, addr + length))
+        return {"readable": frozenset(readable), "continuations": frozenset(continuations)}
+
+    def _replan_reads_if_stale(self) -> bool:
+        """Regroup reads once measured read costs move the bridging threshold.
+
+        Returns True when the groups were rebuilt.
+        """
+        if self.safe_scan or not self._read_cost.calibrated:
+            return False
+        gap = min(self._read_cost.model().max_bridge_gap, self.effective_batch)
+        if abs(gap - self._read_cost_gap) <= 1:
+            return False
+        _LOGGER.debug(
+            "Read cost changed (bridge gap %d -> %d); regrouping", self._read_cost_gap, gap
+        )
+        self._plan_register_groups()
+        return True
+
+    def _apply_quarantine(self, now: float) -> bool:
+        """Regroup reads when registers entered or left quarantine.
+
+        Quarantined registers are left out of the read groups until their
+        re-probe time; at that point they are grouped again and the next read
+        acts as the probe.  Returns True when the groups were rebuilt.
+        """
+        blocked = self._quarantine.blocked(now)
+        if blocked == self._quarantine_blocked:
+            return False
+        _LOGGER.debug(
+            "Quarantined registers changed (%d -> %d); regrouping",
+            len(self._quarantine_blocked),
+            len(blocked),
         )
+        self._quarantine_blocked = blocked
+        self._plan_register_groups()
+        return True
+
+    def _record_read_failures(self, data: dict[str, Any], now: float) -> list[str]:
+        """Feed this cycle's failed registers into the quarantine.
+
+        ``data`` holds what the cycle read; when it is empty the link, not the
+        registers, is the likely culprit and only rejected reads count.
+        """
+        quarantined = self._quarantine.record(self._failure_reasons, now, link_ok=bool(data))
+        self._failure_reasons = {}
+        if quarantined:
+            _LOGGER.info(
+                "Quarantined %d register(s) until re-probe: %s",
+                len(quarantined),
+                ", ".join(sorted(quarantined)),
+            )
+        return quarantined
 
     # ------------------------------------------------------------------
     # IO mixin required helpers (satisfy _ModbusIOMixin protocol)
@@ -86,9 +219,27 @@ class _DeviceClientRegistersMixin:
         """Decode a raw register value via register-processing helpers."""
         return _process_register_value_impl(register_name, value)
 
-    def _mark_registers_failed(self, names: Iterable[str | None]) -> None:
+    def _register_value_decoder(self, register_name: str) -> Callable[[int], Any]:
+        """Return a one-argument decoder for ``register_name`` used by poll plans.
+
+        The compiled decoder is used unless ``_process_register_value`` was
+        replaced on this instance, in which case the replacement is honoured.
+        """
+        if "_process_register_value" not in vars(self):
+            decoder = _get_register_decoders_impl().get(register_name)
+            if decoder is not None:
+                return decoder
+        return partial(self._process_register_value, register_name)
+
+    def _mark_registers_failed(
+        self, names: Iterable[str | None], reason: str = QUARANTINE_REASON_ERROR
+    ) -> None:
         """Record registers that failed to read."""
-        mark_registers_failed(self, names)
+        mark_registers_failed(self, names, reason)
+
+    def _mark_registers_stale(self, names: Iterable[str | None]) -> None:
+        """Record registers the update cycle's deadline left unread."""
+        mark_registers_stale(self, names)
 
     def _clear_register_failure(self, name: str) -> None:
         """Remove register from failed list on successful read."""
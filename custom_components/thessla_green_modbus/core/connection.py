@@ -10,8 +10,8 @@ from typing import Any
 from pymodbus.exceptions import ConnectionException, ModbusException
 
 from ..transport.base import BaseModbusTransport
+from ..transport.mbap import RawModbusTcpTransport
 from ..transport.rtu import RtuModbusTransport
-from ..transport.tcp import TcpModbusTransport
 from ..transport.tcp_rtu import RawRtuOverTcpTransport
 
 
@@ -105,25 +105,20 @@ def build_tcp_transport(
     max_backoff: float,
     timeout: float,
     offline_state: bool,
-    connection_type_tcp: str,
     connection_mode_tcp_rtu: str,
 ) -> BaseModbusTransport:
-    """Build TCP or RTU-over-TCP transport for coordinator runtime settings."""
-
-    if mode == connection_mode_tcp_rtu:
-        return RawRtuOverTcpTransport(
-            host=host,
-            port=port,
-            max_retries=retry,
-            base_backoff=backoff,
-            max_backoff=max_backoff,
-            timeout=timeout,
-            offline_state=offline_state,
-        )
-    return TcpModbusTransport(
+    """Build TCP or RTU-over-TCP transport for coordinator runtime settings.
+
+    Plain Modbus TCP uses the native MBAP transport, which matches responses
+    by transaction ID and can keep several requests in flight.
+    """
+
+    transport_cls = (
+        RawRtuOverTcpTransport if mode == connection_mode_tcp_rtu else RawModbusTcpTransport
+    )
+    return transport_cls(
         host=host,
         port=port,
-        connection_type=connection_type_tcp,
         max_retries=retry,
         base_backoff=backoff,
         max_backoff=max_backoff,
@@ -168,7 +163,7 @@ async def ensure_transport_selected(
     connection_type_rtu: str,
     connection_mode_auto: str,
     connection_mode_tcp: str,
-    build_rtu_transport_fn: Callable[..., RtuModbusTransport],
+    build_rtu_transport_fn: Callable[..., BaseModbusTransport],
     build_tcp_transport_fn: Callable[[str], BaseModbusTransport],
     select_auto_transport_fn: Callable[
         [], Awaitable[tuple[BaseModbusTransport | None, str | None]]
@@ -0,0 +1,170 @@
+"""Per-phase timing of update cycles in fixed-bucket histograms.
+
+``average_response_time`` is one running mean over whole cycles: it neither
+shows which part of a cycle got slower nor the tail a slow link produces.
+:class:`PhaseTimings` keeps a :class:`LatencyHistogram` per phase (connect,
+each register group, decoding, post-processing, the whole cycle) and for
+the latency of single chunk requests.  Histograms have fixed bucket bounds,
+so they cost a few integer additions per sample however long the integration
+runs, and report p50/p95/p99 as the upper bound of the bucket holding them.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+PHASE_CONNECT = "connect"
+PHASE_INPUT = "input"
+PHASE_HOLDING = "holding"
+PHASE_COIL = "coil"
+PHASE_DISCRETE = "discrete"
+PHASE_DECODE = "decode"
+PHASE_POST_PROCESS = "post_process"
+PHASE_CYCLE = "cycle"
+PHASE_REQUEST = "request"
+
+TIMING_PHASES = (
+    PHASE_CONNECT,
+    PHASE_INPUT,
+    PHASE_HOLDING,
+    PHASE_COIL,
+    PHASE_DISCRETE,
+    PHASE_DECODE,
+    PHASE_POST_PROCESS,
+    PHASE_CYCLE,
+    PHASE_REQUEST,
+)
+
+#: Upper bucket bounds in milliseconds; slower samples land in an overflow bucket.
+BUCKET_BOUNDS_MS = (
+    1.0,
+    2.0,
+    5.0,
+    10.0,
+    20.0,
+    50.0,
+    100.0,
+    200.0,
+    500.0,
+    1000.0,
+    2000.0,
+    5000.0,
+    10000.0,
+    30000.0,
+    60000.0,
+)
+
+
+class LatencyHistogram:
+    """Counts of samples per fixed millisecond bucket."""
+
+    __slots__ = ("buckets", "count", "max_ms", "total_ms")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Add one sample of ``seconds``."""
+        ms = max(seconds, 0.0) * 1000
+        self.buckets[bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the bucket bound (ms) below which ``fraction`` of the samples fall."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, bucket in zip(BUCKET_BOUNDS_MS, self.buckets, strict=False):
+            seen += bucket
+            if seen >= rank:
+                return round(min(bound, self.max_ms), 3)
+        return round(self.max_ms, 3)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+        }
+
+
+class PhaseTimings:
+    """Histograms of update-cycle phases and chunk requests."""
+
+    __slots__ = ("histograms", "last_ms")
+
+    def __init__(self) -> None:
+        self.histograms = {phase: LatencyHistogram() for phase in TIMING_PHASES}
+        #: Duration of each phase in the latest cycle that ran it.
+        self.last_ms: dict[str, float] = {}
+
+    def observe(self, phase: str, seconds: float) -> None:
+        """Add a ``seconds`` sample to ``phase``."""
+        self.histograms[phase].observe(seconds)
+        self.last_ms[phase] = round(seconds * 1000, 3)
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Time the ``with`` block as one sample of ``phase``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - started)
+
+    def percentiles(self) -> dict[str, dict[str, float | None]]:
+        """Return p50/p95/p99 (ms) per phase."""
+        return {
+            phase: {
+                "p50_ms": hist.percentile(0.5),
+                "p95_ms": hist.percentile(0.95),
+                "p99_ms": hist.percentile(0.99),
+            }
+            for phase, hist in self.histograms.items()
+        }
+
+    def summary(self) -> dict[str, Any]:
+        """Return p50/p95/p99 per phase and the latest cycle's durations."""
+        return {
+            "buckets_ms": list(BUCKET_BOUNDS_MS),
+            "phases": {phase: hist.summary() for phase, hist in self.histograms.items()},
+            "last_cycle_ms": dict(self.last_ms),
+        }
+
+
+def phase_timings(device_client: Any) -> PhaseTimings | None:
+    """Return the phase timings kept in ``device_client.statistics``, if any."""
+    statistics = getattr(device_client, "statistics", None)
+    timings = statistics.get("phase_timings") if isinstance(statistics, dict) else None
+    return timings if isinstance(timings, PhaseTimings) else None
+
+
+__all__ = [
+    "BUCKET_BOUNDS_MS",
+    "PHASE_COIL",
+    "PHASE_CONNECT",
+    "PHASE_CYCLE",
+    "PHASE_DECODE",
+    "PHASE_DISCRETE",
+    "PHASE_HOLDING",
+    "PHASE_INPUT",
+    "PHASE_POST_PROCESS",
+    "PHASE_REQUEST",
+    "TIMING_PHASES",
+    "LatencyHistogram",
+    "PhaseTimings",
+    "phase_timings",
+]
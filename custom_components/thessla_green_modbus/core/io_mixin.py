@@ -6,11 +6,12 @@ and ThesslaGreenModbusCoordinator.  coordinator/io.py (shim) was removed.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Collection, Iterable
 from typing import TYPE_CHECKING, Any
 
 from pymodbus.exceptions import ConnectionException
 
+from ..const import QUARANTINE_REASON_ERROR
 from .read_batches import (
     execute_read_call as _execute_read_call_impl,
 )
@@ -69,14 +70,25 @@ class _ModbusIOMixin:
     _register_groups: dict[str, list[tuple[int, int]]]
     effective_batch: int
     _failed_registers: set[str]
+    _stale_registers: set[str]
+    _cycle_deadline: float | None
 
     async def _ensure_connection(self) -> None: ...
     def _find_register_name(self, register_type: str, address: int) -> str | None: ...
     def _process_register_value(self, register_name: str, value: int) -> Any: ...
+    def _mark_registers_stale(self, names: Iterable[str | None]) -> None: ...
     def _clear_register_failure(self, name: str) -> None: ...
-    def _mark_registers_failed(self, names: Iterable[str | None]) -> None: ...
+    def _mark_registers_failed(
+        self, names: Iterable[str | None], reason: str = QUARANTINE_REASON_ERROR
+    ) -> None: ...
     async def _read_coils_transport(
-        self, _slave_id: int, address: int, *, count: int, attempt: int = 1
+        self,
+        _slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
     ) -> Any:
         if not self.device_client.client:
             raise ConnectionException("Modbus client is not connected")
@@ -85,10 +97,17 @@ class _ModbusIOMixin:
             address,
             count=count,
             attempt=attempt,
+            deadline=deadline,
         )
 
     async def _read_discrete_inputs_transport(
-        self, _slave_id: int, address: int, *, count: int, attempt: int = 1
+        self,
+        _slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
     ) -> Any:
         if not self.device_client.client:
             raise ConnectionException("Modbus client is not connected")
@@ -97,6 +116,7 @@ class _ModbusIOMixin:
             address,
             count=count,
             attempt=attempt,
+            deadline=deadline,
         )
 
     async def _call_modbus(
@@ -104,8 +124,8 @@ class _ModbusIOMixin:
     ) -> Any:
         return await _call_modbus_impl(self, func, *args, attempt=attempt, **kwargs)
 
-    async def _read_all_register_data(self) -> dict[str, Any]:
-        return await _read_all_register_data_impl(self)
+    async def _read_all_register_data(self, deadline: float | None = None) -> dict[str, Any]:
+        return await _read_all_register_data_impl(self, deadline)
 
     async def _execute_read_call(
         self,
@@ -113,8 +133,11 @@ class _ModbusIOMixin:
         start_address: int,
         count: int,
         attempt: int,
+        deadline: float | None = None,
     ) -> Any:
-        return await _execute_read_call_impl(self, read_method, start_address, count, attempt)
+        return await _execute_read_call_impl(
+            self, read_method, start_address, count, attempt, deadline
+        )
 
     async def _disconnect_and_reconnect_for_retry(
         self,
@@ -169,6 +192,7 @@ class _ModbusIOMixin:
         count: int,
         *,
         register_type: str,
+        on_answer: Callable[[int, float], None] | None = None,
     ) -> Any:
         return await _read_with_retry_impl(
             self,
@@ -176,10 +200,13 @@ class _ModbusIOMixin:
             start_address,
             count,
             register_type=register_type,
+            on_answer=on_answer,
         )
 
-    async def _read_input_registers_optimized(self) -> dict[str, Any]:
-        return await _read_input_registers_optimized_impl(self)
+    async def _read_input_registers_optimized(
+        self, refresh_classes: Collection[str] | None = None
+    ) -> dict[str, Any]:
+        return await _read_input_registers_optimized_impl(self, refresh_classes)
 
     async def _read_holding_individually(
         self,
@@ -196,11 +223,17 @@ class _ModbusIOMixin:
             data,
         )
 
-    async def _read_holding_registers_optimized(self) -> dict[str, Any]:
-        return await _read_holding_registers_optimized_impl(self)
+    async def _read_holding_registers_optimized(
+        self, refresh_classes: Collection[str] | None = None
+    ) -> dict[str, Any]:
+        return await _read_holding_registers_optimized_impl(self, refresh_classes)
 
-    async def _read_coil_registers_optimized(self) -> dict[str, Any]:
-        return await _read_coil_registers_optimized_impl(self)
+    async def _read_coil_registers_optimized(
+        self, refresh_classes: Collection[str] | None = None
+    ) -> dict[str, Any]:
+        return await _read_coil_registers_optimized_impl(self, refresh_classes)
 
-    async def _read_discrete_inputs_optimized(self) -> dict[str, Any]:
-        return await _read_discrete_inputs_optimized_impl(self)
+    async def _read_discrete_inputs_optimized(
+        self, refresh_classes: Collection[str] | None = None
+    ) -> dict[str, Any]:
+        return await _read_discrete_inputs_optimized_impl(self, refresh_classes)
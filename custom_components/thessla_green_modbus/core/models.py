@@ -17,6 +17,7 @@ from ..const import (
     CONF_CONNECTION_TYPE,
     CONF_DEEP_SCAN,
     CONF_FORCE_FULL_REGISTER_LIST,
+    CONF_MAX_INFLIGHT_REQUESTS,
     CONF_MAX_REGISTERS_PER_REQUEST,
     CONF_PARITY,
     CONF_RETRY,
@@ -33,6 +34,7 @@ from ..const import (
     DEFAULT_BAUD_RATE,
     DEFAULT_CONNECTION_TYPE,
     DEFAULT_DEEP_SCAN,
+    DEFAULT_MAX_INFLIGHT_REQUESTS,
     DEFAULT_MAX_REGISTERS_PER_REQUEST,
     DEFAULT_NAME,
     DEFAULT_PARITY,
@@ -74,6 +76,7 @@ class CoordinatorConfig:
     baud_rate: int = DEFAULT_BAUD_RATE
     parity: str = DEFAULT_PARITY
     stop_bits: int = DEFAULT_STOP_BITS
+    max_inflight_requests: int = DEFAULT_MAX_INFLIGHT_REQUESTS
 
     @classmethod
     def from_entry(cls, entry: ConfigEntry | Any) -> CoordinatorConfig:
@@ -108,4 +111,7 @@ class CoordinatorConfig:
             baud_rate=int(data.get(CONF_BAUD_RATE, DEFAULT_BAUD_RATE)),
             parity=str(data.get(CONF_PARITY, DEFAULT_PARITY)),
             stop_bits=int(data.get(CONF_STOP_BITS, DEFAULT_STOP_BITS)),
+            max_inflight_requests=int(
+                options.get(CONF_MAX_INFLIGHT_REQUESTS, DEFAULT_MAX_INFLIGHT_REQUESTS)
+            ),
         )
@@ -0,0 +1,168 @@
+"""Precompiled, immutable poll plans for batched register reads.
+
+A poll plan resolves, once, everything the read loop previously recomputed on
+every cycle: the chunk layout of each register group, the register name at
+every chunk offset and the decoder for each available register.  The read loop
+then only zips response words against ``PlanChunk.slots``, whose decoders are
+the per-register closures compiled by ``register_processing``; multi-word
+registers get the slice of their words from the same response.
+
+Plans are cached on the device client and rebuilt only when their inputs
+(register groups and their refresh classes, batch size, availability or the
+owner's lookup/decode hooks) change.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, NamedTuple, cast
+
+from ..registers.read_planner import chunk_register_range
+from .register_processing import register_word_count
+
+PLANNED_REGISTER_TYPES: tuple[str, ...] = ("input_registers", "holding_registers")
+
+
+class PlanSlot(NamedTuple):
+    """Register decoded from the response word(s) at its chunk offset."""
+
+    name: str
+    decode: Callable[[Any], Any]
+    #: Words the register spans; multi-word registers decode the slice of
+    #: ``width`` words starting at their offset.
+    width: int = 1
+
+
+@dataclass(frozen=True, slots=True)
+class PlanChunk:
+    """One read request and the precomputed meaning of every returned word."""
+
+    start: int
+    count: int
+    #: Register name at every offset (``None`` for unnamed addresses), used by
+    #: the fallback and failure bookkeeping paths.
+    names: tuple[str | None, ...]
+    #: Named registers in the chunk; the chunk is skipped when all have failed.
+    known: tuple[str, ...]
+    #: Decoder slot per offset, ``None`` where the word is not polled.
+    slots: tuple[PlanSlot | None, ...]
+    #: Refresh class of the group the chunk belongs to; ``None`` is read
+    #: every cycle.
+    refresh: str | None = None
+    #: True when a slot spans several words (the read loop then slices).
+    wide: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class PollPlan:
+    """Immutable read plan for one register type."""
+
+    register_type: str
+    signature: tuple[Any, ...]
+    chunks: tuple[PlanChunk, ...]
+
+    @property
+    def request_count(self) -> int:
+        """Return the number of read requests issued per full cycle."""
+        return len(self.chunks)
+
+    def due_chunks(self, refresh_classes: Collection[str] | None) -> tuple[PlanChunk, ...]:
+        """Return the chunks to read when only ``refresh_classes`` are due."""
+        if refresh_classes is None:
+            return self.chunks
+        return tuple(
+            chunk
+            for chunk in self.chunks
+            if chunk.refresh is None or chunk.refresh in refresh_classes
+        )
+
+
+def _plan_signature(owner: Any, register_type: str, *, frozen: bool) -> tuple[Any, ...]:
+    """Return the inputs a plan for ``register_type`` depends on."""
+    device_client = owner.device_client
+    available = device_client.available_registers.get(register_type) or frozenset()
+    group_refresh = getattr(device_client, "_register_group_refresh", None) or {}
+    return (
+        tuple(device_client._register_groups.get(register_type, ())),
+        tuple(group_refresh.get(register_type, ())),
+        device_client.effective_batch,
+        frozenset(available) if frozen else available,
+        owner._find_register_name,
+        owner._process_register_value,
+    )
+
+
+def _slot_decoder_factory(
+    owner: Any, process_register_value: Callable[[str, int], Any]
+) -> Callable[[str], Callable[[int], Any]]:
+    """Return a ``name -> decoder`` factory for plan slots.
+
+    Owners exposing ``_register_value_decoder`` hand out precompiled decoders;
+    any other owner decodes through its ``_process_register_value`` hook.
+    """
+    factory = getattr(owner, "_register_value_decoder", None)
+    if callable(factory):
+        return cast(Callable[[str], Callable[[int], Any]], factory)
+    return lambda name: partial(process_register_value, name)
+
+
+def build_poll_plan(owner: Any, register_type: str) -> PollPlan:
+    """Build the poll plan for ``register_type`` from the owner's current state."""
+    signature = _plan_signature(owner, register_type, frozen=True)
+    groups, refresh, batch, available, find_register_name, process_register_value = signature
+    decoder_for = _slot_decoder_factory(owner, process_register_value)
+    if len(refresh) != len(groups):
+        refresh = (None,) * len(groups)
+
+    chunks: list[PlanChunk] = []
+    for (start_addr, count), refresh_class in zip(groups, refresh, strict=True):
+        for chunk_start, chunk_count in chunk_register_range(start_addr, count, batch):
+            names = tuple(
+                find_register_name(register_type, chunk_start + offset)
+                for offset in range(chunk_count)
+            )
+            slots = tuple(
+                PlanSlot(name, decoder_for(name), register_word_count(name))
+                if name and name in available
+                else None
+                for name in names
+            )
+            chunks.append(
+                PlanChunk(
+                    start=chunk_start,
+                    count=chunk_count,
+                    names=names,
+                    known=tuple(name for name in names if name),
+                    slots=slots,
+                    refresh=refresh_class,
+                    wide=any(slot is not None and slot.width > 1 for slot in slots),
+                )
+            )
+    return PollPlan(register_type=register_type, signature=signature, chunks=tuple(chunks))
+
+
+def poll_plan_for(owner: Any, register_type: str) -> PollPlan:
+    """Return the cached poll plan for ``register_type``, rebuilding it if stale."""
+    device_client = owner.device_client
+    plans = getattr(device_client, "_poll_plans", None)
+    if not isinstance(plans, dict):
+        plans = {}
+        device_client._poll_plans = plans
+
+    plan = plans.get(register_type)
+    if plan is None or plan.signature != _plan_signature(owner, register_type, frozen=False):
+        plan = build_poll_plan(owner, register_type)
+        plans[register_type] = plan
+    return plan
+
+
+def refresh_poll_plans(owner: Any) -> None:
+    """Rebuild poll plans for every grouped register type of ``owner``."""
+    device_client = owner.device_client
+    plans: dict[str, PollPlan] = {}
+    for register_type in PLANNED_REGISTER_TYPES:
+        if register_type in device_client._register_groups:
+            plans[register_type] = build_poll_plan(owner, register_type)
+    device_client._poll_plans = plans
@@ -0,0 +1,135 @@
+"""Quarantine of registers the device keeps failing to read.
+
+A register that fails is normally retried (batch read, then one-by-one
+fallback with full retries) on every poll cycle.  On units with missing
+modules this costs most of the cycle.  :class:`RegisterQuarantine` remembers
+which registers failed and why; the device client leaves quarantined
+registers out of its read groups until their re-probe time, which doubles
+with every failed probe.  Entries use wall-clock times so they can be
+persisted across restarts.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from ..const import (
+    QUARANTINE_BASE_DELAY,
+    QUARANTINE_MAX_DELAY,
+    QUARANTINE_REASON_REJECTED,
+    QUARANTINE_REASON_SKIPPED,
+    QUARANTINE_STRIKES,
+)
+
+
+@dataclass(slots=True)
+class QuarantineEntry:
+    """Why a register is quarantined and when to try it again."""
+
+    reason: str
+    failures: int
+    #: Wall-clock time (``time.time()``) of the next re-probe.
+    next_probe: float
+
+
+class RegisterQuarantine:
+    """Failed registers with an exponential re-probe schedule."""
+
+    def __init__(
+        self,
+        *,
+        base_delay: float = QUARANTINE_BASE_DELAY,
+        max_delay: float = QUARANTINE_MAX_DELAY,
+        strikes: int = QUARANTINE_STRIKES,
+    ) -> None:
+        """Initialize an empty quarantine."""
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.strikes = strikes
+        self.entries: dict[str, QuarantineEntry] = {}
+        #: Consecutive failed cycles of registers not (yet) quarantined.
+        self._strikes: dict[str, int] = {}
+        #: Set when entries changed since the last save.
+        self.dirty = False
+
+    def __len__(self) -> int:
+        """Return the number of quarantined registers."""
+        return len(self.entries)
+
+    def __contains__(self, name: object) -> bool:
+        """Return True when register ``name`` is quarantined."""
+        return name in self.entries
+
+    def delay(self, failures: int) -> float:
+        """Return the re-probe delay after ``failures`` failed attempts."""
+        return float(min(self.base_delay * 2 ** max(failures - 1, 0), self.max_delay))
+
+    def record(self, failures: Mapping[str, str], now: float, *, link_ok: bool = True) -> list[str]:
+        """Account one cycle's failed registers (name -> reason).
+
+        Rejected reads quarantine at once; other reasons only count when
+        ``link_ok`` (something else read fine this cycle) and quarantine after
+        ``strikes`` consecutive failed cycles.  A failed re-probe doubles the
+        delay.  Registers skipped by the retry budget were never read and do
+        not count.  Returns the registers (re-)quarantined.
+        """
+        quarantined = []
+        for name, reason in failures.items():
+            if reason == QUARANTINE_REASON_SKIPPED:
+                continue
+            rejected = reason == QUARANTINE_REASON_REJECTED
+            if not rejected and not link_ok:
+                continue
+            entry = self.entries.get(name)
+            if entry is None and not rejected:
+                strikes = self._strikes.get(name, 0) + 1
+                if strikes < self.strikes:
+                    self._strikes[name] = strikes
+                    continue
+            self._strikes.pop(name, None)
+            count = entry.failures + 1 if entry is not None else 1
+            self.entries[name] = QuarantineEntry(reason, count, now + self.delay(count))
+            quarantined.append(name)
+        if quarantined:
+            self.dirty = True
+        return quarantined
+
+    def release(self, name: str) -> bool:
+        """Forget failures of ``name`` after a successful read."""
+        self._strikes.pop(name, None)
+        if self.entries.pop(name, None) is None:
+            return False
+        self.dirty = True
+        return True
+
+    def blocked(self, now: float) -> frozenset[str]:
+        """Return registers that must not be read at ``now``."""
+        return frozenset(name for name, entry in self.entries.items() if entry.next_probe > now)
+
+    def clear(self) -> None:
+        """Forget every quarantined register."""
+        if self.entries:
+            self.dirty = True
+        self.entries.clear()
+        self._strikes.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the quarantine as JSON-serializable data."""
+        return {"entries": {name: asdict(entry) for name, entry in self.entries.items()}}
+
+    def load(self, data: Any) -> None:
+        """Restore entries saved by :meth:`as_dict`, skipping malformed ones."""
+        entries = data.get("entries") if isinstance(data, Mapping) else None
+        if not isinstance(entries, Mapping):
+            return
+        for name, raw in entries.items():
+            try:
+                entry = QuarantineEntry(
+                    str(raw["reason"]), int(raw["failures"]), float(raw["next_probe"])
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+            if isinstance(name, str) and entry.failures > 0:
+                self.entries[name] = entry
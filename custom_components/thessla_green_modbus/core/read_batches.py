@@ -1,25 +1,142 @@
 """Batch read helpers and shared low-level read infrastructure.
 
-Batched holding/input/coil reads plus the shared retry/error helpers (formerly
+Batched holding/input reads, the transport/client read selection shared with
+the coil/discrete reader, plus the shared retry/error helpers (formerly
 ``core/read_common.py``) used by the coordinator I/O mixin's read-retry paths.
 """
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
-from collections.abc import Callable
-from typing import Any
+import time
+from collections.abc import Awaitable, Callable, Collection, Iterable, Iterator, Sequence
+from functools import partial
+from typing import Any, cast
 
 from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
 
-from ..registers.read_planner import chunk_register_range
+from ..const import (
+    QUARANTINE_REASON_NO_DATA,
+    QUARANTINE_REASON_REJECTED,
+    QUARANTINE_REASON_SKIPPED,
+)
+from ..modbus.deadline import CycleDeadlineExceeded
+from .poll_plan import PlanChunk, PlanSlot, poll_plan_for
+from .read_cost import ReadCostEstimator
+from .register_processing import register_word_count
 from .retry import _PermanentModbusError
+from .retry_budget import RetryBudgetExhausted
 
 _LOGGER = logging.getLogger(__name__)
 ILLEGAL_DATA_ADDRESS = 2
 
 
+def resolve_inflight_window(owner: Any) -> int:
+    """Return how many chunk reads may be in flight at once for ``owner``.
+
+    The configured window is capped by the active transport's capability;
+    the legacy client path and disconnected transports always read one chunk
+    at a time.
+    """
+    transport = owner.device_client._transport
+    if transport is None or not transport.is_connected():
+        return 1
+    requested = int(getattr(owner.device_client, "max_inflight_requests", 1) or 1)
+    supported = int(getattr(transport, "max_inflight_requests", 1) or 1)
+    return max(1, min(requested, supported))
+
+
+def connected_read_method(
+    owner: Any, operation: str, fallback: Callable[..., Any] | None = None
+) -> Callable[..., Any] | None:
+    """Return the read call for ``operation`` (e.g. ``"read_coils"``) on the live link.
+
+    A connected transport serves every function code itself; otherwise the
+    legacy pymodbus client is called, through ``fallback`` when the owner has
+    its own wrapper.  Returns ``None`` when neither is connected.
+    """
+    transport = getattr(owner.device_client, "_transport", None)
+    if transport is not None and transport.is_connected():
+        return cast(Callable[..., Any], getattr(transport, operation))
+    client = owner.device_client.client
+    if client is None or not getattr(client, "connected", True):
+        return None
+    if fallback is not None:
+        return fallback
+
+    async def read_method(
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        return await owner._call_modbus(
+            getattr(client, operation),
+            address,
+            count=count,
+            attempt=attempt,
+            deadline=deadline,
+        )
+
+    return read_method
+
+
+class _RequestTime:
+    """``on_answer`` callback keeping the time of a request answered at once."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self) -> None:
+        self.seconds: float | None = None
+
+    def __call__(self, attempt: int, seconds: float) -> None:
+        # Retried reads also spent time on backoff and reconnects.
+        self.seconds = seconds if attempt == 1 else None
+
+
+def _observe_read_cost(owner: Any, words: int, request: _RequestTime, window: int) -> None:
+    """Feed the duration of a complete batch read into the read cost model.
+
+    Only a request answered on its first attempt with no other request in
+    flight is timed: pipelined requests queue behind each other on the link.
+    """
+    estimator = getattr(owner.device_client, "_read_cost", None)
+    if window == 1 and request.seconds is not None and isinstance(estimator, ReadCostEstimator):
+        estimator.observe(words, request.seconds)
+
+
+async def _dispatch_chunk_reads(jobs: list[Callable[[], Awaitable[None]]], window: int) -> None:
+    """Run chunk read jobs sequentially or with up to ``window`` requests in flight.
+
+    Each job carries its own fallback and failure handling, so only errors
+    that abort the whole cycle (e.g. ``ConnectionException``) escape.  The
+    first such error cancels the remaining jobs and is re-raised unchanged.
+    """
+    if window <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            await job()
+        return
+
+    semaphore = asyncio.Semaphore(window)
+
+    async def _bounded(job: Callable[[], Awaitable[None]]) -> None:
+        async with semaphore:
+            await job()
+
+    tasks = [asyncio.ensure_future(_bounded(job)) for job in jobs]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 async def _read_holding_fallback(
     owner: Any,
     read_method: Any,
@@ -35,25 +152,81 @@ async def _read_holding_fallback(
     await read_holding_individually(owner, read_method, chunk_start, register_names, data)
 
 
+def _wide_slot_values(
+    owner: Any, chunk: PlanChunk, registers: Sequence[int]
+) -> Iterator[tuple[PlanSlot | None, Any]]:
+    """Yield ``(slot, raw value)`` per offset, slicing out multi-word registers.
+
+    A multi-word register cut short by a partial response is marked failed.
+    """
+    available = len(registers)
+    for offset, slot in enumerate(chunk.slots[:available]):
+        if slot is None or slot.width == 1:
+            yield slot, registers[offset]
+            continue
+        end = offset + slot.width
+        if end > available:
+            owner._mark_registers_failed([slot.name], QUARANTINE_REASON_NO_DATA)
+            continue
+        yield slot, registers[offset:end]
+
+
+def _unread_offset(chunk: PlanChunk, answered: int) -> int:
+    """Return the first offset of ``chunk`` a response of ``answered`` words left unread.
+
+    A multi-word register the response cut short counts as unread from its
+    first word, so the fallback reads it whole.
+    """
+    if chunk.wide:
+        for offset, slot in enumerate(chunk.slots[:answered]):
+            if slot is not None and offset + slot.width > answered:
+                return offset
+    return answered
+
+
+def _unread_names(chunk: PlanChunk, offset: int) -> list[str | None]:
+    """Return the register names to read one by one from ``offset`` onwards.
+
+    In a chunk with multi-word registers only the first word of each is
+    named, so the continuation words are not read as registers of their own.
+    """
+    if not chunk.wide:
+        return list(chunk.names[offset:])
+    return [slot.name if slot is not None else None for slot in chunk.slots[offset:]]
+
+
 def _merge_batch_read_results(
     owner: Any,
     response: Any,
-    chunk_start: int,
+    chunk: PlanChunk,
     data: dict[str, Any],
 ) -> None:
-    """Merge successfully-read batch register values into data."""
-    for i, value in enumerate(response.registers):
-        addr = chunk_start + i
-        register_name = owner._find_register_name("input_registers", addr)
-        if (
-            register_name
-            and register_name in owner.device_client.available_registers["input_registers"]
-        ):
-            processed_value = owner._process_register_value(register_name, value)
-            if processed_value is not None:
-                data[register_name] = processed_value
-                owner.device_client.statistics["total_registers_read"] += 1
-                owner._clear_register_failure(register_name)
+    """Merge successfully-read batch register values into data.
+
+    Multi-word registers decode the slice of their words; one cut short by a
+    partial response is marked failed.  The time spent is added to the
+    device client's ``_decode_seconds`` of the running cycle.
+    """
+    started = time.perf_counter()
+    device_client = owner.device_client
+    statistics = device_client.statistics
+    registers = response.registers
+    slot_values: Iterable[tuple[PlanSlot | None, Any]] = (
+        _wide_slot_values(owner, chunk, registers)
+        if chunk.wide
+        else zip(chunk.slots, registers, strict=False)
+    )
+    for slot, value in slot_values:
+        if slot is None:
+            continue
+        processed_value = slot.decode(value)
+        if processed_value is not None:
+            data[slot.name] = processed_value
+            statistics["total_registers_read"] += 1
+            owner._clear_register_failure(slot.name)
+    decoded = getattr(device_client, "_decode_seconds", None)
+    if isinstance(decoded, float):
+        device_client._decode_seconds = decoded + time.perf_counter() - started
 
 
 async def _fallback_individual_input_reads(
@@ -68,20 +241,28 @@ async def _fallback_individual_input_reads(
         if not reg_name:
             continue
         addr = chunk_start + idx
+        words = register_word_count(reg_name)
         try:
-            single = await owner._read_with_retry(read_method, addr, 1, register_type="input")
-            if single.registers:
-                pv = owner._process_register_value(reg_name, single.registers[0])
+            single = await owner._read_with_retry(read_method, addr, words, register_type="input")
+            if len(single.registers) >= words:
+                raw = single.registers[0] if words == 1 else single.registers[:words]
+                pv = owner._process_register_value(reg_name, raw)
                 if pv is not None:
                     data[reg_name] = pv
                     owner.device_client.statistics["total_registers_read"] += 1
                     owner._clear_register_failure(reg_name)
                 else:
-                    owner._mark_registers_failed([reg_name])
+                    owner._mark_registers_failed([reg_name], QUARANTINE_REASON_NO_DATA)
             else:
-                owner._mark_registers_failed([reg_name])
+                owner._mark_registers_failed([reg_name], QUARANTINE_REASON_NO_DATA)
         except _PermanentModbusError:
-            owner._mark_registers_failed([reg_name])
+            owner._mark_registers_failed([reg_name], QUARANTINE_REASON_REJECTED)
+        except CycleDeadlineExceeded:
+            owner._mark_registers_stale(register_names[idx:])
+            return
+        except RetryBudgetExhausted:
+            owner._mark_registers_failed(register_names[idx:], QUARANTINE_REASON_SKIPPED)
+            return
         except (ModbusException, ConnectionException, TimeoutError, OSError, ValueError):
             owner._mark_registers_failed([reg_name])
 
@@ -102,75 +283,86 @@ async def _handle_batch_read_failure(
         )
     else:
         missing = register_names[len(response.registers) :]
-        owner._mark_registers_failed(missing)
+        owner._mark_registers_failed(missing, QUARANTINE_REASON_NO_DATA)
 
 
 async def _read_input_register_batch(
     owner: Any,
     read_method: Any,
-    chunk_start: int,
-    chunk_count: int,
-    register_names: list[str | None],
+    chunk: PlanChunk,
     data: dict[str, Any],
     failed: set[str],
+    *,
+    window: int = 1,
 ) -> None:
-    """Read one input register chunk, with fallback on partial or empty response."""
-    if all(name in failed for name in register_names if name):
+    """Read one input register chunk, with fallback on partial or empty response.
+
+    A chunk rejected with ILLEGAL DATA ADDRESS is read register by register,
+    so only the addresses the device rejects on their own are quarantined.
+    ``window`` is the number of chunk reads the cycle keeps in flight.
+    """
+    if all(name in failed for name in chunk.known):
         return
     try:
+        request = _RequestTime()
         response = await owner._read_with_retry(
-            read_method, chunk_start, chunk_count, register_type="input"
+            read_method, chunk.start, chunk.count, register_type="input", on_answer=request
         )
-        _merge_batch_read_results(owner, response, chunk_start, data)
-        if len(response.registers) < chunk_count:
+        if len(response.registers) == chunk.count:
+            _observe_read_cost(owner, chunk.count, request, window)
+        _merge_batch_read_results(owner, response, chunk, data)
+        if len(response.registers) < chunk.count:
             await _handle_batch_read_failure(
-                owner, response, chunk_count, register_names, read_method, chunk_start, data
+                owner,
+                response,
+                chunk.count,
+                list(chunk.names),
+                read_method,
+                chunk.start,
+                data,
             )
     except _PermanentModbusError:
-        owner._mark_registers_failed(register_names)
+        if len(chunk.known) > 1:
+            await _fallback_individual_input_reads(
+                owner, read_method, chunk.start, _unread_names(chunk, 0), data
+            )
+        else:
+            owner._mark_registers_failed(list(chunk.names), QUARANTINE_REASON_REJECTED)
+    except CycleDeadlineExceeded:
+        owner._mark_registers_stale(chunk.names)
+    except RetryBudgetExhausted:
+        owner._mark_registers_failed(list(chunk.names), QUARANTINE_REASON_SKIPPED)
     except ConnectionException:
         raise
     except (ModbusException, TimeoutError, OSError, ValueError):
-        owner._mark_registers_failed(register_names)
+        owner._mark_registers_failed(list(chunk.names))
+
 
+async def read_input_registers_optimized(
+    owner: Any, refresh_classes: Collection[str] | None = None
+) -> dict[str, Any]:
+    """Read input registers using optimized batch reading.
 
-async def read_input_registers_optimized(owner: Any) -> dict[str, Any]:
-    """Read input registers using optimized batch reading."""
+    Only chunks whose refresh class is in ``refresh_classes`` are read;
+    ``None`` reads the whole plan.
+    """
     data: dict[str, Any] = {}
 
     if "input_registers" not in owner.device_client._register_groups:
         return data
 
-    transport = owner.device_client._transport
-    client = owner.device_client.client
-    if transport is not None and transport.is_connected():
-        read_method = transport.read_input_registers
-    elif client is not None and getattr(client, "connected", True):
-
-        async def read_method(slave_id: int, address: int, *, count: int, attempt: int = 1) -> Any:
-            return await owner._call_modbus(
-                client.read_input_registers,
-                address,
-                count=count,
-                attempt=attempt,
-            )
-    else:
+    read_method = connected_read_method(owner, "read_input_registers")
+    if read_method is None:
         raise ConnectionException("Modbus client is not connected")
 
     failed: set[str] = getattr(owner, "_failed_registers", set())
+    window = resolve_inflight_window(owner)
+    jobs: list[Callable[[], Awaitable[None]]] = [
+        partial(_read_input_register_batch, owner, read_method, chunk, data, failed, window=window)
+        for chunk in poll_plan_for(owner, "input_registers").due_chunks(refresh_classes)
+    ]
 
-    for start_addr, count in owner.device_client._register_groups["input_registers"]:
-        for chunk_start, chunk_count in chunk_register_range(
-            start_addr, count, owner.device_client.effective_batch
-        ):
-            register_names = [
-                owner._find_register_name("input_registers", chunk_start + i)
-                for i in range(chunk_count)
-            ]
-            await _read_input_register_batch(
-                owner, read_method, chunk_start, chunk_count, register_names, data, failed
-            )
-
+    await _dispatch_chunk_reads(jobs, window)
     return data
 
 
@@ -186,103 +378,119 @@ async def read_holding_individually(
         if not reg_name:
             continue
         addr = chunk_start + idx
+        words = register_word_count(reg_name)
         try:
-            single = await owner._read_with_retry(read_method, addr, 1, register_type="holding")
-            if single.registers:
-                pv = owner._process_register_value(reg_name, single.registers[0])
+            single = await owner._read_with_retry(read_method, addr, words, register_type="holding")
+            if len(single.registers) >= words:
+                raw = single.registers[0] if words == 1 else single.registers[:words]
+                pv = owner._process_register_value(reg_name, raw)
                 if pv is not None:
                     data[reg_name] = pv
                     owner.device_client.statistics["total_registers_read"] += 1
                     owner._clear_register_failure(reg_name)
                 else:
-                    owner._mark_registers_failed([reg_name])
+                    owner._mark_registers_failed([reg_name], QUARANTINE_REASON_NO_DATA)
             else:
-                owner._mark_registers_failed([reg_name])
+                owner._mark_registers_failed([reg_name], QUARANTINE_REASON_NO_DATA)
         except _PermanentModbusError:
-            owner._mark_registers_failed([reg_name])
+            owner._mark_registers_failed([reg_name], QUARANTINE_REASON_REJECTED)
+        except CycleDeadlineExceeded:
+            owner._mark_registers_stale(register_names[idx:])
+            return
+        except RetryBudgetExhausted:
+            owner._mark_registers_failed(register_names[idx:], QUARANTINE_REASON_SKIPPED)
+            return
         except ConnectionException:
             raise
         except (ModbusException, TimeoutError, OSError, ValueError):
             owner._mark_registers_failed([reg_name])
 
 
-async def read_holding_registers_optimized(owner: Any) -> dict[str, Any]:
-    """Read holding registers using optimized batch reading."""
+async def _read_holding_register_batch(
+    owner: Any,
+    read_method: Any,
+    chunk: PlanChunk,
+    data: dict[str, Any],
+    failed: set[str],
+    *,
+    window: int = 1,
+) -> None:
+    """Read one holding register chunk, falling back to single reads on failure.
+
+    A chunk rejected with ILLEGAL DATA ADDRESS is read register by register
+    too, so only the addresses the device rejects on their own are
+    quarantined.  ``window`` is the number of chunk reads the cycle keeps in
+    flight.
+    """
+    if all(name in failed for name in chunk.known):
+        return
+    try:
+        request = _RequestTime()
+        response = await owner._read_with_retry(
+            read_method,
+            chunk.start,
+            chunk.count,
+            register_type="holding",
+            on_answer=request,
+        )
+        if len(response.registers) == chunk.count:
+            _observe_read_cost(owner, chunk.count, request, window)
+        _merge_batch_read_results(owner, response, chunk, data)
+
+        if len(response.registers) < chunk.count:
+            tail_offset = _unread_offset(chunk, len(response.registers))
+            await _read_holding_fallback(
+                owner,
+                read_method,
+                chunk.start + tail_offset,
+                _unread_names(chunk, tail_offset),
+                data,
+            )
+    except _PermanentModbusError:
+        if len(chunk.known) > 1:
+            await _read_holding_fallback(
+                owner, read_method, chunk.start, _unread_names(chunk, 0), data
+            )
+        else:
+            owner._mark_registers_failed(list(chunk.names), QUARANTINE_REASON_REJECTED)
+    except CycleDeadlineExceeded:
+        owner._mark_registers_stale(chunk.names)
+    except RetryBudgetExhausted:
+        owner._mark_registers_failed(list(chunk.names), QUARANTINE_REASON_SKIPPED)
+    except ConnectionException:
+        raise
+    except (ModbusException, TimeoutError, OSError, ValueError):
+        await _read_holding_fallback(owner, read_method, chunk.start, _unread_names(chunk, 0), data)
+
+
+async def read_holding_registers_optimized(
+    owner: Any, refresh_classes: Collection[str] | None = None
+) -> dict[str, Any]:
+    """Read holding registers using optimized batch reading.
+
+    Only chunks whose refresh class is in ``refresh_classes`` are read;
+    ``None`` reads the whole plan.
+    """
     data: dict[str, Any] = {}
 
     if "holding_registers" not in owner.device_client._register_groups:
         return data
 
-    transport = owner.device_client._transport
-    client = owner.device_client.client
-    if transport is not None and transport.is_connected():
-        read_method = transport.read_holding_registers
-    elif client is not None and getattr(client, "connected", True):
-
-        async def read_method(slave_id: int, address: int, *, count: int, attempt: int = 1) -> Any:
-            return await owner._call_modbus(
-                client.read_holding_registers,
-                address,
-                count=count,
-                attempt=attempt,
-            )
-    else:
+    read_method = connected_read_method(owner, "read_holding_registers")
+    if read_method is None:
         _LOGGER.debug("Modbus client is not connected")
         return data
 
     failed: set[str] = getattr(owner, "_failed_registers", set())
+    window = resolve_inflight_window(owner)
+    jobs: list[Callable[[], Awaitable[None]]] = [
+        partial(
+            _read_holding_register_batch, owner, read_method, chunk, data, failed, window=window
+        )
+        for chunk in poll_plan_for(owner, "holding_registers").due_chunks(refresh_classes)
+    ]
 
-    for start_addr, count in owner.device_client._register_groups["holding_registers"]:
-        for chunk_start, chunk_count in chunk_register_range(
-            start_addr, count, owner.device_client.effective_batch
-        ):
-            register_names = [
-                owner._find_register_name("holding_registers", chunk_start + i)
-                for i in range(chunk_count)
-            ]
-            if all(name in failed for name in register_names if name):
-                continue
-            try:
-                response = await owner._read_with_retry(
-                    read_method,
-                    chunk_start,
-                    chunk_count,
-                    register_type="holding",
-                )
-
-                for i, value in enumerate(response.registers):
-                    addr = chunk_start + i
-                    register_name = owner._find_register_name("holding_registers", addr)
-                    if (
-                        register_name
-                        and register_name
-                        in owner.device_client.available_registers["holding_registers"]
-                    ):
-                        processed_value = owner._process_register_value(register_name, value)
-                        if processed_value is not None:
-                            data[register_name] = processed_value
-                            owner.device_client.statistics["total_registers_read"] += 1
-                            owner._clear_register_failure(register_name)
-
-                if len(response.registers) < chunk_count:
-                    if len(response.registers) == 0:
-                        await _read_holding_fallback(
-                            owner, read_method, chunk_start, register_names, data
-                        )
-                    else:
-                        tail_offset = len(response.registers)
-                        tail_names = register_names[tail_offset:]
-                        tail_start = chunk_start + tail_offset
-                        await _read_holding_fallback(
-                            owner, read_method, tail_start, tail_names, data
-                        )
-            except _PermanentModbusError:
-                owner._mark_registers_failed(register_names)
-            except ConnectionException:
-                raise
-            except (ModbusException, TimeoutError, OSError, ValueError):
-                await _read_holding_fallback(owner, read_method, chunk_start, register_names, data)
-
+    await _dispatch_chunk_reads(jobs, window)
     return data
 
 
@@ -308,13 +516,20 @@ async def execute_read_call(
     start_address: int,
     count: int,
     attempt: int,
+    deadline: float | None = None,
 ) -> Any:
-    """Execute one read attempt with method fallback through `_call_modbus`."""
+    """Execute one read attempt with method fallback through `_call_modbus`.
+
+    An update-cycle ``deadline`` is only passed on when set, so read methods
+    without deadline support keep working outside a cycle.
+    """
+    extra: dict[str, Any] = {} if deadline is None else {"deadline": deadline}
     call_result = read_method(
         device_client.slave_id,
         start_address,
         count=count,
         attempt=attempt,
+        **extra,
     )
     if call_result is None:
         call_result = device_client._call_modbus(
@@ -322,6 +537,7 @@ async def execute_read_call(
             start_address,
             count=count,
             attempt=attempt,
+            **extra,
         )
     return await call_result if inspect.isawaitable(call_result) else call_result
 
@@ -2,67 +2,77 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Collection
 from typing import Any
 
 from pymodbus.exceptions import ConnectionException, ModbusException
 
+from ..const import (
+    QUARANTINE_REASON_NO_DATA,
+    QUARANTINE_REASON_REJECTED,
+    QUARANTINE_REASON_SKIPPED,
+)
+from ..modbus.deadline import CycleDeadlineExceeded
 from ..registers.read_planner import chunk_register_range
+from .read_batches import connected_read_method
+from .register_groups import due_register_groups
 from .retry import _PermanentModbusError
+from .retry_budget import RetryBudgetExhausted
 
 
-async def read_coil_registers_optimized(owner: Any) -> dict[str, Any]:
-    """Read coil registers using optimized batch reading."""
+async def _read_bit_registers(
+    owner: Any,
+    register_group: str,
+    read_method: Callable[..., Any],
+    register_type: str,
+    refresh_classes: Collection[str] | None,
+) -> dict[str, Any]:
+    """Read the due ``register_group`` chunks through ``read_method``."""
     data: dict[str, Any] = {}
-
-    if "coil_registers" not in owner.device_client._register_groups:
-        return data
-
-    client = owner.device_client.client
-    if client is None or not getattr(client, "connected", True):
-        raise ConnectionException("Modbus client is not connected")
-
     failed: set[str] = getattr(owner, "_failed_registers", set())
+    available = owner.device_client.available_registers[register_group]
 
-    for start_addr, count in owner.device_client._register_groups["coil_registers"]:
+    for start_addr, count in due_register_groups(
+        owner.device_client, register_group, refresh_classes
+    ):
         for chunk_start, chunk_count in chunk_register_range(
             start_addr, count, owner.device_client.effective_batch
         ):
             register_names = [
-                owner._find_register_name("coil_registers", chunk_start + i)
+                owner._find_register_name(register_group, chunk_start + i)
                 for i in range(chunk_count)
             ]
             if all(name in failed for name in register_names if name):
                 continue
             try:
                 response = await owner._read_with_retry(
-                    owner._read_coils_transport,
+                    read_method,
                     chunk_start,
                     chunk_count,
-                    register_type="coil",
+                    register_type=register_type,
                 )
 
                 if not response.bits:
                     owner._mark_registers_failed(register_names)
                     raise ModbusException(f"No bits returned at {chunk_start}")
 
-                for i in range(min(chunk_count, len(response.bits))):
-                    addr = chunk_start + i
-                    register_name = owner._find_register_name("coil_registers", addr)
-                    if (
-                        register_name
-                        and register_name
-                        in owner.device_client.available_registers["coil_registers"]
-                    ):
-                        bit = response.bits[i]
+                for register_name, bit in zip(register_names, response.bits, strict=False):
+                    if register_name and register_name in available:
                         data[register_name] = bit
                         owner.device_client.statistics["total_registers_read"] += 1
                         owner._clear_register_failure(register_name)
 
                 if len(response.bits) < chunk_count:
                     missing = register_names[len(response.bits) :]
-                    owner._mark_registers_failed(missing)
+                    owner._mark_registers_failed(missing, QUARANTINE_REASON_NO_DATA)
             except _PermanentModbusError:
-                owner._mark_registers_failed(register_names)
+                owner._mark_registers_failed(register_names, QUARANTINE_REASON_REJECTED)
+                continue
+            except CycleDeadlineExceeded:
+                owner._mark_registers_stale(register_names)
+                continue
+            except RetryBudgetExhausted:
+                owner._mark_registers_failed(register_names, QUARANTINE_REASON_SKIPPED)
                 continue
             except (ModbusException, ConnectionException, TimeoutError, OSError, ValueError):
                 owner._mark_registers_failed(register_names)
@@ -71,62 +81,39 @@ async def read_coil_registers_optimized(owner: Any) -> dict[str, Any]:
     return data
 
 
-async def read_discrete_inputs_optimized(owner: Any) -> dict[str, Any]:
-    """Read discrete input registers using optimized batch reading."""
-    data: dict[str, Any] = {}
+async def read_coil_registers_optimized(
+    owner: Any, refresh_classes: Collection[str] | None = None
+) -> dict[str, Any]:
+    """Read coil registers using optimized batch reading.
 
-    if "discrete_inputs" not in owner.device_client._register_groups:
-        return data
+    Only groups whose refresh class is in ``refresh_classes`` are read;
+    ``None`` reads every group.
+    """
+    if "coil_registers" not in owner.device_client._register_groups:
+        return {}
 
-    client = owner.device_client.client
-    if client is None or not getattr(client, "connected", True):
+    read_method = connected_read_method(owner, "read_coils", owner._read_coils_transport)
+    if read_method is None:
         raise ConnectionException("Modbus client is not connected")
+    return await _read_bit_registers(owner, "coil_registers", read_method, "coil", refresh_classes)
 
-    failed: set[str] = getattr(owner, "_failed_registers", set())
-
-    for start_addr, count in owner.device_client._register_groups["discrete_inputs"]:
-        for chunk_start, chunk_count in chunk_register_range(
-            start_addr, count, owner.device_client.effective_batch
-        ):
-            register_names = [
-                owner._find_register_name("discrete_inputs", chunk_start + i)
-                for i in range(chunk_count)
-            ]
-            if all(name in failed for name in register_names if name):
-                continue
-            try:
-                response = await owner._read_with_retry(
-                    owner._read_discrete_inputs_transport,
-                    chunk_start,
-                    chunk_count,
-                    register_type="discrete",
-                )
-
-                if not response.bits:
-                    owner._mark_registers_failed(register_names)
-                    raise ModbusException(f"No bits returned at {chunk_start}")
 
-                for i in range(min(chunk_count, len(response.bits))):
-                    addr = chunk_start + i
-                    register_name = owner._find_register_name("discrete_inputs", addr)
-                    if (
-                        register_name
-                        and register_name
-                        in owner.device_client.available_registers["discrete_inputs"]
-                    ):
-                        bit = response.bits[i]
-                        data[register_name] = bit
-                        owner.device_client.statistics["total_registers_read"] += 1
-                        owner._clear_register_failure(register_name)
+async def read_discrete_inputs_optimized(
+    owner: Any, refresh_classes: Collection[str] | None = None
+) -> dict[str, Any]:
+    """Read discrete input registers using optimized batch reading.
 
-                if len(response.bits) < chunk_count:
-                    missing = register_names[len(response.bits) :]
-                    owner._mark_registers_failed(missing)
-            except _PermanentModbusError:
-                owner._mark_registers_failed(register_names)
-                continue
-            except (ModbusException, ConnectionException, TimeoutError, OSError, ValueError):
-                owner._mark_registers_failed(register_names)
-                raise
+    Only groups whose refresh class is in ``refresh_classes`` are read;
+    ``None`` reads every group.
+    """
+    if "discrete_inputs" not in owner.device_client._register_groups:
+        return {}
 
-    return data
+    read_method = connected_read_method(
+        owner, "read_discrete_inputs", owner._read_discrete_inputs_transport
+    )
+    if read_method is None:
+        raise ConnectionException("Modbus client is not connected")
+    return await _read_bit_registers(
+        owner, "discrete_inputs", read_method, "discrete", refresh_classes
+    )
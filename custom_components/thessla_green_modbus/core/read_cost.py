@@ -0,0 +1,68 @@
+"""Measured read cost model used to plan batched register reads.
+
+Every successful batch read reports how many words it returned and how long
+the request took.  A decaying least-squares fit of ``seconds = latency +
+words * word_time`` turns those samples into the :class:`ReadCostModel` that
+``coalesce_reads`` uses to decide whether bridging a hole between polled
+registers is cheaper than one more request.
+"""
+
+from __future__ import annotations
+
+from ..registers.read_planner import ReadCostModel
+
+# Minimum per-word time: keeps the model finite when noise hides the slope.
+_MIN_WORD_TIME = 1e-6
+# Reads must vary in size (std. dev. of half a word) before a slope is fitted.
+_MIN_WORD_VARIANCE = 0.25
+
+
+class ReadCostEstimator:
+    """Decaying linear fit of batch read time against words read."""
+
+    def __init__(self, *, min_samples: int = 16, decay: float = 0.98) -> None:
+        """Initialize an empty estimator."""
+        self.min_samples = min_samples
+        self.decay = decay
+        self.samples = 0
+        self._weight = 0.0
+        self._sum_words = 0.0
+        self._sum_seconds = 0.0
+        self._sum_words_sq = 0.0
+        self._sum_words_seconds = 0.0
+
+    def observe(self, words: int, seconds: float) -> None:
+        """Record one successful read of ``words`` words taking ``seconds``."""
+        if words <= 0 or seconds < 0:
+            return
+        decay = self.decay
+        self.samples += 1
+        self._weight = self._weight * decay + 1.0
+        self._sum_words = self._sum_words * decay + words
+        self._sum_seconds = self._sum_seconds * decay + seconds
+        self._sum_words_sq = self._sum_words_sq * decay + words * words
+        self._sum_words_seconds = self._sum_words_seconds * decay + words * seconds
+
+    @property
+    def calibrated(self) -> bool:
+        """Return True once reads of different sizes have been timed often enough."""
+        return self.samples >= self.min_samples and self._variance() > _MIN_WORD_VARIANCE
+
+    def _variance(self) -> float:
+        """Return the weighted variance of the words per timed read."""
+        if not self._weight:
+            return 0.0
+        mean_words = self._sum_words / self._weight
+        return self._sum_words_sq / self._weight - mean_words * mean_words
+
+    def model(self) -> ReadCostModel:
+        """Return the fitted cost model, or the default one until calibrated."""
+        if not self.calibrated:
+            return ReadCostModel()
+        weight = self._weight
+        mean_words = self._sum_words / weight
+        mean_seconds = self._sum_seconds / weight
+        covariance = self._sum_words_seconds / weight - mean_words * mean_seconds
+        word_time = max(covariance / self._variance(), _MIN_WORD_TIME)
+        latency = max(mean_seconds - word_time * mean_words, 0.0)
+        return ReadCostModel(request_latency=latency, word_time=word_time)
@@ -0,0 +1,104 @@
+"""Tiered poll schedule: which refresh classes a poll cycle has to read.
+
+``compute_register_groups`` groups registers per refresh class (see
+``registers/refresh.py``).  Each update cycle asks the device client's
+:class:`RefreshSchedule` which classes are due, reads only their groups and
+carries forward the last values of every class that was skipped.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..const import (
+    DEFAULT_SCAN_INTERVAL,
+    REFRESH_CLASS_INTERVALS,
+    REFRESH_CLASSES,
+    REFRESH_ONCE,
+)
+
+
+@dataclass
+class RefreshSchedule:
+    """Per-class read bookkeeping for one device client."""
+
+    scan_interval: float = DEFAULT_SCAN_INTERVAL
+    #: Monotonic time of the last completed read per refresh class.
+    last_read: dict[str, float] = field(default_factory=dict)
+    #: Register values of the last cycle, before post-processing.
+    values: dict[str, Any] = field(default_factory=dict)
+    #: Monotonic time of the last write per refresh class, until a cycle reads it.
+    written: dict[str, float] = field(default_factory=dict)
+
+    def is_due(self, refresh_class: str, now: float) -> bool:
+        """Return True when ``refresh_class`` has to be read at ``now``."""
+        interval = REFRESH_CLASS_INTERVALS.get(refresh_class, 0)
+        last = self.last_read.get(refresh_class)
+        if interval is None:
+            return last is None
+        if last is None or interval <= self.scan_interval:
+            return True
+        # Half a tick of slack keeps timer jitter from pushing a read one
+        # whole scan interval late.
+        return now - last >= interval - self.scan_interval / 2
+
+    def due(self, now: float) -> frozenset[str]:
+        """Return the refresh classes to read in a cycle starting at ``now``."""
+        return frozenset(name for name in REFRESH_CLASSES if self.is_due(name, now))
+
+    def complete(
+        self,
+        due: frozenset[str],
+        data: dict[str, Any],
+        *,
+        register_refresh: Mapping[str, str],
+        failed: Iterable[str],
+        now: float,
+        stale: Collection[str] = (),
+    ) -> dict[str, Any]:
+        """Record a finished cycle and return ``data`` merged with skipped classes.
+
+        Values of classes that were not due are carried over from the previous
+        cycle; registers of due classes only appear when they were read now.
+        ``stale`` registers, left unread when the cycle ran out of time, keep
+        their previous value too.  A once-per-session class stays due until
+        all its registers read; any class with stale registers stays due, and
+        so does a class written while the cycle ran (it may have been read
+        before the write).
+        """
+        for name, value in self.values.items():
+            refresh_class = register_refresh.get(name)
+            if (refresh_class is not None and refresh_class not in due) or name in stale:
+                data.setdefault(name, value)
+        self.values = dict(data)
+
+        retry = {REFRESH_ONCE} & {register_refresh.get(name) for name in failed}
+        retry.update(register_refresh[name] for name in stale if name in register_refresh)
+        retry.update(cls for cls, written_at in self.written.items() if written_at >= now)
+        self.written.clear()
+        for refresh_class in due - retry:
+            self.last_read[refresh_class] = now
+        return data
+
+    def invalidate(
+        self, names: Iterable[str], *, register_refresh: Mapping[str, str], now: float
+    ) -> None:
+        """Forget ``names`` after a write at ``now`` so the next cycle reads them.
+
+        Their refresh classes become due again; otherwise a slow or once class
+        would carry the value from before the write until its next read.
+        """
+        for name in names:
+            self.values.pop(name, None)
+            refresh_class = register_refresh.get(name)
+            if refresh_class is not None:
+                self.last_read.pop(refresh_class, None)
+                self.written[refresh_class] = now
+
+    def reset(self) -> None:
+        """Forget all reads so the next cycle reads every class."""
+        self.last_read.clear()
+        self.values.clear()
+        self.written.clear()
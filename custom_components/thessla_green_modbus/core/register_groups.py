@@ -3,77 +3,132 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Collection
 from typing import Any
 
+from ..const import REFRESH_CLASSES, REFRESH_NORMAL
+from ..registers.read_planner import read_plan_quality
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _register_metadata(reg: str, get_register_definition: Any) -> tuple[int, str]:
+    """Return ``(length, refresh class)`` for ``reg``, defaulting when unknown."""
+    try:
+        definition = get_register_definition(reg)
+        length = max(1, definition.length)
+    except (KeyError, AttributeError, TypeError) as err:
+        _LOGGER.debug("Missing definition for %s: %s", reg, err)
+        return 1, REFRESH_NORMAL
+    except (ValueError, OSError, RuntimeError) as err:
+        _LOGGER.exception(
+            "Unexpected error getting definition for %s: %s",
+            reg,
+            err,
+        )
+        return 1, REFRESH_NORMAL
+    refresh_class = getattr(definition, "refresh_class", None)
+    refresh = refresh_class() if callable(refresh_class) else None
+    return length, refresh if refresh in REFRESH_CLASSES else REFRESH_NORMAL
+
+
 def compute_register_groups(
     device_client: Any,
     *,
     get_register_definition: Any,
     group_reads: Any,
     holding_batch_boundaries: frozenset[int],
+    group_read_options: Callable[[str], dict[str, Any]] | None = None,
 ) -> None:
-    """Pre-compute register groups for optimized batch reading."""
+    """Pre-compute register groups for optimized batch reading.
+
+    Registers are grouped per refresh class so a group never mixes classes;
+    ``_register_group_refresh`` holds the class of every group and
+    ``_register_refresh`` the class of every register.  When given,
+    ``group_read_options(register_type)`` supplies extra keyword arguments for
+    ``group_reads`` (cost model, addresses safe to bridge).
+    ``_read_plan_quality`` records requests and wasted words per type.
+    Registers in ``_quarantine_blocked`` are left out until their re-probe.
+    """
     device_client._register_groups.clear()
+    device_client._register_group_refresh = {}
+    device_client._register_refresh = {}
+    device_client._read_plan_quality = {}
+    blocked: frozenset[str] = getattr(device_client, "_quarantine_blocked", frozenset())
 
     for key, names in device_client.available_registers.items():
         if not names:
             continue
 
         mapping = device_client._register_maps[key]
-        if device_client.safe_scan:
-            groups: list[tuple[int, int]] = []
-            for reg in names:
-                addr = mapping.get(reg)
-                if addr is None:
-                    continue
-                try:
-                    definition = get_register_definition(reg)
-                    length = max(1, definition.length)
-                except (KeyError, AttributeError, TypeError) as err:
-                    _LOGGER.debug("Missing definition for %s: %s", reg, err)
-                    length = 1
-                except (ValueError, OSError, RuntimeError) as err:
-                    _LOGGER.exception(
-                        "Unexpected error getting definition for %s: %s",
-                        reg,
-                        err,
-                    )
-                    length = 1
-                groups.append((addr, min(length, device_client.effective_batch)))
-            device_client._register_groups[key] = groups
-            continue
-
-        addresses: list[int] = []
+        class_groups: dict[str, list[tuple[int, int]]] = {}
+        class_addresses: dict[str, list[int]] = {}
         for reg in names:
             addr = mapping.get(reg)
-            if addr is None:
+            if addr is None or reg in blocked:
                 continue
-            try:
-                definition = get_register_definition(reg)
-                length = max(1, definition.length)
-            except (KeyError, AttributeError, TypeError) as err:
-                _LOGGER.debug("Missing definition for %s: %s", reg, err)
-                length = 1
-            except (ValueError, OSError, RuntimeError) as err:
-                _LOGGER.exception(
-                    "Unexpected error getting definition for %s: %s",
-                    reg,
-                    err,
+            length, refresh_class = _register_metadata(reg, get_register_definition)
+            device_client._register_refresh[reg] = refresh_class
+            if device_client.safe_scan:
+                class_groups.setdefault(refresh_class, []).append(
+                    (addr, min(length, device_client.effective_batch))
                 )
-                length = 1
-            addresses.extend(range(addr, addr + length))
+            else:
+                class_addresses.setdefault(refresh_class, []).extend(range(addr, addr + length))
 
         boundaries = holding_batch_boundaries if key == "holding_registers" else None
-        device_client._register_groups[key] = group_reads(
-            addresses,
-            max_block_size=device_client.effective_batch,
-            boundaries=boundaries,
+        read_options: dict[str, Any] = {}
+        if group_read_options is not None and not device_client.safe_scan:
+            read_options = group_read_options(key)
+        groups: list[tuple[int, int]] = []
+        group_refresh: list[str] = []
+        for refresh_class in REFRESH_CLASSES:
+            if device_client.safe_scan:
+                class_reads = class_groups.get(refresh_class, [])
+            elif refresh_class in class_addresses:
+                class_reads = group_reads(
+                    class_addresses[refresh_class],
+                    max_block_size=device_client.effective_batch,
+                    boundaries=boundaries,
+                    **read_options,
+                )
+            else:
+                continue
+            groups.extend(class_reads)
+            group_refresh.extend([refresh_class] * len(class_reads))
+        device_client._register_groups[key] = groups
+        device_client._register_group_refresh[key] = group_refresh
+        wanted = (
+            [addr for start, count in groups for addr in range(start, start + count)]
+            if device_client.safe_scan
+            else [addr for addresses in class_addresses.values() for addr in addresses]
         )
+        device_client._read_plan_quality[key] = read_plan_quality(groups, wanted)
 
     _LOGGER.debug(
         "Pre-computed register groups: %s",
-        {k: len(v) for k, v in device_client._register_groups.items()},
+        dict(device_client._read_plan_quality),
+    )
+
+
+def due_register_groups(
+    device_client: Any,
+    register_type: str,
+    refresh_classes: Collection[str] | None,
+) -> list[tuple[int, int]]:
+    """Return the groups of ``register_type`` whose refresh class is due.
+
+    ``refresh_classes=None`` selects every group, as do groups without a
+    recorded class.
+    """
+    groups = device_client._register_groups.get(register_type, [])
+    group_refresh = (getattr(device_client, "_register_group_refresh", None) or {}).get(
+        register_type
     )
+    if refresh_classes is None or not group_refresh or len(group_refresh) != len(groups):
+        return list(groups)
+    return [
+        group
+        for group, refresh_class in zip(groups, group_refresh, strict=True)
+        if refresh_class in refresh_classes
+    ]
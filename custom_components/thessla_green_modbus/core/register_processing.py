@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Mapping
 from typing import Any
 
 from ..const import SENSOR_UNAVAILABLE, SENSOR_UNAVAILABLE_REGISTERS
 from ..register_defs_cache import get_register_definitions
+from ..registers.register_def import RegisterDef
 
 _LOGGER = logging.getLogger(__name__.rsplit(".", maxsplit=1)[0])
 
@@ -18,58 +20,125 @@ def find_register_name(
     return reverse_maps.get(register_type, {}).get(address)
 
 
-def process_register_value(register_name: str, value: int) -> Any:
-    """Decode a raw register value using its definition."""
-    if register_name in {"dac_supply", "dac_exhaust", "dac_heater", "dac_cooler"} and not (
-        0 <= value <= 4095
-    ):
-        _LOGGER.warning("Register %s out of range for DAC: %s", register_name, value)
-        return None
-    try:
-        definition = get_register_definitions()[register_name]
-    except KeyError:
-        _LOGGER.error("Unknown register name: %s", register_name)
-        return False
+RegisterDecoder = Callable[[int], Any]
 
-    if value == SENSOR_UNAVAILABLE:
-        if definition.is_temperature():
-            _LOGGER.debug(
-                "Processed %s: raw=%s value=None (temperature sentinel)",
-                register_name,
-                value,
-            )
+_DAC_REGISTERS = frozenset({"dac_supply", "dac_exhaust", "dac_heater", "dac_cooler"})
+_SIGNED_FLOW_REGISTERS = frozenset({"supply_flow_rate", "exhaust_flow_rate"})
+
+# Compiled decoders together with the definitions mapping they were built from.
+_decoder_table: tuple[Mapping[str, Any], dict[str, RegisterDecoder]] | None = None
+
+
+def _dac_out_of_range(register_name: str, value: int) -> bool:
+    """Return True (and warn) when a DAC register reports an impossible value."""
+    if 0 <= value <= 4095:
+        return False
+    _LOGGER.warning("Register %s out of range for DAC: %s", register_name, value)
+    return True
+
+
+def compile_register_decoder(register_name: str, definition: Any) -> RegisterDecoder:
+    """Return a callable decoding raw words of ``register_name`` like ``process_register_value``.
+
+    Everything that depends only on the definition (DAC range check, sentinel
+    handling, temperature/flow sign fixes, enum passthrough and the register's
+    own decode branches) is resolved once, so the returned decoder only does
+    the per-value work.
+    """
+    decode = (
+        definition.compile_decoder() if isinstance(definition, RegisterDef) else definition.decode
+    )
+    dac = register_name in _DAC_REGISTERS
+    temperature = definition.is_temperature()
+    reports_unavailable = register_name in SENSOR_UNAVAILABLE_REGISTERS
+    signed_flow = register_name in _SIGNED_FLOW_REGISTERS
+    raw_enum = definition.enum is not None
+
+    def decoder(value: int) -> Any:
+        if dac and _dac_out_of_range(register_name, value):
             return None
-        if register_name in SENSOR_UNAVAILABLE_REGISTERS:
+
+        if value == SENSOR_UNAVAILABLE:
+            if temperature:
+                _LOGGER.debug(
+                    "Processed %s: raw=%s value=None (temperature sentinel)",
+                    register_name,
+                    value,
+                )
+                return None
+            if reports_unavailable:
+                _LOGGER.debug(
+                    "Processed %s: raw=%s value=SENSOR_UNAVAILABLE",
+                    register_name,
+                    value,
+                )
+                return SENSOR_UNAVAILABLE
+
+        raw_value = value
+        if temperature and isinstance(raw_value, int) and raw_value > 32767:
+            raw_value -= 65536
+
+        decoded = decode(raw_value)
+
+        if decoded == SENSOR_UNAVAILABLE:
             _LOGGER.debug(
-                "Processed %s: raw=%s value=SENSOR_UNAVAILABLE",
+                "Processed %s: raw=%s value=SENSOR_UNAVAILABLE (post-decode)",
                 register_name,
                 value,
             )
             return SENSOR_UNAVAILABLE
 
-    raw_value = value
-    if definition.is_temperature() and isinstance(raw_value, int) and raw_value > 32767:
-        raw_value -= 65536
+        if signed_flow and isinstance(decoded, int) and decoded > 32767:
+            decoded -= 65536
 
-    decoded = definition.decode(raw_value)
+        if raw_enum and isinstance(decoded, str) and isinstance(value, int):
+            decoded = value
 
-    if decoded == SENSOR_UNAVAILABLE:
-        _LOGGER.debug(
-            "Processed %s: raw=%s value=SENSOR_UNAVAILABLE (post-decode)",
-            register_name,
-            value,
-        )
-        return SENSOR_UNAVAILABLE
+        _LOGGER.debug("Processed %s: raw=%s value=%s", register_name, value, decoded)
+        return decoded
 
-    if register_name in {"supply_flow_rate", "exhaust_flow_rate"} and isinstance(decoded, int):
-        if decoded > 32767:
-            decoded -= 65536
+    return decoder
+
+
+def compile_register_decoders(definitions: Mapping[str, Any]) -> dict[str, RegisterDecoder]:
+    """Compile a decoder for every register in ``definitions``."""
+    return {
+        name: compile_register_decoder(name, definition) for name, definition in definitions.items()
+    }
+
+
+def get_register_decoders() -> dict[str, RegisterDecoder]:
+    """Return compiled decoders for the currently loaded register catalogue.
 
-    if definition.enum is not None and isinstance(decoded, str) and isinstance(value, int):
-        decoded = value
+    Decoders are compiled once per catalogue and recompiled only when
+    ``get_register_definitions`` returns a different mapping (e.g. after its
+    cache was cleared).
+    """
+    global _decoder_table
+    definitions = get_register_definitions()
+    if _decoder_table is None or _decoder_table[0] is not definitions:
+        _decoder_table = (definitions, compile_register_decoders(definitions))
+    return _decoder_table[1]
 
-    _LOGGER.debug("Processed %s: raw=%s value=%s", register_name, value, decoded)
-    return decoded
+
+def register_word_count(register_name: str) -> int:
+    """Return how many consecutive words ``register_name`` spans (1 when unknown)."""
+    definition = get_register_definitions().get(register_name)
+    return max(1, getattr(definition, "length", 1) or 1)
+
+
+def process_register_value(register_name: str, value: int) -> Any:
+    """Decode a raw register value using its compiled decoder.
+
+    Multi-word registers take the sequence of their words as ``value``.
+    """
+    decoder = get_register_decoders().get(register_name)
+    if decoder is not None:
+        return decoder(value)
+    if register_name in _DAC_REGISTERS and _dac_out_of_range(register_name, value):
+        return None
+    _LOGGER.error("Unknown register name: %s", register_name)
+    return False
 
 
 def create_consecutive_groups(registers: dict[str, int]) -> list[tuple[int, int, dict[str, int]]]:
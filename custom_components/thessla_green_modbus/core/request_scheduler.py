@@ -0,0 +1,214 @@
+"""Priority scheduling of Modbus requests on one device connection.
+
+An update cycle used to hold the device lock for every chunk it read, so a
+user write queued behind it waited for the whole cycle.  The
+:class:`RequestScheduler` replaces that lock: holders take it at a
+:class:`RequestPriority`, and a poll cycle calls :meth:`~RequestScheduler.checkpoint`
+at every chunk boundary, where it hands the connection to any higher-priority
+waiter and queues to take it back.  A pending write therefore runs after at
+most one chunk read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any
+
+
+class RequestPriority(IntEnum):
+    """Priority of a request slot; higher values are served first."""
+
+    POLL = 0
+    SERVICE = 1
+    READBACK = 2
+    WRITE = 3
+
+
+class _Hold:
+    """One holder of the scheduler, shared by the tasks it spawns."""
+
+    __slots__ = ("held", "priority", "scheduler", "yielding")
+
+    def __init__(self, scheduler: RequestScheduler, priority: RequestPriority) -> None:
+        self.scheduler = scheduler
+        self.priority = priority
+        self.held = False
+        #: Set while one task of this holder has handed the slot over.
+        self.yielding: asyncio.Future[None] | None = None
+
+
+# Chunk reads dispatched in parallel run in copies of the holder's context,
+# so they all see (and yield) the same hold.
+_CURRENT_HOLD: ContextVar[_Hold | None] = ContextVar("thessla_green_request_hold", default=None)
+
+
+class RequestScheduler:
+    """Exclusive request slot granted by priority, then in arrival order.
+
+    Used like the :class:`asyncio.Lock` it replaces (``async with``,
+    :meth:`locked`), in which case the slot is taken at ``SERVICE``
+    priority.  :meth:`slot` takes it at an explicit priority.
+    """
+
+    def __init__(self) -> None:
+        self._locked = False
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        #: Times a holder handed the slot to a higher-priority waiter.
+        self.preemptions = 0
+        self._write_count = 0
+        self._write_total = 0.0
+        self._write_last = 0.0
+        self._write_max = 0.0
+
+    def locked(self) -> bool:
+        """Return True while some holder owns the slot."""
+        return self._locked
+
+    @property
+    def queued(self) -> int:
+        """Number of holders waiting for the slot."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    def _outranked(self, priority: int) -> bool:
+        """Return True when a waiter with a higher priority than ``priority`` is queued."""
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        return bool(self._waiters) and -self._waiters[0][0] > priority
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.SERVICE) -> None:
+        """Wait until the slot is granted at ``priority``."""
+        if not self._locked and not self._outranked(-1):
+            self._locked = True
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (-int(priority), next(self._sequence), waiter)
+        heapq.heappush(self._waiters, entry)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation.
+                self.release()
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+
+    def release(self) -> None:
+        """Hand the slot to the highest-priority waiter, or free it."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._locked = False
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Hold the slot at ``priority`` for the body of the ``async with`` block."""
+        hold = _Hold(self, priority)
+        await self.acquire(priority)
+        hold.held = True
+        token = _CURRENT_HOLD.set(hold)
+        try:
+            yield
+        finally:
+            _CURRENT_HOLD.reset(token)
+            if hold.held:
+                hold.held = False
+                self.release()
+
+    async def __aenter__(self) -> None:
+        await self.acquire(RequestPriority.SERVICE)
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        self.release()
+
+    async def checkpoint(self, priority: RequestPriority | None = None) -> None:
+        """Let queued higher-priority requests run before the caller continues.
+
+        A no-op unless the calling task holds the slot through :meth:`slot`.
+        Otherwise, when a waiter outranks the holder, the slot is handed over
+        and re-queued at the holder's priority.  Sibling tasks of the same
+        holder reaching a checkpoint meanwhile wait for it to come back.
+        ``priority`` lowers the holder's priority for the rest of its hold,
+        e.g. from ``WRITE`` to ``READBACK`` once its write was acknowledged.
+        """
+        hold = _CURRENT_HOLD.get()
+        if hold is None or hold.scheduler is not self:
+            return
+        if priority is not None and priority < hold.priority:
+            hold.priority = priority
+        if hold.yielding is not None:
+            await asyncio.shield(hold.yielding)
+            return
+        if not hold.held or not self._outranked(hold.priority):
+            return
+        yielding = hold.yielding = asyncio.get_running_loop().create_future()
+        self.preemptions += 1
+        hold.held = False
+        self.release()
+        try:
+            await self.acquire(hold.priority)
+            hold.held = True
+        finally:
+            hold.yielding = None
+            yielding.set_result(None)
+
+    def record_write(self, seconds: float) -> None:
+        """Record the time from queueing a write to its acknowledgement."""
+        self._write_count += 1
+        self._write_total += seconds
+        self._write_last = seconds
+        self._write_max = max(self._write_max, seconds)
+
+    def statistics(self) -> dict[str, Any]:
+        """Return write-to-ack latency and preemption counters."""
+        count = self._write_count
+        return {
+            "writes": count,
+            "write_latency_last": round(self._write_last, 6),
+            "write_latency_avg": round(self._write_total / count, 6) if count else 0.0,
+            "write_latency_max": round(self._write_max, 6),
+            "preemptions": self.preemptions,
+            "queued": self.queued,
+        }
+
+
+def request_slot(lock: Any, priority: RequestPriority) -> AbstractAsyncContextManager[Any]:
+    """Return the context manager taking ``lock`` at ``priority``.
+
+    Plain locks (as used by lightweight stand-ins) are taken as they are.
+    """
+    if isinstance(lock, RequestScheduler):
+        return lock.slot(priority)
+    return lock  # type: ignore[no-any-return]
+
+
+async def request_checkpoint(lock: Any, priority: RequestPriority | None = None) -> None:
+    """Yield ``lock`` to higher-priority requests when it is a scheduler."""
+    if isinstance(lock, RequestScheduler):
+        await lock.checkpoint(priority)
+
+
+def record_write_latency(lock: Any, started: float) -> None:
+    """Record a write acknowledged now that was queued at ``started`` (monotonic)."""
+    if isinstance(lock, RequestScheduler):
+        lock.record_write(time.monotonic() - started)
+
+
+__all__ = [
+    "RequestPriority",
+    "RequestScheduler",
+    "record_write_latency",
+    "request_checkpoint",
+    "request_slot",
+]
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Callable
+from contextlib import nullcontext
 from typing import Any, cast
 
 from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
 
 from ..error_contract import log_retry_attempt
+from ..modbus.deadline import CycleDeadlineExceeded, deadline_expired
+from ..transport.base import BaseModbusTransport
 from ..transport.retry import classify_transport_error
+from .cycle_timing import PHASE_REQUEST, phase_timings
+from .request_scheduler import request_checkpoint
+from .retry_budget import CycleRetryBudget, RetryBudgetExhausted, active_retry_budget
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -107,7 +116,34 @@ async def disconnect_and_reconnect_for_retry(
     start_address: int,
     attempt: int,
 ) -> Exception | None:
-    """Reset connection before retry and reconnect transport if available."""
+    """Reset connection before retry and reconnect transport if available.
+
+    A transport that kept its connection through the failure (see
+    ``BaseModbusTransport._recover_link``) is retried on that connection.
+    Chunk reads in flight together share the transport: the device client's
+    ``_reconnect_lock`` lets the first failed one reconnect, and the others
+    then retry on the connection it opened instead of closing it again.
+    """
+    lock = getattr(owner.device_client, "_reconnect_lock", None)
+    async with lock if isinstance(lock, asyncio.Lock) else nullcontext():
+        return await _reconnect_for_retry(
+            owner,
+            register_type=register_type,
+            start_address=start_address,
+            attempt=attempt,
+        )
+
+
+async def _reconnect_for_retry(
+    owner: Any,
+    *,
+    register_type: str,
+    start_address: int,
+    attempt: int,
+) -> Exception | None:
+    transport = owner.device_client._transport
+    if isinstance(transport, BaseModbusTransport) and transport.is_connected():
+        return None
     disconnect_error = await _safe_disconnect_for_retry(
         owner,
         register_type=register_type,
@@ -151,10 +187,25 @@ async def _handle_retry_exception(
     exc: Exception,
     reconnect: bool,
     timeout: bool = False,
+    budget: CycleRetryBudget | None = None,
+    started: float | None = None,
 ) -> Exception:
-    """Handle retryable read exception and return the most recent error."""
+    """Handle retryable read exception and return the most recent error.
+
+    Under a cycle retry ``budget`` a failed retry (begun at ``started``) is
+    charged to it, and ``exc`` is raised when the budget refuses another one.
+    """
+    if budget is not None and attempt > 1 and started is not None:
+        budget.charge(time.monotonic() - started)
     if attempt >= owner.device_client.retry:
         raise exc
+    if budget is not None and not budget.take():
+        _LOGGER.debug(
+            "Retry budget of the update cycle spent; not retrying %s:%s",
+            register_type,
+            start_address,
+        )
+        raise exc
 
     if reconnect:
         reconnect_error = await disconnect_and_reconnect_for_retry(
@@ -211,15 +262,44 @@ async def read_with_retry(
     count: int,
     *,
     register_type: str,
+    on_answer: Callable[[int, float], None] | None = None,
 ) -> Any:
-    """Read registers with retry/backoff on transient transport errors."""
+    """Read registers with retry/backoff on transient transport errors.
+
+    Under the update cycle's deadline (``device_client._cycle_deadline``) no
+    attempt starts once it has passed, and a timeout past it raises
+    :class:`CycleDeadlineExceeded` instead of being retried.  Retries draw
+    from the cycle's retry budget (``device_client._retry_budget``); once it
+    has run out the read raises :class:`RetryBudgetExhausted` without a request.
+    The latency of each answered request goes into the request histogram of
+    the device client's phase timings and is passed, with its attempt number,
+    to ``on_answer``.
+    """
+    deadline = getattr(owner.device_client, "_cycle_deadline", None)
+    budget = active_retry_budget(owner.device_client)
+    timings = phase_timings(owner.device_client)
     for attempt in range(1, owner.device_client.retry + 1):
+        # Chunk boundary: a queued user write goes out before this read.
+        await request_checkpoint(getattr(owner.device_client, "_write_lock", None))
+        if deadline_expired(deadline):
+            raise CycleDeadlineExceeded(
+                f"Update cycle deadline passed before reading {register_type} "
+                f"registers at {start_address}"
+            )
+        if attempt == 1 and budget is not None and budget.exhausted:
+            budget.skip()
+            raise RetryBudgetExhausted(
+                f"Retry budget of the update cycle spent before reading {register_type} "
+                f"registers at {start_address}"
+            )
+        started = time.monotonic()
         try:
             response = await owner._execute_read_call(
                 read_method,
                 start_address,
                 count,
                 attempt,
+                deadline,
             )
             if response is None:
                 raise ModbusException(
@@ -230,10 +310,22 @@ async def read_with_retry(
                 register_type=register_type,
                 start_address=start_address,
             )
+            elapsed = time.monotonic() - started
+            if timings is not None:
+                timings.observe(PHASE_REQUEST, elapsed)
+            if on_answer is not None:
+                on_answer(attempt, elapsed)
+            if budget is not None and attempt > 1:
+                budget.charge(elapsed)
             return response
-        except _PermanentModbusError:
+        except (_PermanentModbusError, CycleDeadlineExceeded):
             raise
         except TimeoutError as exc:
+            if deadline_expired(deadline):
+                raise CycleDeadlineExceeded(
+                    f"Update cycle deadline passed while reading {register_type} "
+                    f"registers at {start_address}"
+                ) from exc
             await _handle_retry_exception(
                 owner,
                 register_type=register_type,
@@ -242,6 +334,8 @@ async def read_with_retry(
                 exc=exc,
                 reconnect=True,
                 timeout=True,
+                budget=budget,
+                started=started,
             )
         except (ModbusIOException, ConnectionException, OSError) as exc:
             await _handle_retry_exception(
@@ -251,6 +345,8 @@ async def read_with_retry(
                 attempt=attempt,
                 exc=exc,
                 reconnect=True,
+                budget=budget,
+                started=started,
             )
         except ModbusException as exc:
             await _handle_retry_exception(
@@ -260,6 +356,8 @@ async def read_with_retry(
                 attempt=attempt,
                 exc=exc,
                 reconnect=False,
+                budget=budget,
+                started=started,
             )
     # A zero retry count is invalid for normal runtime configuration but keep a
     # deterministic fail-closed outcome for defensive direct callers.
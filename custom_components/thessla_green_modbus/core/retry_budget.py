@@ -0,0 +1,115 @@
+"""Retry budget shared by all chunks of an update cycle.
+
+``read_with_retry`` retries each chunk up to ``retry`` times, so on a flaky
+link a cycle of many chunks multiplies the retries by the number of chunks
+and runs into its deadline.  :class:`CycleRetryBudget` caps the retries of a
+whole cycle, counted in retried requests and in seconds spent on them.  Once
+a retry is refused, the chunks not yet read fail at once with
+:class:`RetryBudgetExhausted` instead of each timing out in turn.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pymodbus.exceptions import ModbusException
+
+from ..const import RETRY_BUDGET_ATTEMPTS, RETRY_BUDGET_FRACTION
+
+
+class RetryBudgetExhausted(ModbusException):
+    """The update cycle's retry budget ran out before the chunk was read."""
+
+
+class CycleRetryBudget:
+    """Retried requests and retry seconds left in the running update cycle."""
+
+    def __init__(
+        self,
+        *,
+        attempts: int = RETRY_BUDGET_ATTEMPTS,
+        fraction: float = RETRY_BUDGET_FRACTION,
+    ) -> None:
+        """Initialize an inactive budget."""
+        self.attempts = max(0, int(attempts))
+        self.fraction = fraction
+        #: True between ``begin`` and ``end`` of an update cycle.
+        self.active = False
+        #: Retry seconds of the running cycle (``None`` without a deadline).
+        self.seconds: float | None = None
+        self.spent_attempts = 0
+        self.spent_seconds = 0.0
+        #: A retry was refused; chunks not yet read are skipped.
+        self.refused = False
+        self.skipped_chunks = 0
+        self.cycles = 0
+        self.exhausted_cycles = 0
+
+    def _ran_out(self) -> bool:
+        return self.refused or (self.seconds is not None and self.spent_seconds >= self.seconds)
+
+    @property
+    def exhausted(self) -> bool:
+        """Return True when the running cycle may not retry any more."""
+        return self.active and self._ran_out()
+
+    def begin(self, window: float | None) -> None:
+        """Start a cycle whose reads may take ``window`` seconds (``None``: unbounded)."""
+        self.active = True
+        self.seconds = max(window, 0.0) * self.fraction if window is not None else None
+        self.spent_attempts = 0
+        self.spent_seconds = 0.0
+        self.refused = False
+        self.skipped_chunks = 0
+
+    def end(self) -> None:
+        """Close the running cycle; its counters stay for diagnostics."""
+        if not self.active:
+            return
+        self.cycles += 1
+        if self._ran_out():
+            self.exhausted_cycles += 1
+        self.active = False
+
+    def take(self) -> bool:
+        """Draw one retry; return False (and refuse all later ones) when none is left."""
+        if not self.active:
+            return True
+        if self.exhausted or self.spent_attempts >= self.attempts:
+            self.refused = True
+            return False
+        self.spent_attempts += 1
+        return True
+
+    def charge(self, seconds: float) -> None:
+        """Account ``seconds`` spent on a retried request."""
+        if self.active:
+            self.spent_seconds += max(seconds, 0.0)
+
+    def skip(self) -> None:
+        """Count a chunk left unread because the budget ran out."""
+        self.skipped_chunks += 1
+
+    def statistics(self) -> dict[str, Any]:
+        """Return retries spent versus budget in the last (or running) cycle."""
+        return {
+            "attempts_spent": self.spent_attempts,
+            "attempts_budget": self.attempts,
+            "seconds_spent": round(self.spent_seconds, 3),
+            "seconds_budget": round(self.seconds, 3) if self.seconds is not None else None,
+            "exhausted": self._ran_out(),
+            "skipped_chunks": self.skipped_chunks,
+            "cycles": self.cycles,
+            "exhausted_cycles": self.exhausted_cycles,
+        }
+
+
+def active_retry_budget(device_client: Any) -> CycleRetryBudget | None:
+    """Return the retry budget of ``device_client``'s running update cycle, if any."""
+    budget = getattr(device_client, "_retry_budget", None)
+    if isinstance(budget, CycleRetryBudget) and budget.active:
+        return budget
+    return None
+
+
+__all__ = ["CycleRetryBudget", "RetryBudgetExhausted", "active_retry_budget"]
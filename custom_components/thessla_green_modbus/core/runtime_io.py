@@ -2,11 +2,30 @@
 
 from __future__ import annotations
 
+import logging
+import time
+from contextlib import nullcontext
 from typing import Any, cast
 
-from pymodbus.exceptions import ConnectionException
+from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
 
 from ..modbus.call import _call_modbus
+from ..transport.health import PROBE_ADDRESS
+from .circuit_breaker import DeviceCircuitBreaker
+from .cycle_timing import (
+    PHASE_COIL,
+    PHASE_DECODE,
+    PHASE_DISCRETE,
+    PHASE_HOLDING,
+    PHASE_INPUT,
+    PHASE_POST_PROCESS,
+    PhaseTimings,
+    phase_timings,
+)
+from .read_batches import connected_read_method, execute_read_call
+from .retry_budget import CycleRetryBudget
+
+_LOGGER = logging.getLogger(__name__)
 
 
 async def call_modbus(
@@ -14,6 +33,7 @@ async def call_modbus(
     func: Any,
     *args: Any,
     attempt: int = 1,
+    deadline: float | None = None,
     **kwargs: Any,
 ) -> Any:
     """Wrapper around Modbus calls injecting the slave ID."""
@@ -29,6 +49,7 @@ async def call_modbus(
             timeout=device_client.timeout,
             backoff=device_client.backoff,
             backoff_jitter=device_client.backoff_jitter,
+            deadline=deadline,
             **kwargs,
         )
     return await device_client._transport.call(
@@ -39,15 +60,142 @@ async def call_modbus(
         max_attempts=device_client.retry,
         backoff=device_client.backoff,
         backoff_jitter=device_client.backoff_jitter,
+        deadline=deadline,
         **kwargs,
     )
 
 
-async def read_all_register_data(device_client: Any) -> dict[str, Any]:
-    """Read all mapped register groups and run post-processing."""
+async def probe_device(device_client: Any, deadline: float | None = None) -> bool:
+    """Send one single-register read and return whether the unit answered.
+
+    An exception response is an answer too: the unit is there, it just does
+    not serve the probed register.
+    """
+    read_method = connected_read_method(device_client, "read_input_registers")
+    if read_method is None:
+        raise ConnectionException("Modbus client is not connected")
+    try:
+        await execute_read_call(device_client, read_method, PROBE_ADDRESS, 1, 1, deadline)
+    except (TimeoutError, ModbusIOException, ConnectionException, OSError) as exc:
+        _LOGGER.debug("Probe read got no answer: %s", exc)
+        return False
+    except ModbusException:
+        pass
+    return True
+
+
+async def _read_due_groups(
+    device_client: Any,
+    due: Any,
+    breaker: DeviceCircuitBreaker | None,
+    timings: PhaseTimings | None = None,
+) -> dict[str, Any]:
+    """Read every group due this cycle and tell ``breaker`` whether the unit answered.
+
+    Each group's read time goes into its phase histogram of ``timings``.
+    """
     data: dict[str, Any] = {}
-    data.update(await device_client._read_input_registers_optimized())
-    data.update(await device_client._read_holding_registers_optimized())
-    data.update(await device_client._read_coil_registers_optimized())
-    data.update(await device_client._read_discrete_inputs_optimized())
-    return cast(dict[str, Any], cast(Any, device_client)._post_process_data(data))
+    groups = (
+        (PHASE_INPUT, device_client._read_input_registers_optimized),
+        (PHASE_HOLDING, device_client._read_holding_registers_optimized),
+        (PHASE_COIL, device_client._read_coil_registers_optimized),
+        (PHASE_DISCRETE, device_client._read_discrete_inputs_optimized),
+    )
+    try:
+        for phase, read_group in groups:
+            with timings.measure(phase) if timings is not None else nullcontext():
+                data.update(await read_group(refresh_classes=due))
+    except (ModbusException, TimeoutError, OSError):
+        if breaker is not None:
+            breaker.record_cycle(False)
+        raise
+    if breaker is not None:
+        breaker.record_cycle(bool(data) or not getattr(device_client, "_failed_registers", None))
+    return data
+
+
+async def read_all_register_data(
+    device_client: Any, deadline: float | None = None
+) -> dict[str, Any]:
+    """Read the register groups due this cycle and run post-processing.
+
+    Groups of refresh classes the device client's schedule skips keep the
+    values of the cycle that last read them.  Quarantined registers are left
+    out of the groups until their re-probe time; this cycle's failures are
+    fed back into the quarantine.  Reads stop at the ``time.monotonic()``
+    ``deadline``: registers left unread are marked stale and keep their last
+    value.  All chunks draw their retries from one retry budget sized from
+    the time left to the deadline; once it has run out the chunks not yet
+    read fail without a request.  While the device circuit breaker is open
+    the cycle only sends a probe read and raises ``TimeoutError`` when the
+    unit does not answer it.  The time of each group read, of decoding and
+    of post-processing goes into the device client's phase timings.
+    """
+    breaker = getattr(device_client, "_circuit_breaker", None)
+    if not isinstance(breaker, DeviceCircuitBreaker):
+        breaker = None
+    elif breaker.is_open:
+        answered = await probe_device(device_client, deadline)
+        breaker.probe_answered(answered)
+        if not answered:
+            raise TimeoutError("Device is not answering; skipped the read plan")
+        _LOGGER.info("Device answered again; resuming full reads")
+
+    schedule = getattr(device_client, "_refresh_schedule", None)
+    now = time.monotonic()
+    due = schedule.due(now) if schedule is not None else None
+    apply_quarantine = getattr(device_client, "_apply_quarantine", None)
+    if callable(apply_quarantine):
+        apply_quarantine(time.time())
+
+    budget = getattr(device_client, "_retry_budget", None)
+    if not isinstance(budget, CycleRetryBudget):
+        budget = None
+    else:
+        budget.begin(deadline - now if deadline is not None else None)
+    timings = phase_timings(device_client)
+    device_client._cycle_deadline = deadline
+    device_client._decode_seconds = 0.0
+    try:
+        data = await _read_due_groups(device_client, due, breaker, timings)
+    finally:
+        device_client._cycle_deadline = None
+        if budget is not None:
+            budget.end()
+    if timings is not None:
+        timings.observe(PHASE_DECODE, device_client._decode_seconds)
+    if budget is not None and budget.skipped_chunks:
+        _LOGGER.warning(
+            "Retry budget of %d retries spent; %d chunk(s) not read this cycle",
+            budget.attempts,
+            budget.skipped_chunks,
+        )
+    if breaker is not None and breaker.is_open:
+        _LOGGER.warning(
+            "Device answered no read in %d consecutive cycles; polling with a probe read only",
+            breaker.failures,
+        )
+    stale = getattr(device_client, "_stale_registers", None) or set()
+    if stale:
+        _LOGGER.warning(
+            "Update cycle ran out of time after %.1fs; %d register(s) keep their last value",
+            time.monotonic() - now,
+            len(stale),
+        )
+    record_failures = getattr(device_client, "_record_read_failures", None)
+    if callable(record_failures):
+        record_failures(data, time.time())
+    if schedule is not None and due is not None:
+        data = schedule.complete(
+            due,
+            data,
+            register_refresh=getattr(device_client, "_register_refresh", {}),
+            failed=getattr(device_client, "_failed_registers", ()),
+            stale=stale,
+            now=now,
+        )
+    replan = getattr(device_client, "_replan_reads_if_stale", None)
+    if callable(replan):
+        replan()
+    with timings.measure(PHASE_POST_PROCESS) if timings is not None else nullcontext():
+        return cast(dict[str, Any], cast(Any, device_client)._post_process_data(data))
@@ -10,6 +10,7 @@ from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOEx
 
 from ..const import CONNECTION_MODE_TCP, CONNECTION_MODE_TCP_RTU, DEFAULT_PORT
 from ..transport.base import BaseModbusTransport
+from ..transport.detection import detected_modes
 
 
 async def select_auto_transport(
@@ -34,6 +35,11 @@ async def select_auto_transport(
         if prefer_tcp
         else [CONNECTION_MODE_TCP_RTU, CONNECTION_MODE_TCP]
     )
+    # Try the framing detected for this endpoint earlier first.
+    detected = detected_modes.get(host, port)
+    if detected in mode_order:
+        mode_order.remove(detected)
+        mode_order.insert(0, detected)
     attempts: list[tuple[str, float]] = []
     for mode in mode_order:
         mode_timeout = 5.0 if mode == CONNECTION_MODE_TCP_RTU else min(max(timeout, 5.0), 10.0)
@@ -83,6 +89,7 @@ async def select_auto_transport(
             continue
 
         logger.info("Auto-selected Modbus transport %s for %s:%s", mode, host, port)
+        detected_modes.remember(host, port, mode)
         return transport, mode
 
     raise ConnectionException("Auto-detect Modbus transport failed") from last_error
@@ -37,6 +37,19 @@ class ThesslaGreenEntity(CoordinatorEntity):
         # setup; keeping this attribute avoids additional property wrappers.
         self._attr_device_info = coordinator.get_device_info()
 
+    def _source_keys(self) -> frozenset[str] | None:
+        """Return the coordinator data keys this entity's state is derived from.
+
+        The coordinator only wakes the entity when one of these keys changes
+        or availability flips; ``None`` wakes it after every update.
+        """
+        return frozenset({self._key})
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to coordinator updates of this entity's source keys."""
+        self.coordinator_context = self._source_keys()
+        await super().async_added_to_hass()
+
     def _apply_risk_policy(self, entity_config: dict[str, Any]) -> None:
         """Keep advanced/destructive controls opt-in in the entity registry.
 
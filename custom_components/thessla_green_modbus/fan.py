@@ -113,6 +113,10 @@ class ThesslaGreenFan(ThesslaGreenEntity, FanEntity):
 
         _LOGGER.debug("Initialized fan entity")
 
+    def _source_keys(self) -> frozenset[str] | None:
+        """Fan state combines mode, flow and panel registers; wake on every update."""
+        return None
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Drop the optimistic pending percentage once real status catches up.
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import inspect
 import logging
 import random
@@ -13,6 +14,7 @@ from typing import Any
 
 from pymodbus.exceptions import ModbusIOException
 
+from .deadline import CycleDeadlineExceeded, clamp_timeout, remaining_time
 from .frame_logging import _log_modbus_request, _log_modbus_response
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,21 +27,30 @@ _KWARG_CACHE: weakref.WeakKeyDictionary[Callable[..., Awaitable[Any]], str | Non
 _SIG_CACHE: weakref.WeakKeyDictionary[Callable[..., Awaitable[Any]], inspect.Signature] = (
     weakref.WeakKeyDictionary()
 )
+# Compiled call adapters, by callable and, for bound methods, by their function
+_ADAPTER_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], _CallAdapter] = (
+    weakref.WeakKeyDictionary()
+)
+_METHOD_ADAPTER_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], _CallAdapter] = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def _get_signature(func: Callable[..., Awaitable[Any]]) -> inspect.Signature | None:
     """Return a cached signature when introspection is available."""
 
-    signature = _SIG_CACHE.get(func)
-    if signature is not None:
-        return signature
+    with contextlib.suppress(TypeError):  # not weak-referenceable
+        signature = _SIG_CACHE.get(func)
+        if signature is not None:
+            return signature
 
     try:
         signature = inspect.signature(func)
     except (TypeError, ValueError):
         return None
 
-    _SIG_CACHE[func] = signature
+    with contextlib.suppress(TypeError):
+        _SIG_CACHE[func] = signature
     return signature
 
 
@@ -90,43 +101,16 @@ def _calculate_backoff_delay(
     return float(max(delay, 0.0))
 
 
-def _normalize_positional_and_keyword_args(
-    signature: inspect.Signature | None,
-    args: tuple[Any, ...],
-    kwargs: dict[str, Any],
-) -> tuple[list[Any], dict[str, inspect.Parameter]]:
-    """Move positional values targeting keyword-only params into ``kwargs``."""
-    params: dict[str, inspect.Parameter] = (
-        dict(signature.parameters) if signature is not None else {}
-    )
-    positional: list[Any] = []
-    if signature is None:
-        return list(args), params
-
-    param_iter = iter(params.values())
-    for arg in args:
-        try:
-            param = next(param_iter)
-        except StopIteration:
-            positional.append(arg)
-            continue
-
-        if param.kind is inspect.Parameter.KEYWORD_ONLY:
-            kwargs[param.name] = arg
-        else:
-            positional.append(arg)
-    return positional, params
-
-
 def _resolve_slave_kwarg(
     func: Callable[..., Awaitable[Any]],
     params: dict[str, inspect.Parameter],
     signature: inspect.Signature | None,
 ) -> str:
     """Return cached keyword variant supported by Modbus client callable."""
-    kwarg = _KWARG_CACHE.get(func)
-    if kwarg is not None:
-        return kwarg
+    with contextlib.suppress(TypeError):  # not weak-referenceable
+        kwarg = _KWARG_CACHE.get(func)
+        if kwarg is not None:
+            return kwarg
 
     if "device_id" in params and params["device_id"].kind is not inspect.Parameter.POSITIONAL_ONLY:
         kwarg = "device_id"
@@ -137,25 +121,94 @@ def _resolve_slave_kwarg(
     else:
         kwarg = "slave" if signature is None else ""
 
-    _KWARG_CACHE[func] = kwarg
+    with contextlib.suppress(TypeError):
+        _KWARG_CACHE[func] = kwarg
     return kwarg
 
 
-async def _invoke_with_slave_kwarg(
-    func: Callable[..., Awaitable[Any]],
-    positional: list[Any],
-    kwargs: dict[str, Any],
-    kwarg: str,
-    slave_id: int,
-) -> Any:
-    """Invoke wrapped callable using detected slave keyword convention."""
-    if kwarg == "device_id":
-        return await async_maybe_await(func(*positional, device_id=slave_id, **kwargs))
-    if kwarg == "slave":
-        return await async_maybe_await(func(*positional, slave=slave_id, **kwargs))
-    if kwarg == "unit":
-        return await async_maybe_await(func(*positional, unit=slave_id, **kwargs))
-    return await async_maybe_await(func(*positional, **kwargs))
+@dataclass(frozen=True, slots=True)
+class _CallAdapter:
+    """Calling convention of one Modbus callable, resolved once.
+
+    ``keyword_only`` names, for each positional argument, the keyword-only
+    parameter it fills (``None`` where it stays positional); trailing
+    positional slots are left out.
+    """
+
+    func_name: str
+    keyword_only: tuple[str | None, ...]
+    slave_kwarg: str
+    external_timeout: bool
+
+    def layout(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> list[Any]:
+        """Return the positional arguments, moving keyword-only values into ``kwargs``."""
+        keyword_only = self.keyword_only
+        if not keyword_only:
+            return list(args)
+        positional: list[Any] = []
+        slots = len(keyword_only)
+        for index, arg in enumerate(args):
+            name = keyword_only[index] if index < slots else None
+            if name is None:
+                positional.append(arg)
+            else:
+                kwargs[name] = arg
+        return positional
+
+    async def dispatch(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        positional: list[Any],
+        kwargs: dict[str, Any],
+        slave_id: int,
+        timeout: float | None,
+    ) -> Any:
+        """Call ``func`` with the slave keyword and, if it applies, an external timeout."""
+        if self.slave_kwarg:
+            result = func(*positional, **{self.slave_kwarg: slave_id}, **kwargs)
+        else:
+            result = func(*positional, **kwargs)
+        if timeout is not None and self.external_timeout:
+            return await asyncio.wait_for(async_maybe_await(result), timeout=timeout)
+        return await async_maybe_await(result)
+
+
+def _compile_call_adapter(func: Callable[..., Awaitable[Any]]) -> _CallAdapter:
+    signature = _get_signature(func)
+    params: dict[str, inspect.Parameter] = (
+        dict(signature.parameters) if signature is not None else {}
+    )
+    keyword_only = [
+        param.name if param.kind is inspect.Parameter.KEYWORD_ONLY else None
+        for param in params.values()
+    ]
+    while keyword_only and keyword_only[-1] is None:
+        keyword_only.pop()
+    return _CallAdapter(
+        func_name=getattr(func, "__name__", repr(func)),
+        keyword_only=tuple(keyword_only),
+        slave_kwarg=_resolve_slave_kwarg(func, params, signature),
+        external_timeout=_should_apply_external_timeout(func),
+    )
+
+
+def _call_adapter(func: Callable[..., Awaitable[Any]]) -> _CallAdapter:
+    """Return the compiled adapter for ``func``, compiling it on first use.
+
+    Bound methods share the adapter of the function behind them, so every
+    client instance (and every fresh bound method object per request) reuses
+    one adapter per client method.
+    """
+    method = getattr(func, "__func__", None)
+    cache, key = (_ADAPTER_CACHE, func) if method is None else (_METHOD_ADAPTER_CACHE, method)
+    try:
+        adapter = cache.get(key)
+    except TypeError:  # not weak-referenceable
+        return _compile_call_adapter(func)
+    if adapter is None:
+        adapter = _compile_call_adapter(func)
+        cache[key] = adapter
+    return adapter
 
 
 def _calculate_batch_size(kwargs: dict[str, Any]) -> int:
@@ -181,20 +234,18 @@ def _prepare_modbus_call(
     backoff: float,
     backoff_jitter: float | tuple[float, float] | None,
     apply_backoff: bool,
+    adapter: _CallAdapter | None = None,
 ) -> tuple[list[Any], str, str, int, float]:
     """Prepare call metadata for ``_call_modbus`` without mutating behavior."""
 
-    signature = _get_signature(func)
-    positional, params = _normalize_positional_and_keyword_args(signature, args, kwargs)
-    kwarg = _resolve_slave_kwarg(func, params, signature)
-    func_name = getattr(func, "__name__", repr(func))
-    batch_size = _calculate_batch_size(kwargs)
+    adapter = adapter or _call_adapter(func)
+    positional = adapter.layout(args, kwargs)
     delay = (
         _calculate_backoff_delay(base=backoff, attempt=attempt, jitter=backoff_jitter)
         if apply_backoff
         else 0.0
     )
-    return positional, kwarg, func_name, batch_size, delay
+    return positional, adapter.slave_kwarg, adapter.func_name, _calculate_batch_size(kwargs), delay
 
 
 def _classify_modbus_exception(err: Exception) -> str:
@@ -204,24 +255,6 @@ def _classify_modbus_exception(err: Exception) -> str:
     return "failed"
 
 
-async def _dispatch_modbus_call(
-    func: Callable[..., Awaitable[Any]],
-    positional: list[Any],
-    kwargs: dict[str, Any],
-    kwarg: str,
-    slave_id: int,
-    timeout: float | None,
-) -> Any:
-    """Dispatch a Modbus callable with optional external timeout."""
-
-    async def _invoke() -> Any:
-        return await _invoke_with_slave_kwarg(func, positional, kwargs, kwarg, slave_id)
-
-    if timeout is not None and _should_apply_external_timeout(func):
-        return await asyncio.wait_for(_invoke(), timeout=timeout)
-    return await _invoke()
-
-
 async def _apply_attempt_delay(
     *,
     delay: float,
@@ -307,16 +340,24 @@ async def _call_modbus(
     backoff: float = 0.0,
     backoff_jitter: float | tuple[float, float] | None = None,
     apply_backoff: bool = True,
+    deadline: float | None = None,
     **kwargs: Any,
 ) -> Any:
     """Invoke a Modbus function handling Modbus client keyword variants.
 
     The function signature is inspected to determine whether the wrapped
     callable expects a ``device_id`` or ``slave`` keyword argument.  If neither is
-    present the function is called without either keyword.  The chosen keyword
-    (or lack thereof) is cached per callable for subsequent invocations.
+    present the function is called without either keyword.  The argument
+    layout, the chosen keyword (or lack thereof) and the timeout policy are
+    compiled once per callable, or per client method for bound methods, into
+    a :class:`_CallAdapter` reused by later invocations.
+
+    Under an update-cycle ``deadline`` (see ``modbus/deadline.py``) the call is
+    not started when the deadline would pass during the backoff delay, and its
+    timeout is shortened to the time left.
     """
 
+    adapter = _call_adapter(func)
     positional, kwarg, func_name, batch_size, delay = _prepare_modbus_call(
         func,
         args,
@@ -325,15 +366,20 @@ async def _call_modbus(
         backoff=backoff,
         backoff_jitter=backoff_jitter,
         apply_backoff=apply_backoff,
+        adapter=adapter,
     )
 
     prepared = _PreparedCall(positional, kwarg, func_name, batch_size, delay)
+    remaining = remaining_time(deadline)
+    if remaining is not None and remaining <= prepared.delay:
+        raise CycleDeadlineExceeded(f"Update cycle deadline exceeded before calling {func_name}")
     await _apply_attempt_delay(
         delay=prepared.delay,
         func_name=prepared.func_name,
         attempt=attempt,
         max_attempts=max_attempts,
     )
+    timeout = clamp_timeout(timeout, deadline)
 
     _log_call_attempt(
         prepared,
@@ -344,14 +390,7 @@ async def _call_modbus(
     )
 
     try:
-        response = await _dispatch_modbus_call(
-            func=func,
-            positional=prepared.positional,
-            kwargs=kwargs,
-            kwarg=prepared.kwarg,
-            slave_id=slave_id,
-            timeout=timeout,
-        )
+        response = await adapter.dispatch(func, prepared.positional, kwargs, slave_id, timeout)
     except TimeoutError as err:
         _raise_mapped_call_exception(
             err, func_name=prepared.func_name, attempt=attempt, max_attempts=max_attempts
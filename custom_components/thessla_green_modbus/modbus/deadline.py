@@ -0,0 +1,41 @@
+"""Update-cycle deadlines for Modbus calls.
+
+A deadline is an absolute ``time.monotonic()`` timestamp by which the update
+cycle's reads must finish; ``None`` means no deadline.  Calls made under a
+deadline shorten their timeout to the time left and are not started at all
+once it has passed.
+"""
+
+from __future__ import annotations
+
+import time
+
+
+class CycleDeadlineExceeded(TimeoutError):
+    """The update cycle's deadline passed before the request could finish."""
+
+
+def remaining_time(deadline: float | None) -> float | None:
+    """Return the seconds left before ``deadline`` (``None`` without one)."""
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def deadline_expired(deadline: float | None) -> bool:
+    """Return True when ``deadline`` is set and has passed."""
+    remaining = remaining_time(deadline)
+    return remaining is not None and remaining <= 0
+
+
+def clamp_timeout(timeout: float | None, deadline: float | None) -> float | None:
+    """Return ``timeout`` shortened to the time left before ``deadline``.
+
+    Raises :class:`CycleDeadlineExceeded` when the deadline has already passed.
+    """
+    remaining = remaining_time(deadline)
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise CycleDeadlineExceeded("Update cycle deadline exceeded")
+    return remaining if timeout is None else min(timeout, remaining)
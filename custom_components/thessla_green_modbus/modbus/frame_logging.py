@@ -86,36 +86,30 @@ def _log_modbus_request(
     kwargs: dict[str, Any],
 ) -> None:
     """Emit request diagnostics at debug level."""
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        return
     request_frame = _build_request_frame(func_name, slave_id, positional, kwargs)
     if request_frame:
         _LOGGER.debug("Modbus request: %s", _mask_frame(request_frame))
         return
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        _LOGGER.debug(
-            "Sending %s to slave %s: args=%s kwargs=%s", func_name, slave_id, positional, kwargs
-        )
+    _LOGGER.debug(
+        "Sending %s to slave %s: args=%s kwargs=%s", func_name, slave_id, positional, kwargs
+    )
 
 
 def _log_modbus_response(func_name: str, response: Any) -> None:
     """Emit response diagnostics at debug level."""
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        try:
-            encoded = response.encode() if hasattr(response, "encode") else b""
-        except (AttributeError, ValueError, TypeError, UnicodeError) as err:
-            _LOGGER.debug("Failed to encode Modbus response: %s", err)
-            encoded = b""
-        except (OSError, RuntimeError) as err:  # pragma: no cover - unexpected
-            _LOGGER.exception("Unexpected error encoding Modbus response: %s", err)
-            encoded = b""
-        if encoded:
-            _LOGGER.debug("Modbus response: %s", _mask_frame(encoded))
-        else:
-            _LOGGER.debug("Received from %s: %s", func_name, response)
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
         return
-
     try:
         encoded = response.encode() if hasattr(response, "encode") else b""
-    except (AttributeError, OSError, RuntimeError, TypeError, ValueError):
+    except (AttributeError, ValueError, TypeError, UnicodeError) as err:
+        _LOGGER.debug("Failed to encode Modbus response: %s", err)
+        encoded = b""
+    except (OSError, RuntimeError) as err:  # pragma: no cover - unexpected
+        _LOGGER.exception("Unexpected error encoding Modbus response: %s", err)
         encoded = b""
     if encoded:
         _LOGGER.debug("Modbus response: %s", _mask_frame(encoded))
+    else:
+        _LOGGER.debug("Received from %s: %s", func_name, response)
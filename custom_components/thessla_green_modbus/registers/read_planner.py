@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+import math
+from collections.abc import Callable, Container, Iterable
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import NamedTuple
 
 from .. import const
 from .definition import ReadPlan
@@ -46,6 +50,126 @@ def group_reads(
     return groups
 
 
+@dataclass(frozen=True, slots=True)
+class ReadCostModel:
+    """Linear cost of one read request: fixed latency plus time per word."""
+
+    request_latency: float = const.DEFAULT_READ_REQUEST_LATENCY
+    word_time: float = const.DEFAULT_READ_WORD_TIME
+
+    @property
+    def max_bridge_gap(self) -> int:
+        """Return the most unused words worth reading to save one request."""
+        if self.word_time <= 0:
+            return const.MAX_REGS_PER_REQUEST
+        return int(self.request_latency // self.word_time)
+
+
+class ReadPlanQuality(NamedTuple):
+    """How much a set of read groups costs per poll cycle."""
+
+    requests: int
+    words: int
+    wasted_words: int
+
+
+def read_plan_quality(
+    groups: Iterable[tuple[int, int]], addresses: Iterable[int]
+) -> ReadPlanQuality:
+    """Return request count, words read and words read but not wanted."""
+    groups = list(groups)
+    words = sum(length for _, length in groups)
+    return ReadPlanQuality(len(groups), words, words - len(set(addresses)))
+
+
+def coalesce_reads(
+    addresses: Iterable[int],
+    max_block_size: int | None = None,
+    boundaries: frozenset[int] | None = None,
+    *,
+    cost_model: ReadCostModel | None = None,
+    illegal: Container[int] = frozenset(),
+    readable: Container[int] | None = None,
+    continuations: Container[int] = frozenset(),
+    max_gap: int | None = None,
+) -> list[tuple[int, int]]:
+    """Group register addresses into the cheapest set of read blocks.
+
+    Unlike :func:`group_reads`, blocks may bridge holes between wanted
+    addresses whenever reading the unused words costs less than an extra
+    request under ``cost_model``.  The grouping minimises total cost over all
+    block layouts (not greedily), never exceeds ``max_block_size``, never
+    spans a ``boundaries`` address (a block may start at one) and never reads
+    an ``illegal`` address.  When ``readable`` is given, holes are only bridged
+    across addresses it contains.  A block never starts at one of the
+    ``continuations`` (the second and later words of multi-word registers),
+    so such registers are read in one piece unless they exceed a block.
+    ``max_gap`` additionally caps the number of unused words bridged in one
+    hole; ``0`` only merges contiguous addresses.
+    """
+    if max_block_size is None:
+        max_block_size = const.MAX_REGS_PER_REQUEST
+    max_block_size = max(1, min(max_block_size, const.MAX_REGS_PER_REQUEST))
+    sorted_addresses = sorted(set(addresses))
+    if not sorted_addresses:
+        return []
+
+    model = cost_model or ReadCostModel()
+    # Costs are expressed in words: one request costs ``request_words``.
+    request_words = model.request_latency / model.word_time if model.word_time > 0 else math.inf
+    if max_gap is None:
+        max_gap = max_block_size
+    split_at = boundaries or frozenset()
+
+    # links[k]: may one block cover both sorted_addresses[k] and [k + 1]?
+    links = []
+    for prev, addr in pairwise(sorted_addresses):
+        gap = range(prev + 1, addr)
+        links.append(
+            len(gap) <= max_gap
+            and not any(prev < boundary <= addr for boundary in split_at)
+            and not any(hole in illegal for hole in gap)
+            and (readable is None or all(hole in readable for hole in gap))
+        )
+
+    count = len(sorted_addresses)
+    # best[j]: (cost, requests, start index of the last block) for the first j
+    # addresses.  Costs are rounded so equal layouts compare equal; ties keep
+    # the shortest last block, matching :func:`group_reads` on contiguous runs.
+    best: list[tuple[float, int, int]] = [(0.0, 0, 0)] * (count + 1)
+    for end in range(count):
+        cost, requests, _ = best[end]
+        # ``anywhere`` ignores continuations; it is only used when a register
+        # longer than a block leaves no valid start.
+        anywhere = (round(cost + request_words + 1, 9), requests + 1, end)
+        candidate = None if sorted_addresses[end] in continuations else anywhere
+        start = end
+        while start > 0 and links[start - 1]:
+            start -= 1
+            span = sorted_addresses[end] - sorted_addresses[start] + 1
+            if span > max_block_size:
+                break
+            cost, requests, _ = best[start]
+            option = (round(cost + request_words + span, 9), requests + 1, start)
+            if option[:2] < anywhere[:2]:
+                anywhere = option
+            if sorted_addresses[start] in continuations:
+                continue
+            if candidate is None or option[:2] < candidate[:2]:
+                candidate = option
+        best[end + 1] = candidate or anywhere
+
+    groups: list[tuple[int, int]] = []
+    end = count
+    while end > 0:
+        start = best[end][2]
+        first = sorted_addresses[start]
+        groups.append((first, sorted_addresses[end - 1] - first + 1))
+        end = start
+    groups.reverse()
+    return groups
+
+
 def chunk_register_range(
     start: int,
     count: int,
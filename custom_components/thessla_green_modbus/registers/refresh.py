@@ -0,0 +1,67 @@
+"""Refresh-class rules deciding how often the poll cycle re-reads a register."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .. import const
+
+if TYPE_CHECKING:
+    from .register_def import RegisterDef
+
+# Identity, firmware and UART configuration never change while connected.
+_ONCE_PREFIXES = ("serial_number", "device_name", "version_", "compilation_", "uart_")
+_ONCE_NAMES = frozenset({"cf_version", "exp_version"})
+
+# Weekly schedule/setting slots and installer configuration rarely change;
+# a write from Home Assistant makes the register's class due on the next cycle.
+_SLOW_PREFIXES = (
+    "schedule_",
+    "setting_",
+    "airing_summer_",
+    "airing_winter_",
+    "start_gwc_regen_",
+    "stop_gwc_regen_",
+    "pres_check_",
+    "nominal_",
+    "lock_",
+    "hard_reset_",
+)
+_SLOW_NAMES = frozenset({"language", "rtc_cal"})
+
+# Live airflow measurements and fan drive outputs (temperatures are matched
+# on input registers separately).
+_FAST_NAMES = frozenset(
+    {
+        "supply_flow_rate",
+        "exhaust_flow_rate",
+        "supply_percentage",
+        "exhaust_percentage",
+        "supply_air_flow",
+        "exhaust_air_flow",
+        "dac_supply",
+        "dac_exhaust",
+        "dac_heater",
+        "dac_cooler",
+    }
+)
+
+
+def classify_refresh(definition: RegisterDef) -> str:
+    """Return the refresh class for ``definition``.
+
+    An explicit ``extra["refresh"]`` entry in the register JSON wins over the
+    name-based rules.
+    """
+    override = definition.extra.get("refresh") if definition.extra else None
+    if override in const.REFRESH_CLASSES:
+        return str(override)
+
+    name = definition.name
+    if name in _ONCE_NAMES or name.startswith(_ONCE_PREFIXES):
+        return const.REFRESH_ONCE
+    if name in _SLOW_NAMES or name.startswith(_SLOW_PREFIXES):
+        return const.REFRESH_SLOW
+    if name in _FAST_NAMES or (definition.function == 4 and definition.is_temperature()):
+        return const.REFRESH_FAST
+    return const.REFRESH_NORMAL
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import struct
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from datetime import time
 from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
@@ -58,6 +58,12 @@ class RegisterDef:
     def is_temperature(self) -> bool:
         return self._is_temperature()
 
+    def refresh_class(self) -> str:
+        """Return how often the poll cycle should re-read this register."""
+        from .refresh import classify_refresh
+
+        return classify_refresh(self)
+
     def _is_bcd_time(self) -> bool:
         """Return True when the register stores a BCD HHMM time value."""
 
@@ -86,7 +92,9 @@ class RegisterDef:
         return self._decode_single_register(raw)
 
     def _decode_multi_register(self, raw: int | Sequence[int]) -> Any:
-        if isinstance(raw, Sequence):
+        if isinstance(raw, list):
+            raw_list = raw
+        elif isinstance(raw, Sequence):
             raw_list = list(raw)
         else:
             raw_list = [(raw >> (16 * (self.length - 1 - i))) & 65535 for i in range(self.length)]
@@ -165,6 +173,72 @@ class RegisterDef:
             return decode_bcd_time(raw)
         return self._apply_output_scaling(value)
 
+    def compile_decoder(self) -> Callable[[int], Any]:
+        """Return a callable equivalent to :meth:`decode` for single raw words.
+
+        The metadata lookups :meth:`_decode_single_register` repeats on every
+        call (DAC range, sentinel, bitmask/enum, ``i16``, AATT, BCD time and
+        scaling) are resolved once into closure constants.  Multi-register
+        definitions keep using :meth:`decode`.
+        """
+        if self.length > 1:
+            return self.decode
+
+        from ..utils import decode_aatt, decode_bcd_time
+
+        dac_range = self.name.startswith("dac_")
+        sentinel = self.function == 4 or self._is_temperature()
+        bitmask = bool(self.extra and self.extra.get("bitmask") and self.enum)
+        signed = bool(self.extra and self.extra.get("type") == "i16")
+        multiplier = self.multiplier
+        resolution = self.resolution
+        scaled = multiplier not in (None, 1) or resolution not in (None, 1)
+
+        labels: dict[int, Any] = {}
+        if self.enum is not None and not bitmask:
+            # ``decode_enum_value`` prefers the int key over its string form.
+            labels = {
+                int(key): label
+                for key, label in self.enum.items()
+                if isinstance(key, str) and key.lstrip("-").isdigit() and key == str(int(key))
+            }
+            labels.update({key: label for key, label in self.enum.items() if isinstance(key, int)})
+            labels = {key: label for key, label in labels.items() if label is not None}
+        bits = (
+            tuple(sorted(((int(k), v) for k, v in self.enum.items()), key=lambda pair: pair[0]))
+            if bitmask and self.enum
+            else ()
+        )
+
+        if self._is_aatt():
+            tail: Callable[[int], Any] = decode_aatt
+        elif self._is_bcd_time():
+            tail = decode_bcd_time
+        elif scaled:
+
+            def tail(raw: int) -> Any:
+                return apply_output_scaling(raw, multiplier, resolution)
+
+        else:
+
+            def tail(raw: int) -> Any:
+                return raw
+
+        def decoder(raw: int) -> Any:
+            if dac_range and not (0 <= raw <= 4095):
+                return None
+            if sentinel and raw == 32768:
+                return None
+            if bitmask:
+                return [label for bit, label in bits if raw & bit]
+            if labels and raw in labels:
+                return labels[raw]
+            if signed and raw >= 32768:
+                raw -= 65536
+            return tail(raw)
+
+        return decoder
+
     def encode(self, value: Any) -> int | list[int]:
         """Encode ``value`` into the raw register representation."""
 
@@ -11,12 +11,22 @@ from homeassistant.helpers import issue_registry as ir
 from .const import DOMAIN
 
 _WRITE_FAILURE_KEY = "modbus_write_failed"
+_DEVICE_UNREACHABLE_KEY = "device_unreachable"
+
+
+def _entry_issue_id(key: str, entry: Any | None) -> str:
+    entry_id = getattr(entry, "entry_id", None)
+    return f"{key}_{entry_id}" if entry_id else key
 
 
 def write_failure_issue_id(entry: Any | None) -> str:
     """Return an issue id unique to a config entry when available."""
-    entry_id = getattr(entry, "entry_id", None)
-    return f"{_WRITE_FAILURE_KEY}_{entry_id}" if entry_id else _WRITE_FAILURE_KEY
+    return _entry_issue_id(_WRITE_FAILURE_KEY, entry)
+
+
+def device_unreachable_issue_id(entry: Any | None) -> str:
+    """Return the unreachable-device issue id of a config entry."""
+    return _entry_issue_id(_DEVICE_UNREACHABLE_KEY, entry)
 
 
 def create_write_failure_issue(
@@ -48,6 +58,27 @@ def clear_write_failure_issue(hass: HomeAssistant, entry: Any | None) -> None:
     ir.async_delete_issue(hass, DOMAIN, write_failure_issue_id(entry))
 
 
+def create_device_unreachable_issue(hass: HomeAssistant, entry: Any | None) -> None:
+    """Report a unit that stopped answering reads (device circuit breaker open).
+
+    The issue is non-persistent and cleared as soon as the unit answers again.
+    """
+    ir.async_create_issue(
+        hass,
+        DOMAIN,
+        device_unreachable_issue_id(entry),
+        is_fixable=False,
+        is_persistent=False,
+        severity=ir.IssueSeverity.WARNING,
+        translation_key=_DEVICE_UNREACHABLE_KEY,
+    )
+
+
+def clear_device_unreachable_issue(hass: HomeAssistant, entry: Any | None) -> None:
+    """Clear the unreachable-device issue once the unit answers again."""
+    ir.async_delete_issue(hass, DOMAIN, device_unreachable_issue_id(entry))
+
+
 async def async_create_fix_flow(
     hass: HomeAssistant,
     issue_id: str,
@@ -326,7 +326,7 @@ def _handle_input_attempt_exception(
     )
 
 
-async def _execute_word_read_attempt(
+async def _execute_read_attempt(
     scanner: Any,
     *,
     transport: Any,
@@ -336,7 +336,7 @@ async def _execute_word_read_attempt(
     count: int,
     attempt: int,
 ) -> Any:
-    """Execute one word-register read attempt via transport or client fallback."""
+    """Execute one register or bit read attempt via transport or client fallback."""
     if transport is not None:
         return await getattr(transport, method_name)(scanner.slave_id, address, count=count)
     return await _call_modbus_with_fallback(
@@ -374,7 +374,7 @@ async def _run_word_read_single_attempt(
     Returns (done, aborted_transiently, stop_retries, payload).
     """
     try:
-        response = await _execute_word_read_attempt(
+        response = await _execute_read_attempt(
             scanner,
             transport=transport,
             client=client,
@@ -714,21 +714,22 @@ async def read_bit_registers(
     client, address, count = _normalize_bit_read_request(
         scanner, client_or_address, address_or_count, count
     )
-    client = _resolve_bit_read_client(scanner, client)
+    # Native transports (raw RTU over TCP) have no pymodbus client to hand out.
+    transport = scanner._transport if client is None else None
+    if transport is None or getattr(transport, "client", None) is not None:
+        transport = None
+        client = _resolve_bit_read_client(scanner, client)
 
     for attempt in range(1, scanner.retry + 1):
         try:
-            response: Any = await _call_modbus_with_fallback(
+            response: Any = await _execute_read_attempt(
                 scanner,
-                getattr(client, method_name),
-                scanner.slave_id,
-                address,
+                transport=transport,
+                client=client,
+                method_name=method_name,
+                address=address,
                 count=count,
                 attempt=attempt,
-                retry=scanner.retry,
-                timeout=scanner.timeout,
-                backoff=scanner.backoff,
-                backoff_jitter=scanner.backoff_jitter,
             )
             if (normalized_bits := normalize_bit_read_result(response, count)) is not None:
                 return normalized_bits
@@ -740,7 +741,8 @@ async def read_bit_registers(
                 attempt,
             )
         except (ModbusException, ConnectionException):
-            client = await _attempt_bit_reconnect(scanner, client)
+            if transport is None:
+                client = await _attempt_bit_reconnect(scanner, client)
         except asyncio.CancelledError:
             raise
         except OSError as exc:
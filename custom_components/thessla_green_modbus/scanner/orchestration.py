@@ -20,6 +20,7 @@ from ..const import (
 )
 from ..registers.read_planner import group_reads as _group_reads
 from ..scanner.device_info import ScannerDeviceInfo
+from ..transport.detection import PROBE_ERRORS, detect_mode
 from ..transport.rtu import RtuModbusTransport
 from . import custom_scan as scanner_custom_scan
 from . import scan_runtime
@@ -98,42 +99,47 @@ async def _accumulate_raw_registers(scanner: Any) -> dict[int, int]:
     return raw_registers
 
 
+async def _probe_tcp_mode(scanner: Any, transport: Any, timeout: float) -> None:
+    """Connect ``transport`` and check that the device answers its framing."""
+    await asyncio.wait_for(transport.ensure_connected(), timeout=timeout)
+    try:
+        await transport.read_input_registers(scanner.slave_id, 0, count=2)
+    except TimeoutError:
+        raise
+    except ModbusIOException as exc:
+        if is_request_cancelled_error(exc):
+            raise TimeoutError(str(exc)) from exc
+    except (
+        ModbusException,
+        ConnectionException,
+        OSError,
+        TypeError,
+        ValueError,
+        AttributeError,
+    ) as exc:
+        _LOGGER.debug("Protocol probe non-critical exception (protocol ok): %s", exc)
+
+
 async def _auto_detect_tcp_transport(scanner: Any) -> None:
-    """Attempt TCP mode probes and keep first successful transport."""
-    last_error: Exception | None = None
-    for selected_mode, transport, timeout in scanner._build_auto_tcp_attempts():
-        try:
-            await asyncio.wait_for(transport.ensure_connected(), timeout=timeout)
-            try:
-                await transport.read_input_registers(scanner.slave_id, 0, count=2)
-            except TimeoutError:
-                raise
-            except ModbusIOException as exc:
-                if is_request_cancelled_error(exc):
-                    raise TimeoutError(str(exc)) from exc
-            except (
-                ModbusException,
-                ConnectionException,
-                OSError,
-                TypeError,
-                ValueError,
-                AttributeError,
-            ) as exc:
-                _LOGGER.debug("Protocol probe non-critical exception (protocol ok): %s", exc)
-        except (TimeoutError, ConnectionException, ModbusException, OSError) as exc:
-            last_error = exc
-            await transport.close()
-            continue
-        scanner._transport = transport
-        scanner._resolved_connection_mode = selected_mode
-        _LOGGER.info(
-            "scan_device: auto-selected Modbus transport %s for %s:%s",
-            selected_mode,
-            scanner.host,
-            scanner.port,
+    """Probe the TCP framings concurrently and keep the first transport to answer."""
+
+    async def probe(_mode: str, transport: Any, timeout: float) -> None:
+        await _probe_tcp_mode(scanner, transport, timeout)
+
+    try:
+        selected_mode, transport = await detect_mode(
+            scanner.host, scanner.port, scanner._build_auto_tcp_attempts(), probe
         )
-        return
-    raise ConnectionException("Auto-detect Modbus transport failed") from last_error
+    except PROBE_ERRORS as exc:
+        raise ConnectionException("Auto-detect Modbus transport failed") from exc
+    scanner._transport = transport
+    scanner._resolved_connection_mode = selected_mode
+    _LOGGER.info(
+        "scan_device: auto-selected Modbus transport %s for %s:%s",
+        selected_mode,
+        scanner.host,
+        scanner.port,
+    )
 
 
 def _create_rtu_transport(scanner: Any) -> Any:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..registers.read_planner import coalesce_reads as _coalesce_reads
 from ..registers.read_planner import group_reads as _group_reads
 from ..scanner.register_maps import (
     COIL_REGISTERS,
@@ -48,20 +49,31 @@ def group_registers_for_batch_read(
     max_batch: int | None = None,
     boundaries: frozenset[int] | None = None,
 ) -> list[tuple[int, int]]:
-    """Group addresses for efficient reads, isolating known-missing addresses."""
+    """Group addresses for efficient reads, isolating known-missing addresses.
+
+    ``max_gap`` is the largest address step merged into one read: ``1`` only
+    merges contiguous addresses, larger values bridge up to ``max_gap - 1``
+    unread words as long as no known-missing address falls inside the hole.
+    """
     if not addresses:
         return []
 
-    # ``max_gap`` parameter is currently unused
-    _ = max_gap
-
     if max_batch is None:
         max_batch = scanner.effective_batch
 
     if scanner.safe_scan:
         return [(addr, 1) for addr in sorted(set(addresses))]
 
-    groups = _group_reads(addresses, max_block_size=max_batch, boundaries=boundaries)
+    if max_gap > 1:
+        groups = _coalesce_reads(
+            addresses,
+            max_block_size=max_batch,
+            boundaries=boundaries,
+            illegal=scanner._known_missing_addresses,
+            max_gap=max_gap - 1,
+        )
+    else:
+        groups = _group_reads(addresses, max_block_size=max_batch, boundaries=boundaries)
     if not scanner._known_missing_addresses:
         return groups
 
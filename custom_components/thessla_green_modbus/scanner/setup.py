@@ -26,6 +26,7 @@ from ..registers.read_planner import group_reads as _group_reads
 from ..scanner.helpers import MAX_BATCH_REGISTERS, SAFE_REGISTERS
 from ..scanner.register_maps import REGISTER_DEFINITIONS
 from ..transport.base import BaseModbusTransport
+from ..transport.detection import detect_mode, race_modes
 from ..transport.rtu import RtuModbusTransport
 from ..transport.tcp import TcpModbusTransport
 from ..transport.tcp_rtu import RawRtuOverTcpTransport
@@ -322,7 +323,6 @@ async def _attempt_single_verification(
         await _probe_safe_registers(
             scanner, transport, safe_input, safe_holding, holding_batch_boundaries, group_reads
         )
-        _store_resolved_mode(scanner, mode_name)
     finally:
         await close_verification_transport_once(transport, closed_transports)
 
@@ -346,9 +346,15 @@ async def verify_connection(
         rtu_transport_cls=rtu_transport_cls,
     )
 
-    last_error: Exception | None = None
     closed_transports: set[int] = set()
-    for mode_name, transport, timeout in attempts:
+    probed: set[tuple[str | None, int]] = set()
+
+    async def probe(mode_name: str | None, transport: Any, timeout: float) -> None:
+        # A refused AUTO candidate is probed again after the race; its
+        # transport has to be closed again afterwards.
+        if (mode_name, id(transport)) in probed:
+            closed_transports.discard(id(transport))
+        probed.add((mode_name, id(transport)))
         try:
             await _attempt_single_verification(
                 scanner,
@@ -361,9 +367,6 @@ async def verify_connection(
                 group_reads,
                 closed_transports,
             )
-            return
-        except asyncio.CancelledError:
-            raise
         except (
             ModbusIOException,
             TimeoutError,
@@ -371,10 +374,21 @@ async def verify_connection(
             ModbusException,
             OSError,
         ) as exc:
-            last_error = classify_verify_connection_exception(exc)
+            classify_verify_connection_exception(exc)
+            raise
+
+    async def close(transport: Any) -> None:
+        await close_verification_transport_once(transport, closed_transports)
 
-    if last_error:
-        raise last_error
+    if scanner.connection_type != CONNECTION_TYPE_RTU and (
+        scanner.connection_mode == CONNECTION_MODE_AUTO
+    ):
+        mode_name, _transport = await detect_mode(
+            scanner.host, scanner.port, attempts, probe, close=close
+        )
+    else:
+        mode_name, _transport = await race_modes(attempts, probe, close=close)
+    _store_resolved_mode(scanner, mode_name)
 
 
 def build_tcp_transport(
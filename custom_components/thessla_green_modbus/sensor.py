@@ -9,9 +9,9 @@ from __future__ import annotations
 import logging
 from typing import Any, cast
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE
+from homeassistant.const import PERCENTAGE, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -27,6 +27,7 @@ from .const import (
     STATUS_REGISTER_PREFIX,
 )
 from .coordinator import ThesslaGreenModbusCoordinator
+from .core.cycle_timing import TIMING_PHASES, phase_timings
 from .entity import ThesslaGreenEntity
 from .mappings import ENTITY_MAPPINGS
 from .registers.loader import get_register_definition
@@ -122,6 +123,8 @@ async def async_setup_entry(
     if error_registers:
         entities.append(ThesslaGreenActiveErrorsSensor(coordinator))
 
+    entities.extend(ThesslaGreenCycleTimingSensor(coordinator, phase) for phase in TIMING_PHASES)
+
     if entities:
         # The coordinator has completed its first refresh before platforms are
         # forwarded, so per-entity initial updates would duplicate Modbus IO.
@@ -186,6 +189,14 @@ class ThesslaGreenSensor(ThesslaGreenEntity, SensorEntity):
             register_name,
         )
 
+    def _source_keys(self) -> frozenset[str] | None:
+        """Return the register key, plus the nominal flow used for percentages."""
+        if self._register_name in AIRFLOW_RATE_REGISTERS:
+            return frozenset(
+                {self._register_name, "nominal_supply_air_flow", "nominal_exhaust_air_flow"}
+            )
+        return super()._source_keys()
+
     @property
     def native_value(self) -> float | int | str | None:
         """Return the state of the sensor."""
@@ -261,6 +272,10 @@ class ThesslaGreenSensor(ThesslaGreenEntity, SensorEntity):
 class ThesslaGreenSerialNumberSensor(ThesslaGreenSensor):
     """Diagnostic sensor that reads the serial number from device_info."""
 
+    def _source_keys(self) -> frozenset[str] | None:
+        """device_info is not coordinator data; wake on every update."""
+        return None
+
     @property
     def native_value(self) -> str | None:
         """Return the serial number string assembled during device scan."""
@@ -291,6 +306,10 @@ class ThesslaGreenErrorCodesSensor(ThesslaGreenEntity, SensorEntity):
         super().__init__(coordinator, self._register_name, -2)
         self._attr_translation_key = self._register_name
 
+    def _source_keys(self) -> frozenset[str] | None:
+        """Aggregates every error/status register; wake on every update."""
+        return None
+
     @property
     def available(self) -> bool:
         """Return sensor availability."""
@@ -327,6 +346,10 @@ class ThesslaGreenActiveErrorsSensor(ThesslaGreenEntity, SensorEntity):
         """Initialize the active errors sensor."""
         super().__init__(coordinator, "active_errors", -3)
 
+    def _source_keys(self) -> frozenset[str] | None:
+        """Aggregates every error/status register; wake on every update."""
+        return None
+
     @property
     def available(self) -> bool:
         """Return sensor availability."""
@@ -365,3 +388,45 @@ class ThesslaGreenActiveErrorsSensor(ThesslaGreenEntity, SensorEntity):
             _format_error_status_code(code): _error_status_description(code) for code in codes
         }
         return {"errors": errors, "codes": [_format_error_status_code(code) for code in codes]}
+
+
+class ThesslaGreenCycleTimingSensor(ThesslaGreenEntity, SensorEntity):
+    """p95 duration of one update-cycle phase (disabled by default)."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, coordinator: ThesslaGreenModbusCoordinator, phase: str) -> None:
+        """Initialize the timing sensor of ``phase``."""
+        super().__init__(coordinator, f"timing_{phase}", None)
+        self._phase = phase
+        self._register_name = self._key
+        self._attr_translation_key = self._key
+
+    def _source_keys(self) -> frozenset[str] | None:
+        """Timings change with every cycle; wake on every update."""
+        return None
+
+    def _summary(self) -> dict[str, Any] | None:
+        timings = phase_timings(self.coordinator.device_client)
+        return timings.histograms[self._phase].summary() if timings is not None else None
+
+    @property
+    def available(self) -> bool:
+        """Return sensor availability."""
+        return bool(self.coordinator.last_update_success) and self._summary() is not None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the 95th percentile in milliseconds."""
+        summary = self._summary()
+        return summary["p95_ms"] if summary else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return sample count, mean, maximum and p50/p95/p99."""
+        return self._summary() or {}
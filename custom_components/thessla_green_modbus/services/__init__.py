@@ -155,7 +155,7 @@ SERVICE_REGISTRATION_GROUPS: tuple[ServiceRegistrationGroup, ...] = (
     ),
     ServiceRegistrationGroup(
         register=register_logging_services,
-        service_names=("set_debug_logging",),
+        service_names=("set_debug_logging", "capture_frames"),
     ),
 )
 
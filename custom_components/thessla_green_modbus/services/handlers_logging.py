@@ -6,8 +6,9 @@ import logging
 
 from homeassistant.core import HomeAssistant, ServiceCall
 
+from ..transport.capture import DEFAULT_CAPTURE_FRAMES, frame_capture
 from .handler_deps import ServiceHandlerDeps
-from .schema import SET_LOG_LEVEL_SCHEMA
+from .schema import CAPTURE_FRAMES_SCHEMA, SET_LOG_LEVEL_SCHEMA
 
 
 def register_logging_services(hass: HomeAssistant, deps: ServiceHandlerDeps) -> None:
@@ -25,3 +26,14 @@ def register_logging_services(hass: HomeAssistant, deps: ServiceHandlerDeps) ->
     hass.services.async_register(
         deps.domain, "set_debug_logging", set_debug_logging, SET_LOG_LEVEL_SCHEMA
     )
+
+    async def capture_frames(call: ServiceCall) -> None:
+        frames = int(call.data.get("frames", DEFAULT_CAPTURE_FRAMES))
+        if frames:
+            frame_capture.start(frames)
+        else:
+            frame_capture.stop()
+
+    hass.services.async_register(
+        deps.domain, "capture_frames", capture_frames, CAPTURE_FRAMES_SCHEMA
+    )
@@ -19,6 +19,7 @@ from ..options import (
     RESET_TYPES,
     SPECIAL_MODE_OPTIONS,
 )
+from ..transport.capture import DEFAULT_CAPTURE_FRAMES, MAX_CAPTURE_FRAMES
 from .validation import (
     validate_bypass_temperature_range as _validate_bypass_temperature_range_impl,
 )
@@ -161,3 +162,10 @@ SET_LOG_LEVEL_SCHEMA = vol.Schema(
         ),
     }
 )
+CAPTURE_FRAMES_SCHEMA = vol.Schema(
+    {
+        vol.Optional("frames", default=DEFAULT_CAPTURE_FRAMES): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=MAX_CAPTURE_FRAMES)
+        ),
+    }
+)
@@ -109,6 +109,10 @@ class ThesslaGreenSwitch(ThesslaGreenEntity, SwitchEntity):
         self._optimistic = OptimisticState()
         _LOGGER.debug("Initialized switch entity: %s", key)
 
+    def _source_keys(self) -> frozenset[str] | None:
+        """Return the entity key and the register the switch state is read from."""
+        return frozenset({self._key, self.register_name})
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Drop the optimistic value once the confirmed on/off state matches."""
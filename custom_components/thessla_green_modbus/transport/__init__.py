@@ -1,7 +1,12 @@
 """Transport package for Modbus communication."""
 
 from .base import BaseModbusTransport
-from .crc import append_crc, crc16, crc16_bytes
+from .bus import BusRegistry, SharedBus, SharedBusTransport, bus_registry
+from .capture import FrameCapture, frame_capture
+from .crc import CRC16_INIT, append_crc, crc16, crc16_bytes, crc16_update
+from .detection import DetectedModes, detect_mode, detected_modes, race_modes
+from .health import ConnectionHealth
+from .mbap import RawModbusTcpTransport
 from .raw import (
     _MAX_READ_REGISTERS,
     _MAX_SLAVE_ID,
@@ -11,29 +16,48 @@ from .raw import (
     RawModbusWriteResponse,
 )
 from .retry import ErrorKind, RetryDecision, classify_transport_error, should_retry
+from .rtt import RttEstimator
 from .rtu import SERIAL_IMPORT_ERROR, RtuModbusTransport, _AsyncModbusSerialClient
+from .rtu_timing import InterFrameGate, RtuLineTiming
 from .tcp import TcpModbusTransport, _ClientBackedTransport
 from .tcp_rtu import RawRtuOverTcpTransport
 
 __all__ = [
+    "CRC16_INIT",
     "SERIAL_IMPORT_ERROR",
     "_MAX_READ_REGISTERS",
     "_MAX_SLAVE_ID",
     "_MAX_WRITE_REGISTERS",
     "_MIN_SLAVE_ID",
     "BaseModbusTransport",
+    "BusRegistry",
+    "ConnectionHealth",
+    "DetectedModes",
     "ErrorKind",
+    "FrameCapture",
+    "InterFrameGate",
     "RawModbusResponse",
+    "RawModbusTcpTransport",
     "RawModbusWriteResponse",
     "RawRtuOverTcpTransport",
     "RetryDecision",
+    "RttEstimator",
+    "RtuLineTiming",
     "RtuModbusTransport",
+    "SharedBus",
+    "SharedBusTransport",
     "TcpModbusTransport",
     "_AsyncModbusSerialClient",
     "_ClientBackedTransport",
     "append_crc",
+    "bus_registry",
     "classify_transport_error",
     "crc16",
     "crc16_bytes",
+    "crc16_update",
+    "detect_mode",
+    "detected_modes",
+    "frame_capture",
+    "race_modes",
     "should_retry",
 ]
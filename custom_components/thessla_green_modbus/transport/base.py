@@ -9,10 +9,19 @@ from typing import Any
 
 from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
 
+from ..const import RESPONSE_TIMEOUT_FLOOR
 from ..error_policy import to_log_message
 from ..modbus.call import _call_modbus
+from ..modbus.deadline import (
+    CycleDeadlineExceeded,
+    clamp_timeout,
+    deadline_expired,
+    remaining_time,
+)
 from ..transport.retry_logging import apply_transport_backoff, log_transport_retry
+from .health import ConnectionHealth
 from .retry import classify_transport_error
+from .rtt import RttEstimator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +29,10 @@ _LOGGER = logging.getLogger(__name__)
 class BaseModbusTransport(ABC):
     """Base interface for transport implementations."""
 
+    #: Requests this transport can keep in flight on one connection.  Transports
+    #: that serialise requests (serial lines, pymodbus clients) leave this at 1.
+    max_inflight_requests: int = 1
+
     def __init__(
         self,
         *,
@@ -35,11 +48,20 @@ class BaseModbusTransport(ABC):
         self.timeout = float(timeout)
         self.offline_state = offline_state
         self._lock = asyncio.Lock()
+        #: Per-request response timeout, learnt from the connection's round trips.
+        self.rtt = RttEstimator(floor=RESPONSE_TIMEOUT_FLOOR, ceiling=self.timeout)
+        #: Connections kept and dropped after failed requests.
+        self.health = ConnectionHealth()
 
     @property
     def offline(self) -> bool:
         return self.offline_state
 
+    @property
+    def response_timeout(self) -> float:
+        """Seconds to wait for the response to the next request."""
+        return min(self.timeout, self.rtt.timeout)
+
     def is_connected(self) -> bool:
         return self._is_connected()
 
@@ -47,13 +69,25 @@ class BaseModbusTransport(ABC):
         self.offline_state = True
         await self._reset_connection()
 
-    async def _execute(self, func: Any, *, ensure_connection: bool = False) -> Any:
+    async def _execute(
+        self, func: Any, *, ensure_connection: bool = False, deadline: float | None = None
+    ) -> Any:
+        """Run ``func`` with connection management.
+
+        With an update-cycle ``deadline`` the whole request is bounded by the
+        time left; a request cut short resets the connection like a timeout.
+        """
         try:
             if ensure_connection:
                 await self.ensure_connected()
-            result = await func()
+            if deadline is None:
+                result = await func()
+            else:
+                result = await asyncio.wait_for(func(), clamp_timeout(None, deadline))
             self.offline_state = False
             return result
+        except CycleDeadlineExceeded:
+            raise
         except asyncio.CancelledError:
             self.offline_state = True
             try:
@@ -61,7 +95,11 @@ class BaseModbusTransport(ABC):
             except (ConnectionException, ModbusException, OSError, RuntimeError) as exc:
                 _LOGGER.debug("Reset connection failed during CancelledError handling: %s", exc)
             raise
-        except (TimeoutError, ModbusIOException, ConnectionException, OSError):
+        except (TimeoutError, ModbusIOException) as exc:
+            if not await self._link_survives(exc, deadline):
+                await self._mark_offline_and_reset()
+            raise
+        except (ConnectionException, OSError):
             await self._mark_offline_and_reset()
             raise
         except ModbusException as exc:
@@ -79,6 +117,32 @@ class BaseModbusTransport(ABC):
             self.offline_state = True
             raise
 
+    async def _link_survives(self, exc: Exception, deadline: float | None = None) -> bool:
+        """Return True when the connection is still usable after the failed request.
+
+        The check shares the update-cycle ``deadline``; with no time left the
+        connection is reset as before.
+        """
+        try:
+            kept = (
+                self._is_connected()
+                and not deadline_expired(deadline)
+                and await asyncio.wait_for(self._recover_link(exc), remaining_time(deadline))
+            )
+        except (ModbusException, OSError) as recover_error:
+            _LOGGER.debug("Connection check after %s failed: %s", type(exc).__name__, recover_error)
+            kept = False
+        self.health.record(kept)
+        return kept
+
+    async def _recover_link(self, exc: Exception) -> bool:
+        """Bring an open connection back in step after ``exc``; False when it is down.
+
+        Transports that cannot tell a lost frame from a dead link reconnect.
+        """
+        _ = exc
+        return False
+
     async def call(
         self,
         func: Any,
@@ -89,6 +153,7 @@ class BaseModbusTransport(ABC):
         backoff: float | None = None,
         backoff_jitter: float | tuple[float, float] | None = None,
         apply_backoff: bool = True,
+        deadline: float | None = None,
         **kwargs: Any,
     ) -> Any:
         """Call a Modbus function with connection management and retries."""
@@ -100,10 +165,11 @@ class BaseModbusTransport(ABC):
                 *args,
                 attempt=attempt,
                 max_attempts=max_attempts or self.max_retries,
-                timeout=self.timeout,
+                timeout=self.response_timeout,
                 backoff=backoff if backoff is not None else self.base_backoff,
                 backoff_jitter=backoff_jitter,
                 apply_backoff=apply_backoff,
+                deadline=deadline,
                 **kwargs,
             )
 
@@ -169,6 +235,7 @@ class BaseModbusTransport(ABC):
         *,
         count: int,
         attempt: int = 1,
+        deadline: float | None = None,
     ) -> Any:
         """Read input registers from the device."""
 
@@ -180,9 +247,34 @@ class BaseModbusTransport(ABC):
         *,
         count: int,
         attempt: int = 1,
+        deadline: float | None = None,
     ) -> Any:
         """Read holding registers from the device."""
 
+    @abstractmethod
+    async def read_coils(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        """Read coils (FC01) from the device."""
+
+    @abstractmethod
+    async def read_discrete_inputs(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        """Read discrete inputs (FC02) from the device."""
+
     @abstractmethod
     async def write_register(
         self,
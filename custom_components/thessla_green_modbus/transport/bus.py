@@ -0,0 +1,373 @@
+"""Process-wide sharing of one Modbus connection between several units.
+
+Several AirPacks can sit behind one Modbus TCP gateway or on one RS485
+segment.  Rather than each config entry opening its own socket or serial
+port (and colliding on the medium with independent locks and reconnects),
+every entry gets a :class:`SharedBusTransport` handle for its slave ID.  All
+handles for the same endpoint lease one :class:`SharedBus`, which owns the
+single underlying transport and hands its request slots out round-robin
+across slave IDs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from .base import BaseModbusTransport
+
+BusKey = tuple[Hashable, ...]
+
+
+def tcp_bus_key(host: str, port: int, mode: str) -> BusKey:
+    """Return the bus key of a TCP endpoint spoken to in ``mode``."""
+    return ("tcp", host.strip().lower(), int(port), mode)
+
+
+def serial_bus_key(serial_port: str) -> BusKey:
+    """Return the bus key of a serial port."""
+    return ("rtu", serial_port)
+
+
+class _FairSlots:
+    """Request slots granted round-robin across slave IDs.
+
+    A unit with many queued requests cannot starve another unit: once a slot
+    is granted to a waiter of one slave ID, that slave ID moves to the back
+    of the rotation.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._free = max(1, capacity)
+        self._waiters: dict[int, deque[asyncio.Future[None]]] = {}
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._waiters.values())
+
+    async def acquire(self, slave_id: int) -> None:
+        if self._free and not self._waiters:
+            self._free -= 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(slave_id, deque()).append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation.
+                self.release()
+            else:
+                queue = self._waiters.get(slave_id)
+                if queue is not None and waiter in queue:
+                    queue.remove(waiter)
+                    if not queue:
+                        del self._waiters[slave_id]
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            slave_id = next(iter(self._waiters))
+            queue = self._waiters.pop(slave_id)
+            waiter = queue.popleft()
+            if queue:
+                self._waiters[slave_id] = queue
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._free += 1
+
+
+class SharedBus:
+    """One underlying transport shared by every unit on the same endpoint."""
+
+    def __init__(self, key: BusKey, transport: BaseModbusTransport) -> None:
+        self.key = key
+        self.transport = transport
+        self.leases = 0
+        #: Leases held per slave ID.
+        self.units: dict[int, int] = {}
+        self._slots = _FairSlots(transport.max_inflight_requests)
+        self._created = time.monotonic()
+        self._busy_time = 0.0
+        self._wait_time = 0.0
+        self._in_flight = 0
+        self._requests: dict[int, int] = {}
+
+    async def run(self, slave_id: int, func: Callable[[], Any]) -> Any:
+        """Run ``func`` for ``slave_id`` once a request slot is free."""
+        queued_at = time.monotonic()
+        await self._slots.acquire(slave_id)
+        started = time.monotonic()
+        self._wait_time += started - queued_at
+        self._in_flight += 1
+        self._requests[slave_id] = self._requests.get(slave_id, 0) + 1
+        try:
+            return await func()
+        finally:
+            self._in_flight -= 1
+            self._busy_time += time.monotonic() - started
+            self._slots.release()
+
+    def statistics(self) -> dict[str, Any]:
+        """Return the bus utilisation since it was opened.
+
+        ``utilisation`` is the share of the available request slots that
+        were busy, so a single-slot bus at 1.0 never idles.
+        """
+        elapsed = max(time.monotonic() - self._created, 1e-9)
+        requests = sum(self._requests.values())
+        capacity = max(1, self.transport.max_inflight_requests)
+        return {
+            "units": sorted(self.units),
+            "requests": requests,
+            "requests_per_unit": dict(sorted(self._requests.items())),
+            "in_flight": self._in_flight,
+            "queued": self._slots.queued,
+            "utilisation": round(min(1.0, self._busy_time / (elapsed * capacity)), 4),
+            "average_wait": round(self._wait_time / requests, 6) if requests else 0.0,
+        }
+
+
+class BusRegistry:
+    """Shared buses by endpoint, leased by :class:`SharedBusTransport` handles."""
+
+    def __init__(self) -> None:
+        self._buses: dict[BusKey, SharedBus] = {}
+
+    def acquire(
+        self, key: BusKey, factory: Callable[[], BaseModbusTransport], slave_id: int
+    ) -> SharedBus:
+        """Lease the bus for ``key``, opening it with ``factory`` if needed."""
+        bus = self._buses.get(key)
+        if bus is None:
+            bus = self._buses[key] = SharedBus(key, factory())
+        bus.leases += 1
+        bus.units[slave_id] = bus.units.get(slave_id, 0) + 1
+        return bus
+
+    async def release(self, bus: SharedBus, slave_id: int) -> None:
+        """Return a lease; the last one closes the underlying transport."""
+        bus.leases -= 1
+        if bus.units.get(slave_id, 0) > 1:
+            bus.units[slave_id] -= 1
+        else:
+            bus.units.pop(slave_id, None)
+        if bus.leases > 0:
+            return
+        if self._buses.get(bus.key) is bus:
+            del self._buses[bus.key]
+        await bus.transport.close()
+
+    def get(self, key: BusKey) -> SharedBus | None:
+        return self._buses.get(key)
+
+    def statistics(self) -> list[dict[str, Any]]:
+        """Return the utilisation of every open bus."""
+        return [bus.statistics() for bus in self._buses.values()]
+
+    def clear(self) -> None:
+        """Forget every bus without closing it (used by tests)."""
+        self._buses.clear()
+
+
+#: The registry shared by every config entry in the process.
+bus_registry = BusRegistry()
+
+
+class SharedBusTransport(BaseModbusTransport):
+    """Per-slave handle on a :class:`SharedBus`.
+
+    The handle leases its bus on creation and again on the next connect after
+    :meth:`close`, which only returns the lease; the connection itself is
+    closed when the last unit on the bus lets go of it.
+    """
+
+    def __init__(
+        self,
+        key: BusKey,
+        factory: Callable[[], BaseModbusTransport],
+        *,
+        slave_id: int,
+        registry: BusRegistry | None = None,
+    ) -> None:
+        self._key = key
+        self._factory = factory
+        self._registry = registry or bus_registry
+        self.slave_id = slave_id
+        self._bus: SharedBus | None = None
+        transport = self._lease().transport
+        super().__init__(
+            max_retries=transport.max_retries,
+            base_backoff=transport.base_backoff,
+            max_backoff=transport.max_backoff,
+            timeout=transport.timeout,
+            offline_state=transport.offline_state,
+        )
+
+    def _lease(self) -> SharedBus:
+        if self._bus is None:
+            self._bus = self._registry.acquire(self._key, self._factory, self.slave_id)
+            self.max_inflight_requests = self._bus.transport.max_inflight_requests
+        return self._bus
+
+    @property
+    def bus(self) -> SharedBus | None:
+        """The leased bus, or ``None`` while the handle is closed."""
+        return self._bus
+
+    @property
+    def client(self) -> Any:
+        return getattr(self._bus.transport, "client", None) if self._bus else None
+
+    def bus_statistics(self) -> dict[str, Any] | None:
+        return self._bus.statistics() if self._bus else None
+
+    @property
+    def offline(self) -> bool:
+        return self._bus is None or self._bus.transport.offline
+
+    def _is_connected(self) -> bool:
+        return self._bus is not None and self._bus.transport.is_connected()
+
+    async def _connect(self) -> None:
+        await self._lease().transport.ensure_connected()
+
+    async def _reset_connection(self) -> None:
+        """Leave the shared connection alone; other units may be using it."""
+
+    async def ensure_connected(self) -> None:
+        await self._lease().transport.ensure_connected()
+
+    async def close(self) -> None:
+        bus, self._bus = self._bus, None
+        self.offline_state = True
+        if bus is not None:
+            await self._registry.release(bus, self.slave_id)
+
+    async def call(self, func: Any, slave_id: int, *args: Any, **kwargs: Any) -> Any:
+        bus = self._lease()
+        return await bus.run(slave_id, lambda: bus.transport.call(func, slave_id, *args, **kwargs))
+
+    async def _forward(self, operation: str, slave_id: int, address: int, **kwargs: Any) -> Any:
+        bus = self._lease()
+        method = getattr(bus.transport, operation)
+        return await bus.run(slave_id, lambda: method(slave_id, address, **kwargs))
+
+    async def read_input_registers(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        return await self._forward(
+            "read_input_registers",
+            slave_id,
+            address,
+            count=count,
+            attempt=attempt,
+            deadline=deadline,
+        )
+
+    async def read_holding_registers(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        return await self._forward(
+            "read_holding_registers",
+            slave_id,
+            address,
+            count=count,
+            attempt=attempt,
+            deadline=deadline,
+        )
+
+    async def read_coils(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        return await self._forward(
+            "read_coils",
+            slave_id,
+            address,
+            count=count,
+            attempt=attempt,
+            deadline=deadline,
+        )
+
+    async def read_discrete_inputs(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        return await self._forward(
+            "read_discrete_inputs",
+            slave_id,
+            address,
+            count=count,
+            attempt=attempt,
+            deadline=deadline,
+        )
+
+    async def write_register(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        value: int,
+        attempt: int = 1,
+    ) -> Any:
+        return await self._forward(
+            "write_register",
+            slave_id,
+            address,
+            value=value,
+            attempt=attempt,
+        )
+
+    async def write_registers(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        values: list[int],
+        attempt: int = 1,
+    ) -> Any:
+        return await self._forward(
+            "write_registers",
+            slave_id,
+            address,
+            values=values,
+            attempt=attempt,
+        )
+
+
+__all__ = [
+    "BusKey",
+    "BusRegistry",
+    "SharedBus",
+    "SharedBusTransport",
+    "bus_registry",
+    "serial_bus_key",
+    "tcp_bus_key",
+]
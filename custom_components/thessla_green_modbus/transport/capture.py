@@ -0,0 +1,107 @@
+"""Capture of raw Modbus frames for bus traces.
+
+Capture is off by default and then costs the transports one attribute check
+per frame.  Once started (``capture_frames`` service) every frame the
+integration writes to or reads from a connection is recorded with its
+monotonic timestamp in a fixed-size ring buffer, the oldest frames making
+way for new ones.  The buffer is part of the diagnostics download, giving a
+bus trace from a production installation without debug logging.
+"""
+
+from __future__ import annotations
+
+import inspect
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+DEFAULT_CAPTURE_FRAMES = 500
+MAX_CAPTURE_FRAMES = 10000
+
+TracePacket = Callable[[bool, bytes], bytes]
+"""pymodbus ``trace_packet`` hook: called with each packet sent or received."""
+
+
+class FrameCapture:
+    """Ring buffer of ``(monotonic time, endpoint, sending, frame)`` records."""
+
+    __slots__ = ("_frames", "enabled")
+
+    def __init__(self) -> None:
+        #: Checked by the transports before recording; a plain attribute so
+        #: the check stays free while capture is off.
+        self.enabled = False
+        self._frames: deque[tuple[float, str, bool, bytes]] = deque(maxlen=0)
+
+    def start(self, frames: int = DEFAULT_CAPTURE_FRAMES) -> None:
+        """Start a new capture keeping the last ``frames`` frames."""
+        self._frames = deque(maxlen=max(1, min(int(frames), MAX_CAPTURE_FRAMES)))
+        self.enabled = True
+
+    def stop(self) -> None:
+        """Stop recording; the frames captured so far stay available."""
+        self.enabled = False
+
+    def clear(self) -> None:
+        """Stop and drop every frame (used by tests)."""
+        self.enabled = False
+        self._frames = deque(maxlen=0)
+
+    def record(self, endpoint: str, sending: bool, frame: bytes | bytearray | memoryview) -> None:
+        self._frames.append((time.monotonic(), endpoint, sending, bytes(frame)))
+
+    def trace_packet(self, endpoint: str) -> TracePacket:
+        """Return a pymodbus ``trace_packet`` hook recording packets of ``endpoint``."""
+
+        def trace(sending: bool, data: bytes) -> bytes:
+            if self.enabled:
+                self.record(endpoint, sending, data)
+            return data
+
+        return trace
+
+    def dump(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "size": self._frames.maxlen,
+            "frames": [
+                {
+                    "time": round(timestamp, 6),
+                    "endpoint": endpoint,
+                    "direction": "tx" if sending else "rx",
+                    "frame": frame.hex(),
+                }
+                for timestamp, endpoint, sending, frame in self._frames
+            ],
+        }
+
+
+frame_capture = FrameCapture()
+
+
+def trace_packet_kwargs(client_class: Any, endpoint: str) -> dict[str, TracePacket]:
+    """Return the ``trace_packet`` keyword for ``client_class`` when it takes one.
+
+    pymodbus clients only accept ``trace_packet`` from 3.8 on; older ones
+    reject it, and their frames are not captured.
+    """
+    try:
+        parameters = inspect.signature(client_class).parameters.values()
+    except (TypeError, ValueError):
+        return {}
+    if any(
+        parameter.name == "trace_packet" or parameter.kind is inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters
+    ):
+        return {"trace_packet": frame_capture.trace_packet(endpoint)}
+    return {}
+
+
+__all__ = [
+    "DEFAULT_CAPTURE_FRAMES",
+    "MAX_CAPTURE_FRAMES",
+    "FrameCapture",
+    "frame_capture",
+    "trace_packet_kwargs",
+]
@@ -2,17 +2,40 @@
 
 from __future__ import annotations
 
+#: Initial value of a Modbus CRC16 computation.
+CRC16_INIT = 0xFFFF
 
-def crc16(data: bytes) -> int:
-    crc = 0xFFFF
-    for byte in data:
-        crc ^= byte
+
+def _build_table() -> tuple[int, ...]:
+    table = []
+    for value in range(256):
+        crc = value
         for _ in range(8):
             crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
-    return crc & 0xFFFF
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _build_table()
+
+
+def crc16_update(crc: int, data: bytes | bytearray | memoryview) -> int:
+    """Fold ``data`` into a running CRC16 started from :data:`CRC16_INIT`.
+
+    Feeding a frame in pieces gives the same result as :func:`crc16` over the
+    whole frame, and folding in a frame's own CRC bytes yields ``0``.
+    """
+    table = _CRC16_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def crc16(data: bytes | bytearray | memoryview) -> int:
+    return crc16_update(CRC16_INIT, data)
 
 
-def crc16_bytes(data: bytes) -> bytes:
+def crc16_bytes(data: bytes | bytearray | memoryview) -> bytes:
     """Return Modbus CRC16 serialized in little-endian order."""
     return crc16(data).to_bytes(2, "little")
 
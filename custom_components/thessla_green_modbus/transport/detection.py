@@ -0,0 +1,176 @@
+"""Concurrent detection of the framing spoken on a Modbus TCP endpoint.
+
+A TCP port may speak Modbus TCP (MBAP framing) or pass raw RTU frames on to
+an RS485 line.  Trying one framing after the other costs the full probe
+timeout of every wrong guess before the right one is tried.
+:func:`race_modes` probes all candidates at once, each on its own socket:
+the first probe to succeed wins and the others are cancelled and closed.
+:func:`detect_mode` remembers the winner per endpoint in
+:data:`detected_modes`, so later connections try that framing alone first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
+
+_LOGGER = logging.getLogger(__name__)
+
+ModeAttempt = tuple[Any, Any, float]
+"""``(mode, transport, timeout)`` as built by the scanner for one candidate framing."""
+
+ModeProbe = Callable[[Any, Any, float], Awaitable[None]]
+"""Connect and probe one candidate; raises when it does not answer the framing."""
+
+TransportClose = Callable[[Any], Awaitable[None]]
+
+# Errors a failed probe is expected to raise.
+PROBE_ERRORS: tuple[type[Exception], ...] = (
+    TimeoutError,
+    ConnectionException,
+    ModbusException,
+    OSError,
+)
+
+
+class DetectedModes:
+    """Connection mode last detected for each TCP endpoint."""
+
+    def __init__(self) -> None:
+        self._modes: dict[tuple[str, int], str] = {}
+
+    @staticmethod
+    def _key(host: str, port: int) -> tuple[str, int]:
+        return host.strip().lower(), int(port)
+
+    def get(self, host: str, port: int) -> str | None:
+        return self._modes.get(self._key(host, port))
+
+    def remember(self, host: str, port: int, mode: str) -> None:
+        self._modes[self._key(host, port)] = mode
+
+    def forget(self, host: str, port: int) -> None:
+        self._modes.pop(self._key(host, port), None)
+
+    def clear(self) -> None:
+        """Forget every endpoint (used by tests)."""
+        self._modes.clear()
+
+
+detected_modes = DetectedModes()
+
+
+async def close_transport(transport: Any) -> None:
+    """Close a probe transport, supporting sync/async ``close()``."""
+    try:
+        result = transport.close()
+        if inspect.isawaitable(result):
+            await result
+    except (OSError, ConnectionException, ModbusIOException):
+        _LOGGER.debug("Error closing probe transport", exc_info=True)
+
+
+def _refused(error: BaseException | None) -> bool:
+    """Return True when ``error`` means the socket was not accepted at all."""
+    return isinstance(error, ConnectionException | ConnectionError)
+
+
+async def race_modes(
+    attempts: Sequence[ModeAttempt],
+    probe: ModeProbe,
+    *,
+    close: TransportClose = close_transport,
+) -> tuple[Any, Any]:
+    """Probe every attempt concurrently and return the first ``(mode, transport)`` to answer.
+
+    When several probes finish together the earlier attempt wins.  Every other
+    transport is closed, also when the caller is cancelled.  Endpoints that
+    accept a single client (common on serial gateways) refuse the second
+    socket, so a refused candidate gets a turn of its own when another one
+    got through but failed.  When no probe succeeds the error of the last
+    attempt is raised.
+    """
+    if not attempts:
+        raise ConnectionException("No transport to probe")
+    tasks = [
+        asyncio.ensure_future(probe(mode, transport, timeout))
+        for mode, transport, timeout in attempts
+    ]
+    winner: int | None = None
+    try:
+        pending: set[asyncio.Future[None]] = set(tasks)
+        while pending and winner is None:
+            _done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winner = next(
+                (
+                    index
+                    for index, task in enumerate(tasks)
+                    if task.done() and not task.cancelled() and task.exception() is None
+                ),
+                None,
+            )
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for index, (_mode, transport, _timeout) in enumerate(attempts):
+            if index != winner:
+                await close(transport)
+
+    if winner is not None:
+        return attempts[winner][0], attempts[winner][1]
+
+    errors = [task.exception() for task in tasks]
+    if len(attempts) > 1 and not all(_refused(error) for error in errors):
+        for (mode, transport, timeout), error in zip(attempts, errors, strict=True):
+            if not _refused(error):
+                continue
+            try:
+                await probe(mode, transport, timeout)
+            except PROBE_ERRORS:
+                await close(transport)
+                continue
+            return mode, transport
+    last_error = errors[-1]
+    if last_error is None:
+        raise ConnectionException("No transport answered")
+    raise last_error
+
+
+async def detect_mode(
+    host: str,
+    port: int,
+    attempts: Sequence[ModeAttempt],
+    probe: ModeProbe,
+    *,
+    close: TransportClose = close_transport,
+) -> tuple[Any, Any]:
+    """Race ``attempts`` for ``host:port``, trying the mode detected last time alone first."""
+    cached = detected_modes.get(host, port)
+    remaining = [attempt for attempt in attempts if attempt[0] != cached]
+    if len(remaining) < len(attempts):
+        first = [attempt for attempt in attempts if attempt[0] == cached]
+        try:
+            return await race_modes(first, probe, close=close)
+        except PROBE_ERRORS as exc:
+            _LOGGER.debug("Cached mode %s no longer answers on %s:%s: %s", cached, host, port, exc)
+            detected_modes.forget(host, port)
+            if not remaining:
+                raise
+    mode, transport = await race_modes(remaining, probe, close=close)
+    detected_modes.remember(host, port, mode)
+    return mode, transport
+
+
+__all__ = [
+    "DetectedModes",
+    "close_transport",
+    "detect_mode",
+    "detected_modes",
+    "race_modes",
+]
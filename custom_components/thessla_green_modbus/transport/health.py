@@ -0,0 +1,44 @@
+"""Connection health after failed requests.
+
+A request that times out or gets a garbled answer does not mean the
+connection is gone: the answer may just be late, or one frame was lost.
+Tearing the socket down costs a reconnect, and on some gateways a
+multi-second session setup.  Each transport therefore checks its link after
+such a failure (see ``BaseModbusTransport._recover_link``) and keeps it when
+it is still usable.  :class:`ConnectionHealth` counts the outcomes.
+"""
+
+from __future__ import annotations
+
+# One-register read sent to check that the unit still answers on a quiet link.
+PROBE_FUNCTION = 4
+PROBE_ADDRESS = 0
+
+
+class ConnectionHealth:
+    """Counts of connections kept and dropped after failed requests."""
+
+    __slots__ = ("drained_bytes", "kept", "probes", "reconnects")
+
+    def __init__(self) -> None:
+        self.kept = 0
+        self.reconnects = 0
+        self.probes = 0
+        self.drained_bytes = 0
+
+    def record(self, kept: bool) -> None:
+        if kept:
+            self.kept += 1
+        else:
+            self.reconnects += 1
+
+    def statistics(self) -> dict[str, int]:
+        return {
+            "reconnects_avoided": self.kept,
+            "reconnects": self.reconnects,
+            "probes": self.probes,
+            "drained_bytes": self.drained_bytes,
+        }
+
+
+__all__ = ["PROBE_ADDRESS", "PROBE_FUNCTION", "ConnectionHealth"]
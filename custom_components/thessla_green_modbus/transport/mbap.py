@@ -0,0 +1,360 @@
+"""Native Modbus TCP (MBAP) transport implementation."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+import time
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
+
+from ..const import MAX_INFLIGHT_REQUESTS
+from .base import BaseModbusTransport
+from .capture import frame_capture
+from .health import PROBE_ADDRESS, PROBE_FUNCTION
+from .raw import RawModbusResponse, RawModbusWriteResponse
+from .tcp_rtu import RawRtuOverTcpTransport
+
+_LOGGER = logging.getLogger(__name__)
+
+# Transaction ID, protocol ID, length of the unit ID plus PDU, unit ID.
+_MBAP_HEADER = struct.Struct(">HHHB")
+_MODBUS_PROTOCOL_ID = 0
+_MAX_PDU_LENGTH = 253
+
+
+class RawModbusTcpTransport(BaseModbusTransport):
+    """Modbus TCP transport that frames MBAP requests itself.
+
+    Every request carries its own transaction ID and a background receive
+    task hands each response to the request waiting on that ID, so several
+    requests can share one connection and be answered in any order.  A late
+    response to a request that already gave up is dropped instead of being
+    taken as the answer to the next one.
+    """
+
+    max_inflight_requests = MAX_INFLIGHT_REQUESTS
+
+    _validate_slave_id = staticmethod(RawRtuOverTcpTransport._validate_slave_id)
+    _validate_read_count = staticmethod(RawRtuOverTcpTransport._validate_read_count)
+    _validate_bit_count = staticmethod(RawRtuOverTcpTransport._validate_bit_count)
+    _validate_write_count = staticmethod(RawRtuOverTcpTransport._validate_write_count)
+    _decode_register_words = staticmethod(RawRtuOverTcpTransport._decode_register_words)
+    _decode_bits = staticmethod(RawRtuOverTcpTransport._decode_bits)
+    _validate_write_echo = staticmethod(RawRtuOverTcpTransport._validate_write_echo)
+
+    def __init__(
+        self,
+        *,
+        host: str,
+        port: int,
+        max_retries: int,
+        base_backoff: float,
+        max_backoff: float,
+        timeout: float,
+        offline_state: bool = False,
+    ) -> None:
+        super().__init__(
+            max_retries=max_retries,
+            base_backoff=base_backoff,
+            max_backoff=max_backoff,
+            timeout=timeout,
+            offline_state=offline_state,
+        )
+        self.host = host
+        self.port = port
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._receiver: asyncio.Task[None] | None = None
+        #: Outstanding requests by transaction ID.
+        self._pending: dict[int, asyncio.Future[tuple[int, bytes]]] = {}
+        self._transaction_id = 0
+        #: Unit addressed by the last request, probed when the link goes quiet.
+        self._last_slave_id = 1
+
+    def _is_connected(self) -> bool:
+        return bool(
+            self._writer
+            and not self._writer.is_closing()
+            and self._receiver is not None
+            and not self._receiver.done()
+        )
+
+    async def _connect(self) -> None:
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                timeout=self.timeout,
+            )
+        except TimeoutError as exc:
+            raise TimeoutError(f"Timed out connecting to {self.host}:{self.port}") from exc
+        except OSError as exc:
+            raise ConnectionException(f"Could not connect to {self.host}:{self.port}") from exc
+        self._reader, self._writer = reader, writer
+        self._receiver = asyncio.get_running_loop().create_task(self._receive_responses(reader))
+
+    async def _reset_connection(self) -> None:
+        receiver, self._receiver = self._receiver, None
+        if receiver is not None and receiver is not asyncio.current_task():
+            receiver.cancel()
+        self._fail_pending(ConnectionException("Modbus TCP connection was reset"))
+        if self._writer is None:
+            self._reader = None
+            return
+        try:
+            self._writer.close()
+            wait_closed = getattr(self._writer, "wait_closed", None)
+            if callable(wait_closed):
+                await wait_closed()
+        finally:
+            self._reader = None
+            self._writer = None
+
+    def _fail_pending(self, exc: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _receive_responses(self, reader: asyncio.StreamReader) -> None:
+        """Route every response on the connection to the request awaiting it."""
+        error: Exception
+        try:
+            while True:
+                header = await reader.readexactly(_MBAP_HEADER.size)
+                transaction_id, protocol_id, length, unit = _MBAP_HEADER.unpack(header)
+                if protocol_id != _MODBUS_PROTOCOL_ID or not 2 <= length <= _MAX_PDU_LENGTH + 1:
+                    raise ModbusIOException("Invalid MBAP header in Modbus TCP response")
+                pdu = await reader.readexactly(length - 1)
+                if frame_capture.enabled:
+                    frame_capture.record(f"{self.host}:{self.port}", False, header + pdu)
+                future = self._pending.pop(transaction_id, None)
+                if future is None or future.done():
+                    _LOGGER.debug(
+                        "Dropping Modbus TCP response for unknown transaction %s", transaction_id
+                    )
+                    continue
+                future.set_result((unit, pdu))
+        except asyncio.IncompleteReadError:
+            error = ConnectionException("Modbus TCP connection closed by peer")
+        except (ModbusIOException, OSError) as exc:
+            error = exc
+        self._fail_pending(error)
+
+    def _next_transaction_id(self) -> int:
+        for _ in range(0x10000):
+            self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+            if self._transaction_id not in self._pending:
+                return self._transaction_id
+        raise ModbusIOException("No free Modbus TCP transaction ID")  # pragma: no cover
+
+    async def _request(
+        self,
+        slave_id: int,
+        pdu: bytes,
+        decode: Callable[[memoryview], Any] = bytes,
+    ) -> Any:
+        """Send ``pdu`` to ``slave_id`` and return ``decode`` applied to the response data.
+
+        The data is the response PDU after the function code: the byte count
+        and data of a read, or the echo of a write.
+        """
+        writer = self._writer
+        if writer is None or self._receiver is None:
+            raise ConnectionException("Modbus TCP socket not connected")
+        function = pdu[0]
+        self._last_slave_id = slave_id
+        transaction_id = self._next_transaction_id()
+        future: asyncio.Future[tuple[int, bytes]] = asyncio.get_running_loop().create_future()
+        self._pending[transaction_id] = future
+        try:
+            started = time.monotonic()
+            adu = (
+                _MBAP_HEADER.pack(transaction_id, _MODBUS_PROTOCOL_ID, len(pdu) + 1, slave_id) + pdu
+            )
+            writer.write(adu)
+            if frame_capture.enabled:
+                frame_capture.record(f"{self.host}:{self.port}", True, adu)
+            await writer.drain()
+            try:
+                async with asyncio.timeout(self.response_timeout):
+                    unit, response = await future
+            except TimeoutError as exc:
+                self.rtt.timed_out()
+                raise TimeoutError("Timed out waiting for Modbus TCP response") from exc
+        finally:
+            self._pending.pop(transaction_id, None)
+        self.rtt.observe(time.monotonic() - started)
+
+        if unit != (slave_id & 0xFF):
+            raise ModbusIOException("Unexpected unit ID in Modbus TCP response")
+        if response[0] == function | 0x80:
+            if len(response) != 2:
+                raise ModbusIOException("Invalid exception response payload length")
+            raise ModbusException(f"Modbus exception {response[1]} for function {response[0]}")
+        if response[0] != function:
+            raise ModbusIOException("Unexpected function code in Modbus TCP response")
+        return decode(memoryview(response)[1:])
+
+    async def _recover_link(self, exc: Exception) -> bool:
+        """Keep the connection after a lost or rejected response.
+
+        The receive task matches responses to requests by transaction ID, so
+        a late answer is dropped when it arrives and an unexpected one did
+        not desynchronise the stream; the connection only ends with that
+        task.  After a timeout a one-register read checks that the unit still
+        answers.
+        """
+        if not isinstance(exc, TimeoutError):
+            return True
+        self.health.probes += 1
+        pdu = struct.pack(">BHH", PROBE_FUNCTION, PROBE_ADDRESS, 1)
+        try:
+            await self._request(self._last_slave_id, pdu)
+        except (TimeoutError, ModbusIOException):
+            return False
+        except ModbusException:
+            pass
+        return True
+
+    @staticmethod
+    def _read_data(data: memoryview, decode: Callable[..., Any], *, count: int) -> Any:
+        if not data or data[0] != len(data) - 1:
+            raise ModbusIOException("Invalid byte count in Modbus TCP response")
+        return decode(data[1:], count=count)
+
+    async def _read(
+        self,
+        slave_id: int,
+        function: int,
+        address: int,
+        count: int,
+        decode: Callable[..., Any],
+        deadline: float | None,
+    ) -> Any:
+        pdu = struct.pack(">BHH", function, address & 0xFFFF, count)
+
+        async def _invoke() -> Any:
+            return await self._request(
+                slave_id, pdu, partial(self._read_data, decode=decode, count=count)
+            )
+
+        return await self._execute(_invoke, ensure_connection=True, deadline=deadline)
+
+    async def read_input_registers(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        _ = attempt
+        self._validate_slave_id(slave_id)
+        self._validate_read_count(count)
+        registers = await self._read(
+            slave_id, 4, address, count, self._decode_register_words, deadline
+        )
+        return RawModbusResponse(registers)
+
+    async def read_holding_registers(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        _ = attempt
+        self._validate_slave_id(slave_id)
+        self._validate_read_count(count)
+        registers = await self._read(
+            slave_id, 3, address, count, self._decode_register_words, deadline
+        )
+        return RawModbusResponse(registers)
+
+    async def read_coils(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        _ = attempt
+        self._validate_slave_id(slave_id)
+        self._validate_bit_count(count)
+        bits = await self._read(slave_id, 1, address, count, self._decode_bits, deadline)
+        return RawModbusResponse(bits=bits)
+
+    async def read_discrete_inputs(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        _ = attempt
+        self._validate_slave_id(slave_id)
+        self._validate_bit_count(count)
+        bits = await self._read(slave_id, 2, address, count, self._decode_bits, deadline)
+        return RawModbusResponse(bits=bits)
+
+    async def write_register(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        value: int,
+        attempt: int = 1,
+    ) -> Any:
+        _ = attempt
+        self._validate_slave_id(slave_id)
+        pdu = struct.pack(">BHH", 6, address & 0xFFFF, value & 0xFFFF)
+
+        async def _invoke() -> RawModbusWriteResponse:
+            response = await self._request(slave_id, pdu)
+            self._validate_write_echo(response, address=address, expected_value=(value & 0xFFFF))
+            return RawModbusWriteResponse()
+
+        return await self._execute(_invoke, ensure_connection=True)
+
+    async def write_registers(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        values: list[int],
+        attempt: int = 1,
+    ) -> Any:
+        _ = attempt
+        self._validate_slave_id(slave_id)
+        self._validate_write_count(len(values))
+        qty = len(values)
+        pdu = struct.pack(
+            f">BHHB{qty}H",
+            16,
+            address & 0xFFFF,
+            qty,
+            qty * 2,
+            *(value & 0xFFFF for value in values),
+        )
+
+        async def _invoke() -> RawModbusWriteResponse:
+            response = await self._request(slave_id, pdu)
+            self._validate_write_echo(response, address=address, expected_value=qty)
+            return RawModbusWriteResponse()
+
+        return await self._execute(_invoke, ensure_connection=True)
+
+
+__all__ = ["RawModbusTcpTransport"]
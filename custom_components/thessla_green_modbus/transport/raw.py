@@ -5,14 +5,18 @@ from __future__ import annotations
 _MIN_SLAVE_ID = 1
 _MAX_SLAVE_ID = 247
 _MAX_READ_REGISTERS = 125
+_MAX_READ_BITS = 2000
 _MAX_WRITE_REGISTERS = 123
+# Largest RTU response: slave, function and byte count, 255 data bytes, CRC.
+_MAX_RESPONSE_FRAME = 3 + 255 + 2
 
 
 class RawModbusResponse:
     """Minimal Modbus response container for raw RTU-over-TCP reads."""
 
-    def __init__(self, registers: list[int] | None = None) -> None:
+    def __init__(self, registers: list[int] | None = None, bits: list[bool] | None = None) -> None:
         self.registers = registers or []
+        self.bits = bits or []
 
     def isError(self) -> bool:
         return False
@@ -26,7 +30,9 @@ class RawModbusWriteResponse:
 
 
 __all__ = [
+    "_MAX_READ_BITS",
     "_MAX_READ_REGISTERS",
+    "_MAX_RESPONSE_FRAME",
     "_MAX_SLAVE_ID",
     "_MAX_WRITE_REGISTERS",
     "_MIN_SLAVE_ID",
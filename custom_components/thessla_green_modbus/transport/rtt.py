@@ -0,0 +1,79 @@
+"""Response timeouts derived from observed round-trip times.
+
+A flat timeout has to cover the slowest link the integration may ever talk
+to, so on a healthy LAN one lost frame stalls the update cycle for the whole
+configured timeout.  :class:`RttEstimator` follows the retransmission timer
+of RFC 6298 instead: it keeps a smoothed round-trip time and its mean
+deviation, and times requests out after ``SRTT + 4 * RTTVAR``, kept between a
+floor and the configured timeout.  Every timeout doubles the value until the
+next answered request brings a fresh sample.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# RFC 6298 gains for the smoothed RTT and its deviation, and the deviation factor.
+_ALPHA = 1 / 8
+_BETA = 1 / 4
+_K = 4
+# Lower bound of the deviation term, as the clock granularity G of the RFC.
+_GRANULARITY = 0.001
+
+
+class RttEstimator:
+    """Smoothed round-trip time of one connection and the timeout derived from it.
+
+    Until the first sample the timeout is ``ceiling``, the configured
+    timeout, so a slow first answer is never cut short.
+    """
+
+    __slots__ = ("_rto", "ceiling", "floor", "rttvar", "samples", "srtt", "timeouts")
+
+    def __init__(self, *, floor: float, ceiling: float) -> None:
+        self.ceiling = float(ceiling)
+        self.floor = min(float(floor), self.ceiling)
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self.samples = 0
+        self.timeouts = 0
+        self._rto = self.ceiling
+
+    @property
+    def timeout(self) -> float:
+        """Seconds to wait for the next response."""
+        return self._rto
+
+    def observe(self, rtt: float) -> None:
+        """Fold one answered request's round-trip time into the estimate."""
+        rtt = max(0.0, float(rtt))
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - _BETA) * self.rttvar + _BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - _ALPHA) * self.srtt + _ALPHA * rtt
+        self.samples += 1
+        self._rto = self._clamp(self.srtt + max(_GRANULARITY, _K * self.rttvar))
+
+    def timed_out(self) -> None:
+        """Back the timeout off after a request went unanswered."""
+        self.timeouts += 1
+        self._rto = self._clamp(2 * self._rto)
+
+    def _clamp(self, value: float) -> float:
+        return min(self.ceiling, max(self.floor, value))
+
+    def statistics(self) -> dict[str, Any]:
+        return {
+            "timeout_ms": round(self._rto * 1000, 1),
+            "srtt_ms": None if self.srtt is None else round(self.srtt * 1000, 2),
+            "rttvar_ms": round(self.rttvar * 1000, 2),
+            "floor_ms": round(self.floor * 1000, 1),
+            "ceiling_ms": round(self.ceiling * 1000, 1),
+            "samples": self.samples,
+            "timeouts": self.timeouts,
+        }
+
+
+__all__ = ["RttEstimator"]
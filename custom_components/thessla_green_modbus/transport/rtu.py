@@ -13,16 +13,26 @@ except (ImportError, AttributeError) as serial_import_err:  # pragma: no cover
 else:  # pragma: no cover
     SERIAL_IMPORT_ERROR = None
 
-from pymodbus.exceptions import ConnectionException
+from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
 
+from ..const import MAX_BATCH_REGISTERS, RESPONSE_TIMEOUT_FLOOR
+from ..modbus.call import _call_modbus
 from ..modbus.client_close import async_maybe_await_close
+from .capture import trace_packet_kwargs
+from .health import PROBE_ADDRESS
+from .rtt import RttEstimator
+from .rtu_timing import InterFrameGate, RtuLineTiming, frame_sizes
 from .tcp import _ClientBackedTransport
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class RtuModbusTransport(_ClientBackedTransport):
-    """RTU Modbus transport implementation using async serial client."""
+    """RTU Modbus transport implementation using async serial client.
+
+    Requests are spaced by the line's 3.5-character silent interval computed
+    from the serial settings, not by a fixed delay.
+    """
 
     def __init__(
         self,
@@ -49,6 +59,15 @@ class RtuModbusTransport(_ClientBackedTransport):
         self.parity = parity
         self.stopbits = stopbits
         self.client: Any | None = None
+        self.line_timing = RtuLineTiming(baudrate, parity, stopbits)
+        self.gate = InterFrameGate(self.line_timing)
+        # No response arrives before the frames have crossed the line.
+        self.rtt = RttEstimator(
+            floor=RESPONSE_TIMEOUT_FLOOR
+            + self.line_timing.read_transaction_time(MAX_BATCH_REGISTERS),
+            ceiling=self.timeout,
+        )
+        self._last_slave_id = 1
 
     def _is_connected(self) -> bool:
         return bool(self.client and getattr(self.client, "connected", False))
@@ -68,10 +87,57 @@ class RtuModbusTransport(_ClientBackedTransport):
             parity=self.parity,
             stopbits=self.stopbits,
             timeout=self.timeout,
+            **trace_packet_kwargs(_AsyncModbusSerialClient, self.serial_port),
         )
         await self._connect_client(endpoint=self.serial_port)
         _LOGGER.debug("RTU Modbus connection established on %s", self.serial_port)
 
+    async def _invoke_client(
+        self, method_name: str, slave_id: int, address: int, **kwargs: Any
+    ) -> Any:
+        self._last_slave_id = slave_id
+        request_size, response_size = frame_sizes(method_name, **kwargs)
+        await self.gate.wait()
+        try:
+            return await super()._invoke_client(method_name, slave_id, address, **kwargs)
+        finally:
+            self.gate.transaction_done(
+                request_size,
+                response_size,
+                registers=int(kwargs.get("count", 0)) if method_name.startswith("read") else 0,
+            )
+
+    async def _recover_link(self, exc: Exception) -> bool:
+        """Probe the unit after a lost response; False when it stays silent.
+
+        pymodbus never drops a serial client that stopped getting answers; it
+        stays ``connected``.  A one-register read, sent straight to the client
+        so a failure cannot recurse into this check, decides.
+        """
+        _ = exc
+        client = self.client
+        if client is None:
+            return False
+        self.health.probes += 1
+        request_size, response_size = frame_sizes("read_input_registers", count=1)
+        await self.gate.wait()
+        try:
+            await _call_modbus(
+                client.read_input_registers,
+                self._last_slave_id,
+                PROBE_ADDRESS,
+                count=1,
+                timeout=self.response_timeout,
+                apply_backoff=False,
+            )
+        except (TimeoutError, ModbusIOException):
+            return False
+        except ModbusException:
+            pass
+        finally:
+            self.gate.transaction_done(request_size, response_size, registers=1)
+        return True
+
     async def _reset_connection(self) -> None:
         if self.client is None:
             return
@@ -0,0 +1,182 @@
+"""Modbus RTU line timing derived from the serial settings.
+
+Modbus over Serial Line (V1.02, 2.5.1.1) delimits RTU frames by a silent
+interval of at least 3.5 character times.  Above 19200 baud the spec fixes
+the interval at 1.75 ms instead.  :class:`RtuLineTiming` turns the baud rate,
+parity and stop bits into character and frame times, and
+:class:`InterFrameGate` holds each request back until the silent interval
+after the previous response has passed, so back-to-back requests go out at
+the highest rate the line allows rather than after a guessed delay.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+# Above this rate the spec fixes t3.5 and t1.5 instead of scaling them.
+_FIXED_TIMING_BAUD = 19200
+_FIXED_SILENT_INTERVAL = 0.00175
+_FIXED_INTER_CHAR_TIMEOUT = 0.00075
+
+# RTU frame sizes: slave ID + function code ... + CRC.
+_READ_REQUEST_BYTES = 8
+_READ_RESPONSE_OVERHEAD = 5
+_WRITE_SINGLE_BYTES = 8
+_WRITE_MULTIPLE_OVERHEAD = 9
+
+#: Baud rates reported in the diagnostics throughput table.
+REFERENCE_BAUD_RATES = (9600, 19200)
+
+
+@dataclass(frozen=True, slots=True)
+class RtuLineTiming:
+    """Character and frame timing of one serial line configuration."""
+
+    baudrate: int
+    parity: str = "N"
+    stopbits: int = 1
+
+    @property
+    def bits_per_char(self) -> int:
+        """Start bit, eight data bits, optional parity bit and stop bits."""
+        parity_bits = 0 if self.parity.upper().startswith("N") else 1
+        return 1 + 8 + parity_bits + int(self.stopbits)
+
+    @property
+    def char_time(self) -> float:
+        """Seconds one character occupies the line."""
+        return self.bits_per_char / self.baudrate
+
+    @property
+    def silent_interval(self) -> float:
+        """Minimum gap between frames (t3.5) in seconds."""
+        if self.baudrate > _FIXED_TIMING_BAUD:
+            return _FIXED_SILENT_INTERVAL
+        return 3.5 * self.char_time
+
+    @property
+    def inter_char_timeout(self) -> float:
+        """Maximum gap inside a frame (t1.5) in seconds."""
+        if self.baudrate > _FIXED_TIMING_BAUD:
+            return _FIXED_INTER_CHAR_TIMEOUT
+        return 1.5 * self.char_time
+
+    def frame_time(self, size: int) -> float:
+        """Seconds a frame of ``size`` bytes occupies the line."""
+        return size * self.char_time
+
+    def read_transaction_time(self, count: int) -> float:
+        """Line time of reading ``count`` registers, silent intervals included.
+
+        The slave's own turnaround time is not part of it, so this is the
+        lower bound any real request/response pair can reach.
+        """
+        frames = _READ_REQUEST_BYTES + read_response_size(count, bits=False)
+        return self.frame_time(frames) + 2 * self.silent_interval
+
+    def read_throughput(self, count: int) -> float:
+        """Registers per second when reading ``count`` registers back to back."""
+        return count / self.read_transaction_time(count)
+
+
+def read_response_size(count: int, *, bits: bool) -> int:
+    """Return the RTU response size of reading ``count`` registers or bits."""
+    data = (count + 7) // 8 if bits else 2 * count
+    return _READ_RESPONSE_OVERHEAD + data
+
+
+def frame_sizes(operation: str, **kwargs: Any) -> tuple[int, int]:
+    """Return the ``(request, response)`` RTU frame sizes of a transport call."""
+    if operation in ("read_coils", "read_discrete_inputs"):
+        return _READ_REQUEST_BYTES, read_response_size(int(kwargs["count"]), bits=True)
+    if operation in ("read_holding_registers", "read_input_registers"):
+        return _READ_REQUEST_BYTES, read_response_size(int(kwargs["count"]), bits=False)
+    if operation == "write_registers":
+        return _WRITE_MULTIPLE_OVERHEAD + 2 * len(kwargs["values"]), _WRITE_SINGLE_BYTES
+    return _WRITE_SINGLE_BYTES, _WRITE_SINGLE_BYTES
+
+
+class InterFrameGate:
+    """Spaces RTU transactions by the line's silent interval.
+
+    :meth:`wait` returns once t3.5 has passed since the previous transaction
+    ended; :meth:`transaction_done` marks the end of one and accounts the
+    line time its two frames occupied.
+    """
+
+    def __init__(self, timing: RtuLineTiming) -> None:
+        self.timing = timing
+        self._idle_at = 0.0
+        self._opened = time.monotonic()
+        self.transactions = 0
+        self.registers = 0
+        self._wire_time = 0.0
+        self._gap_time = 0.0
+        self._busy_time = 0.0
+        self._started = 0.0
+
+    async def wait(self) -> None:
+        """Sleep until a new request may be sent."""
+        delay = self._idle_at - time.monotonic()
+        if delay > 0:
+            self._gap_time += delay
+            await asyncio.sleep(delay)
+        self._started = time.monotonic()
+
+    def transaction_done(self, request_size: int, response_size: int, *, registers: int) -> None:
+        """Record a finished transaction and start its trailing silent interval."""
+        now = time.monotonic()
+        self._idle_at = now + self.timing.silent_interval
+        self._busy_time += now - self._started
+        self.transactions += 1
+        self.registers += registers
+        self._wire_time += self.timing.frame_time(request_size + response_size)
+
+    def statistics(self) -> dict[str, Any]:
+        """Return line timing, line occupancy and the effective read rate.
+
+        ``registers_per_second`` counts registers read per second spent in
+        transactions, including slave turnaround but not idle time.
+        """
+        elapsed = max(time.monotonic() - self._opened, 1e-9)
+        return {
+            "baud_rate": self.timing.baudrate,
+            "char_time_ms": round(self.timing.char_time * 1000, 4),
+            "silent_interval_ms": round(self.timing.silent_interval * 1000, 4),
+            "transactions": self.transactions,
+            "line_occupancy": round(min(1.0, self._wire_time / elapsed), 4),
+            "gap_wait_s": round(self._gap_time, 6),
+            "registers_per_second": (
+                round(self.registers / self._busy_time, 1) if self._busy_time else 0.0
+            ),
+        }
+
+
+def throughput_table(
+    count: int, *, parity: str = "N", stopbits: int = 1
+) -> dict[int, dict[str, float]]:
+    """Return the best-case read rate at the reference baud rates.
+
+    ``count`` registers are read per request with the given framing.
+    """
+    table: dict[int, dict[str, float]] = {}
+    for baudrate in REFERENCE_BAUD_RATES:
+        timing = RtuLineTiming(baudrate, parity, stopbits)
+        table[baudrate] = {
+            "transaction_ms": round(timing.read_transaction_time(count) * 1000, 3),
+            "registers_per_second": round(timing.read_throughput(count), 1),
+        }
+    return table
+
+
+__all__ = [
+    "REFERENCE_BAUD_RATES",
+    "InterFrameGate",
+    "RtuLineTiming",
+    "frame_sizes",
+    "read_response_size",
+    "throughput_table",
+]
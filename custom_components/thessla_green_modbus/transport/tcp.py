@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import inspect
 import logging
+import time
 from typing import Any
 
 from pymodbus.client import AsyncModbusTcpClient
-from pymodbus.exceptions import ConnectionException
+from pymodbus.exceptions import ConnectionException, ModbusIOException
 
 from ..const import CONNECTION_TYPE_TCP, CONNECTION_TYPE_TCP_RTU
 from ..modbus.client_close import async_maybe_await_close
 from ..modbus.framer import get_rtu_framer
 from .base import BaseModbusTransport
+from .capture import trace_packet_kwargs
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,7 +35,36 @@ class _ClientBackedTransport(BaseModbusTransport):
     ) -> Any:
         client = await self._ensure_client()
         func = getattr(client, method_name)
-        return await self.call(func, slave_id, address, **kwargs)
+        # pymodbus waits ``timeout_connect`` for every response (and resend);
+        # it gets the learnt timeout for this request only, so reconnects keep
+        # the configured one.
+        params = getattr(getattr(client, "ctx", None), "comm_params", None)
+        if params is not None:
+            params.timeout_connect = self.response_timeout
+        started = time.monotonic()
+        try:
+            response = await self.call(func, slave_id, address, **kwargs)
+        except (TimeoutError, ModbusIOException):
+            self.rtt.timed_out()
+            raise
+        finally:
+            if params is not None:
+                params.timeout_connect = self.timeout
+        # A response that took a resend says nothing about the round trip, and
+        # a retried attempt's time includes the backoff before it was sent.
+        if getattr(response, "retries", 0) == 0 and kwargs.get("attempt", 1) == 1:
+            self.rtt.observe(time.monotonic() - started)
+        return response
+
+    async def _recover_link(self, exc: Exception) -> bool:
+        """Keep a client that is still connected after a lost or rejected response.
+
+        pymodbus clears its receive buffer and checks the transaction ID for
+        every request, and drops a TCP connection itself once the server has
+        stopped answering.  The serial transport probes the unit instead.
+        """
+        _ = exc
+        return True
 
     async def _connect_client(self, *, endpoint: str) -> None:
         client = self.client
@@ -68,6 +99,7 @@ class _ClientBackedTransport(BaseModbusTransport):
         *,
         count: int,
         attempt: int = 1,
+        deadline: float | None = None,
     ) -> Any:
         return await self._invoke_client(
             "read_input_registers",
@@ -75,6 +107,7 @@ class _ClientBackedTransport(BaseModbusTransport):
             address,
             count=count,
             attempt=attempt,
+            deadline=deadline,
         )
 
     async def read_holding_registers(
@@ -84,6 +117,7 @@ class _ClientBackedTransport(BaseModbusTransport):
         *,
         count: int,
         attempt: int = 1,
+        deadline: float | None = None,
     ) -> Any:
         return await self._invoke_client(
             "read_holding_registers",
@@ -91,6 +125,43 @@ class _ClientBackedTransport(BaseModbusTransport):
             address,
             count=count,
             attempt=attempt,
+            deadline=deadline,
+        )
+
+    async def read_coils(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        return await self._invoke_client(
+            "read_coils",
+            slave_id,
+            address,
+            count=count,
+            attempt=attempt,
+            deadline=deadline,
+        )
+
+    async def read_discrete_inputs(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        return await self._invoke_client(
+            "read_discrete_inputs",
+            slave_id,
+            address,
+            count=count,
+            attempt=attempt,
+            deadline=deadline,
         )
 
     async def write_register(
@@ -163,6 +234,7 @@ class TcpModbusTransport(_ClientBackedTransport):
             "reconnect_delay": 1,
             "reconnect_delay_max": 300,
             "retries": self.max_retries,
+            **trace_packet_kwargs(AsyncModbusTcpClient, f"{self.host}:{self.port}"),
         }
         if framer is not None:
             common_kwargs["framer"] = framer
@@ -3,16 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import struct
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
 
 from .base import BaseModbusTransport
+from .capture import frame_capture
+from .crc import CRC16_INIT
 from .crc import append_crc as _append_crc
 from .crc import crc16 as _crc16
+from .crc import crc16_update as _crc16_update
+from .health import PROBE_ADDRESS, PROBE_FUNCTION
 from .raw import (
+    _MAX_READ_BITS,
     _MAX_READ_REGISTERS,
+    _MAX_RESPONSE_FRAME,
     _MAX_SLAVE_ID,
     _MAX_WRITE_REGISTERS,
     _MIN_SLAVE_ID,
@@ -20,6 +30,9 @@ from .raw import (
     RawModbusWriteResponse,
 )
 
+# A link that keeps streaming more than this after a failure is resynced by reconnecting.
+_MAX_STALE_BYTES = 4 * _MAX_RESPONSE_FRAME
+
 
 class RawRtuOverTcpTransport(BaseModbusTransport):
     """RTU-over-TCP transport that sends raw Modbus RTU frames over TCP."""
@@ -52,6 +65,10 @@ class RawRtuOverTcpTransport(BaseModbusTransport):
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
         self._request_lock = asyncio.Lock()
+        #: Unit addressed by the last request, probed when the link goes quiet.
+        self._last_slave_id = _MIN_SLAVE_ID
+        #: Receive buffer reused for every response frame.
+        self._frame = bytearray(_MAX_RESPONSE_FRAME)
 
     def _is_connected(self) -> bool:
         return bool(self._writer and not self._writer.is_closing())
@@ -80,18 +97,8 @@ class RawRtuOverTcpTransport(BaseModbusTransport):
             self._reader = None
             self._writer = None
 
-    async def _read_exactly(self, size: int) -> bytes:
-        if self._reader is None:
-            raise ConnectionException("RTU-over-TCP socket not connected")
-        try:
-            return await asyncio.wait_for(self._reader.readexactly(size), timeout=self.timeout)
-        except asyncio.IncompleteReadError as exc:
-            raise ModbusIOException("Incomplete RTU response") from exc
-        except TimeoutError as exc:
-            raise TimeoutError("Timed out waiting for RTU response") from exc
-
     @staticmethod
-    def _validate_crc(payload: bytes, crc_bytes: bytes) -> None:
+    def _validate_crc(payload: bytes | memoryview, crc_bytes: bytes | memoryview) -> None:
         expected = _crc16(payload).to_bytes(2, "little")
         if crc_bytes != expected:
             raise ModbusIOException("CRC mismatch in RTU response")
@@ -122,6 +129,11 @@ class RawRtuOverTcpTransport(BaseModbusTransport):
         if not (1 <= count <= _MAX_READ_REGISTERS):
             raise ModbusIOException(f"Invalid read count={count}; expected 1-{_MAX_READ_REGISTERS}")
 
+    @staticmethod
+    def _validate_bit_count(count: int) -> None:
+        if not (1 <= count <= _MAX_READ_BITS):
+            raise ModbusIOException(f"Invalid read count={count}; expected 1-{_MAX_READ_BITS}")
+
     @staticmethod
     def _validate_write_count(qty: int) -> None:
         if not (1 <= qty <= _MAX_WRITE_REGISTERS):
@@ -193,7 +205,7 @@ class RawRtuOverTcpTransport(BaseModbusTransport):
         return (resp_func & 0x80) != 0 and (resp_func & 0x7F) == (expected_function & 0xFF)
 
     @staticmethod
-    def _parse_exception_response_payload(payload: bytes, *, function: int) -> int:
+    def _parse_exception_response_payload(payload: bytes | memoryview, *, function: int) -> int:
         """Validate and parse an exception response payload."""
         if len(payload) != 3:
             raise ModbusIOException("Invalid exception response payload length")
@@ -202,60 +214,176 @@ class RawRtuOverTcpTransport(BaseModbusTransport):
         return payload[2]
 
     @staticmethod
-    def _validate_exception_frame(payload: bytes, crc_bytes: bytes, *, function: int) -> int:
+    def _validate_exception_frame(
+        payload: bytes | memoryview, crc_bytes: bytes | memoryview, *, function: int
+    ) -> int:
         RawRtuOverTcpTransport._validate_crc(payload, crc_bytes)
         return RawRtuOverTcpTransport._parse_exception_response_payload(payload, function=function)
 
-    async def _read_exception_response(self, header: bytes, *, function: int) -> bytes:
-        exception_code = await self._read_exactly(1)
-        crc_bytes = await self._read_exactly(2)
-        payload = header + exception_code
-        parsed_exception = self._validate_exception_frame(payload, crc_bytes, function=function)
-        raise ModbusException(f"Modbus exception {parsed_exception} for function {function}")
-
-    async def _read_response_payload(self, header: bytes, body_length: int) -> bytes:
-        body = await self._read_exactly(body_length)
-        crc_bytes = await self._read_exactly(2)
-        payload = header + body
-        self._validate_crc(payload, crc_bytes)
-        return body
-
-    async def _read_register_data_response(self, header: bytes) -> bytes:
-        byte_count_raw = await self._read_exactly(1)
-        byte_count = byte_count_raw[0]
-        data = await self._read_response_payload(header + byte_count_raw, byte_count)
-        return data
-
-    async def _read_write_body_response(self, header: bytes) -> bytes:
-        return await self._read_response_payload(header, 4)
+    def _response_remainder(self, function: int, resp_func: int) -> int:
+        """Return the bytes following the first three of a response frame.
 
-    async def _read_response(self, slave_id: int, function: int) -> bytes:
-        raw_header = await self._read_exactly(2)
-        parsed_header = self._parse_response_header(raw_header)
-        resp_func = self._validate_response_header(
-            parsed_header, slave_id=slave_id, function=function
-        )
+        The third byte is the exception code, the byte count of a read or the
+        first byte of a write echo; every remainder ends with the 2-byte CRC.
+        """
+        if self._is_exception_function(resp_func, expected_function=function):
+            return 2
+        if function in (1, 2, 3, 4):
+            return self._frame[2] + 2
+        return 5
+
+    async def _read_frame(self, slave_id: int, function: int) -> memoryview:
+        """Read one response frame into the reusable buffer and return its data.
+
+        The frame arrives in two reads (the fixed three leading bytes, then
+        the rest) under a single timeout, and each read is folded into the
+        running CRC as it arrives.  A view of the data bytes (read data or
+        write echo) is returned; it is only valid until the next response is
+        read.
+        """
+        reader = self._reader
+        if reader is None:
+            raise ConnectionException("RTU-over-TCP socket not connected")
+        frame = self._frame
+        try:
+            async with asyncio.timeout(self.response_timeout):
+                chunk = await reader.readexactly(3)
+                frame[0:3] = chunk
+                crc = _crc16_update(CRC16_INIT, chunk)
+                header = self._ResponseHeader(slave=frame[0], function=frame[1])
+                resp_func = self._validate_response_header(
+                    header, slave_id=slave_id, function=function
+                )
+                end = 3 + self._response_remainder(function, resp_func)
+                chunk = await reader.readexactly(end - 3)
+                frame[3:end] = chunk
+                crc = _crc16_update(crc, chunk)
+        except asyncio.IncompleteReadError as exc:
+            raise ModbusIOException("Incomplete RTU response") from exc
+        except TimeoutError as exc:
+            raise TimeoutError("Timed out waiting for RTU response") from exc
 
+        if frame_capture.enabled:
+            frame_capture.record(f"{self.host}:{self.port}", False, frame[:end])
+        view = memoryview(frame)[:end]
         if self._is_exception_function(resp_func, expected_function=function):
-            return await self._read_exception_response(raw_header, function=resp_func)
-        if function in (3, 4):
-            return await self._read_register_data_response(raw_header)
-        return await self._read_write_body_response(raw_header)
+            exception_code = self._validate_exception_frame(view[:3], view[3:], function=resp_func)
+            raise ModbusException(f"Modbus exception {exception_code} for function {resp_func}")
+        if crc:
+            raise ModbusIOException("CRC mismatch in RTU response")
+        return view[3:-2] if function in (1, 2, 3, 4) else view[2:-2]
+
+    async def _read_response(self, slave_id: int, function: int) -> bytes:
+        return bytes(await self._read_frame(slave_id, function))
+
+    async def _send_frame(
+        self,
+        frame: bytes,
+        slave_id: int,
+        function: int,
+        decode: Callable[[memoryview], Any] = bytes,
+    ) -> Any:
+        """Send ``frame`` and return ``decode`` applied to the response data.
 
-    async def _send_frame(self, frame: bytes, slave_id: int, function: int) -> bytes:
+        Decoding happens while the request lock is held, before the buffer
+        can be reused by the next response.
+        """
+        async with self._request_lock:
+            self._last_slave_id = slave_id
+            return await self._exchange(frame, slave_id, function, decode)
+
+    async def _exchange(
+        self,
+        frame: bytes,
+        slave_id: int,
+        function: int,
+        decode: Callable[[memoryview], Any] = bytes,
+    ) -> Any:
+        if self._writer is None:
+            raise ConnectionException("RTU-over-TCP socket not connected")
+        started = time.monotonic()
+        self._writer.write(frame)
+        if frame_capture.enabled:
+            frame_capture.record(f"{self.host}:{self.port}", True, frame)
+        await self._writer.drain()
+        try:
+            data = await self._read_frame(slave_id, function)
+        except TimeoutError:
+            self.rtt.timed_out()
+            raise
+        except ModbusException as exc:
+            # An exception response is an answer like any other.
+            if not isinstance(exc, ModbusIOException):
+                self.rtt.observe(time.monotonic() - started)
+            raise
+        self.rtt.observe(time.monotonic() - started)
+        return decode(data)
+
+    async def _recover_link(self, exc: Exception) -> bool:
+        """Drain a late or garbled response and, if the socket stayed silent, probe the unit.
+
+        RTU frames carry no transaction ID, so the rest of a late answer would
+        be taken as the response to the next request.  Bytes are discarded
+        until the socket has been quiet for the response timeout floor; any byte shows
+        the link is up.  After a timeout with nothing to drain a one-register
+        read decides.
+        """
+        if isinstance(exc.__cause__, asyncio.IncompleteReadError):
+            return False
         async with self._request_lock:
-            if self._writer is None:
-                raise ConnectionException("RTU-over-TCP socket not connected")
-            self._writer.write(frame)
-            await self._writer.drain()
-            return await self._read_response(slave_id, function)
+            drained = await self._drain_stale_bytes()
+            if drained is None:
+                return False
+            self.health.drained_bytes += drained
+            if drained or not isinstance(exc, TimeoutError):
+                return True
+            self.health.probes += 1
+            frame = self._build_read_frame(self._last_slave_id, PROBE_FUNCTION, PROBE_ADDRESS, 1)
+            try:
+                await self._exchange(
+                    frame,
+                    self._last_slave_id,
+                    PROBE_FUNCTION,
+                    partial(self._decode_register_words, count=1),
+                )
+            except (TimeoutError, ModbusIOException):
+                return False
+            except ModbusException:
+                pass
+            return True
+
+    async def _drain_stale_bytes(self) -> int | None:
+        """Return the bytes discarded until the socket went quiet, or None if it closed."""
+        reader = self._reader
+        if reader is None:
+            return None
+        quiet = min(self.response_timeout, self.rtt.floor)
+        drained = 0
+        while drained < _MAX_STALE_BYTES:
+            try:
+                chunk = await asyncio.wait_for(reader.read(_MAX_RESPONSE_FRAME), timeout=quiet)
+            except TimeoutError:
+                return drained
+            if not chunk:
+                return None
+            if frame_capture.enabled:
+                frame_capture.record(f"{self.host}:{self.port}", False, chunk)
+            drained += len(chunk)
+        return None
 
     @staticmethod
-    def _decode_register_words(data: bytes, *, count: int) -> list[int]:
-        expected_bytes = count * 2
-        if len(data) != expected_bytes:
+    def _decode_register_words(data: bytes | memoryview, *, count: int) -> list[int]:
+        if len(data) != count * 2:
             raise ModbusIOException("Invalid byte count in RTU response")
-        return [int.from_bytes(data[i : i + 2], "big") for i in range(0, len(data), 2)]
+        return list(struct.unpack(f">{count}H", data))
+
+    @staticmethod
+    def _decode_bits(data: bytes | memoryview, *, count: int) -> list[bool]:
+        """Unpack ``count`` bits packed LSB-first, as returned by FC01/FC02."""
+        if len(data) != (count + 7) // 8:
+            raise ModbusIOException("Invalid byte count in RTU response")
+        packed = int.from_bytes(data, "little")
+        return [bool(packed >> i & 1) for i in range(count)]
 
     @staticmethod
     def _validate_write_echo(response: bytes, *, address: int, expected_value: int) -> None:
@@ -270,8 +398,19 @@ class RawRtuOverTcpTransport(BaseModbusTransport):
         self, *, slave_id: int, address: int, count: int, function: int
     ) -> RawModbusResponse:
         frame = self._build_read_frame(slave_id, function, address, count)
-        data = await self._send_frame(frame, slave_id, function)
-        return RawModbusResponse(self._decode_register_words(data, count=count))
+        registers = await self._send_frame(
+            frame, slave_id, function, partial(self._decode_register_words, count=count)
+        )
+        return RawModbusResponse(registers)
+
+    async def _read_bits_common(
+        self, *, slave_id: int, address: int, count: int, function: int
+    ) -> RawModbusResponse:
+        frame = self._build_read_frame(slave_id, function, address, count)
+        bits = await self._send_frame(
+            frame, slave_id, function, partial(self._decode_bits, count=count)
+        )
+        return RawModbusResponse(bits=bits)
 
     async def read_input_registers(
         self,
@@ -280,6 +419,7 @@ class RawRtuOverTcpTransport(BaseModbusTransport):
         *,
         count: int,
         attempt: int = 1,
+        deadline: float | None = None,
     ) -> Any:
         _ = attempt
         self._validate_slave_id(slave_id)
@@ -293,7 +433,7 @@ class RawRtuOverTcpTransport(BaseModbusTransport):
                 function=4,
             )
 
-        return await self._execute(_invoke, ensure_connection=True)
+        return await self._execute(_invoke, ensure_connection=True, deadline=deadline)
 
     async def read_holding_registers(
         self,
@@ -302,6 +442,7 @@ class RawRtuOverTcpTransport(BaseModbusTransport):
         *,
         count: int,
         attempt: int = 1,
+        deadline: float | None = None,
     ) -> Any:
         _ = attempt
         self._validate_slave_id(slave_id)
@@ -315,7 +456,53 @@ class RawRtuOverTcpTransport(BaseModbusTransport):
                 function=3,
             )
 
-        return await self._execute(_invoke, ensure_connection=True)
+        return await self._execute(_invoke, ensure_connection=True, deadline=deadline)
+
+    async def read_coils(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        _ = attempt
+        self._validate_slave_id(slave_id)
+        self._validate_bit_count(count)
+
+        async def _invoke() -> RawModbusResponse:
+            return await self._read_bits_common(
+                slave_id=slave_id,
+                address=address,
+                count=count,
+                function=1,
+            )
+
+        return await self._execute(_invoke, ensure_connection=True, deadline=deadline)
+
+    async def read_discrete_inputs(
+        self,
+        slave_id: int,
+        address: int,
+        *,
+        count: int,
+        attempt: int = 1,
+        deadline: float | None = None,
+    ) -> Any:
+        _ = attempt
+        self._validate_slave_id(slave_id)
+        self._validate_bit_count(count)
+
+        async def _invoke() -> RawModbusResponse:
+            return await self._read_bits_common(
+                slave_id=slave_id,
+                address=address,
+                count=count,
+                function=2,
+            )
+
+        return await self._execute(_invoke, ensure_connection=True, deadline=deadline)
 
     async def write_register(
         self,
@@ -82,6 +82,36 @@ def enable_event_loop_debug():
     _ensure_current_event_loop()
 
 
+@pytest.fixture(autouse=True)
+def isolated_bus_registry():
+    """Keep shared Modbus buses from leaking between tests."""
+    from custom_components.thessla_green_modbus.transport.bus import bus_registry
+
+    bus_registry.clear()
+    yield
+    bus_registry.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_detected_modes():
+    """Keep auto-detected connection modes from leaking between tests."""
+    from custom_components.thessla_green_modbus.transport.detection import detected_modes
+
+    detected_modes.clear()
+    yield
+    detected_modes.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_frame_capture():
+    """Keep captured Modbus frames from leaking between tests."""
+    from custom_components.thessla_green_modbus.transport.capture import frame_capture
+
+    frame_capture.clear()
+    yield
+    frame_capture.clear()
+
+
 @pytest.fixture
 def mock_coordinator():
     """Return a coordinator-shaped mock with current device-domain state."""
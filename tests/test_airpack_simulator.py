@@ -0,0 +1,199 @@
+"""Tests for the local AirPack Modbus simulator in ``tools/simulator``."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+
+import pytest
+from custom_components.thessla_green_modbus.const import (
+    CONNECTION_TYPE_TCP,
+    CONNECTION_TYPE_TCP_RTU,
+    DEFAULT_SLAVE_ID,
+    SENSOR_UNAVAILABLE,
+)
+from custom_components.thessla_green_modbus.scanner.core import ThesslaGreenDeviceScanner
+from custom_components.thessla_green_modbus.transport.mbap import RawModbusTcpTransport
+from custom_components.thessla_green_modbus.transport.tcp_rtu import RawRtuOverTcpTransport
+from pymodbus.exceptions import ModbusException
+from tools.simulator import (
+    ILLEGAL_DATA_ADDRESS,
+    ILLEGAL_FUNCTION,
+    SERVER_DEVICE_BUSY,
+    AirPackDevice,
+    AirPackSimulator,
+    SimulatorProfile,
+)
+
+
+class _PipeWriter:
+    """Stream writer feeding the reader of the other end of an in-memory pipe."""
+
+    def __init__(self, peer: asyncio.StreamReader) -> None:
+        self._peer = peer
+        self._closed = False
+
+    def write(self, data: bytes) -> None:
+        if not self._closed:
+            self._peer.feed_data(bytes(data))
+
+    async def drain(self) -> None:
+        await asyncio.sleep(0)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._peer.feed_eof()
+
+    async def wait_closed(self) -> None:
+        return None
+
+    def is_closing(self) -> bool:
+        return self._closed
+
+
+def _serve_in_memory(monkeypatch: pytest.MonkeyPatch, simulator: AirPackSimulator) -> None:
+    """Route ``asyncio.open_connection`` to ``simulator`` without sockets."""
+    tasks: set[asyncio.Task[None]] = set()
+
+    async def open_connection(_host: str, _port: int):
+        client_reader, server_reader = asyncio.StreamReader(), asyncio.StreamReader()
+        task = asyncio.create_task(
+            simulator.handle_connection(server_reader, _PipeWriter(client_reader))
+        )
+        tasks.add(task)
+        return client_reader, _PipeWriter(server_reader)
+
+    monkeypatch.setattr(asyncio, "open_connection", open_connection)
+
+
+def _read(function: int, address: int, count: int) -> bytes:
+    return struct.pack(">BHH", function, address, count)
+
+
+def _words(response: bytes) -> list[int]:
+    return list(struct.unpack(f">{response[1] // 2}H", response[2:]))
+
+
+def test_device_serves_register_values_in_raw_units():
+    device = AirPackDevice()
+    outside = device.definitions["outside_temperature"]
+
+    response = device.handle(_read(4, outside.address, 1))
+
+    assert response[0] == 4
+    assert _words(response) == [85]
+    assert device.raw_value("version_major") == 3
+
+
+def test_device_reproduces_holding_batch_boundaries():
+    device = AirPackDevice()
+
+    assert device.handle(_read(3, 0, 16))[0] == 3
+    assert device.handle(_read(3, 8, 16)) == bytes((0x83, ILLEGAL_DATA_ADDRESS))
+    assert device.handle(_read(3, 0x1FF8, 16)) == bytes((0x83, ILLEGAL_DATA_ADDRESS))
+    # Input registers are not split by the firmware.
+    assert device.handle(_read(4, 16, 16))[0] == 4
+
+
+def test_device_reproduces_missing_registers_and_sentinels():
+    device = AirPackDevice()
+    patch = device.definitions["version_patch"]
+
+    assert device.handle(_read(4, patch.address, 1)) == bytes((0x84, ILLEGAL_DATA_ADDRESS))
+    assert device.raw_value("duct_supply_temperature") == SENSOR_UNAVAILABLE
+
+    plain = AirPackDevice(SimulatorProfile(firmware_quirks=False))
+    assert plain.handle(_read(4, patch.address, 1))[0] == 4
+    assert plain.handle(_read(3, 8, 16))[0] == 3
+
+
+def test_device_writes_only_writable_holding_registers():
+    device = AirPackDevice()
+    manual = device.definitions["air_flow_rate_manual"]
+    request = struct.pack(">BHH", 6, manual.address, 70)
+
+    assert device.handle(request) == request
+    assert device.raw_value("air_flow_rate_manual") == 70
+    multiple = struct.pack(">BHHBH", 16, manual.address, 1, 2, 65)
+    assert device.handle(multiple) == multiple[:5]
+    assert device.raw_value("air_flow_rate_manual") == 65
+
+    read_only = struct.pack(">BHH", 6, 0xFFF0, 1)
+    assert device.handle(read_only) == bytes((0x86, ILLEGAL_DATA_ADDRESS))
+    assert device.handle(bytes((0x2B, 0x0E))) == bytes((0xAB, ILLEGAL_FUNCTION))
+    assert device.statistics() == {"requests": 4, "exceptions": 2}
+
+
+def test_device_injects_configured_and_random_faults():
+    outside = AirPackDevice().definitions["outside_temperature"]
+    device = AirPackDevice(SimulatorProfile(faults={(4, outside.address): SERVER_DEVICE_BUSY}))
+    assert device.handle(_read(4, outside.address - 1, 3)) == bytes((0x84, SERVER_DEVICE_BUSY))
+
+    noisy = AirPackDevice(SimulatorProfile(fault_rate=0.5, seed=7))
+    again = AirPackDevice(SimulatorProfile(fault_rate=0.5, seed=7))
+    first = [noisy.handle(_read(4, outside.address, 1))[0] for _ in range(40)]
+    second = [again.handle(_read(4, outside.address, 1))[0] for _ in range(40)]
+    assert first == second
+    assert 0 < first.count(0x84) < 40
+
+
+def test_device_response_delay_stays_within_jitter():
+    device = AirPackDevice(SimulatorProfile(latency=0.01, jitter=0.005, seed=1))
+
+    delays = [device.response_delay() for _ in range(20)]
+
+    assert all(0.01 <= delay <= 0.015 for delay in delays)
+
+
+@pytest.mark.parametrize(
+    ("mode", "transport_cls"),
+    [
+        (CONNECTION_TYPE_TCP, RawModbusTcpTransport),
+        (CONNECTION_TYPE_TCP_RTU, RawRtuOverTcpTransport),
+    ],
+)
+async def test_simulator_serves_native_transports(monkeypatch, mode, transport_cls):
+    device = AirPackDevice()
+    simulator = AirPackSimulator(device, mode=mode)
+    _serve_in_memory(monkeypatch, simulator)
+    transport = transport_cls(
+        host="127.0.0.1", port=502, max_retries=1, base_backoff=0.0, max_backoff=0.0, timeout=1.0
+    )
+    outside = device.definitions["outside_temperature"]
+    manual = device.definitions["air_flow_rate_manual"]
+    try:
+        response = await transport.read_input_registers(DEFAULT_SLAVE_ID, outside.address, count=1)
+        assert response.registers == [85]
+
+        await transport.write_register(DEFAULT_SLAVE_ID, manual.address, value=40)
+        assert device.raw_value("air_flow_rate_manual") == 40
+
+        with pytest.raises(ModbusException):
+            await transport.read_holding_registers(DEFAULT_SLAVE_ID, 8, count=16)
+    finally:
+        await transport.close()
+
+    assert simulator.statistics() == {DEFAULT_SLAVE_ID: {"requests": 3, "exceptions": 1}}
+
+
+async def test_scanner_scans_simulated_unit_over_rtu_over_tcp(monkeypatch):
+    simulator = AirPackSimulator(mode=CONNECTION_TYPE_TCP_RTU)
+    _serve_in_memory(monkeypatch, simulator)
+    scanner = await ThesslaGreenDeviceScanner.create(
+        host="127.0.0.1",
+        port=502,
+        slave_id=DEFAULT_SLAVE_ID,
+        timeout=1,
+        retry=1,
+        connection_type=CONNECTION_TYPE_TCP,
+        connection_mode=CONNECTION_TYPE_TCP_RTU,
+    )
+    try:
+        result = await scanner.scan_device()
+    finally:
+        await scanner.close()
+
+    assert result["device_info"]["firmware"].startswith("3.11")
+    assert result["available_registers"]["coil_registers"]
+    assert "version_patch" not in result["available_registers"]["input_registers"]
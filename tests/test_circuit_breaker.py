@@ -0,0 +1,156 @@
+"""Tests for the device circuit breaker around update cycles."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from custom_components.thessla_green_modbus.coordinator import update
+from custom_components.thessla_green_modbus.core.circuit_breaker import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    DeviceCircuitBreaker,
+)
+from custom_components.thessla_green_modbus.core.runtime_io import read_all_register_data
+from pymodbus.exceptions import ModbusException
+
+from tests.helpers_coordinator import make_coordinator
+
+
+class _Unit:
+    """Device client reading nothing while ``answering`` is False."""
+
+    def __init__(self) -> None:
+        self.device_client = self
+        self.slave_id = 10
+        self.answering = False
+        self._circuit_breaker = DeviceCircuitBreaker(threshold=3)
+        self._failed_registers: set[str] = set()
+        self._transport = SimpleNamespace(
+            is_connected=lambda: True, read_input_registers=AsyncMock(side_effect=self._probe)
+        )
+        self.plan_reads = 0
+
+    async def _probe(self, _slave_id, _address, *, count, attempt=1, deadline=None):
+        if not self.answering:
+            raise TimeoutError("no answer")
+        return SimpleNamespace(registers=[0] * count)
+
+    async def _read_input_registers_optimized(self, refresh_classes=None):
+        self.plan_reads += 1
+        if self.answering:
+            return {"outside_temperature": 12.5}
+        self._failed_registers.add("outside_temperature")
+        return {}
+
+    async def _read_holding_registers_optimized(self, refresh_classes=None):
+        return {}
+
+    _read_coil_registers_optimized = _read_holding_registers_optimized
+    _read_discrete_inputs_optimized = _read_holding_registers_optimized
+
+    def _post_process_data(self, data):
+        return data
+
+
+def test_breaker_opens_after_threshold_and_reopens_from_half_open():
+    breaker = DeviceCircuitBreaker(threshold=2)
+
+    breaker.record_cycle(False)
+    assert breaker.state == BREAKER_CLOSED
+    breaker.record_cycle(False)
+    assert breaker.state == BREAKER_OPEN
+
+    breaker.probe_answered(True)
+    assert breaker.state == BREAKER_HALF_OPEN
+    breaker.record_cycle(False)
+    assert breaker.state == BREAKER_OPEN
+    assert breaker.trips == 1
+
+    breaker.probe_answered(True)
+    breaker.record_cycle(True)
+    assert breaker.statistics() == {
+        "state": BREAKER_CLOSED,
+        "consecutive_failed_cycles": 0,
+        "trips": 1,
+        "probes": 2,
+        "skipped_cycles": 0,
+    }
+
+
+async def test_open_breaker_costs_one_probe_read_instead_of_the_plan():
+    unit = _Unit()
+    for _ in range(3):
+        assert await read_all_register_data(unit) == {}
+    assert unit._circuit_breaker.is_open
+
+    with pytest.raises(TimeoutError):
+        await read_all_register_data(unit)
+
+    assert unit.plan_reads == 3
+    assert unit._transport.read_input_registers.await_count == 1
+    assert unit._circuit_breaker.skipped_cycles == 1
+
+
+async def test_answered_probe_resumes_the_full_plan():
+    unit = _Unit()
+    unit._circuit_breaker.state = BREAKER_OPEN
+    unit.answering = True
+
+    assert await read_all_register_data(unit) == {"outside_temperature": 12.5}
+
+    assert unit._circuit_breaker.state == BREAKER_CLOSED
+    assert unit.plan_reads == 1
+
+
+async def test_exception_response_to_the_probe_counts_as_an_answer():
+    unit = _Unit()
+    unit._circuit_breaker.state = BREAKER_OPEN
+    unit._transport.read_input_registers = AsyncMock(side_effect=ModbusException("code 2"))
+
+    await read_all_register_data(unit)
+
+    assert unit.plan_reads == 1
+    assert unit._circuit_breaker.probes == 1
+
+
+async def test_failing_reads_count_as_unanswered_cycles():
+    unit = _Unit()
+    unit._read_input_registers_optimized = AsyncMock(side_effect=TimeoutError)
+
+    with pytest.raises(TimeoutError):
+        await read_all_register_data(unit)
+
+    assert unit._circuit_breaker.failures == 1
+
+
+def test_repair_issue_follows_the_breaker():
+    coordinator = SimpleNamespace(
+        hass=MagicMock(),
+        entry=SimpleNamespace(entry_id="abc"),
+        device_client=SimpleNamespace(_circuit_breaker=DeviceCircuitBreaker(threshold=1)),
+    )
+    with (
+        patch.object(update, "create_device_unreachable_issue") as create,
+        patch.object(update, "clear_device_unreachable_issue") as clear,
+    ):
+        update.sync_unreachable_repair(coordinator, was_open=False)
+        create.assert_not_called()
+
+        coordinator.device_client._circuit_breaker.record_cycle(False)
+        update.sync_unreachable_repair(coordinator, was_open=False)
+        create.assert_called_once_with(coordinator.hass, coordinator.entry)
+
+        coordinator.device_client._circuit_breaker.record_cycle(True)
+        update.sync_unreachable_repair(coordinator, was_open=True)
+        clear.assert_called_once_with(coordinator.hass, coordinator.entry)
+
+
+def test_status_overview_and_diagnostics_report_the_breaker():
+    coordinator = make_coordinator()
+    coordinator.device_client._circuit_breaker.state = BREAKER_OPEN
+
+    assert coordinator.status_overview["circuit_breaker"] == BREAKER_OPEN
+    assert coordinator.get_diagnostic_data()["circuit_breaker"]["state"] == BREAKER_OPEN
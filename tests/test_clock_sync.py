@@ -903,6 +903,7 @@ def test_options_form_has_clock_sync_schema_keys():
         "airflow_unit": "m3h",
         "deep_scan": False,
         "max_registers_per_request": 16,
+        "max_inflight_requests": 1,
         CONF_SYNC_DEVICE_CLOCK_ENABLED: DEFAULT_SYNC_DEVICE_CLOCK_ENABLED,
         CONF_SYNC_DEVICE_CLOCK_ON_START: DEFAULT_SYNC_DEVICE_CLOCK_ON_START,
         CONF_SYNC_DEVICE_CLOCK_INTERVAL_HOURS: DEFAULT_SYNC_DEVICE_CLOCK_INTERVAL_HOURS,
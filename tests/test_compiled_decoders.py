@@ -0,0 +1,130 @@
+"""Compiled per-register decoders must match the generic decode path."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from custom_components.thessla_green_modbus.const import SENSOR_UNAVAILABLE
+from custom_components.thessla_green_modbus.core import register_processing as rp
+from custom_components.thessla_green_modbus.core.client import ThesslaGreenDeviceClient
+from custom_components.thessla_green_modbus.core.models import CoordinatorConfig
+from custom_components.thessla_green_modbus.core.poll_plan import build_poll_plan
+from custom_components.thessla_green_modbus.register_defs_cache import get_register_definitions
+from custom_components.thessla_green_modbus.registers.register_def import RegisterDef
+
+_RAW_WORDS = [0, 1, 2, 3, 5, 10, 100, 255, 256, 390, 1234, 2359, 4095, 4096, 0x0830]
+_RAW_WORDS += [32767, SENSOR_UNAVAILABLE, 32769, 40000, 65435, 65535]
+
+
+def _generic_process(register_name: str, value: int):
+    """Replay the definition-driven decode path without compiled decoders."""
+    definition = get_register_definitions()[register_name]
+    if register_name.startswith("dac_") and not 0 <= value <= 4095:
+        return None
+    if value == SENSOR_UNAVAILABLE:
+        if definition.is_temperature():
+            return None
+        if register_name in rp.SENSOR_UNAVAILABLE_REGISTERS:
+            return SENSOR_UNAVAILABLE
+    raw = value - 65536 if definition.is_temperature() and value > 32767 else value
+    decoded = definition.decode(raw)
+    if decoded == SENSOR_UNAVAILABLE:
+        return SENSOR_UNAVAILABLE
+    if register_name in {"supply_flow_rate", "exhaust_flow_rate"} and isinstance(decoded, int):
+        decoded = decoded - 65536 if decoded > 32767 else decoded
+    if definition.enum is not None and isinstance(decoded, str):
+        return value
+    return decoded
+
+
+def test_compiled_decoder_matches_definition_decode():
+    for definition in get_register_definitions().values():
+        decoder = definition.compile_decoder()
+        for raw in _RAW_WORDS:
+            expected = definition.decode(raw)
+            assert decoder(raw) == expected, (definition.name, raw)
+            assert type(decoder(raw)) is type(expected), (definition.name, raw)
+
+
+def test_process_register_value_matches_generic_path():
+    for register_name in get_register_definitions():
+        for raw in _RAW_WORDS:
+            expected = _generic_process(register_name, raw)
+            assert rp.process_register_value(register_name, raw) == expected, (register_name, raw)
+
+
+def test_enum_int_key_wins_over_string_key():
+    definition = RegisterDef(
+        function=3, address=1, name="mode_x", access="RW", enum={"1": "str", 1: "int", "x": "?"}
+    )
+    decoder = definition.compile_decoder()
+    assert decoder(1) == definition.decode(1) == "int"
+    assert decoder(2) == definition.decode(2) == 2
+
+
+def test_bitmask_decoder_lists_set_flags_in_bit_order():
+    definition = RegisterDef(
+        function=3,
+        address=1,
+        name="flags_x",
+        access="R",
+        enum={"4": "c", "1": "a", "2": "b"},
+        extra={"bitmask": True},
+    )
+    assert definition.compile_decoder()(7) == definition.decode(7) == ["a", "b", "c"]
+
+
+def test_multi_register_definition_keeps_generic_decode():
+    definition = RegisterDef(function=3, address=1, name="serial", access="R", length=2)
+    assert definition.compile_decoder() == definition.decode
+
+
+def test_decoders_recompile_when_definitions_change():
+    first = rp.get_register_decoders()
+    assert rp.get_register_decoders() is first
+
+    mock_def = MagicMock()
+    mock_def.is_temperature.return_value = False
+    mock_def.enum = None
+    mock_def.decode.return_value = 7
+    with patch.object(rp, "get_register_definitions", return_value={"mode": mock_def}):
+        assert rp.process_register_value("mode", 1) == 7
+        assert set(rp.get_register_decoders()) == {"mode"}
+
+    assert rp.get_register_decoders() is not first
+    assert "outside_temperature" in rp.get_register_decoders()
+
+
+def test_unknown_dac_register_is_range_checked_before_lookup():
+    with patch.object(rp, "get_register_definitions", return_value={}):
+        assert rp.process_register_value("dac_supply", 5000) is None
+        assert rp.process_register_value("dac_supply", 10) is False
+
+
+def _device_client() -> ThesslaGreenDeviceClient:
+    client = ThesslaGreenDeviceClient(
+        CoordinatorConfig(host="192.168.1.1", port=502, slave_id=1),
+        hass=MagicMock(),
+        effective_batch=16,
+        resolved_connection_mode=None,
+        backoff=0.0,
+        backoff_jitter=None,
+    )
+    client.available_registers["input_registers"] = {"outside_temperature"}
+    client._register_groups = {
+        "input_registers": [(client._register_maps["input_registers"]["outside_temperature"], 1)]
+    }
+    return client
+
+
+def test_poll_plan_slots_use_compiled_decoders():
+    client = _device_client()
+    slot = build_poll_plan(client, "input_registers").chunks[0].slots[0]
+    assert slot.decode is rp.get_register_decoders()["outside_temperature"]
+
+
+def test_poll_plan_honours_instance_decode_override():
+    client = _device_client()
+    client._process_register_value = lambda _name, value: value * 2
+    slot = build_poll_plan(client, "input_registers").chunks[0].slots[0]
+    assert slot.decode(21) == 42
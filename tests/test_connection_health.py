@@ -0,0 +1,229 @@
+"""Tests for keeping connections alive across lost or late responses."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from collections.abc import Callable
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from custom_components.thessla_green_modbus.coordinator.diagnostics import (
+    connection_health_stats,
+)
+from custom_components.thessla_green_modbus.core.retry import disconnect_and_reconnect_for_retry
+from custom_components.thessla_green_modbus.transport.crc import append_crc
+from custom_components.thessla_green_modbus.transport.mbap import RawModbusTcpTransport
+from custom_components.thessla_green_modbus.transport.rtt import RttEstimator
+from custom_components.thessla_green_modbus.transport.rtu import RtuModbusTransport
+from custom_components.thessla_green_modbus.transport.tcp_rtu import RawRtuOverTcpTransport
+from pymodbus.exceptions import ModbusIOException
+
+_TIMEOUT = 0.05
+
+
+class _Responder:
+    """Stream writer answering each request after the next queued delay.
+
+    A delay of ``None`` leaves the request unanswered.  Answers carry the
+    request's sequence number as register value.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        answer: Callable[[bytes, int], bytes],
+        delays: list[float | None],
+    ) -> None:
+        self._reader = reader
+        self._answer = answer
+        self._delays = delays
+        self.requests = 0
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        self.requests += 1
+        delay = self._delays.pop(0) if self._delays else 0.0
+        if delay is not None:
+            answer = self._answer(bytes(data), self.requests)
+            asyncio.get_running_loop().call_later(delay, self._reader.feed_data, answer)
+
+    async def drain(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def wait_closed(self) -> None:
+        return None
+
+    def is_closing(self) -> bool:
+        return self.closed
+
+
+def _rtu_answer(request: bytes, value: int) -> bytes:
+    return append_crc(bytes([request[0], request[1], 2, 0, value]))
+
+
+def _mbap_answer(request: bytes, value: int) -> bytes:
+    transaction_id, _protocol, _length, unit = struct.unpack(">HHHB", request[:7])
+    return struct.pack(">HHHB", transaction_id, 0, 5, unit) + bytes([request[7], 2, 0, value])
+
+
+def _connect(monkeypatch, transport_cls, answer, delays, *, eof: bool = False):
+    writers: list[_Responder] = []
+
+    async def open_connection(_host: str, _port: int):
+        reader = asyncio.StreamReader()
+        if eof:
+            reader.feed_eof()
+        writers.append(_Responder(reader, answer, delays))
+        return reader, writers[-1]
+
+    monkeypatch.setattr(asyncio, "open_connection", open_connection)
+    transport = transport_cls(
+        host="127.0.0.1", port=502, max_retries=1, base_backoff=0.0, max_backoff=0.0, timeout=1.0
+    )
+    transport.rtt = RttEstimator(floor=_TIMEOUT, ceiling=_TIMEOUT)
+    return transport, writers
+
+
+async def test_late_rtu_answer_is_drained_and_the_socket_kept(monkeypatch):
+    transport, writers = _connect(monkeypatch, RawRtuOverTcpTransport, _rtu_answer, [0.08, 0.0])
+
+    with pytest.raises(TimeoutError):
+        await transport.read_input_registers(1, 0, count=1)
+    response = await transport.read_input_registers(1, 0, count=1)
+
+    assert response.registers == [2]
+    assert len(writers) == 1
+    assert transport.health.statistics() == {
+        "reconnects_avoided": 1,
+        "reconnects": 0,
+        "probes": 0,
+        "drained_bytes": 7,
+    }
+
+
+async def test_silent_rtu_link_is_kept_when_the_probe_answers(monkeypatch):
+    transport, writers = _connect(monkeypatch, RawRtuOverTcpTransport, _rtu_answer, [None])
+
+    with pytest.raises(TimeoutError):
+        await transport.read_input_registers(1, 0x10, count=1)
+
+    assert transport.is_connected()
+    assert transport.health.kept == 1
+    assert transport.health.probes == 1
+    assert (await transport.read_input_registers(1, 0x10, count=1)).registers == [3]
+    assert len(writers) == 1
+
+
+async def test_dead_rtu_link_is_reset(monkeypatch):
+    transport, writers = _connect(monkeypatch, RawRtuOverTcpTransport, _rtu_answer, [None, None])
+
+    with pytest.raises(TimeoutError):
+        await transport.read_input_registers(1, 0, count=1)
+
+    assert writers[0].closed
+    assert transport.health.reconnects == 1
+    assert transport.health.probes == 1
+
+
+async def test_closed_rtu_socket_is_reset_without_a_probe(monkeypatch):
+    transport, writers = _connect(monkeypatch, RawRtuOverTcpTransport, _rtu_answer, [], eof=True)
+
+    with pytest.raises(ModbusIOException):
+        await transport.read_input_registers(1, 0, count=1)
+
+    assert writers[0].closed
+    assert transport.health.probes == 0
+
+
+async def test_late_mbap_answer_is_dropped_by_transaction_id(monkeypatch):
+    transport, writers = _connect(monkeypatch, RawModbusTcpTransport, _mbap_answer, [0.08, 0.0])
+
+    try:
+        with pytest.raises(TimeoutError):
+            await transport.read_input_registers(1, 0, count=1)
+        await asyncio.sleep(0.05)
+        response = await transport.read_input_registers(1, 0, count=1)
+    finally:
+        await transport.close()
+
+    assert response.registers == [3]
+    assert len(writers) == 1
+    assert transport.health.kept == 1
+    assert transport.health.probes == 1
+
+
+async def test_coordinator_retries_on_the_kept_connection(monkeypatch):
+    transport, _writers = _connect(monkeypatch, RawRtuOverTcpTransport, _rtu_answer, [])
+    await transport.ensure_connected()
+    owner = SimpleNamespace(
+        device_client=SimpleNamespace(_transport=transport, retry=3),
+        _disconnect=AsyncMock(),
+        _ensure_connection=AsyncMock(),
+    )
+
+    error = await disconnect_and_reconnect_for_retry(
+        owner, register_type="input", start_address=0, attempt=1
+    )
+
+    assert error is None
+    owner._disconnect.assert_not_awaited()
+    owner._ensure_connection.assert_not_awaited()
+
+
+def test_diagnostics_report_connection_health():
+    transport = RawRtuOverTcpTransport(
+        host="127.0.0.1", port=502, max_retries=1, base_backoff=0.0, max_backoff=0.0, timeout=1.0
+    )
+    transport.health.record(True)
+    coordinator = SimpleNamespace(device_client=SimpleNamespace(_transport=transport))
+
+    assert connection_health_stats(coordinator)["reconnects_avoided"] == 1
+    idle = SimpleNamespace(device_client=SimpleNamespace(_transport=None))
+    assert connection_health_stats(idle) is None
+
+
+class _SerialClient:
+    """pymodbus-like serial client that stays ``connected`` while unanswered."""
+
+    def __init__(self, answers: list[bool]) -> None:
+        self.connected = True
+        self.closed = False
+        self._answers = answers
+
+    async def read_input_registers(self, address, *, count=1, device_id=1):
+        if not self._answers.pop(0):
+            raise ModbusIOException("No response received")
+        return SimpleNamespace(registers=[1] * count, retries=0, isError=lambda: False)
+
+    def close(self) -> None:
+        self.closed = True
+        self.connected = False
+
+
+@pytest.mark.parametrize(("probe_answered", "kept"), [(True, True), (False, False)])
+async def test_serial_link_is_probed_after_a_lost_response(probe_answered, kept):
+    transport = RtuModbusTransport(
+        serial_port="/dev/ttyUSB0",
+        baudrate=115200,
+        parity="N",
+        stopbits=1,
+        max_retries=1,
+        base_backoff=0.0,
+        max_backoff=0.0,
+        timeout=_TIMEOUT,
+    )
+    client = _SerialClient([False, probe_answered])
+    transport.client = client
+
+    with pytest.raises(ModbusIOException):
+        await transport.read_input_registers(3, 0, count=1)
+
+    assert transport.health.probes == 1
+    assert (transport.health.kept, transport.health.reconnects) == (int(kept), int(not kept))
+    # A silent line is reset; pymodbus would keep reporting it connected.
+    assert client.closed is not kept
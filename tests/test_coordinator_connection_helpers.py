@@ -8,7 +8,6 @@ import logging
 import pytest
 from custom_components.thessla_green_modbus.const import (
     CONNECTION_MODE_TCP_RTU,
-    CONNECTION_TYPE_TCP,
 )
 from custom_components.thessla_green_modbus.core.connection import (
     build_tcp_transport,
@@ -18,6 +17,7 @@ from custom_components.thessla_green_modbus.core.connection import (
     ensure_transport_selected,
     setup_client_with_retry,
 )
+from custom_components.thessla_green_modbus.transport.mbap import RawModbusTcpTransport
 from custom_components.thessla_green_modbus.transport.tcp import TcpModbusTransport
 from custom_components.thessla_green_modbus.transport.tcp_rtu import RawRtuOverTcpTransport
 from pymodbus.exceptions import (
@@ -94,7 +94,6 @@ def test_build_tcp_transport_rtu_over_tcp_mode() -> None:
         max_backoff=1.0,
         timeout=5.0,
         offline_state=False,
-        connection_type_tcp=CONNECTION_TYPE_TCP,
         connection_mode_tcp_rtu=CONNECTION_MODE_TCP_RTU,
     )
     assert isinstance(transport, RawRtuOverTcpTransport)
@@ -110,10 +109,9 @@ def test_build_tcp_transport_tcp_mode() -> None:
         max_backoff=1.0,
         timeout=5.0,
         offline_state=False,
-        connection_type_tcp=CONNECTION_TYPE_TCP,
         connection_mode_tcp_rtu=CONNECTION_MODE_TCP_RTU,
     )
-    assert isinstance(transport, TcpModbusTransport)
+    assert isinstance(transport, RawModbusTcpTransport)
 
 
 def test_setup_client_with_retry_success() -> None:
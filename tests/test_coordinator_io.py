@@ -119,7 +119,7 @@ async def test_holding_modbus_io_exception_falls_back_to_individual(
 
 
 @pytest.mark.asyncio
-async def test_holding_permanent_error_marks_failed_without_fallback(
+async def test_holding_permanent_error_reads_the_chunk_register_by_register(
     coordinator: ThesslaGreenModbusCoordinator,
 ) -> None:
     dc = coordinator.device_client
@@ -133,8 +133,13 @@ async def test_holding_permanent_error_marks_failed_without_fallback(
 
     await dc._read_holding_registers_optimized()
 
-    dc._mark_registers_failed.assert_called_once_with(["mode", "air_flow_rate_manual"])
-    dc._read_holding_individually.assert_not_called()
+    # One missing address must not quarantine the whole chunk.
+    dc._mark_registers_failed.assert_not_called()
+    dc._read_holding_individually.assert_awaited_once()
+    assert dc._read_holding_individually.await_args.args[1:3] == (
+        100,
+        ["mode", "air_flow_rate_manual"],
+    )
 
 
 @pytest.mark.asyncio
@@ -183,6 +188,7 @@ async def test_holding_falls_back_to_client_read_method(
         100,
         count=2,
         attempt=1,
+        deadline=None,
     )
 
 
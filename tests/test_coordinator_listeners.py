@@ -0,0 +1,135 @@
+"""Tests for change-aware coordinator listener dispatch."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from custom_components.thessla_green_modbus.coordinator import ThesslaGreenModbusCoordinator
+from custom_components.thessla_green_modbus.coordinator import listeners as listeners_module
+from custom_components.thessla_green_modbus.coordinator.listeners import (
+    KeyedListeners,
+    changed_keys,
+    listener_keys,
+)
+from custom_components.thessla_green_modbus.entity import ThesslaGreenEntity
+
+
+def test_changed_keys_covers_added_removed_and_changed_values():
+    previous = {"a": 1, "b": 2, "c": None}
+    current = {"a": 1, "b": 3, "d": None}
+    assert changed_keys(previous, current) == {"b", "c", "d"}
+
+
+def test_listener_keys_only_accepts_frozensets_of_names():
+    assert listener_keys(frozenset({"a"})) == frozenset({"a"})
+    assert listener_keys(None) is None
+    assert listener_keys({"a"}) is None
+    assert listener_keys(frozenset({1})) is None
+
+
+def test_index_wakes_everyone_first_then_only_changed_keys():
+    index = KeyedListeners()
+    a, b, everything = MagicMock(), MagicMock(), MagicMock()
+    index.add("a", a, frozenset({"a"}))
+    index.add("b", b, frozenset({"b", "shared"}))
+    index.add("all", everything, None)
+
+    assert index.due({"a": 1, "b": 1}, (True, False)) is None
+    assert index.due({"a": 1, "b": 1}, (True, False)) == [everything]
+    assert set(index.due({"a": 2, "b": 1}, (True, False))) == {a, everything}
+    assert set(index.due({"a": 2, "b": 1, "shared": 0}, (True, False))) == {b, everything}
+
+
+def test_index_wakes_everyone_when_status_flips_or_invalidated():
+    index = KeyedListeners()
+    index.add("a", MagicMock(), frozenset({"a"}))
+    index.due({"a": 1}, (True, False))
+
+    assert index.due({"a": 1}, (True, True)) is None
+    assert index.due({"a": 1}, (True, True)) == []
+    index.invalidate()
+    assert index.due({"a": 1}, (True, True)) is None
+
+
+def test_discarded_listener_is_no_longer_woken():
+    index = KeyedListeners()
+    listener = MagicMock()
+    index.add("a", listener, frozenset({"a"}))
+    index.due({"a": 1}, (True, False))
+    index.discard("a")
+
+    assert index.due({"a": 2}, (True, False)) == []
+    assert len(index) == 0
+
+
+def test_touched_keys_wake_until_one_dispatch_after_hold():
+    index = KeyedListeners()
+    listener = MagicMock()
+    index.add("a", listener, frozenset({"a"}))
+    with patch.object(listeners_module.time, "monotonic", return_value=100.0):
+        index.due({"a": 1}, (True, False))
+        index.touch(["a"], 10.0)
+        assert index.due({"a": 1}, (True, False)) == [listener]
+    with patch.object(listeners_module.time, "monotonic", return_value=110.0):
+        assert index.due({"a": 1}, (True, False)) == [listener]
+        assert index.due({"a": 1}, (True, False)) == []
+
+
+def _coordinator() -> ThesslaGreenModbusCoordinator:
+    return ThesslaGreenModbusCoordinator.from_params(MagicMock(), "host", 502, 1, "name")
+
+
+def test_coordinator_dispatches_only_to_listeners_of_changed_keys():
+    coordinator = _coordinator()
+    temperature, mode, unkeyed = MagicMock(), MagicMock(), MagicMock()
+    coordinator.async_add_listener(temperature, frozenset({"outside_temperature"}))
+    remove_mode = coordinator.async_add_listener(mode, frozenset({"mode"}))
+    coordinator.async_add_listener(unkeyed)
+
+    coordinator.data = {"outside_temperature": 10.0, "mode": 0}
+    coordinator.async_update_listeners()
+    assert (temperature.call_count, mode.call_count, unkeyed.call_count) == (1, 1, 1)
+
+    coordinator.data = {"outside_temperature": 10.5, "mode": 0}
+    coordinator.async_update_listeners()
+    assert (temperature.call_count, mode.call_count, unkeyed.call_count) == (2, 1, 2)
+
+    remove_mode()
+    coordinator.data = {"outside_temperature": 10.5, "mode": 1}
+    coordinator.async_update_listeners()
+    assert mode.call_count == 1
+
+
+def test_coordinator_wakes_everyone_when_going_offline():
+    coordinator = _coordinator()
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, frozenset({"mode"}))
+    coordinator.data = {"mode": 0}
+    coordinator.async_update_listeners()
+
+    coordinator.device_client.offline_state = True
+    coordinator.async_update_listeners()
+    assert listener.call_count == 2
+
+
+def test_set_updated_data_wakes_every_listener():
+    coordinator = _coordinator()
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, frozenset({"mode"}))
+    coordinator.data = {"mode": 0, "other": 1}
+    coordinator.async_update_listeners()
+
+    coordinator.async_set_updated_data({"mode": 0, "other": 2})
+    assert listener.call_count == 2
+
+
+async def test_entity_registers_its_source_keys_as_listener_context():
+    coordinator = MagicMock()
+    coordinator.get_device_info.return_value = {}
+    entity = ThesslaGreenEntity(coordinator, "mode", 1)
+
+    await entity.async_added_to_hass()
+
+    coordinator.async_add_listener.assert_called_once_with(
+        entity._handle_coordinator_update, frozenset({"mode"})
+    )
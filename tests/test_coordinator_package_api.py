@@ -184,17 +184,17 @@ def test_build_tcp_transport_tcp_rtu_mode():
 
     coord = _make_coordinator()
     result = coord.device_client._build_tcp_transport(CONNECTION_MODE_TCP_RTU)
-    assert isinstance(result, RawRtuOverTcpTransport)
+    assert isinstance(result.bus.transport, RawRtuOverTcpTransport)
 
 
 def test_build_tcp_transport_tcp_mode():
-    """TCP mode returns TcpModbusTransport."""
+    """TCP mode returns the native MBAP transport."""
     from custom_components.thessla_green_modbus.const import CONNECTION_MODE_TCP
-    from custom_components.thessla_green_modbus.transport.tcp import TcpModbusTransport
+    from custom_components.thessla_green_modbus.transport.mbap import RawModbusTcpTransport
 
     coord = _make_coordinator()
     result = coord.device_client._build_tcp_transport(CONNECTION_MODE_TCP)
-    assert isinstance(result, TcpModbusTransport)
+    assert isinstance(result.bus.transport, RawModbusTcpTransport)
 
 
 # ---------------------------------------------------------------------------
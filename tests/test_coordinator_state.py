@@ -118,10 +118,12 @@ def test_initialize_connection_state_resets_client():
 def test_initialize_connection_state_creates_locks():
     import asyncio
 
+    from custom_components.thessla_green_modbus.core.request_scheduler import RequestScheduler
+
     coord = _make_coord()
     _initialize_connection_state(coord)
     assert isinstance(coord.device_client._client_lock, asyncio.Lock)
-    assert isinstance(coord.device_client._write_lock, asyncio.Lock)
+    assert isinstance(coord.device_client._write_lock, RequestScheduler)
 
 
 def test_initialize_device_state_resets_device_info():
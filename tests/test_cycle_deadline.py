@@ -0,0 +1,124 @@
+"""Tests for the per-cycle read deadline and stale-value reporting."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from custom_components.thessla_green_modbus.const import REFRESH_FAST
+from custom_components.thessla_green_modbus.coordinator.update import cycle_deadline
+from custom_components.thessla_green_modbus.core.client import ThesslaGreenDeviceClient
+from custom_components.thessla_green_modbus.core.models import CoordinatorConfig
+from custom_components.thessla_green_modbus.core.retry import read_with_retry
+from custom_components.thessla_green_modbus.core.runtime_io import read_all_register_data
+from custom_components.thessla_green_modbus.modbus.call import _call_modbus
+from custom_components.thessla_green_modbus.modbus.deadline import CycleDeadlineExceeded
+from custom_components.thessla_green_modbus.transport.tcp_rtu import RawRtuOverTcpTransport
+
+
+async def test_call_is_not_started_after_the_deadline():
+    func = AsyncMock()
+    with pytest.raises(CycleDeadlineExceeded):
+        await _call_modbus(func, 1, 0, count=1, deadline=time.monotonic() - 1)
+    func.assert_not_awaited()
+
+
+async def test_call_timeout_is_shortened_to_the_time_left():
+    async def never_answers(address, *, count):
+        await asyncio.sleep(10)
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        await _call_modbus(never_answers, 1, 0, count=1, timeout=10, deadline=started + 0.05)
+    assert time.monotonic() - started < 1
+
+
+def _retry_owner(deadline: float | None, read: AsyncMock) -> SimpleNamespace:
+    return SimpleNamespace(
+        device_client=SimpleNamespace(retry=3, _cycle_deadline=deadline),
+        _execute_read_call=read,
+        _raise_for_error_response=MagicMock(),
+        _log_read_retry=MagicMock(),
+    )
+
+
+async def test_read_with_retry_stops_at_the_deadline():
+    read = AsyncMock()
+    owner = _retry_owner(time.monotonic() - 1, read)
+    with pytest.raises(CycleDeadlineExceeded):
+        await read_with_retry(owner, AsyncMock(), 0, 1, register_type="input")
+    read.assert_not_awaited()
+
+    # A timeout once the deadline has passed is not retried.
+    deadline = time.monotonic() + 0.05
+
+    async def slow_timeout(*_args):
+        await asyncio.sleep(0.1)
+        raise TimeoutError
+
+    read = AsyncMock(side_effect=slow_timeout)
+    owner = _retry_owner(deadline, read)
+    with pytest.raises(CycleDeadlineExceeded):
+        await read_with_retry(owner, AsyncMock(), 0, 1, register_type="input")
+    read.assert_awaited_once()
+    assert read.await_args.args[-1] == deadline
+
+
+async def test_raw_transport_request_is_bounded_by_the_deadline(monkeypatch):
+    writer = MagicMock(
+        is_closing=MagicMock(return_value=False), drain=AsyncMock(), wait_closed=AsyncMock()
+    )
+
+    async def open_connection(_host, _port):
+        return asyncio.StreamReader(), writer
+
+    monkeypatch.setattr(asyncio, "open_connection", open_connection)
+    transport = RawRtuOverTcpTransport(
+        host="127.0.0.1", port=502, max_retries=1, base_backoff=0, max_backoff=0, timeout=10
+    )
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        await transport.read_input_registers(1, 0, count=1, deadline=started + 0.05)
+    assert time.monotonic() - started < 1
+
+
+def _device_client() -> ThesslaGreenDeviceClient:
+    client = ThesslaGreenDeviceClient(
+        CoordinatorConfig(host="192.168.1.1", port=502, slave_id=1),
+        hass=MagicMock(),
+        effective_batch=16,
+        resolved_connection_mode=None,
+        backoff=0.0,
+        backoff_jitter=None,
+    )
+    client.available_registers["input_registers"] = {"outside_temperature", "supply_temperature"}
+    client.compute_register_groups()
+    client._transport = SimpleNamespace(is_connected=lambda: True, read_input_registers=AsyncMock())
+    return client
+
+
+async def test_expired_cycle_keeps_last_values_and_marks_them_stale():
+    client = _device_client()
+    client._refresh_schedule.values = {"outside_temperature": 12.5}
+
+    data = await read_all_register_data(client, time.monotonic() - 1)
+
+    client._transport.read_input_registers.assert_not_awaited()
+    assert data["outside_temperature"] == 12.5
+    assert client._stale_registers == {"outside_temperature", "supply_temperature"}
+    assert client._failed_registers == set()
+    assert client._cycle_deadline is None
+    # The class is not recorded as read, so it stays due.
+    assert REFRESH_FAST not in client._refresh_schedule.last_read
+    assert not client._quarantine.entries
+
+
+def test_cycle_deadline_is_a_share_of_the_scan_interval():
+    before = time.monotonic()
+    deadline = cycle_deadline(SimpleNamespace(scan_interval=30))
+    assert before + 20 < deadline < time.monotonic() + 30
+    assert cycle_deadline(SimpleNamespace()) is None
@@ -0,0 +1,136 @@
+"""Tests for the per-phase update-cycle timing histograms."""
+
+from __future__ import annotations
+
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.thessla_green_modbus.coordinator.update import run_update_cycle
+from custom_components.thessla_green_modbus.coordinator.update_result import apply_success_result
+from custom_components.thessla_green_modbus.core.client import ThesslaGreenDeviceClient
+from custom_components.thessla_green_modbus.core.cycle_timing import (
+    PHASE_CONNECT,
+    PHASE_CYCLE,
+    PHASE_DECODE,
+    PHASE_HOLDING,
+    PHASE_INPUT,
+    PHASE_POST_PROCESS,
+    PHASE_REQUEST,
+    TIMING_PHASES,
+    LatencyHistogram,
+    PhaseTimings,
+    phase_timings,
+)
+from custom_components.thessla_green_modbus.core.models import CoordinatorConfig
+from custom_components.thessla_green_modbus.core.runtime_io import read_all_register_data
+from custom_components.thessla_green_modbus.sensor import ThesslaGreenCycleTimingSensor
+from custom_components.thessla_green_modbus.utils import utcnow
+from pymodbus.pdu.register_message import ReadInputRegistersResponse
+
+from tests.helpers_coordinator import make_coordinator
+
+
+def test_histogram_reports_bucket_bound_percentiles():
+    hist = LatencyHistogram()
+    assert hist.percentile(0.5) is None
+    assert hist.summary()["mean_ms"] is None
+
+    for ms in [3] * 90 + [40] * 8 + [700] * 2:
+        hist.observe(ms / 1000)
+
+    summary = hist.summary()
+    assert summary["count"] == 100
+    assert summary["p50_ms"] == 5.0
+    assert summary["p95_ms"] == 50.0
+    # The top bucket is capped at the slowest sample seen.
+    assert summary["p99_ms"] == 700.0
+    assert summary["max_ms"] == 700.0
+
+    hist.observe(120.0)  # past the last bound: the overflow bucket
+    assert hist.percentile(1.0) == 120000.0
+
+
+def _device_client() -> ThesslaGreenDeviceClient:
+    client = ThesslaGreenDeviceClient(
+        CoordinatorConfig(host="192.168.1.1", port=502, slave_id=1),
+        hass=MagicMock(),
+        effective_batch=16,
+        resolved_connection_mode=None,
+        backoff=0.0,
+        backoff_jitter=None,
+    )
+    client.available_registers["input_registers"] = {"outside_temperature", "supply_temperature"}
+    client.compute_register_groups()
+
+    async def read_input_registers(*_args, count=1, **_kwargs):
+        return ReadInputRegistersResponse(registers=[215] * count)
+
+    client._transport = SimpleNamespace(
+        is_connected=lambda: True, read_input_registers=read_input_registers
+    )
+    return client
+
+
+async def test_read_cycle_records_group_decode_and_request_timings():
+    client = _device_client()
+    timings = phase_timings(client)
+    assert timings is not None
+
+    data = await read_all_register_data(client, time.monotonic() + 10)
+
+    assert data["outside_temperature"] is not None
+    phases = timings.summary()["phases"]
+    for phase in (PHASE_INPUT, PHASE_HOLDING, PHASE_DECODE, PHASE_POST_PROCESS):
+        assert phases[phase]["count"] == 1, phase
+    assert phases[PHASE_REQUEST]["count"] >= 1
+    assert phases[PHASE_CYCLE]["count"] == 0
+    assert set(timings.summary()["last_cycle_ms"]) >= {PHASE_INPUT, PHASE_DECODE}
+
+
+async def test_update_cycle_records_connect_and_cycle_time():
+    coord = make_coordinator()
+    coord._ensure_connection = AsyncMock()
+    coord.device_client._transport = SimpleNamespace(is_connected=lambda: True)
+    coord.device_client._read_all_register_data = AsyncMock(return_value={"mode": 1})
+
+    await run_update_cycle(coord, utcnow())
+
+    percentiles = coord.performance_stats["phase_timings"]
+    assert set(percentiles) == set(TIMING_PHASES)
+    assert percentiles[PHASE_CONNECT]["p50_ms"] is not None
+    assert percentiles[PHASE_CYCLE]["p95_ms"] is not None
+
+    diagnostics = coord.get_diagnostic_data()
+    summary = diagnostics["statistics"]["phase_timings"]
+    assert summary["phases"][PHASE_CYCLE]["count"] == 1
+    json.dumps(diagnostics, default=str)
+
+
+def test_apply_success_result_without_timings_keeps_the_running_mean():
+    coord = make_coordinator()
+    coord.device_client.statistics.pop("phase_timings")
+
+    apply_success_result(coord, start_time=utcnow(), data={})
+
+    assert coord.device_client.statistics["successful_reads"] == 1
+    assert coord.performance_stats["phase_timings"] is None
+
+
+def test_timing_sensor_reports_p95_and_is_disabled_by_default():
+    coord = make_coordinator()
+    coord.last_update_success = True
+    timings = phase_timings(coord.device_client)
+    assert isinstance(timings, PhaseTimings)
+    for ms in (4, 4, 4, 30):
+        timings.observe(PHASE_REQUEST, ms / 1000)
+
+    sensor = ThesslaGreenCycleTimingSensor(coord, PHASE_REQUEST)
+
+    assert sensor.entity_registry_enabled_default is False
+    assert sensor.translation_key == "timing_request"
+    assert sensor.available
+    assert sensor.native_value == 30.0
+    assert sensor.extra_state_attributes["p50_ms"] == 5.0
+    assert sensor.extra_state_attributes["count"] == 4
@@ -18,6 +18,7 @@ from custom_components.thessla_green_modbus.coordinator import (
 )
 from custom_components.thessla_green_modbus.core.client import ThesslaGreenDeviceClient
 from custom_components.thessla_green_modbus.core.models import CoordinatorConfig
+from custom_components.thessla_green_modbus.core.request_scheduler import RequestScheduler
 from custom_components.thessla_green_modbus.scanner import DeviceCapabilities
 
 # ---------------------------------------------------------------------------
@@ -106,7 +107,7 @@ def test_device_client_initial_connection_state():
     assert client.client is None
     assert client._transport is None
     assert isinstance(client._client_lock, asyncio.Lock)
-    assert isinstance(client._write_lock, asyncio.Lock)
+    assert isinstance(client._write_lock, RequestScheduler)
     assert client.offline_state is False
     assert client._update_in_progress is False
 
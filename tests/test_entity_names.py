@@ -18,6 +18,7 @@ import json
 import os
 
 import pytest
+from custom_components.thessla_green_modbus.core.cycle_timing import TIMING_PHASES
 
 # ---------------------------------------------------------------------------
 # Load translation files once
@@ -223,6 +224,7 @@ class TestEntityNames:
         Accounts for special sensor classes outside entity_mappings:
         - 'error_codes': ThesslaGreenErrorCodesSensor
         - 'active_errors': ThesslaGreenActiveErrorsSensor (uses _attr_name, no tk)
+        - 'timing_*': ThesslaGreenCycleTimingSensor, one per update-cycle phase
         """
         # Translation keys used via SENSOR_ENTITY_MAPPINGS (may differ from mapping key)
         mapping_tks = {
@@ -230,7 +232,7 @@ class TestEntityNames:
             for key, data in entity_mappings["sensor"].items()
         }
         # Known special sensor classes with their translation keys
-        special_sensor_tks = {"error_codes"}
+        special_sensor_tks = {"error_codes", *(f"timing_{phase}" for phase in TIMING_PHASES)}
 
         valid_tks = mapping_tks | special_sensor_tks
         en_sensor_tks = set(EN.get("entity", {}).get("sensor", {}).keys())
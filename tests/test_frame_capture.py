@@ -0,0 +1,175 @@
+"""Tests for the Modbus frame capture ring buffer."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+
+from custom_components.thessla_green_modbus.transport import tcp as tcp_module
+from custom_components.thessla_green_modbus.transport.capture import (
+    MAX_CAPTURE_FRAMES,
+    FrameCapture,
+    frame_capture,
+    trace_packet_kwargs,
+)
+from custom_components.thessla_green_modbus.transport.crc import append_crc
+from custom_components.thessla_green_modbus.transport.mbap import RawModbusTcpTransport
+from custom_components.thessla_green_modbus.transport.tcp import TcpModbusTransport
+from custom_components.thessla_green_modbus.transport.tcp_rtu import RawRtuOverTcpTransport
+
+from tests.helpers_coordinator import make_coordinator
+
+
+class _Echo:
+    """Stream writer answering every request with ``answer(request)``."""
+
+    def __init__(self, reader: asyncio.StreamReader, answer) -> None:
+        self._reader = reader
+        self._answer = answer
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        self._reader.feed_data(self._answer(bytes(data)))
+
+    async def drain(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def wait_closed(self) -> None:
+        return None
+
+    def is_closing(self) -> bool:
+        return self.closed
+
+
+def _connect(monkeypatch, transport_cls, answer):
+    async def open_connection(_host: str, _port: int):
+        reader = asyncio.StreamReader()
+        return reader, _Echo(reader, answer)
+
+    monkeypatch.setattr(asyncio, "open_connection", open_connection)
+    return transport_cls(
+        host="gateway", port=502, max_retries=1, base_backoff=0.0, max_backoff=0.0, timeout=1.0
+    )
+
+
+def _rtu_answer(request: bytes) -> bytes:
+    return append_crc(bytes([request[0], request[1], 2, 0x01, 0x2C]))
+
+
+def _mbap_answer(request: bytes) -> bytes:
+    transaction_id, _protocol, _length, unit = struct.unpack(">HHHB", request[:7])
+    return struct.pack(">HHHB", transaction_id, 0, 5, unit) + bytes([request[7], 2, 0x01, 0x2C])
+
+
+def test_ring_buffer_keeps_the_most_recent_frames():
+    capture = FrameCapture()
+    capture.start(2)
+    for value in range(3):
+        capture.record("gateway:502", value % 2 == 0, bytes([value]))
+
+    dump = capture.dump()
+
+    assert dump["enabled"] is True
+    assert [(frame["direction"], frame["frame"]) for frame in dump["frames"]] == [
+        ("rx", "01"),
+        ("tx", "02"),
+    ]
+    assert dump["frames"][0]["time"] <= dump["frames"][1]["time"]
+
+
+def test_capture_size_is_bounded():
+    capture = FrameCapture()
+    capture.start(MAX_CAPTURE_FRAMES * 10)
+
+    assert capture.dump()["size"] == MAX_CAPTURE_FRAMES
+
+
+async def test_nothing_is_recorded_while_capture_is_off(monkeypatch):
+    transport = _connect(monkeypatch, RawRtuOverTcpTransport, _rtu_answer)
+
+    await transport.read_input_registers(10, 0x10, count=1)
+
+    assert frame_capture.dump()["frames"] == []
+
+
+async def test_rtu_over_tcp_frames_are_captured(monkeypatch):
+    transport = _connect(monkeypatch, RawRtuOverTcpTransport, _rtu_answer)
+    frame_capture.start()
+
+    await transport.read_input_registers(10, 0x10, count=1)
+
+    frames = frame_capture.dump()["frames"]
+    assert [(frame["endpoint"], frame["direction"]) for frame in frames] == [
+        ("gateway:502", "tx"),
+        ("gateway:502", "rx"),
+    ]
+    assert frames[0]["frame"] == append_crc(bytes([10, 4, 0, 0x10, 0, 1])).hex()
+    assert frames[1]["frame"] == _rtu_answer(bytes([10, 4])).hex()
+
+
+async def test_modbus_tcp_frames_are_captured(monkeypatch):
+    transport = _connect(monkeypatch, RawModbusTcpTransport, _mbap_answer)
+    frame_capture.start()
+
+    try:
+        await transport.read_holding_registers(10, 0x10, count=1)
+    finally:
+        await transport.close()
+
+    frames = frame_capture.dump()["frames"]
+    assert [frame["direction"] for frame in frames] == ["tx", "rx"]
+    assert frames[1]["frame"] == _mbap_answer(bytes.fromhex(frames[0]["frame"])).hex()
+
+
+async def test_pymodbus_clients_report_packets_to_the_capture():
+    transport = TcpModbusTransport(
+        host="gateway", port=502, max_retries=1, base_backoff=0.0, max_backoff=0.0, timeout=1.0
+    )
+    trace = transport._build_tcp_client().ctx.trace_packet
+
+    assert trace(True, b"\x00\x01") == b"\x00\x01"
+    frame_capture.start()
+    assert trace(False, b"\x00\x02") == b"\x00\x02"
+
+    assert [(f["endpoint"], f["direction"]) for f in frame_capture.dump()["frames"]] == [
+        ("gateway:502", "rx")
+    ]
+
+
+def test_clients_without_trace_packet_keep_their_reconnect_settings(monkeypatch):
+    seen: dict[str, object] = {}
+
+    class LegacyTcpClient:  # pymodbus < 3.8 has no trace_packet
+        def __init__(
+            self,
+            host,
+            *,
+            port=502,
+            framer=None,
+            timeout=3,
+            retries=3,
+            reconnect_delay=0.1,
+            reconnect_delay_max=300,
+        ):
+            seen.update(port=port, retries=retries, reconnect_delay=reconnect_delay)
+
+    monkeypatch.setattr(tcp_module, "AsyncModbusTcpClient", LegacyTcpClient)
+    transport = TcpModbusTransport(
+        host="gateway", port=1502, max_retries=4, base_backoff=0.0, max_backoff=0.0, timeout=1.0
+    )
+
+    assert isinstance(transport._build_tcp_client(), LegacyTcpClient)
+    assert seen == {"port": 1502, "retries": 4, "reconnect_delay": 1}
+    assert trace_packet_kwargs(LegacyTcpClient, "gateway:1502") == {}
+
+
+def test_diagnostics_include_the_captured_frames():
+    frame_capture.start(10)
+    frame_capture.record("gateway:502", True, b"\x0a\x04")
+
+    data = make_coordinator().get_diagnostic_data()
+
+    assert data["frame_capture"]["frames"][0]["frame"] == "0a04"
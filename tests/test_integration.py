@@ -45,6 +45,7 @@ def test_coordinator_config_from_entry() -> None:
         "safe_scan": True,
         "max_registers_per_request": 10,
         "skip_missing_registers": True,
+        "max_inflight_requests": 4,
     }
 
     config = CoordinatorConfig.from_entry(entry)
@@ -53,6 +54,7 @@ def test_coordinator_config_from_entry() -> None:
     assert config.slave_id == 7
     assert config.connection_type == "tcp_rtu"
     assert config.max_registers_per_request == 10
+    assert config.max_inflight_requests == 4
 
 
 async def test_async_setup_entry_success():
@@ -586,3 +586,71 @@ def test_log_call_attempt_includes_attempt_context(caplog):
         _log_call_attempt(prepared, slave_id=2, attempt=2, max_attempts=4, kwargs={})
     messages = [r.message for r in caplog.records]
     assert any("2/4" in m for m in messages)
+
+
+# ---------------------------------------------------------------------------
+# Compiled call adapters
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_call_adapter_is_compiled_once_per_client_method(monkeypatch):
+    """Bound methods of every client instance share one adapter."""
+    from custom_components.thessla_green_modbus.modbus import call as call_mod
+    from pymodbus.client import AsyncModbusTcpClient
+
+    compiled = []
+    compile_adapter = call_mod._compile_call_adapter
+    monkeypatch.setattr(
+        call_mod,
+        "_compile_call_adapter",
+        lambda func: compiled.append(func) or compile_adapter(func),
+    )
+    first, second = AsyncModbusTcpClient("127.0.0.1"), AsyncModbusTcpClient("127.0.0.2")
+
+    adapter = call_mod._call_adapter(first.read_holding_registers)
+
+    assert call_mod._call_adapter(first.read_holding_registers) is adapter
+    assert call_mod._call_adapter(second.read_holding_registers) is adapter
+    assert len(compiled) == 1
+    assert adapter.slave_kwarg == "device_id"
+    assert adapter.external_timeout is False
+    assert adapter.layout((10, 4), kwargs := {}) == [10]
+    assert kwargs == {"count": 4}
+
+
+@pytest.mark.asyncio
+async def test_call_adapter_dispatches_pymodbus_client_methods():
+    """A pymodbus client method is called with ``device_id`` and mapped arguments."""
+    from pymodbus.client import AsyncModbusTcpClient
+
+    client = AsyncModbusTcpClient("127.0.0.1")
+    requests = []
+
+    async def execute(no_response_expected, request):
+        requests.append(request)
+        return request
+
+    client.execute = execute
+
+    await _call_modbus(client.read_input_registers, 7, 0x10, 3, timeout=1.0)
+
+    assert (requests[0].dev_id, requests[0].address, requests[0].count) == (7, 0x10, 3)
+
+
+def test_call_adapter_falls_back_for_unreferenceable_callables():
+    """Callables without weak reference support still get an adapter."""
+    from custom_components.thessla_green_modbus.modbus.call import _call_adapter
+
+    class SlottedReader:
+        __slots__ = ()
+        __name__ = "read_input_registers"
+
+        async def __call__(self, address, *, count=1, slave=1):
+            return address
+
+    adapter = _call_adapter(SlottedReader())
+
+    assert adapter.func_name == "read_input_registers"
+    assert adapter.keyword_only == (None, "count", "slave")
+    assert adapter.slave_kwarg == "slave"
@@ -0,0 +1,155 @@
+"""Tests for the native Modbus TCP (MBAP) transport."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+
+import pytest
+from custom_components.thessla_green_modbus.transport.mbap import RawModbusTcpTransport
+from custom_components.thessla_green_modbus.transport.raw import RawModbusWriteResponse
+from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
+
+
+class RecordingWriter:
+    """Stream writer that keeps every request frame it was given."""
+
+    def __init__(self) -> None:
+        self.frames: list[bytes] = []
+        self._closed = False
+
+    def write(self, data: bytes) -> None:
+        self.frames.append(bytes(data))
+
+    async def drain(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self._closed = True
+
+    async def wait_closed(self) -> None:
+        return None
+
+    def is_closing(self) -> bool:
+        return self._closed
+
+
+def _response(request: bytes, pdu: bytes, *, unit: int | None = None) -> bytes:
+    transaction_id, protocol_id, _length, request_unit = struct.unpack(">HHHB", request[:7])
+    unit = request_unit if unit is None else unit
+    return struct.pack(">HHHB", transaction_id, protocol_id, len(pdu) + 1, unit) + pdu
+
+
+async def _connected(monkeypatch, timeout: float = 1.0):
+    reader = asyncio.StreamReader()
+    writer = RecordingWriter()
+
+    async def open_connection(_host: str, _port: int):
+        return reader, writer
+
+    monkeypatch.setattr(asyncio, "open_connection", open_connection)
+    transport = RawModbusTcpTransport(
+        host="127.0.0.1",
+        port=502,
+        max_retries=1,
+        base_backoff=0.0,
+        max_backoff=0.0,
+        timeout=timeout,
+    )
+    await transport.ensure_connected()
+    return transport, reader, writer
+
+
+async def _sent(writer: RecordingWriter, count: int) -> list[bytes]:
+    for _ in range(100):
+        if len(writer.frames) >= count:
+            break
+        await asyncio.sleep(0)
+    return writer.frames
+
+
+async def test_read_holding_registers_frames_mbap_request(monkeypatch):
+    transport, reader, writer = await _connected(monkeypatch)
+
+    task = asyncio.create_task(transport.read_holding_registers(0x0A, 0x0010, count=2))
+    (request,) = await _sent(writer, 1)
+    reader.feed_data(_response(request, bytes.fromhex("0304002a002b")))
+
+    assert (await task).registers == [0x002A, 0x002B]
+    assert request.hex() == "0001000000060a0300100002"
+    await transport.close()
+
+
+async def test_concurrent_requests_are_matched_out_of_order(monkeypatch):
+    transport, reader, writer = await _connected(monkeypatch)
+
+    first = asyncio.create_task(transport.read_input_registers(1, 0, count=1))
+    second = asyncio.create_task(transport.read_coils(1, 0, count=3))
+    requests = await _sent(writer, 2)
+    assert requests[0][:2] != requests[1][:2]
+
+    reader.feed_data(_response(requests[1], bytes([1, 1, 0b101])))
+    reader.feed_data(_response(requests[0], bytes([4, 2, 0x12, 0x34])))
+
+    assert (await first).registers == [0x1234]
+    assert (await second).bits == [True, False, True]
+    assert not transport._pending
+    await transport.close()
+
+
+async def test_late_response_to_abandoned_request_is_dropped(monkeypatch):
+    transport, reader, writer = await _connected(monkeypatch, timeout=0.01)
+
+    with pytest.raises(TimeoutError):
+        await transport._request(1, struct.pack(">BHH", 4, 0, 1))
+    (stale,) = writer.frames
+
+    task = asyncio.create_task(transport._request(1, struct.pack(">BHH", 4, 0, 1)))
+    _, request = await _sent(writer, 2)
+    reader.feed_data(_response(stale, bytes([4, 2, 0xDE, 0xAD])))
+    reader.feed_data(_response(request, bytes([4, 2, 0x00, 0x07])))
+
+    assert await task == bytes([2, 0x00, 0x07])
+    await transport.close()
+
+
+async def test_exception_and_unit_mismatch_responses(monkeypatch):
+    transport, reader, writer = await _connected(monkeypatch)
+
+    task = asyncio.create_task(transport.read_holding_registers(1, 0, count=1))
+    (request,) = await _sent(writer, 1)
+    reader.feed_data(_response(request, bytes([0x83, 2])))
+    with pytest.raises(ModbusException, match="exception 2"):
+        await task
+
+    task = asyncio.create_task(transport._request(1, struct.pack(">BHH", 3, 0, 1)))
+    request = (await _sent(writer, 2))[-1]
+    reader.feed_data(_response(request, bytes([3, 2, 0, 1]), unit=2))
+    with pytest.raises(ModbusIOException, match="unit ID"):
+        await task
+    await transport.close()
+
+
+async def test_write_registers_validates_echo(monkeypatch):
+    transport, reader, writer = await _connected(monkeypatch)
+
+    task = asyncio.create_task(transport.write_registers(1, 0x0010, values=[1, 2]))
+    (request,) = await _sent(writer, 1)
+    reader.feed_data(_response(request, bytes.fromhex("1000100002")))
+
+    assert isinstance(await task, RawModbusWriteResponse)
+    assert request[7:].hex() == "100010000204" + "00010002"
+    await transport.close()
+
+
+async def test_peer_close_fails_outstanding_requests(monkeypatch):
+    transport, reader, writer = await _connected(monkeypatch)
+
+    task = asyncio.create_task(transport._request(1, struct.pack(">BHH", 4, 0, 1)))
+    await _sent(writer, 1)
+    reader.feed_eof()
+
+    with pytest.raises(ConnectionException, match="closed by peer"):
+        await task
+    assert not transport.is_connected()
+    await transport.close()
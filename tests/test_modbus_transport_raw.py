@@ -91,40 +91,31 @@ async def test_raw_tcp_reset_connection_with_writer():
 
 
 @pytest.mark.asyncio
-async def test_raw_tcp_read_exactly_no_reader():
-    """_read_exactly raises ConnectionException when reader is None."""
+async def test_raw_tcp_read_frame_no_reader():
+    """_read_frame raises ConnectionException when reader is None."""
     t = _make_raw_tcp()
     with pytest.raises(ConnectionException, match="not connected"):
-        await t._read_exactly(4)
+        await t._read_frame(1, 4)
 
 
 @pytest.mark.asyncio
-async def test_raw_tcp_read_exactly_incomplete_read():
-    """_read_exactly raises ModbusIOException on IncompleteReadError."""
-    t = _make_raw_tcp()
-    mock_reader = AsyncMock()
-    mock_reader.readexactly = AsyncMock(side_effect=asyncio.IncompleteReadError(b"", 4))
-    t._reader = mock_reader
+async def test_raw_tcp_read_frame_incomplete_read():
+    """_read_frame raises ModbusIOException when the stream ends mid-frame."""
+    t = _make_raw_tcp_with_frames(bytes([1, 4, 4, 0x00]))
+    t._reader.feed_eof()
 
     with pytest.raises(ModbusIOException, match="Incomplete"):
-        await t._read_exactly(4)
+        await t._read_frame(1, 4)
 
 
 @pytest.mark.asyncio
-async def test_raw_tcp_read_exactly_timeout():
-    """_read_exactly raises TimeoutError when read times out."""
-    t = _make_raw_tcp(timeout=0.001)
-    mock_reader = AsyncMock()
-
-    async def slow_read(n):
-        await asyncio.sleep(10)
-        return b"\x00" * n
+async def test_raw_tcp_read_frame_timeout():
+    """A frame that stalls after its header still times out as a whole."""
+    t = _make_raw_tcp_with_frames(bytes([1, 4, 2]))
+    t.timeout = 0.01
 
-    mock_reader.readexactly = slow_read
-    t._reader = mock_reader
-
-    with pytest.raises((TimeoutError, asyncio.TimeoutError)):
-        await t._read_exactly(4)
+    with pytest.raises(TimeoutError, match="Timed out waiting"):
+        await t._read_frame(1, 4)
 
 
 def test_validate_crc_mismatch():
@@ -213,48 +204,21 @@ def test_build_write_multiple_frame_structure():
     assert frame[1] == 16  # function code 0x10
 
 
-@pytest.mark.asyncio
-async def test_read_response_payload_reads_body_and_validates_crc():
-    t = _make_raw_tcp()
-    t._read_exactly = AsyncMock(side_effect=[b"\x10\x20", b"\xaa\xbb"])
-    t._validate_crc = MagicMock()
-
-    payload = await t._read_response_payload(b"\x01\x04", 2)
-
-    assert payload == b"\x10\x20"
-    t._read_exactly.assert_any_await(2)
-    t._read_exactly.assert_any_await(2)
-    t._validate_crc.assert_called_once_with(b"\x01\x04\x10\x20", b"\xaa\xbb")
-
-
-@pytest.mark.asyncio
-async def test_read_register_data_response_uses_payload_helper():
-    t = _make_raw_tcp()
-    t._read_exactly = AsyncMock(return_value=b"\x04")
-    t._read_response_payload = AsyncMock(return_value=b"\x00\x01\x00\x02")
-
-    payload = await t._read_register_data_response(b"\x01\x04")
-
-    assert payload == b"\x00\x01\x00\x02"
-    t._read_response_payload.assert_awaited_once_with(b"\x01\x04\x04", 4)
-
-
 # ---------------------------------------------------------------------------
 # _read_response paths
 # ---------------------------------------------------------------------------
 
 
-def _make_raw_tcp_with_reader(responses: list[bytes]) -> RawRtuOverTcpTransport:
-    """Create transport with a reader that returns given byte sequences."""
-    t = _make_raw_tcp()
-    read_iter = iter(responses)
+def _with_crc(payload: bytes) -> bytes:
+    return payload + _crc16(payload).to_bytes(2, "little")
 
-    async def readexactly(n):
-        return next(read_iter)
 
-    mock_reader = AsyncMock()
-    mock_reader.readexactly = readexactly
-    t._reader = mock_reader
+def _make_raw_tcp_with_frames(*frames: bytes) -> RawRtuOverTcpTransport:
+    """Create transport whose reader has the given bytes already received."""
+    t = _make_raw_tcp()
+    t._reader = asyncio.StreamReader()
+    for frame in frames:
+        t._reader.feed_data(frame)
     return t
 
 
@@ -262,7 +226,7 @@ def _make_raw_tcp_with_reader(responses: list[bytes]) -> RawRtuOverTcpTransport:
 async def test_read_response_wrong_slave():
     """_read_response raises ModbusIOException when slave ID doesn't match."""
     # response says slave=2, but we asked for slave=1
-    t = _make_raw_tcp_with_reader([bytes([2, 4])])
+    t = _make_raw_tcp_with_frames(_with_crc(bytes([2, 4, 2, 0, 5])))
 
     with pytest.raises(ModbusIOException, match="slave ID"):
         await t._read_response(1, 4)
@@ -272,14 +236,9 @@ async def test_read_response_wrong_slave():
 async def test_read_response_modbus_exception():
     """_read_response raises ModbusException when error bit is set."""
     # func = 0x84 (0x04 | 0x80), exception code = 2
-    payload = bytes([1, 0x84])
-    exception_code = bytes([2])
-    # valid CRC for payload + exception_code
-    full = payload + exception_code
-    crc = _crc16(full).to_bytes(2, "little")
-    t = _make_raw_tcp_with_reader([payload, exception_code, crc])
-
-    with pytest.raises(ModbusException):
+    t = _make_raw_tcp_with_frames(_with_crc(bytes([1, 0x84, 2])))
+
+    with pytest.raises(ModbusException, match="exception 2"):
         await t._read_response(1, 4)
 
 
@@ -287,7 +246,7 @@ async def test_read_response_modbus_exception():
 async def test_read_response_wrong_function():
     """_read_response raises ModbusIOException when function code doesn't match."""
     # slave=1 matches, func=3 but we asked for 4
-    t = _make_raw_tcp_with_reader([bytes([1, 3])])
+    t = _make_raw_tcp_with_frames(_with_crc(bytes([1, 3, 2, 0, 5])))
 
     with pytest.raises(ModbusIOException, match="function code"):
         await t._read_response(1, 4)
@@ -296,12 +255,8 @@ async def test_read_response_wrong_function():
 @pytest.mark.asyncio
 async def test_read_response_write_body():
     """_read_response returns 4-byte body for write operations (func != 3/4)."""
-    # For write single (func=6): header + 4 body bytes + 2 CRC
-    header = bytes([1, 6])
     body = bytes([0x00, 0x64, 0x00, 0x2A])  # addr=100, value=42
-    payload = header + body
-    crc = _crc16(payload).to_bytes(2, "little")
-    t = _make_raw_tcp_with_reader([header, body, crc])
+    t = _make_raw_tcp_with_frames(_with_crc(bytes([1, 6]) + body))
 
     result = await t._read_response(1, 6)
     assert result == body
@@ -310,17 +265,40 @@ async def test_read_response_write_body():
 @pytest.mark.asyncio
 async def test_read_response_read_registers():
     """_read_response returns register data for func=4 (input registers)."""
-    header = bytes([1, 4])
     data = bytes([0x00, 0x05])  # one register = 5
-    byte_count = bytes([len(data)])
-    payload = header + byte_count + data
-    crc = _crc16(payload).to_bytes(2, "little")
-    t = _make_raw_tcp_with_reader([header, byte_count, data, crc])
+    t = _make_raw_tcp_with_frames(_with_crc(bytes([1, 4, len(data)]) + data))
 
     result = await t._read_response(1, 4)
     assert result == data
 
 
+@pytest.mark.asyncio
+async def test_read_response_rejects_bad_crc():
+    """The CRC is checked over the whole buffered frame."""
+    frame = bytearray(_with_crc(bytes([1, 4, 2, 0, 5])))
+    frame[-1] ^= 0xFF
+    t = _make_raw_tcp_with_frames(bytes(frame))
+
+    with pytest.raises(ModbusIOException, match="CRC mismatch"):
+        await t._read_response(1, 4)
+
+
+@pytest.mark.asyncio
+async def test_read_frame_reuses_the_receive_buffer():
+    """Consecutive frames are read into the same buffer without reallocation."""
+    t = _make_raw_tcp_with_frames(
+        _with_crc(bytes([1, 4, 4, 0, 1, 0, 2])), _with_crc(bytes([1, 4, 2, 0xFF, 0xFE]))
+    )
+    buffer = t._frame
+
+    first = await t._read_frame(1, 4)
+    assert t._decode_register_words(first, count=2) == [1, 2]
+    second = await t._read_frame(1, 4)
+    assert t._decode_register_words(second, count=1) == [0xFFFE]
+    assert t._frame is buffer
+    assert first.obj is second.obj is buffer
+
+
 # ---------------------------------------------------------------------------
 # _send_frame when writer is None
 # ---------------------------------------------------------------------------
@@ -348,8 +326,8 @@ async def test_raw_tcp_read_input_registers():
 
     data = bytes([0x00, 0x2A])  # value = 42
 
-    async def fake_send_frame(frame, slave, func):
-        return data
+    async def fake_send_frame(frame, slave, func, decode=bytes):
+        return decode(memoryview(data))
 
     with patch.object(t, "_send_frame", side_effect=fake_send_frame):
         with patch.object(t, "ensure_connected", new=AsyncMock()):
@@ -364,8 +342,8 @@ async def test_raw_tcp_read_holding_registers():
     t = _make_raw_tcp()
     data = bytes([0x00, 0x0F])  # value = 15
 
-    async def fake_send_frame(frame, slave, func):
-        return data
+    async def fake_send_frame(frame, slave, func, decode=bytes):
+        return decode(memoryview(data))
 
     with patch.object(t, "_send_frame", side_effect=fake_send_frame):
         with patch.object(t, "ensure_connected", new=AsyncMock()):
@@ -381,8 +359,8 @@ async def test_raw_tcp_write_register():
     # response body: addr_hi, addr_lo, val_hi, val_lo
     response_body = bytes([0x00, 0x64, 0x00, 0x05])  # addr=100, value=5
 
-    async def fake_send_frame(frame, slave, func):
-        return response_body
+    async def fake_send_frame(frame, slave, func, decode=bytes):
+        return decode(memoryview(response_body))
 
     with patch.object(t, "_send_frame", side_effect=fake_send_frame):
         with patch.object(t, "ensure_connected", new=AsyncMock()):
@@ -398,8 +376,8 @@ async def test_raw_tcp_write_register_mismatch():
     # Wrong value returned
     response_body = bytes([0x00, 0x64, 0x00, 0x09])  # addr=100, value=9 (expected 5)
 
-    async def fake_send_frame(frame, slave, func):
-        return response_body
+    async def fake_send_frame(frame, slave, func, decode=bytes):
+        return decode(memoryview(response_body))
 
     with patch.object(t, "_send_frame", side_effect=fake_send_frame):
         with patch.object(t, "ensure_connected", new=AsyncMock()):
@@ -414,8 +392,8 @@ async def test_raw_tcp_write_registers():
     # response: addr=100, qty=2
     response_body = bytes([0x00, 0x64, 0x00, 0x02])
 
-    async def fake_send_frame(frame, slave, func):
-        return response_body
+    async def fake_send_frame(frame, slave, func, decode=bytes):
+        return decode(memoryview(response_body))
 
     with patch.object(t, "_send_frame", side_effect=fake_send_frame):
         with patch.object(t, "ensure_connected", new=AsyncMock()):
@@ -431,8 +409,8 @@ async def test_raw_tcp_write_registers_mismatch():
     # response says qty=1, but we sent 2
     response_body = bytes([0x00, 0x64, 0x00, 0x01])
 
-    async def fake_send_frame(frame, slave, func):
-        return response_body
+    async def fake_send_frame(frame, slave, func, decode=bytes):
+        return decode(memoryview(response_body))
 
     with patch.object(t, "_send_frame", side_effect=fake_send_frame):
         with patch.object(t, "ensure_connected", new=AsyncMock()):
@@ -445,8 +423,8 @@ async def test_raw_tcp_write_register_invalid_length():
     """write_register raises ModbusIOException when response length != 4."""
     t = _make_raw_tcp()
 
-    async def fake_send_frame(frame, slave, func):
-        return bytes([0x00, 0x64])  # only 2 bytes, should be 4
+    async def fake_send_frame(frame, slave, func, decode=bytes):
+        return decode(memoryview(bytes([0x00, 0x64])))  # only 2 bytes, should be 4
 
     with patch.object(t, "_send_frame", side_effect=fake_send_frame):
         with patch.object(t, "ensure_connected", new=AsyncMock()):
@@ -459,8 +437,8 @@ async def test_raw_tcp_read_input_registers_invalid_byte_count():
     """read_input_registers raises ModbusIOException on odd data length."""
     t = _make_raw_tcp()
 
-    async def fake_send_frame(frame, slave, func):
-        return bytes([0x00, 0x01, 0x02])  # 3 bytes = odd
+    async def fake_send_frame(frame, slave, func, decode=bytes):
+        return decode(memoryview(bytes([0x00, 0x01, 0x02])))  # 3 bytes = odd
 
     with patch.object(t, "_send_frame", side_effect=fake_send_frame):
         with patch.object(t, "ensure_connected", new=AsyncMock()):
@@ -484,8 +462,8 @@ async def test_raw_tcp_read_holding_registers_invalid_byte_count():
     """read_holding_registers raises ModbusIOException on odd data length."""
     t = _make_raw_tcp()
 
-    async def fake_send_frame(frame, slave, func):
-        return bytes([0x00, 0x01, 0x02])  # 3 bytes = odd
+    async def fake_send_frame(frame, slave, func, decode=bytes):
+        return decode(memoryview(bytes([0x00, 0x01, 0x02])))  # 3 bytes = odd
 
     with patch.object(t, "_send_frame", side_effect=fake_send_frame):
         with patch.object(t, "ensure_connected", new=AsyncMock()):
@@ -498,8 +476,8 @@ async def test_raw_tcp_write_registers_invalid_length():
     """write_registers raises ModbusIOException when response length != 4."""
     t = _make_raw_tcp()
 
-    async def fake_send_frame(frame, slave, func):
-        return bytes([0x00, 0x64])  # only 2 bytes
+    async def fake_send_frame(frame, slave, func, decode=bytes):
+        return decode(memoryview(bytes([0x00, 0x64])))  # only 2 bytes
 
     with patch.object(t, "_send_frame", side_effect=fake_send_frame):
         with patch.object(t, "ensure_connected", new=AsyncMock()):
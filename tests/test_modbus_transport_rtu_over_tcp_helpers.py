@@ -5,7 +5,13 @@ from __future__ import annotations
 import importlib
 
 import pytest
-from custom_components.thessla_green_modbus.transport.crc import append_crc, crc16, crc16_bytes
+from custom_components.thessla_green_modbus.transport.crc import (
+    CRC16_INIT,
+    append_crc,
+    crc16,
+    crc16_bytes,
+    crc16_update,
+)
 from custom_components.thessla_green_modbus.transport.tcp_rtu import RawRtuOverTcpTransport
 from pymodbus.exceptions import ModbusIOException
 
@@ -18,6 +24,31 @@ def test_crc16_and_bytes_use_little_endian() -> None:
     assert append_crc(payload) == payload + crc16_bytes(payload)
 
 
+def _bitwise_crc16(data: bytes) -> int:
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+
+def test_table_crc16_matches_bitwise_reference() -> None:
+    for payload in (b"", bytes(range(256)), bytes([0x0A, 0x04, 0x02, 0x12, 0x34]) * 7):
+        assert crc16(payload) == _bitwise_crc16(payload)
+
+
+def test_crc16_update_folds_frame_in_pieces() -> None:
+    frame = append_crc(bytes([0x0A, 0x04, 0x04, 0x00, 0x01, 0x00, 0x02]))
+    crc = CRC16_INIT
+    for piece in (frame[:3], memoryview(frame)[3:5], bytearray(frame[5:-2])):
+        crc = crc16_update(crc, piece)
+
+    assert crc == crc16(frame[:-2])
+    # Folding in the frame's own CRC leaves a zero residue.
+    assert crc16_update(crc, frame[-2:]) == 0
+
+
 def test_validate_crc_accepts_valid_frame_crc() -> None:
     payload = bytes([0x0A, 0x04, 0x02, 0x12, 0x34])
 
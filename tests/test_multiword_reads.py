@@ -0,0 +1,131 @@
+"""Tests for assembling multi-word registers in the batch read path."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.thessla_green_modbus.const import QUARANTINE_REASON_NO_DATA
+from custom_components.thessla_green_modbus.core.client import ThesslaGreenDeviceClient
+from custom_components.thessla_green_modbus.core.models import CoordinatorConfig
+from custom_components.thessla_green_modbus.core.poll_plan import build_poll_plan
+from custom_components.thessla_green_modbus.core.read_batches import (
+    _merge_batch_read_results,
+    _read_holding_register_batch,
+    read_holding_individually,
+)
+from custom_components.thessla_green_modbus.register_defs_cache import get_register_definitions
+from custom_components.thessla_green_modbus.registers.read_planner import (
+    ReadCostModel,
+    coalesce_reads,
+)
+
+
+def test_blocks_never_start_inside_a_multi_word_register():
+    model = ReadCostModel(request_latency=0.05, word_time=0.002)
+    addresses = list(range(18))
+    assert coalesce_reads(addresses, 16, cost_model=model) == [(0, 16), (16, 2)]
+    assert coalesce_reads(
+        addresses, 16, cost_model=model, continuations=frozenset(range(13, 18))
+    ) == [(0, 12), (12, 6)]
+    # A register longer than a block is split rather than dropped.
+    assert coalesce_reads(range(6), 4, continuations=frozenset(range(1, 6))) == [(0, 4), (4, 2)]
+
+
+def _device_client() -> ThesslaGreenDeviceClient:
+    client = ThesslaGreenDeviceClient(
+        CoordinatorConfig(host="192.168.1.1", port=502, slave_id=1),
+        hass=MagicMock(),
+        effective_batch=16,
+        resolved_connection_mode=None,
+        backoff=0.0,
+        backoff_jitter=None,
+    )
+    client.available_registers["input_registers"] = {"serial_number"}
+    client.compute_register_groups()
+    return client
+
+
+def _serial_words(serial: str) -> list[int]:
+    return get_register_definitions()["serial_number"].encode(serial)
+
+
+def test_plan_slot_spans_every_word_of_the_register():
+    client = _device_client()
+    (chunk,) = build_poll_plan(client, "input_registers").chunks
+    assert chunk.wide
+    assert chunk.slots[0].width == 6
+    assert chunk.slots[1:] == (None,) * 5
+
+
+def test_batch_merge_decodes_multi_word_register_from_one_response():
+    client = _device_client()
+    (chunk,) = build_poll_plan(client, "input_registers").chunks
+    data = {}
+
+    _merge_batch_read_results(
+        client, SimpleNamespace(registers=_serial_words("AP12345678")), chunk, data
+    )
+
+    assert data == {"serial_number": "AP12345678"}
+
+
+def test_truncated_multi_word_register_is_marked_failed():
+    client = _device_client()
+    client._mark_registers_failed = MagicMock()
+    (chunk,) = build_poll_plan(client, "input_registers").chunks
+    data = {}
+
+    _merge_batch_read_results(
+        client, SimpleNamespace(registers=_serial_words("AP12345678")[:3]), chunk, data
+    )
+
+    assert data == {}
+    client._mark_registers_failed.assert_called_once_with(
+        ["serial_number"], QUARANTINE_REASON_NO_DATA
+    )
+
+
+async def test_individual_fallback_reads_all_words_of_the_register():
+    definition = get_register_definitions()["lock_pass"]
+    owner = SimpleNamespace(
+        device_client=SimpleNamespace(statistics={"total_registers_read": 0}),
+        _read_with_retry=AsyncMock(
+            return_value=SimpleNamespace(registers=definition.encode(123456))
+        ),
+        _process_register_value=lambda name, raw: get_register_definitions()[name].decode(raw),
+        _clear_register_failure=MagicMock(),
+        _mark_registers_failed=MagicMock(),
+    )
+    read_method = AsyncMock()
+    data = {}
+
+    await read_holding_individually(owner, read_method, definition.address, ["lock_pass"], data)
+
+    owner._read_with_retry.assert_awaited_once_with(
+        read_method, definition.address, 2, register_type="holding"
+    )
+    assert data == {"lock_pass": 123456}
+
+
+async def test_partial_holding_response_rereads_the_cut_register_whole():
+    definition = get_register_definitions()["device_name"]
+    client = _device_client()
+    client.available_registers["holding_registers"] = {"device_name"}
+    client.compute_register_groups()
+    (chunk,) = build_poll_plan(client, "holding_registers").chunks
+    words = definition.encode("Rekuperator")
+    client._read_with_retry = AsyncMock(
+        side_effect=[SimpleNamespace(registers=words[:5]), SimpleNamespace(registers=words)]
+    )
+    read_method = AsyncMock()
+    data = {}
+
+    await _read_holding_register_batch(client, read_method, chunk, data, set())
+
+    assert client._read_with_retry.await_args_list[-1].args == (
+        read_method,
+        definition.address,
+        definition.length,
+    )
+    assert data == {"device_name": "Rekuperator"}
@@ -0,0 +1,140 @@
+"""Tests for precompiled poll plans (core/poll_plan.py)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.thessla_green_modbus.core.client import ThesslaGreenDeviceClient
+from custom_components.thessla_green_modbus.core.models import CoordinatorConfig
+from custom_components.thessla_green_modbus.core.poll_plan import (
+    build_poll_plan,
+    poll_plan_for,
+    refresh_poll_plans,
+)
+
+_NAMES = {100: "reg_a", 101: "reg_b", 102: "reg_c", 103: "reg_d"}
+
+
+def _owner(*, groups=None, available=None, batch=16):
+    device_client = SimpleNamespace(
+        _register_groups={"input_registers": groups or [(100, 4)]},
+        effective_batch=batch,
+        available_registers={
+            "input_registers": set(available if available is not None else _NAMES.values())
+        },
+    )
+    owner = SimpleNamespace(device_client=device_client)
+    owner._find_register_name = MagicMock(side_effect=lambda _kind, addr: _NAMES.get(addr))
+    owner._process_register_value = MagicMock(side_effect=lambda name, value: (name, value))
+    return owner
+
+
+def test_plan_resolves_names_slots_and_decoders():
+    owner = _owner(available={"reg_a", "reg_c"})
+    plan = build_poll_plan(owner, "input_registers")
+
+    assert plan.request_count == 1
+    chunk = plan.chunks[0]
+    assert (chunk.start, chunk.count) == (100, 4)
+    assert chunk.names == ("reg_a", "reg_b", "reg_c", "reg_d")
+    assert chunk.known == chunk.names
+    assert [slot.name if slot else None for slot in chunk.slots] == [
+        "reg_a",
+        None,
+        "reg_c",
+        None,
+    ]
+    assert chunk.slots[2].decode(7) == ("reg_c", 7)
+
+
+def test_plan_splits_groups_by_batch_size_and_keeps_unnamed_offsets():
+    owner = _owner(groups=[(99, 5)], batch=2)
+    plan = build_poll_plan(owner, "input_registers")
+
+    assert [(chunk.start, chunk.count) for chunk in plan.chunks] == [(99, 2), (101, 2), (103, 1)]
+    assert plan.chunks[0].names == (None, "reg_a")
+    assert plan.chunks[0].known == ("reg_a",)
+    assert plan.chunks[0].slots[0] is None
+
+
+def test_cached_plan_is_reused_while_inputs_are_unchanged():
+    owner = _owner()
+    first = poll_plan_for(owner, "input_registers")
+    lookups = owner._find_register_name.call_count
+
+    assert poll_plan_for(owner, "input_registers") is first
+    assert owner._find_register_name.call_count == lookups
+
+
+def test_plan_rebuilds_when_availability_changes():
+    owner = _owner(available={"reg_a"})
+    first = poll_plan_for(owner, "input_registers")
+
+    owner.device_client.available_registers["input_registers"].add("reg_b")
+    second = poll_plan_for(owner, "input_registers")
+
+    assert second is not first
+    assert second.chunks[0].slots[1].name == "reg_b"
+
+
+def test_plan_rebuilds_when_batch_size_or_groups_change():
+    owner = _owner()
+    first = poll_plan_for(owner, "input_registers")
+
+    owner.device_client.effective_batch = 2
+    by_batch = poll_plan_for(owner, "input_registers")
+    assert by_batch is not first
+    assert by_batch.request_count == 2
+
+    owner.device_client._register_groups = {"input_registers": [(100, 1)]}
+    by_groups = poll_plan_for(owner, "input_registers")
+    assert by_groups is not by_batch
+    assert by_groups.request_count == 1
+
+
+def test_plan_rebuilds_when_decode_hook_is_replaced():
+    owner = _owner()
+    first = poll_plan_for(owner, "input_registers")
+
+    owner._process_register_value = MagicMock(return_value=1)
+    second = poll_plan_for(owner, "input_registers")
+
+    assert second is not first
+    assert second.chunks[0].slots[0].decode(5) == 1
+
+
+def test_missing_availability_entry_yields_stable_empty_plan():
+    owner = _owner()
+    owner.device_client.available_registers = {}
+    first = poll_plan_for(owner, "input_registers")
+
+    assert all(slot is None for slot in first.chunks[0].slots)
+    assert poll_plan_for(owner, "input_registers") is first
+
+
+def test_refresh_builds_plans_only_for_grouped_types():
+    owner = _owner()
+    refresh_poll_plans(owner)
+    assert set(owner.device_client._poll_plans) == {"input_registers"}
+
+
+def test_device_client_compute_register_groups_emits_poll_plans():
+    client = ThesslaGreenDeviceClient(
+        CoordinatorConfig(host="192.168.1.1", port=502, slave_id=1),
+        hass=MagicMock(),
+        effective_batch=16,
+        resolved_connection_mode=None,
+        backoff=0.0,
+        backoff_jitter=None,
+    )
+    client.available_registers["input_registers"] = {"outside_temperature", "supply_temperature"}
+    client.available_registers["holding_registers"] = {"mode"}
+
+    client.compute_register_groups()
+
+    assert set(client._poll_plans) == {"input_registers", "holding_registers"}
+    plan = client._poll_plans["input_registers"]
+    polled = {slot.name for chunk in plan.chunks for slot in chunk.slots if slot}
+    assert polled == {"outside_temperature", "supply_temperature"}
+    assert poll_plan_for(client, "input_registers") is plan
@@ -242,7 +242,7 @@ def test_transport_builders_forward_runtime_settings() -> None:
 
     with (
         patch.object(connection, "RawRtuOverTcpTransport", return_value="raw") as raw_cls,
-        patch.object(connection, "TcpModbusTransport", return_value="tcp") as tcp_cls,
+        patch.object(connection, "RawModbusTcpTransport", return_value="tcp") as tcp_cls,
     ):
         common = dict(
             host="host",
@@ -252,7 +252,6 @@ def test_transport_builders_forward_runtime_settings() -> None:
             max_backoff=1.0,
             timeout=2.0,
             offline_state=False,
-            connection_type_tcp="tcp",
             connection_mode_tcp_rtu="tcp_rtu",
         )
         assert connection.build_tcp_transport(mode="tcp_rtu", **common) == "raw"
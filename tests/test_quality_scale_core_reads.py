@@ -12,6 +12,8 @@ from custom_components.thessla_green_modbus.const import (
     CONNECTION_MODE_TCP,
     CONNECTION_MODE_TCP_RTU,
     DEFAULT_PORT,
+    QUARANTINE_REASON_NO_DATA,
+    QUARANTINE_REASON_REJECTED,
 )
 from custom_components.thessla_green_modbus.core.read_bits import (
     read_coil_registers_optimized,
@@ -121,7 +123,7 @@ async def test_bit_reader_marks_short_response_tail_failed(
 
     assert result == {"r0": True, "r1": False}
     assert owner.device_client.statistics["total_registers_read"] == 2
-    owner._mark_registers_failed.assert_called_once_with(["r2"])
+    owner._mark_registers_failed.assert_called_once_with(["r2"], QUARANTINE_REASON_NO_DATA)
 
 
 @pytest.mark.asyncio
@@ -162,7 +164,9 @@ async def test_bit_reader_permanent_error_marks_chunk_and_continues(
     owner._read_with_retry.side_effect = _PermanentModbusError("unsupported")
 
     assert await reader(owner) == {}
-    owner._mark_registers_failed.assert_called_once_with(["r0", "r1", "r2"])
+    owner._mark_registers_failed.assert_called_once_with(
+        ["r0", "r1", "r2"], QUARANTINE_REASON_REJECTED
+    )
 
 
 @pytest.mark.asyncio
@@ -178,6 +182,25 @@ async def test_bit_reader_transient_error_marks_chunk_and_reraises(
     owner._mark_registers_failed.assert_called_once_with(["r0", "r1", "r2"])
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("reader,group,transport_attr,register_type", _BIT_READ_CASES)
+async def test_bit_reader_prefers_connected_transport_without_client(
+    reader, group, transport_attr, register_type
+):
+    owner = _bit_owner(group=group, transport_attr=transport_attr)
+    owner.device_client.client = None
+    transport = SimpleNamespace(
+        is_connected=lambda: True, read_coils=AsyncMock(), read_discrete_inputs=AsyncMock()
+    )
+    owner.device_client._transport = transport
+
+    assert await reader(owner) == {"r0": True, "r1": False, "r2": True}
+    operation = "read_coils" if register_type == "coil" else "read_discrete_inputs"
+    owner._read_with_retry.assert_awaited_once_with(
+        getattr(transport, operation), 0, 3, register_type=register_type
+    )
+
+
 class _FakeTransport:
     def __init__(self) -> None:
         self.ensure_connected = AsyncMock()
@@ -179,6 +179,7 @@ async def test_runtime_io_uses_transport_and_post_processes_reads() -> None:
         max_attempts=3,
         backoff=0.1,
         backoff_jitter=0.2,
+        deadline=None,
         count=1,
     )
 
@@ -118,9 +118,11 @@ async def test_io_mixin_transport_wrappers_cover_connected_and_disconnected_clie
     client = SimpleNamespace(read_coils=Mock(), read_discrete_inputs=Mock())
     mixin.device_client.client = client
     assert await mixin._read_coils_transport(10, 1, count=2, attempt=3) == "ok"
-    mixin._call_modbus.assert_awaited_with(client.read_coils, 1, count=2, attempt=3)
+    mixin._call_modbus.assert_awaited_with(client.read_coils, 1, count=2, attempt=3, deadline=None)
     assert await mixin._read_discrete_inputs_transport(10, 2, count=1, attempt=4) == "ok"
-    mixin._call_modbus.assert_awaited_with(client.read_discrete_inputs, 2, count=1, attempt=4)
+    mixin._call_modbus.assert_awaited_with(
+        client.read_discrete_inputs, 2, count=1, attempt=4, deadline=None
+    )
 
     with patch.object(
         io_mixin,
@@ -128,7 +130,7 @@ async def test_io_mixin_transport_wrappers_cover_connected_and_disconnected_clie
         new=AsyncMock(return_value={"ready": True}),
     ) as impl:
         assert await mixin._read_discrete_inputs_optimized() == {"ready": True}
-    impl.assert_awaited_once_with(mixin)
+    impl.assert_awaited_once_with(mixin, None)
 
 
 def _register_group_client(*, safe_scan: bool):
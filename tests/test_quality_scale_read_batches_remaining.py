@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from custom_components.thessla_green_modbus.core import read_batches
+from custom_components.thessla_green_modbus.core.poll_plan import PlanChunk
 from custom_components.thessla_green_modbus.core.retry import _PermanentModbusError
 from pymodbus.exceptions import ConnectionException, ModbusException
 
@@ -35,6 +36,16 @@ def _owner():
     return owner
 
 
+def _chunk(start, names):
+    return PlanChunk(
+        start=start,
+        count=len(names),
+        names=tuple(names),
+        known=tuple(name for name in names if name),
+        slots=(None,) * len(names),
+    )
+
+
 @pytest.mark.asyncio
 async def test_holding_fallback_uses_default_when_owner_has_no_hook() -> None:
     owner = _owner()
@@ -66,21 +77,27 @@ async def test_input_batch_shortcuts_and_error_classes() -> None:
     owner = _owner()
     owner._failed_registers = {"r1", "r2"}
     await read_batches._read_input_register_batch(
-        owner, "read", 10, 2, ["r1", "r2"], {}, owner._failed_registers
+        owner, "read", _chunk(10, ["r1", "r2"]), {}, owner._failed_registers
     )
     owner._read_with_retry.assert_not_awaited()
 
     owner._failed_registers = set()
     owner._read_with_retry = AsyncMock(side_effect=_PermanentModbusError("permanent"))
-    await read_batches._read_input_register_batch(owner, "read", 10, 2, ["r1", "r2"], {}, set())
+    await read_batches._read_input_register_batch(
+        owner, "read", _chunk(10, ["r1", "r2"]), {}, set()
+    )
     owner._mark_registers_failed.assert_called()
 
     owner._read_with_retry = AsyncMock(side_effect=ConnectionException("offline"))
     with pytest.raises(ConnectionException):
-        await read_batches._read_input_register_batch(owner, "read", 10, 2, ["r1", "r2"], {}, set())
+        await read_batches._read_input_register_batch(
+            owner, "read", _chunk(10, ["r1", "r2"]), {}, set()
+        )
 
     owner._read_with_retry = AsyncMock(side_effect=ValueError("bad"))
-    await read_batches._read_input_register_batch(owner, "read", 10, 2, ["r1", "r2"], {}, set())
+    await read_batches._read_input_register_batch(
+        owner, "read", _chunk(10, ["r1", "r2"]), {}, set()
+    )
 
 
 @pytest.mark.asyncio
@@ -155,7 +172,7 @@ async def test_holding_optimized_no_group_disconnected_partial_and_failures() ->
     owner._read_holding_individually.reset_mock()
     owner._read_with_retry = AsyncMock(side_effect=_PermanentModbusError("permanent"))
     assert await read_batches.read_holding_registers_optimized(owner) == {}
-    owner._mark_registers_failed.assert_called()
+    owner._read_holding_individually.assert_awaited_once()
 
     owner._read_with_retry = AsyncMock(side_effect=ValueError("bad"))
     assert await read_batches.read_holding_registers_optimized(owner) == {}
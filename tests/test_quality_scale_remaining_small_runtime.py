@@ -61,7 +61,7 @@ async def test_io_mixin_disconnected_bit_reads_fail_closed_and_delegate() -> Non
         io_mixin, "_read_discrete_inputs_optimized_impl", new=AsyncMock(return_value={"x": 1})
     ) as delegated:
         assert await owner._read_discrete_inputs_optimized() == {"x": 1}
-    delegated.assert_awaited_once_with(owner)
+    delegated.assert_awaited_once_with(owner, None)
 
 
 @pytest.mark.asyncio
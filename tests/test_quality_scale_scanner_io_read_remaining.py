@@ -305,7 +305,7 @@ async def test_word_attempt_transport_client_cancel_and_exception_paths() -> Non
             return_value=SimpleNamespace(isError=lambda: False, registers=[1])
         )
     )
-    result = await io_read._execute_word_read_attempt(
+    result = await io_read._execute_read_attempt(
         scanner,
         transport=transport,
         client=None,
@@ -317,9 +317,7 @@ async def test_word_attempt_transport_client_cancel_and_exception_paths() -> Non
     assert result.registers == [1]
 
     handler = Mock(return_value=(True, True))
-    with patch.object(
-        io_read, "_execute_word_read_attempt", new=AsyncMock(side_effect=TimeoutError())
-    ):
+    with patch.object(io_read, "_execute_read_attempt", new=AsyncMock(side_effect=TimeoutError())):
         assert await io_read._run_word_read_single_attempt(
             scanner,
             transport=None,
@@ -338,7 +336,7 @@ async def test_word_attempt_transport_client_cancel_and_exception_paths() -> Non
 
     with patch.object(
         io_read,
-        "_execute_word_read_attempt",
+        "_execute_read_attempt",
         new=AsyncMock(side_effect=asyncio.CancelledError()),
     ):
         with pytest.raises(asyncio.CancelledError):
@@ -442,3 +440,25 @@ async def test_bit_reads_timeout_reconnect_oserror_cancel_and_failure_bucket() -
     ):
         with pytest.raises(asyncio.CancelledError):
             await io_read.read_coil(scanner, 40, 1)
+
+
+@pytest.mark.asyncio
+async def test_bit_reads_go_through_a_transport_without_pymodbus_client() -> None:
+    scanner = _scanner()
+    scanner._client = None
+    answer = SimpleNamespace(isError=lambda: False, bits=[True, False, True, False])
+    scanner._transport = SimpleNamespace(
+        client=None,
+        read_coils=AsyncMock(side_effect=[ModbusException("lost frame"), answer]),
+    )
+    reconnect = AsyncMock()
+
+    with patch.object(io_read, "_attempt_bit_reconnect", new=reconnect):
+        bits = await io_read.read_bit_registers(
+            scanner, "read_coils", "coil_registers", "coil", 5, 3
+        )
+
+    assert bits == [True, False, True]
+    scanner._transport.read_coils.assert_awaited_with(10, 5, count=3)
+    # The transport recovers its own link; no pymodbus client is reconnected.
+    reconnect.assert_not_awaited()
@@ -116,3 +116,38 @@ async def test_raw_rtu_over_tcp_rejects_invalid_quantity_before_send():
 
     with pytest.raises(ModbusIOException, match="Invalid slave_id=0"):
         await transport.write_register(0, 0x0010, value=1)
+
+
+@pytest.mark.asyncio
+async def test_raw_rtu_over_tcp_reads_and_unpacks_bits(monkeypatch):
+    reader = asyncio.StreamReader()
+    # FC01, two data bytes packed LSB-first: 0xCD -> 1,0,1,1,0,0,1,1 then 0x01 -> 1.
+    reader.feed_data(bytes.fromhex("0a0102cd01896d"))
+    reader.feed_data(bytes.fromhex("0a01010593af"))
+    reader.feed_eof()
+    writer = DummyWriter()
+
+    async def open_connection(_host: str, _port: int):
+        return reader, writer
+
+    monkeypatch.setattr(asyncio, "open_connection", open_connection)
+
+    transport = RawRtuOverTcpTransport(
+        host="127.0.0.1",
+        port=502,
+        max_retries=1,
+        base_backoff=0.0,
+        max_backoff=0.0,
+        timeout=1.0,
+    )
+
+    response = await transport.read_coils(0x0A, 0x0013, count=9)
+    assert response.bits == [True, False, True, True, False, False, True, True, True]
+    assert bytes(writer.buffer[:8]) == RawRtuOverTcpTransport._build_read_frame(0x0A, 1, 0x0013, 9)
+
+    # A byte count that does not match the requested bit count is rejected.
+    with pytest.raises(ModbusIOException, match="Invalid byte count"):
+        await transport.read_coils(0x0A, 0x0013, count=9)
+
+    with pytest.raises(ModbusIOException, match="Invalid read count=2001"):
+        await transport.read_discrete_inputs(0x0A, 0x0000, count=2001)
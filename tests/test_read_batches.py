@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from custom_components.thessla_green_modbus.const import (
+    QUARANTINE_REASON_NO_DATA,
+    QUARANTINE_REASON_REJECTED,
+)
+from custom_components.thessla_green_modbus.core.poll_plan import PlanChunk, build_poll_plan
 from custom_components.thessla_green_modbus.core.read_batches import (
+    _dispatch_chunk_reads,
     _fallback_individual_input_reads,
     _handle_batch_read_failure,
     _merge_batch_read_results,
@@ -14,9 +22,12 @@ from custom_components.thessla_green_modbus.core.read_batches import (
     read_holding_individually,
     read_holding_registers_optimized,
     read_input_registers_optimized,
+    resolve_inflight_window,
 )
-from custom_components.thessla_green_modbus.core.retry import _PermanentModbusError
-from pymodbus.exceptions import ConnectionException, ModbusException
+from custom_components.thessla_green_modbus.core.read_cost import ReadCostEstimator
+from custom_components.thessla_green_modbus.core.retry import _PermanentModbusError, read_with_retry
+from custom_components.thessla_green_modbus.transport.base import BaseModbusTransport
+from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
 
 # ---------------------------------------------------------------------------
 # Minimal owner factory
@@ -62,6 +73,22 @@ def _ok_response(values):
     return r
 
 
+def _planned_chunk(owner, start=0, count=1, key="input_registers"):
+    """Return the first poll-plan chunk the owner would read for ``key``."""
+    owner.device_client._register_groups = {key: [(start, count)]}
+    return build_poll_plan(owner, key).chunks[0]
+
+
+def _chunk(start, names):
+    return PlanChunk(
+        start=start,
+        count=len(names),
+        names=tuple(names),
+        known=tuple(name for name in names if name),
+        slots=(None,) * len(names),
+    )
+
+
 # ---------------------------------------------------------------------------
 # _merge_batch_read_results
 # ---------------------------------------------------------------------------
@@ -72,7 +99,7 @@ def test_merge_stores_processed_value():
     owner._find_register_name.return_value = "reg_a"
     owner._process_register_value.return_value = 55
     data = {}
-    _merge_batch_read_results(owner, _ok_response([10]), chunk_start=0, data=data)
+    _merge_batch_read_results(owner, _ok_response([10]), _planned_chunk(owner), data)
     assert data == {"reg_a": 55}
     assert owner.device_client.statistics["total_registers_read"] == 1
 
@@ -81,7 +108,7 @@ def test_merge_skips_when_register_not_available():
     owner = _make_owner()
     owner._find_register_name.return_value = "unknown_reg"
     data = {}
-    _merge_batch_read_results(owner, _ok_response([10]), chunk_start=0, data=data)
+    _merge_batch_read_results(owner, _ok_response([10]), _planned_chunk(owner), data)
     assert data == {}
 
 
@@ -90,7 +117,7 @@ def test_merge_skips_when_process_returns_none():
     owner._find_register_name.return_value = "reg_a"
     owner._process_register_value.return_value = None
     data = {}
-    _merge_batch_read_results(owner, _ok_response([10]), chunk_start=0, data=data)
+    _merge_batch_read_results(owner, _ok_response([10]), _planned_chunk(owner), data)
     assert data == {}
     assert owner.device_client.statistics["total_registers_read"] == 0
 
@@ -99,7 +126,7 @@ def test_merge_clears_failure_on_success():
     owner = _make_owner()
     owner._find_register_name.return_value = "reg_a"
     owner._process_register_value.return_value = 7
-    _merge_batch_read_results(owner, _ok_response([7]), chunk_start=0, data={})
+    _merge_batch_read_results(owner, _ok_response([7]), _planned_chunk(owner), {})
     owner._clear_register_failure.assert_called_once_with("reg_a")
 
 
@@ -134,7 +161,7 @@ async def test_fallback_marks_failed_on_permanent_error():
     owner = _make_owner()
     owner._read_with_retry.side_effect = _PermanentModbusError("bad")
     await _fallback_individual_input_reads(owner, owner._read_with_retry, 0, ["reg_a"], {})
-    owner._mark_registers_failed.assert_called_once_with(["reg_a"])
+    owner._mark_registers_failed.assert_called_once_with(["reg_a"], QUARANTINE_REASON_REJECTED)
 
 
 @pytest.mark.asyncio
@@ -150,7 +177,7 @@ async def test_fallback_marks_failed_when_response_empty():
     owner = _make_owner()
     owner._read_with_retry.return_value = _ok_response([])
     await _fallback_individual_input_reads(owner, owner._read_with_retry, 0, ["reg_a"], {})
-    owner._mark_registers_failed.assert_called_once_with(["reg_a"])
+    owner._mark_registers_failed.assert_called_once_with(["reg_a"], QUARANTINE_REASON_NO_DATA)
 
 
 # ---------------------------------------------------------------------------
@@ -189,7 +216,7 @@ async def test_handle_failure_partial_response_marks_tail_failed():
         chunk_start=0,
         data=data,
     )
-    owner._mark_registers_failed.assert_called_once_with(["reg_b", None])
+    owner._mark_registers_failed.assert_called_once_with(["reg_b", None], QUARANTINE_REASON_NO_DATA)
 
 
 # ---------------------------------------------------------------------------
@@ -201,7 +228,7 @@ async def test_handle_failure_partial_response_marks_tail_failed():
 async def test_read_batch_skips_when_all_already_failed():
     owner = _make_owner(failed_registers={"reg_a", "reg_b"})
     await _read_input_register_batch(
-        owner, owner._read_with_retry, 0, 2, ["reg_a", "reg_b"], {}, {"reg_a", "reg_b"}
+        owner, owner._read_with_retry, _chunk(0, ["reg_a", "reg_b"]), {}, {"reg_a", "reg_b"}
     )
     owner._read_with_retry.assert_not_called()
 
@@ -214,7 +241,7 @@ async def test_read_batch_success_path():
     owner._read_with_retry.return_value = _ok_response([10, 20])
     data = {}
     await _read_input_register_batch(
-        owner, owner._read_with_retry, 0, 2, ["reg_a", "reg_b"], data, set()
+        owner, owner._read_with_retry, _planned_chunk(owner, count=2), data, set()
     )
     assert "reg_a" in data
 
@@ -224,25 +251,72 @@ async def test_read_batch_connection_exception_propagates():
     owner = _make_owner()
     owner._read_with_retry.side_effect = ConnectionException("down")
     with pytest.raises(ConnectionException):
-        await _read_input_register_batch(owner, owner._read_with_retry, 0, 1, ["reg_a"], {}, set())
+        await _read_input_register_batch(
+            owner, owner._read_with_retry, _chunk(0, ["reg_a"]), {}, set()
+        )
 
 
 @pytest.mark.asyncio
 async def test_read_batch_permanent_error_marks_failed():
     owner = _make_owner()
     owner._read_with_retry.side_effect = _PermanentModbusError("perm")
-    await _read_input_register_batch(owner, owner._read_with_retry, 0, 1, ["reg_a"], {}, set())
-    owner._mark_registers_failed.assert_called_once_with(["reg_a"])
+    await _read_input_register_batch(owner, owner._read_with_retry, _chunk(0, ["reg_a"]), {}, set())
+    owner._mark_registers_failed.assert_called_once_with(["reg_a"], QUARANTINE_REASON_REJECTED)
 
 
 @pytest.mark.asyncio
 async def test_read_batch_modbus_exception_marks_failed():
     owner = _make_owner()
     owner._read_with_retry.side_effect = ModbusException("transient")
-    await _read_input_register_batch(owner, owner._read_with_retry, 0, 1, ["reg_a"], {}, set())
+    await _read_input_register_batch(owner, owner._read_with_retry, _chunk(0, ["reg_a"]), {}, set())
     owner._mark_registers_failed.assert_called_once_with(["reg_a"])
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("attempt", "window", "samples"),
+    [(1, 1, 1), (2, 1, 0), (1, 4, 0)],
+)
+async def test_read_cost_only_learns_from_unqueued_first_attempts(attempt, window, samples):
+    owner = _make_owner()
+    owner._find_register_name.return_value = "reg_a"
+    owner.device_client._read_cost = ReadCostEstimator()
+
+    async def answered(*_args, on_answer, **_kwargs):
+        on_answer(attempt, 0.05)
+        return _ok_response([10, 20])
+
+    owner._read_with_retry.side_effect = answered
+    await _read_input_register_batch(
+        owner, owner._read_with_retry, _planned_chunk(owner, count=2), {}, set(), window=window
+    )
+    assert owner.device_client._read_cost.samples == samples
+
+
+@pytest.mark.asyncio
+async def test_read_with_retry_reports_the_answered_attempt():
+    read = AsyncMock(side_effect=[ModbusException("no answer"), _ok_response([1])])
+    owner = SimpleNamespace(
+        device_client=SimpleNamespace(retry=3, _cycle_deadline=None),
+        _execute_read_call=read,
+        _raise_for_error_response=MagicMock(),
+        _log_read_retry=MagicMock(),
+    )
+    answers = []
+
+    await read_with_retry(
+        owner,
+        AsyncMock(),
+        0,
+        1,
+        register_type="input",
+        on_answer=lambda attempt, seconds: answers.append((attempt, seconds)),
+    )
+
+    assert [attempt for attempt, _seconds in answers] == [2]
+    assert answers[0][1] >= 0
+
+
 # ---------------------------------------------------------------------------
 # read_input_registers_optimized
 # ---------------------------------------------------------------------------
@@ -306,7 +380,7 @@ async def test_read_holding_individually_marks_failed_on_permanent():
     owner = _make_owner()
     owner._read_with_retry.side_effect = _PermanentModbusError("perm")
     await read_holding_individually(owner, owner._read_with_retry, 0, ["hold_a"], {})
-    owner._mark_registers_failed.assert_called_once_with(["hold_a"])
+    owner._mark_registers_failed.assert_called_once_with(["hold_a"], QUARANTINE_REASON_REJECTED)
 
 
 # ---------------------------------------------------------------------------
@@ -341,3 +415,182 @@ async def test_read_holding_uses_transport_when_connected():
     owner._read_with_retry.return_value = _ok_response([3, 4])
     result = await read_holding_registers_optimized(owner)
     assert isinstance(result, dict)
+
+
+# ---------------------------------------------------------------------------
+# Pipelined chunk dispatch
+# ---------------------------------------------------------------------------
+
+
+def _pipelining_transport(window):
+    transport = MagicMock()
+    transport.is_connected.return_value = True
+    transport.max_inflight_requests = window
+    return transport
+
+
+def test_inflight_window_is_one_without_transport():
+    owner = _make_owner(transport=None)
+    owner.device_client.max_inflight_requests = 4
+    assert resolve_inflight_window(owner) == 1
+
+
+def test_inflight_window_is_one_when_transport_disconnected():
+    transport = _pipelining_transport(8)
+    transport.is_connected.return_value = False
+    owner = _make_owner(transport=transport)
+    owner.device_client.max_inflight_requests = 4
+    assert resolve_inflight_window(owner) == 1
+
+
+def test_inflight_window_capped_by_transport_capability():
+    owner = _make_owner(transport=_pipelining_transport(2))
+    owner.device_client.max_inflight_requests = 4
+    assert resolve_inflight_window(owner) == 2
+
+
+def test_inflight_window_uses_configured_value():
+    owner = _make_owner(transport=_pipelining_transport(8))
+    owner.device_client.max_inflight_requests = 3
+    assert resolve_inflight_window(owner) == 3
+
+
+def test_inflight_window_defaults_to_one_when_not_configured():
+    owner = _make_owner(transport=_pipelining_transport(8))
+    assert resolve_inflight_window(owner) == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatch_limits_requests_in_flight():
+    in_flight = 0
+    peak = 0
+    done = []
+
+    async def job(idx):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        done.append(idx)
+
+    await _dispatch_chunk_reads([lambda i=i: job(i) for i in range(7)], 3)
+    assert peak == 3
+    assert sorted(done) == list(range(7))
+
+
+@pytest.mark.asyncio
+async def test_dispatch_cancels_remaining_jobs_and_reraises():
+    started = []
+    cancelled = []
+
+    async def failing():
+        await asyncio.sleep(0)
+        raise ConnectionException("link lost")
+
+    async def slow(idx):
+        started.append(idx)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(idx)
+            raise
+
+    jobs = [failing, lambda: slow(1), lambda: slow(2)]
+    with pytest.raises(ConnectionException, match="link lost"):
+        await _dispatch_chunk_reads(jobs, 3)
+    assert sorted(cancelled) == sorted(started) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_read_holding_pipelined_matches_sequential_result():
+    names = {0: "hold_a", 1: "hold_b"}
+
+    def _owner(window):
+        owner = _make_owner(
+            reg_groups={"holding_registers": [(0, 2)]},
+            transport=_pipelining_transport(window),
+        )
+        owner.device_client.effective_batch = 1
+        owner.device_client.max_inflight_requests = window
+        owner._find_register_name.side_effect = lambda _key, addr: names.get(addr)
+        owner._process_register_value.side_effect = lambda _name, value: value
+        owner._read_with_retry.side_effect = lambda _method, start, _count, **_kw: _ok_response(
+            [start + 10]
+        )
+        return owner
+
+    sequential = await read_holding_registers_optimized(_owner(1))
+    pipelined_owner = _owner(2)
+    pipelined = await read_holding_registers_optimized(pipelined_owner)
+    assert pipelined == sequential == {"hold_a": 10, "hold_b": 11}
+    assert pipelined_owner._read_with_retry.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_read_input_pipelined_propagates_connection_error():
+    owner = _make_owner(
+        reg_groups={"input_registers": [(0, 4)]},
+        transport=_pipelining_transport(4),
+    )
+    owner.device_client.effective_batch = 1
+    owner.device_client.max_inflight_requests = 4
+    owner._find_register_name.return_value = "reg_a"
+    owner._read_with_retry.side_effect = ConnectionException("gone")
+    with pytest.raises(ConnectionException):
+        await read_input_registers_optimized(owner)
+
+
+@pytest.mark.asyncio
+async def test_parallel_chunks_reconnect_a_dropped_link_once():
+    names = {0: "reg_a", 1: "reg_b", 2: "reg_c", 3: "reg_d"}
+    link = {"up": True}
+    sent = []
+    all_sent = asyncio.Event()
+
+    async def read_input_registers(_slave, address, *, count=1, **_kwargs):
+        sent.append(address)
+        if len(sent) <= len(names):
+            # Every chunk is in flight when the link drops under them.
+            if len(sent) == len(names):
+                all_sent.set()
+            await all_sent.wait()
+            link["up"] = False
+            raise ModbusIOException("link dropped")
+        return _ok_response([address + 10])
+
+    async def reconnect():
+        await asyncio.sleep(0.01)
+        link["up"] = True
+
+    transport = MagicMock(spec=BaseModbusTransport)
+    transport.is_connected.side_effect = lambda: link["up"]
+    transport.max_inflight_requests = 4
+    transport.read_input_registers = read_input_registers
+    owner = _make_owner(reg_groups={"input_registers": [(0, 4)]}, transport=transport)
+    dc = owner.device_client
+    dc.effective_batch = 1
+    dc.max_inflight_requests = 4
+    dc.retry = 3
+    dc.available_registers["input_registers"] = set(names.values())
+    dc._reconnect_lock = asyncio.Lock()
+    owner._find_register_name.side_effect = lambda _key, addr: names.get(addr)
+    owner._process_register_value.side_effect = lambda _name, value: value
+
+    async def execute_read_call(method, start, count, attempt, _deadline):
+        return await method(1, start, count=count, attempt=attempt)
+
+    owner._execute_read_call = execute_read_call
+    owner._raise_for_error_response = MagicMock()
+    owner._log_read_retry = MagicMock()
+    owner._read_with_retry = partial(read_with_retry, owner)
+    owner._disconnect = AsyncMock()
+    owner._ensure_connection = AsyncMock(side_effect=reconnect)
+
+    data = await read_input_registers_optimized(owner)
+
+    assert data == {"reg_a": 10, "reg_b": 11, "reg_c": 12, "reg_d": 13}
+    # One chunk reconnects; the others retry on the connection it opened.
+    owner._disconnect.assert_awaited_once()
+    owner._ensure_connection.assert_awaited_once()
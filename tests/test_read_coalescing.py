@@ -0,0 +1,157 @@
+"""Tests for cost-model read coalescing."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from custom_components.thessla_green_modbus.coordinator.diagnostics import read_plan_stats
+from custom_components.thessla_green_modbus.core.client import ThesslaGreenDeviceClient
+from custom_components.thessla_green_modbus.core.models import CoordinatorConfig
+from custom_components.thessla_green_modbus.core.read_cost import ReadCostEstimator
+from custom_components.thessla_green_modbus.registers.read_planner import (
+    ReadCostModel,
+    ReadPlanQuality,
+    coalesce_reads,
+    group_reads,
+    read_plan_quality,
+)
+from custom_components.thessla_green_modbus.scanner.selection import (
+    group_registers_for_batch_read,
+)
+
+# 50 ms per request, 2 ms per word: bridging up to 25 unused words pays off.
+MODEL = ReadCostModel(request_latency=0.05, word_time=0.002)
+
+
+def test_max_bridge_gap_follows_latency_to_word_time_ratio():
+    assert MODEL.max_bridge_gap == 25
+    assert ReadCostModel(request_latency=0.004, word_time=0.002).max_bridge_gap == 2
+    assert ReadCostModel(word_time=0.0).max_bridge_gap == 16
+
+
+def test_coalesce_bridges_holes_cheaper_than_a_request():
+    assert coalesce_reads([0, 1, 5, 6], cost_model=MODEL) == [(0, 7)]
+    expensive_words = ReadCostModel(request_latency=0.004, word_time=0.002)
+    assert coalesce_reads([0, 1, 5, 6], cost_model=expensive_words) == [(0, 2), (5, 2)]
+
+
+def test_coalesce_respects_block_size_and_boundaries():
+    assert coalesce_reads([0, 10, 20], max_block_size=16, cost_model=MODEL) == [(0, 11), (20, 1)]
+    assert coalesce_reads([14, 15, 16, 17], boundaries=frozenset({16}), cost_model=MODEL) == [
+        (14, 2),
+        (16, 2),
+    ]
+
+
+def test_coalesce_never_reads_illegal_or_unreadable_holes():
+    assert coalesce_reads([0, 4], illegal={2}, cost_model=MODEL) == [(0, 1), (4, 1)]
+    assert coalesce_reads([0, 4], readable={1, 3}, cost_model=MODEL) == [(0, 1), (4, 1)]
+    assert coalesce_reads([0, 4], readable={1, 2, 3}, cost_model=MODEL) == [(0, 5)]
+
+
+def test_coalesce_finds_cheaper_layout_than_greedy_merging():
+    # Greedy merging of 0..15 leaves 16 and 17 as an extra request; the optimal
+    # plan starts the second block earlier instead.
+    addresses = [0, 1, 2, 14, 15, 16, 17]
+    groups = coalesce_reads(addresses, max_block_size=16, cost_model=MODEL)
+    assert len(groups) == 2
+    assert all(length <= 16 for _, length in groups)
+    covered = {addr for start, length in groups for addr in range(start, start + length)}
+    assert covered >= set(addresses)
+
+
+def test_coalesce_without_gaps_matches_group_reads():
+    rng = random.Random(0)
+    for _ in range(200):
+        addresses = rng.sample(range(64), rng.randint(1, 40))
+        boundaries = frozenset(rng.sample(range(64), 3))
+        size = rng.choice([1, 4, 8, 16])
+        assert coalesce_reads(
+            addresses, size, boundaries, cost_model=MODEL, max_gap=0
+        ) == group_reads(addresses, size, boundaries)
+
+
+def test_read_plan_quality_counts_wasted_words():
+    assert read_plan_quality([(0, 7), (10, 1)], [0, 1, 5, 6, 10]) == ReadPlanQuality(2, 8, 3)
+
+
+def test_estimator_fits_latency_and_word_time():
+    estimator = ReadCostEstimator(min_samples=4)
+    for words in (1, 16) * 2:
+        estimator.observe(words, 0.03 + words * 0.001)
+    assert estimator.calibrated
+    model = estimator.model()
+    assert model.request_latency == pytest.approx(0.03)
+    assert model.word_time == pytest.approx(0.001)
+    assert model.max_bridge_gap in (29, 30)
+
+
+def test_estimator_needs_reads_of_different_sizes():
+    estimator = ReadCostEstimator(min_samples=2)
+    for _ in range(10):
+        estimator.observe(16, 0.1)
+    assert not estimator.calibrated
+    assert estimator.model() == ReadCostModel()
+
+
+def test_scanner_honours_max_gap_around_known_missing_addresses():
+    scanner = SimpleNamespace(effective_batch=16, safe_scan=False, _known_missing_addresses=set())
+    assert group_registers_for_batch_read(scanner, [0, 3, 8]) == [(0, 1), (3, 1), (8, 1)]
+    assert group_registers_for_batch_read(scanner, [0, 3, 8], max_gap=3) == [(0, 4), (8, 1)]
+
+    scanner._known_missing_addresses = {2}
+    assert group_registers_for_batch_read(scanner, [0, 3], max_gap=3) == [(0, 1), (3, 1)]
+
+
+def _device_client() -> ThesslaGreenDeviceClient:
+    return ThesslaGreenDeviceClient(
+        CoordinatorConfig(host="192.168.1.1", port=502, slave_id=1),
+        hass=MagicMock(),
+        effective_batch=16,
+        resolved_connection_mode=None,
+        backoff=0.0,
+        backoff_jitter=None,
+    )
+
+
+def test_client_only_bridges_available_registers_and_reports_quality():
+    client = _device_client()
+    mapping = client._register_maps["input_registers"]
+    # Same refresh class, one unavailable register in between.
+    names = ["outside_temperature", "supply_temperature", "exhaust_temperature"]
+    names.sort(key=mapping.__getitem__)
+    client.available_registers["input_registers"] = {names[0], names[2]}
+    client.compute_register_groups()
+
+    first, last = mapping[names[0]], mapping[names[2]]
+    groups = client._register_groups["input_registers"]
+    assert all(not (start <= mapping[names[1]] < start + length) for start, length in groups)
+    assert read_plan_quality(groups, [first, last]) == client._read_plan_quality["input_registers"]
+
+    client.available_registers["input_registers"].add(names[1])
+    client.compute_register_groups()
+    assert client._register_groups["input_registers"] == [(first, last - first + 1)]
+
+    stats = read_plan_stats(SimpleNamespace(device_client=client))
+    assert stats["requests_per_cycle"] == 1
+    assert stats["cost_model"]["calibrated"] is False
+
+
+def test_replan_only_after_calibration_moves_the_bridge_gap():
+    client = _device_client()
+    client.compute_register_groups()
+    assert client._replan_reads_if_stale() is False
+
+    # 8 ms per request, 2 ms per word: the bridge gap drops from 16 to 4.
+    for words in (1, 16) * 10:
+        client._read_cost.observe(words, 0.008 + words * 0.002)
+    assert client._replan_reads_if_stale() is True
+    assert client._read_cost_gap == 4
+    assert client._replan_reads_if_stale() is False
+
+
+def test_read_plan_stats_empty_without_planner_state():
+    assert read_plan_stats(SimpleNamespace(device_client=SimpleNamespace())) == {}
@@ -0,0 +1,280 @@
+"""Tests for tiered polling: refresh classes, schedule and filtered reads."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from custom_components.thessla_green_modbus.const import (
+    REFRESH_FAST,
+    REFRESH_NORMAL,
+    REFRESH_ONCE,
+    REFRESH_SLOW,
+)
+from custom_components.thessla_green_modbus.core.client import ThesslaGreenDeviceClient
+from custom_components.thessla_green_modbus.core.models import CoordinatorConfig
+from custom_components.thessla_green_modbus.core.poll_plan import build_poll_plan
+from custom_components.thessla_green_modbus.core.read_bits import read_coil_registers_optimized
+from custom_components.thessla_green_modbus.core.refresh_schedule import RefreshSchedule
+from custom_components.thessla_green_modbus.core.register_groups import due_register_groups
+from custom_components.thessla_green_modbus.core.runtime_io import read_all_register_data
+from custom_components.thessla_green_modbus.register_defs_cache import get_register_definitions
+from custom_components.thessla_green_modbus.registers.register_def import RegisterDef
+from pymodbus.pdu.register_message import (
+    ReadHoldingRegistersResponse,
+    WriteSingleRegisterResponse,
+)
+
+from tests.helpers_coordinator import make_coordinator
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("outside_temperature", REFRESH_FAST),
+        ("supply_flow_rate", REFRESH_FAST),
+        ("mode", REFRESH_NORMAL),
+        ("schedule_summer_mon_1", REFRESH_SLOW),
+        ("language", REFRESH_SLOW),
+        ("serial_number", REFRESH_ONCE),
+        ("version_major", REFRESH_ONCE),
+    ],
+)
+def test_catalogue_refresh_classes(name, expected):
+    assert get_register_definitions()[name].refresh_class() == expected
+
+
+def test_refresh_override_in_register_extra_wins():
+    definition = RegisterDef(
+        function=3, address=1, name="schedule_x", access="RW", extra={"refresh": "fast"}
+    )
+    assert definition.refresh_class() == REFRESH_FAST
+
+
+def test_schedule_reads_everything_first_then_skips_slow_and_once():
+    schedule = RefreshSchedule(scan_interval=30)
+    assert schedule.due(0.0) == {REFRESH_FAST, REFRESH_NORMAL, REFRESH_SLOW, REFRESH_ONCE}
+
+    schedule.complete(schedule.due(0.0), {}, register_refresh={}, failed=(), now=0.0)
+    assert schedule.due(30.0) == {REFRESH_FAST, REFRESH_NORMAL}
+    assert schedule.due(600.0) == {REFRESH_FAST, REFRESH_NORMAL, REFRESH_SLOW}
+
+
+def test_short_scan_interval_reads_normal_class_every_default_interval():
+    schedule = RefreshSchedule(scan_interval=5)
+    schedule.complete(schedule.due(0.0), {}, register_refresh={}, failed=(), now=0.0)
+
+    assert schedule.due(5.0) == {REFRESH_FAST}
+    assert schedule.due(30.0) == {REFRESH_FAST, REFRESH_NORMAL}
+
+
+def test_skipped_classes_carry_over_last_values():
+    refresh = {"temp": REFRESH_FAST, "slot": REFRESH_SLOW, "serial": REFRESH_ONCE}
+    schedule = RefreshSchedule(scan_interval=30)
+    first = schedule.due(0.0)
+    schedule.complete(
+        first, {"temp": 1, "slot": 2, "serial": "x"}, register_refresh=refresh, failed=(), now=0.0
+    )
+
+    due = schedule.due(30.0)
+    data = schedule.complete(due, {"temp": 5}, register_refresh=refresh, failed=(), now=30.0)
+    assert data == {"temp": 5, "slot": 2, "serial": "x"}
+
+    # A due register that failed to read is not resurrected from the cache.
+    data = schedule.complete(due, {}, register_refresh=refresh, failed={"temp"}, now=60.0)
+    assert "temp" not in data
+
+
+def test_once_class_stays_due_until_its_registers_read():
+    refresh = {"serial": REFRESH_ONCE}
+    schedule = RefreshSchedule(scan_interval=30)
+    schedule.complete(schedule.due(0.0), {}, register_refresh=refresh, failed={"serial"}, now=0.0)
+    assert REFRESH_ONCE in schedule.due(30.0)
+
+    schedule.complete(
+        schedule.due(30.0), {"serial": "x"}, register_refresh=refresh, failed=(), now=30.0
+    )
+    assert REFRESH_ONCE not in schedule.due(60.0)
+
+    schedule.reset()
+    assert REFRESH_ONCE in schedule.due(90.0)
+
+
+def test_written_registers_are_dropped_and_their_class_made_due():
+    refresh = {"temp": REFRESH_FAST, "slot": REFRESH_SLOW, "serial": REFRESH_ONCE}
+    schedule = RefreshSchedule(scan_interval=30)
+    schedule.complete(
+        schedule.due(0.0),
+        {"temp": 1, "slot": 2, "serial": "x"},
+        register_refresh=refresh,
+        failed=(),
+        now=0.0,
+    )
+
+    schedule.invalidate(["slot", "serial"], register_refresh=refresh, now=10.0)
+
+    assert schedule.due(30.0) == {REFRESH_FAST, REFRESH_NORMAL, REFRESH_SLOW, REFRESH_ONCE}
+    data = schedule.complete(
+        schedule.due(30.0), {"temp": 1}, register_refresh=refresh, failed=(), now=30.0
+    )
+    assert "slot" not in data
+    assert schedule.due(60.0) == {REFRESH_FAST, REFRESH_NORMAL}
+
+
+def test_class_written_while_the_cycle_ran_stays_due():
+    refresh = {"slot": REFRESH_SLOW}
+    schedule = RefreshSchedule(scan_interval=30)
+    due = schedule.due(0.0)
+    # The write lands after the cycle started; its read may predate it.
+    schedule.invalidate(["slot"], register_refresh=refresh, now=1.0)
+    schedule.complete(due, {"slot": 2}, register_refresh=refresh, failed=(), now=0.0)
+
+    assert REFRESH_SLOW in schedule.due(30.0)
+    schedule.complete(
+        schedule.due(30.0), {"slot": 3}, register_refresh=refresh, failed=(), now=30.0
+    )
+    assert REFRESH_SLOW not in schedule.due(60.0)
+
+
+async def test_written_schedule_slot_is_read_again_by_the_next_refresh():
+    coord = make_coordinator()
+    client = coord.device_client
+    client.available_registers["holding_registers"] = {"mode", "schedule_summer_mon_1"}
+    client.compute_register_groups()
+    slot = get_register_definitions()["schedule_summer_mon_1"]
+    registers = {slot.address: 0x0600}
+
+    async def read_holding_registers(_slave, address, count=1, **_kwargs):
+        return ReadHoldingRegistersResponse(
+            registers=[registers.get(address + i, 0) for i in range(count)]
+        )
+
+    async def write_register(_slave, address, value, **_kwargs):
+        registers[address] = value
+        return WriteSingleRegisterResponse(address=address, registers=[value])
+
+    client._transport = SimpleNamespace(
+        is_connected=lambda: True,
+        read_holding_registers=read_holding_registers,
+        write_register=write_register,
+    )
+    coord._ensure_connection = AsyncMock()
+
+    with patch("time.monotonic", return_value=0.0):
+        assert (await read_all_register_data(client))["schedule_summer_mon_1"] == "06:00"
+
+    assert await coord.async_write_register("schedule_summer_mon_1", "08:15", refresh=False)
+
+    # The slow class is not due 30 s later, but the write made it due again.
+    with patch("time.monotonic", return_value=30.0):
+        assert (await read_all_register_data(client))["schedule_summer_mon_1"] == "08:15"
+
+
+def _device_client() -> ThesslaGreenDeviceClient:
+    return ThesslaGreenDeviceClient(
+        CoordinatorConfig(host="192.168.1.1", port=502, slave_id=1),
+        hass=MagicMock(),
+        effective_batch=16,
+        resolved_connection_mode=None,
+        backoff=0.0,
+        backoff_jitter=None,
+    )
+
+
+def test_register_groups_never_mix_refresh_classes():
+    client = _device_client()
+    client.available_registers["input_registers"] = {
+        "version_major",
+        "outside_temperature",
+        "supply_temperature",
+        "serial_number",
+    }
+    client.compute_register_groups()
+
+    groups = client._register_groups["input_registers"]
+    refresh = client._register_group_refresh["input_registers"]
+    assert len(groups) == len(refresh)
+    assert set(refresh) == {REFRESH_FAST, REFRESH_ONCE}
+    assert client._register_refresh["serial_number"] == REFRESH_ONCE
+
+    plan = build_poll_plan(client, "input_registers")
+    fast_chunks = plan.due_chunks({REFRESH_FAST})
+    assert fast_chunks
+    assert {name for chunk in fast_chunks for name in chunk.known} >= {
+        "outside_temperature",
+        "supply_temperature",
+    }
+    assert all(chunk.refresh == REFRESH_FAST for chunk in fast_chunks)
+    assert plan.due_chunks(None) == plan.chunks
+
+
+def test_plan_without_group_classes_reads_every_chunk():
+    device_client = SimpleNamespace(
+        _register_groups={"input_registers": [(1, 1)]},
+        _register_group_refresh={"input_registers": []},
+        effective_batch=16,
+        available_registers={"input_registers": set()},
+    )
+    owner = SimpleNamespace(
+        device_client=device_client,
+        _find_register_name=lambda _kind, _addr: None,
+        _process_register_value=lambda _name, value: value,
+    )
+    plan = build_poll_plan(owner, "input_registers")
+    assert plan.due_chunks(frozenset()) == plan.chunks
+
+
+def test_due_register_groups_filters_by_class():
+    device_client = SimpleNamespace(
+        _register_groups={"coil_registers": [(0, 2), (10, 1)]},
+        _register_group_refresh={"coil_registers": [REFRESH_NORMAL, REFRESH_SLOW]},
+    )
+    assert due_register_groups(device_client, "coil_registers", {REFRESH_NORMAL}) == [(0, 2)]
+    assert due_register_groups(device_client, "coil_registers", None) == [(0, 2), (10, 1)]
+
+
+async def test_coil_read_skips_groups_that_are_not_due():
+    device_client = SimpleNamespace(
+        _register_groups={"coil_registers": [(0, 1), (10, 1)]},
+        _register_group_refresh={"coil_registers": [REFRESH_NORMAL, REFRESH_SLOW]},
+        client=SimpleNamespace(connected=True),
+        effective_batch=16,
+        available_registers={"coil_registers": {"a", "b"}},
+        statistics={"total_registers_read": 0},
+    )
+    owner = SimpleNamespace(
+        device_client=device_client,
+        _failed_registers=set(),
+        _find_register_name=lambda _kind, addr: {0: "a", 10: "b"}.get(addr),
+        _read_with_retry=AsyncMock(return_value=SimpleNamespace(bits=[True])),
+        _read_coils_transport=MagicMock(),
+        _clear_register_failure=MagicMock(),
+        _mark_registers_failed=MagicMock(),
+    )
+
+    data = await read_coil_registers_optimized(owner, {REFRESH_NORMAL})
+
+    assert data == {"a": True}
+    owner._read_with_retry.assert_awaited_once()
+
+
+async def test_read_all_register_data_reads_due_classes_and_merges_cache():
+    client = _device_client()
+    client._register_refresh = {"temp": REFRESH_FAST, "slot": REFRESH_SLOW}
+    client._read_input_registers_optimized = AsyncMock(return_value={"temp": 1})
+    client._read_holding_registers_optimized = AsyncMock(return_value={"slot": 2})
+    client._read_coil_registers_optimized = AsyncMock(return_value={})
+    client._read_discrete_inputs_optimized = AsyncMock(return_value={})
+    client._post_process_data = lambda data: data
+
+    with patch("time.monotonic", return_value=0.0):
+        assert await read_all_register_data(client) == {"temp": 1, "slot": 2}
+
+    client._read_input_registers_optimized.return_value = {"temp": 3}
+    client._read_holding_registers_optimized.return_value = {}
+    with patch("time.monotonic", return_value=30.0):
+        assert await read_all_register_data(client) == {"temp": 3, "slot": 2}
+
+    due = client._read_holding_registers_optimized.await_args.kwargs["refresh_classes"]
+    assert due == {REFRESH_FAST, REFRESH_NORMAL}
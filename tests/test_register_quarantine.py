@@ -0,0 +1,193 @@
+"""Tests for the failed-register quarantine and its persistence."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.thessla_green_modbus.const import (
+    DOMAIN,
+    QUARANTINE_REASON_ERROR,
+    QUARANTINE_REASON_NO_DATA,
+    QUARANTINE_REASON_REJECTED,
+)
+from custom_components.thessla_green_modbus.coordinator.diagnostics import quarantine_stats
+from custom_components.thessla_green_modbus.coordinator.quarantine_store import (
+    async_load_quarantine,
+    schedule_quarantine_save,
+)
+from custom_components.thessla_green_modbus.core.client import ThesslaGreenDeviceClient
+from custom_components.thessla_green_modbus.core.models import CoordinatorConfig
+from custom_components.thessla_green_modbus.core.quarantine import RegisterQuarantine
+from custom_components.thessla_green_modbus.core.runtime_io import read_all_register_data
+from homeassistant.util import dt as dt_util
+from pymodbus.pdu import ExceptionResponse
+from pymodbus.pdu.register_message import ReadInputRegistersResponse
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+
+def test_rejected_read_quarantines_at_once_and_backs_off_exponentially():
+    quarantine = RegisterQuarantine(base_delay=10.0, max_delay=35.0)
+
+    assert quarantine.record({"a": QUARANTINE_REASON_REJECTED}, 100.0) == ["a"]
+    assert quarantine.blocked(109.0) == {"a"}
+    assert quarantine.blocked(110.0) == frozenset()
+
+    # Failed re-probes double the delay up to the maximum.
+    quarantine.record({"a": QUARANTINE_REASON_REJECTED}, 110.0)
+    assert quarantine.entries["a"].next_probe == 130.0
+    quarantine.record({"a": QUARANTINE_REASON_REJECTED}, 130.0)
+    quarantine.record({"a": QUARANTINE_REASON_REJECTED}, 165.0)
+    assert quarantine.entries["a"].next_probe == 200.0
+    assert quarantine.entries["a"].failures == 4
+
+
+def test_other_failures_need_consecutive_strikes_with_a_working_link():
+    quarantine = RegisterQuarantine(strikes=3)
+    failures = {"a": QUARANTINE_REASON_ERROR, "b": QUARANTINE_REASON_NO_DATA}
+
+    assert quarantine.record(failures, 0.0) == []
+    assert quarantine.record(failures, 1.0, link_ok=False) == []
+    quarantine.release("b")
+    assert quarantine.record(failures, 2.0) == []
+    assert quarantine.record(failures, 3.0) == ["a"]
+    assert "a" in quarantine and "b" not in quarantine
+
+
+def test_release_and_round_trip_through_saved_data():
+    quarantine = RegisterQuarantine()
+    quarantine.record({"a": QUARANTINE_REASON_REJECTED, "b": QUARANTINE_REASON_REJECTED}, 0.0)
+    assert quarantine.dirty
+    assert quarantine.release("b") is True
+    assert quarantine.release("b") is False
+
+    restored = RegisterQuarantine()
+    saved = quarantine.as_dict()
+    saved["entries"]["broken"] = {"reason": "rejected"}
+    restored.load(saved)
+    assert restored.entries == quarantine.entries
+    assert not restored.dirty
+
+
+def _device_client() -> ThesslaGreenDeviceClient:
+    return ThesslaGreenDeviceClient(
+        CoordinatorConfig(host="192.168.1.1", port=502, slave_id=1),
+        hass=MagicMock(),
+        effective_batch=16,
+        resolved_connection_mode=None,
+        backoff=0.0,
+        backoff_jitter=None,
+    )
+
+
+def test_quarantined_registers_leave_the_read_groups_until_reprobe():
+    client = _device_client()
+    mapping = client._register_maps["input_registers"]
+    client.available_registers["input_registers"] = {"outside_temperature", "supply_temperature"}
+    client.compute_register_groups()
+    client._quarantine.record({"supply_temperature": QUARANTINE_REASON_REJECTED}, 0.0)
+
+    assert client._apply_quarantine(1.0) is True
+    addresses = {
+        addr
+        for start, count in client._register_groups["input_registers"]
+        for addr in range(start, start + count)
+    }
+    assert mapping["outside_temperature"] in addresses
+    assert mapping["supply_temperature"] not in addresses
+    assert client._apply_quarantine(2.0) is False
+
+    # Past the re-probe time the register is read again as the probe.
+    assert client._apply_quarantine(1e9) is True
+    assert "supply_temperature" in client._register_refresh
+
+
+def test_failure_reasons_are_tracked_until_a_successful_read():
+    client = _device_client()
+    client._quarantine.record({"mode": QUARANTINE_REASON_REJECTED}, 0.0)
+
+    client._mark_registers_failed(["mode", None, "bypass"], QUARANTINE_REASON_NO_DATA)
+    assert client._failure_reasons == {"mode": "no_data", "bypass": "no_data"}
+    client._clear_register_failure("mode")
+    assert client._failure_reasons == {"bypass": "no_data"}
+    assert "mode" not in client._quarantine
+
+
+async def test_read_cycle_records_failures_into_the_quarantine():
+    client = _device_client()
+
+    async def read_input(refresh_classes=None):
+        client._mark_registers_failed(["mode"], QUARANTINE_REASON_REJECTED)
+        return {"outside_temperature": 1.0}
+
+    client._read_input_registers_optimized = read_input
+    client._read_holding_registers_optimized = AsyncMock(return_value={})
+    client._read_coil_registers_optimized = AsyncMock(return_value={})
+    client._read_discrete_inputs_optimized = AsyncMock(return_value={})
+    client._post_process_data = lambda data: data
+
+    with patch("time.time", return_value=1000.0):
+        await read_all_register_data(client)
+
+    assert "mode" in client._quarantine
+    assert client._failure_reasons == {}
+    stats = quarantine_stats(SimpleNamespace(device_client=client))
+    assert stats["mode"]["reason"] == QUARANTINE_REASON_REJECTED
+    assert stats["mode"]["failures"] == 1
+
+
+async def test_one_missing_address_only_quarantines_that_register():
+    client = _device_client()
+    names = {"outside_temperature", "supply_temperature", "exhaust_temperature"}
+    client.available_registers["input_registers"] = set(names)
+    client.compute_register_groups()
+    missing = client._register_maps["input_registers"]["supply_temperature"]
+    requests: list[tuple[int, int]] = []
+
+    async def read_input_registers(_slave, address, *, count=1, **_kwargs):
+        requests.append((address, count))
+        if address <= missing < address + count:
+            return ExceptionResponse(4, exception_code=2)
+        return ReadInputRegistersResponse(registers=[215] * count)
+
+    client._transport = SimpleNamespace(
+        is_connected=lambda: True, read_input_registers=read_input_registers
+    )
+
+    with patch("time.time", return_value=1000.0):
+        data = await read_all_register_data(client)
+    assert {"outside_temperature", "exhaust_temperature"} <= set(data)
+    assert set(client._quarantine.entries) == {"supply_temperature"}
+
+    # The healthy registers keep being polled, without the missing address.
+    requests.clear()
+    with patch("time.time", return_value=1030.0):
+        data = await read_all_register_data(client)
+    assert {"outside_temperature", "exhaust_temperature"} <= set(data)
+    assert all(not address <= missing < address + count for address, count in requests)
+
+
+async def test_quarantine_persists_through_entry_storage(hass, hass_storage):
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    key = f"{DOMAIN}.quarantine.{entry.entry_id}"
+    coordinator = SimpleNamespace(
+        hass=hass, entry=entry, device_client=SimpleNamespace(_quarantine=RegisterQuarantine())
+    )
+    coordinator.device_client._quarantine.record({"mode": QUARANTINE_REASON_REJECTED}, 50.0)
+
+    schedule_quarantine_save(coordinator)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=60))
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"]["entries"]["mode"]["reason"] == QUARANTINE_REASON_REJECTED
+
+    restored = SimpleNamespace(
+        hass=hass, entry=entry, device_client=SimpleNamespace(_quarantine=RegisterQuarantine())
+    )
+    await async_load_quarantine(restored)
+    assert (
+        restored.device_client._quarantine.entries == coordinator.device_client._quarantine.entries
+    )
@@ -0,0 +1,185 @@
+"""Tests for the priority request scheduler guarding the device connection."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from custom_components.thessla_green_modbus.coordinator import ThesslaGreenModbusCoordinator
+from custom_components.thessla_green_modbus.coordinator.update_state import (
+    begin_update_cycle,
+    keep_written_values,
+)
+from custom_components.thessla_green_modbus.core.request_scheduler import (
+    RequestPriority,
+    RequestScheduler,
+    request_slot,
+)
+
+
+async def test_waiters_are_served_by_priority_then_arrival():
+    scheduler = RequestScheduler()
+    order: list[str] = []
+
+    async def take(name: str, priority: RequestPriority) -> None:
+        async with scheduler.slot(priority):
+            order.append(name)
+
+    await scheduler.acquire(RequestPriority.POLL)
+    tasks = [
+        asyncio.create_task(take("poll", RequestPriority.POLL)),
+        asyncio.create_task(take("service", RequestPriority.SERVICE)),
+        asyncio.create_task(take("write-1", RequestPriority.WRITE)),
+        asyncio.create_task(take("write-2", RequestPriority.WRITE)),
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queued == 4
+
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["write-1", "write-2", "service", "poll"]
+    assert not scheduler.locked()
+
+
+async def test_poll_checkpoint_hands_the_slot_to_a_queued_write():
+    scheduler = RequestScheduler()
+    order: list[str] = []
+    write_queued = asyncio.Event()
+
+    async def poll() -> None:
+        async with scheduler.slot(RequestPriority.POLL):
+            for chunk in range(3):
+                await scheduler.checkpoint()
+                order.append(f"chunk-{chunk}")
+                if chunk == 0:
+                    await write_queued.wait()
+
+    async def write() -> None:
+        write_queued.set()
+        async with scheduler.slot(RequestPriority.WRITE):
+            order.append("write")
+
+    poll_task = asyncio.create_task(poll())
+    await asyncio.sleep(0)
+    await asyncio.gather(poll_task, write())
+
+    assert order == ["chunk-0", "write", "chunk-1", "chunk-2"]
+    assert scheduler.preemptions == 1
+    assert not scheduler.locked()
+
+
+async def test_parallel_chunk_reads_yield_once_and_resume_together():
+    scheduler = RequestScheduler()
+    order: list[str] = []
+
+    async def chunk(name: str) -> None:
+        await scheduler.checkpoint()
+        order.append(name)
+
+    async def poll() -> None:
+        async with scheduler.slot(RequestPriority.POLL):
+            await asyncio.sleep(0)
+            await asyncio.gather(chunk("a"), chunk("b"))
+
+    async def write() -> None:
+        async with scheduler.slot(RequestPriority.WRITE):
+            order.append("write")
+
+    poll_task = asyncio.create_task(poll())
+    await asyncio.sleep(0)
+    await asyncio.gather(poll_task, write())
+
+    assert order == ["write", "a", "b"]
+    assert scheduler.preemptions == 1
+
+
+async def test_checkpoint_outside_a_slot_and_plain_locks_are_noops():
+    scheduler = RequestScheduler()
+    await scheduler.checkpoint()
+
+    async with scheduler:
+        assert scheduler.locked()
+        await scheduler.checkpoint()
+    assert not scheduler.locked()
+
+    lock = asyncio.Lock()
+    async with request_slot(lock, RequestPriority.WRITE):
+        assert lock.locked()
+
+
+async def test_cancelled_waiter_does_not_keep_the_slot():
+    scheduler = RequestScheduler()
+    await scheduler.acquire(RequestPriority.POLL)
+    waiter = asyncio.create_task(scheduler.acquire(RequestPriority.WRITE))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    scheduler.release()
+
+    assert not scheduler.locked()
+    assert scheduler.queued == 0
+
+
+def _make_coordinator() -> ThesslaGreenModbusCoordinator:
+    coordinator = ThesslaGreenModbusCoordinator.from_params(
+        hass=MagicMock(),
+        host="localhost",
+        port=502,
+        slave_id=1,
+        name="test",
+        scan_interval=30,
+        timeout=10,
+        retry=3,
+    )
+    coordinator.device_client.available_registers["holding_registers"] = {"mode"}
+    return coordinator
+
+
+async def test_user_write_preempts_update_cycle_and_keeps_its_read_back():
+    coordinator = _make_coordinator()
+    coordinator._ensure_connection = AsyncMock()
+    coordinator.async_request_refresh = AsyncMock()
+    coordinator.data = {"mode": 0}
+    dc = coordinator.device_client
+    client = MagicMock()
+    client.write_register = AsyncMock(return_value=MagicMock(isError=lambda: False))
+    client.read_holding_registers = AsyncMock(
+        return_value=MagicMock(isError=lambda: False, registers=[1])
+    )
+    dc.client = client
+    scheduler = dc._write_lock
+    write_queued = asyncio.Event()
+    order: list[str] = []
+
+    async def update_cycle() -> dict[str, int]:
+        assert begin_update_cycle(coordinator) is None
+        async with request_slot(scheduler, RequestPriority.POLL):
+            data = {"mode": 0}
+            order.append("chunk-0")
+            await write_queued.wait()
+            await scheduler.checkpoint()
+            order.append("chunk-1")
+            keep_written_values(coordinator, data)
+            dc._update_in_progress = False
+            return data
+
+    cycle = asyncio.create_task(update_cycle())
+    await asyncio.sleep(0)
+
+    async def user_write() -> bool:
+        write_queued.set()
+        result = await coordinator.async_write_register("mode", 1)
+        order.append("write-acked")
+        return result
+
+    assert await user_write()
+    assert await cycle == {"mode": 1}
+    assert order == ["chunk-0", "write-acked", "chunk-1"]
+    stats = scheduler.statistics()
+    assert stats["writes"] == 1
+    assert stats["preemptions"] == 1
+    assert stats["write_latency_max"] >= stats["write_latency_last"] > 0.0
@@ -0,0 +1,169 @@
+"""Tests for the retry budget shared by all chunks of an update cycle."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from custom_components.thessla_green_modbus.const import (
+    QUARANTINE_REASON_ERROR,
+    QUARANTINE_REASON_SKIPPED,
+)
+from custom_components.thessla_green_modbus.core.client import ThesslaGreenDeviceClient
+from custom_components.thessla_green_modbus.core.models import CoordinatorConfig
+from custom_components.thessla_green_modbus.core.quarantine import RegisterQuarantine
+from custom_components.thessla_green_modbus.core.retry import read_with_retry
+from custom_components.thessla_green_modbus.core.retry_budget import (
+    CycleRetryBudget,
+    RetryBudgetExhausted,
+)
+from custom_components.thessla_green_modbus.core.runtime_io import read_all_register_data
+from pymodbus.exceptions import ModbusException
+
+from tests.helpers_coordinator import make_coordinator
+
+
+def test_budget_refuses_retries_once_spent():
+    budget = CycleRetryBudget(attempts=2)
+    assert budget.take()  # inactive budgets never refuse
+
+    budget.begin(None)
+    assert budget.take()
+    assert budget.take()
+    assert not budget.exhausted
+    assert not budget.take()
+    assert budget.exhausted
+    budget.end()
+
+    assert not budget.exhausted
+    stats = budget.statistics()
+    assert stats["attempts_spent"] == 2
+    assert stats["exhausted"] is True
+    assert stats["seconds_budget"] is None
+    assert (stats["cycles"], stats["exhausted_cycles"]) == (1, 1)
+
+    budget.begin(8.0)
+    assert budget.statistics()["attempts_spent"] == 0
+    assert budget.seconds == 2.0
+    budget.charge(2.5)
+    assert budget.exhausted
+    assert not budget.take()
+
+
+def _owner(read: AsyncMock, budget: CycleRetryBudget) -> SimpleNamespace:
+    return SimpleNamespace(
+        device_client=SimpleNamespace(retry=3, _cycle_deadline=None, _retry_budget=budget),
+        _execute_read_call=read,
+        _raise_for_error_response=MagicMock(),
+        _log_read_retry=MagicMock(),
+    )
+
+
+async def test_chunks_share_the_budget_and_fail_at_once_when_it_is_spent():
+    budget = CycleRetryBudget(attempts=1)
+    budget.begin(None)
+    read = AsyncMock(side_effect=ModbusException("no answer"))
+    owner = _owner(read, budget)
+
+    # The first chunk gets one retry, then the budget refuses the second.
+    with pytest.raises(ModbusException) as err:
+        await read_with_retry(owner, AsyncMock(), 0, 1, register_type="input")
+    assert not isinstance(err.value, RetryBudgetExhausted)
+    assert read.await_count == 2
+
+    # Later chunks are not read at all.
+    with pytest.raises(RetryBudgetExhausted):
+        await read_with_retry(owner, AsyncMock(), 16, 1, register_type="input")
+    assert read.await_count == 2
+    assert budget.statistics()["skipped_chunks"] == 1
+
+
+async def test_retry_seconds_are_charged_to_the_budget():
+    budget = CycleRetryBudget(attempts=10, fraction=1.0)
+    budget.begin(0.02)
+
+    async def slow_failure(*_args):
+        await asyncio.sleep(0.03)
+        raise ModbusException("late")
+
+    read = AsyncMock(side_effect=slow_failure)
+    with pytest.raises(ModbusException):
+        await read_with_retry(_owner(read, budget), AsyncMock(), 0, 1, register_type="input")
+    # The first retry overran the budget's seconds; no third attempt was made.
+    assert read.await_count == 2
+    assert budget.spent_seconds >= 0.03
+    assert budget.exhausted
+
+
+async def test_outside_a_cycle_reads_keep_their_own_retries():
+    budget = CycleRetryBudget(attempts=0)
+    read = AsyncMock(side_effect=ModbusException("no answer"))
+    with pytest.raises(ModbusException):
+        await read_with_retry(_owner(read, budget), AsyncMock(), 0, 1, register_type="input")
+    assert read.await_count == 3
+
+
+def _device_client() -> ThesslaGreenDeviceClient:
+    client = ThesslaGreenDeviceClient(
+        CoordinatorConfig(host="192.168.1.1", port=502, slave_id=1),
+        hass=MagicMock(),
+        effective_batch=1,
+        resolved_connection_mode=None,
+        backoff=0.0,
+        backoff_jitter=None,
+    )
+    client.available_registers["input_registers"] = {"outside_temperature", "supply_temperature"}
+    client.compute_register_groups()
+    client._transport = SimpleNamespace(
+        is_connected=lambda: True,
+        read_input_registers=AsyncMock(side_effect=ModbusException("no answer")),
+    )
+    client._retry_budget = CycleRetryBudget(attempts=1)
+    return client
+
+
+async def test_cycle_marks_skipped_chunks_failed_without_quarantining_them():
+    client = _device_client()
+    recorded: dict[str, str] = {}
+    record = client._quarantine.record
+
+    def capture(failures, now, *, link_ok=True):
+        recorded.update(failures)
+        return record(failures, now, link_ok=link_ok)
+
+    client._quarantine.record = capture
+
+    await read_all_register_data(client, time.monotonic() + 10)
+
+    # One chunk is read and retried once; the other is not read at all.
+    assert client._transport.read_input_registers.await_count == 2
+    assert client._failed_registers == {"outside_temperature", "supply_temperature"}
+    assert sorted(recorded.values()) == [QUARANTINE_REASON_ERROR, QUARANTINE_REASON_SKIPPED]
+    assert not client._retry_budget.active
+    stats = client._retry_budget.statistics()
+    assert stats["attempts_spent"] == 1
+    assert stats["skipped_chunks"] == 1
+    assert stats["seconds_budget"] > 0
+
+
+def test_quarantine_ignores_registers_skipped_by_the_budget():
+    quarantine = RegisterQuarantine(strikes=1)
+    failures = {"a": QUARANTINE_REASON_ERROR, "b": QUARANTINE_REASON_SKIPPED}
+    assert quarantine.record(failures, 0.0) == ["a"]
+
+
+def test_diagnostics_report_retries_spent_versus_budget():
+    coord = make_coordinator()
+    budget = coord.device_client._retry_budget
+    budget.begin(4.0)
+    budget.take()
+    budget.end()
+
+    stats = coord.get_diagnostic_data()["retry_budget"]
+    assert stats["attempts_spent"] == 1
+    assert stats["attempts_budget"] == budget.attempts
+    assert stats["seconds_budget"] == 1.0
+    assert stats["exhausted"] is False
@@ -0,0 +1,232 @@
+"""Tests for response timeouts derived from observed round-trip times."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from custom_components.thessla_green_modbus.const import (
+    MAX_BATCH_REGISTERS,
+    RESPONSE_TIMEOUT_FLOOR,
+)
+from custom_components.thessla_green_modbus.coordinator.diagnostics import response_timeout_stats
+from custom_components.thessla_green_modbus.transport.bus import SharedBus, SharedBusTransport
+from custom_components.thessla_green_modbus.transport.crc import append_crc
+from custom_components.thessla_green_modbus.transport.rtt import RttEstimator
+from custom_components.thessla_green_modbus.transport.rtu import RtuModbusTransport
+from custom_components.thessla_green_modbus.transport.tcp import TcpModbusTransport
+from custom_components.thessla_green_modbus.transport.tcp_rtu import RawRtuOverTcpTransport
+from pymodbus.exceptions import ModbusIOException
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        return None
+
+    async def drain(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def wait_closed(self) -> None:
+        return None
+
+    def is_closing(self) -> bool:
+        return self.closed
+
+
+def test_first_sample_sets_srtt_and_deviation():
+    rtt = RttEstimator(floor=0.01, ceiling=10.0)
+    assert rtt.timeout == 10.0
+
+    rtt.observe(0.02)
+
+    assert rtt.srtt == pytest.approx(0.02)
+    assert rtt.rttvar == pytest.approx(0.01)
+    assert rtt.timeout == pytest.approx(0.02 + 4 * 0.01)
+
+
+def test_timeout_converges_on_a_steady_link_and_stays_clamped():
+    rtt = RttEstimator(floor=0.05, ceiling=2.0)
+    for _ in range(50):
+        rtt.observe(0.01)
+
+    assert rtt.srtt == pytest.approx(0.01)
+    assert rtt.timeout == pytest.approx(0.05)
+
+    rtt.observe(30.0)
+    assert rtt.timeout == 2.0
+    assert rtt.statistics()["samples"] == 51
+
+
+def test_timeouts_double_up_to_the_ceiling():
+    rtt = RttEstimator(floor=0.1, ceiling=1.0)
+    rtt.observe(0.02)
+
+    rtt.timed_out()
+    assert rtt.timeout == pytest.approx(0.2)
+    rtt.timed_out()
+    rtt.timed_out()
+    rtt.timed_out()
+    assert rtt.timeout == 1.0
+    assert rtt.statistics()["timeouts"] == 4
+
+
+def test_floor_never_exceeds_the_configured_timeout():
+    rtt = RttEstimator(floor=RESPONSE_TIMEOUT_FLOOR, ceiling=0.2)
+
+    rtt.observe(0.001)
+
+    assert rtt.floor == 0.2
+    assert rtt.timeout == 0.2
+
+
+def test_serial_floor_covers_a_full_size_read():
+    transport = RtuModbusTransport(
+        serial_port="/dev/ttyUSB0",
+        baudrate=9600,
+        parity="N",
+        stopbits=1,
+        max_retries=1,
+        base_backoff=0.0,
+        max_backoff=0.0,
+        timeout=10.0,
+    )
+
+    full_read = transport.line_timing.read_transaction_time(MAX_BATCH_REGISTERS)
+    assert transport.rtt.floor == pytest.approx(RESPONSE_TIMEOUT_FLOOR + full_read)
+
+
+async def test_raw_transport_learns_round_trips_and_times_out_early(monkeypatch):
+    reader = asyncio.StreamReader()
+    reader.feed_data(append_crc(bytes([1, 4, 2, 0, 7])))
+
+    async def open_connection(_host: str, _port: int):
+        return reader, _Writer()
+
+    monkeypatch.setattr(asyncio, "open_connection", open_connection)
+    transport = RawRtuOverTcpTransport(
+        host="127.0.0.1",
+        port=502,
+        max_retries=1,
+        base_backoff=0.0,
+        max_backoff=0.0,
+        timeout=5.0,
+    )
+    transport.rtt = RttEstimator(floor=0.02, ceiling=transport.timeout)
+
+    response = await transport.read_input_registers(1, 0, count=1)
+    assert response.registers == [7]
+    assert transport.rtt.samples == 1
+    assert transport.response_timeout < 1.0
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        await transport.read_input_registers(1, 0, count=1)
+    assert time.monotonic() - started < 1.0
+    # The request and the probe of the silent link both went unanswered.
+    assert transport.rtt.timeouts == 2
+
+
+async def test_pymodbus_client_gets_learnt_timeout_per_request():
+    transport = TcpModbusTransport(
+        host="127.0.0.1",
+        port=502,
+        max_retries=1,
+        base_backoff=0.0,
+        max_backoff=0.0,
+        timeout=10.0,
+    )
+    transport.rtt.observe(0.01)
+    params = SimpleNamespace(timeout_connect=10.0)
+    seen: list[float] = []
+
+    async def read_input_registers(*_args, **_kwargs):
+        seen.append(params.timeout_connect)
+        return SimpleNamespace(registers=[1], retries=0, isError=lambda: False)
+
+    client = MagicMock(connected=True, ctx=SimpleNamespace(comm_params=params))
+    client.read_input_registers = read_input_registers
+    transport.client = client
+
+    await transport.read_input_registers(1, 0, count=1)
+
+    assert seen == [pytest.approx(RESPONSE_TIMEOUT_FLOOR)]
+    assert params.timeout_connect == 10.0
+    assert transport.rtt.samples == 2
+
+
+async def test_pymodbus_retried_attempt_is_not_a_round_trip_sample():
+    transport = TcpModbusTransport(
+        host="127.0.0.1",
+        port=502,
+        max_retries=1,
+        base_backoff=0.0,
+        max_backoff=0.0,
+        timeout=10.0,
+    )
+
+    async def read_input_registers(*_args, **_kwargs):
+        return SimpleNamespace(registers=[1], retries=0, isError=lambda: False)
+
+    client = MagicMock(connected=True, ctx=None)
+    client.read_input_registers = read_input_registers
+    transport.client = client
+
+    # The time of a retry includes the backoff slept before it.
+    await transport.read_input_registers(1, 0, count=1, attempt=2)
+    assert transport.rtt.samples == 0
+
+    await transport.read_input_registers(1, 0, count=1)
+    assert transport.rtt.samples == 1
+
+
+async def test_pymodbus_no_response_backs_the_timeout_off():
+    transport = TcpModbusTransport(
+        host="127.0.0.1",
+        port=502,
+        max_retries=1,
+        base_backoff=0.0,
+        max_backoff=0.0,
+        timeout=10.0,
+    )
+    transport.rtt.observe(0.01)
+    client = MagicMock(connected=True)
+    client.read_input_registers = AsyncMock(side_effect=ModbusIOException("No response"))
+    transport.client = client
+
+    with pytest.raises(ModbusIOException):
+        await transport.read_input_registers(1, 0, count=1)
+
+    assert transport.rtt.timeouts == 1
+    assert transport.rtt.timeout == pytest.approx(2 * RESPONSE_TIMEOUT_FLOOR)
+
+
+def test_diagnostics_report_the_shared_connection_estimate():
+    inner = TcpModbusTransport(
+        host="127.0.0.1",
+        port=502,
+        max_retries=1,
+        base_backoff=0.0,
+        max_backoff=0.0,
+        timeout=10.0,
+    )
+    inner.rtt.observe(0.004)
+    handle = MagicMock(spec=SharedBusTransport)
+    handle.bus = MagicMock(spec=SharedBus, transport=inner)
+    coordinator = SimpleNamespace(device_client=SimpleNamespace(_transport=handle))
+
+    stats = response_timeout_stats(coordinator)
+
+    assert stats is not None
+    assert stats["srtt_ms"] == 4.0
+    assert stats["timeout_ms"] == RESPONSE_TIMEOUT_FLOOR * 1000
+    idle = SimpleNamespace(device_client=SimpleNamespace(_transport=None))
+    assert response_timeout_stats(idle) is None
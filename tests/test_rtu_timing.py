@@ -0,0 +1,103 @@
+"""Tests for baud-rate-derived RTU line timing and inter-frame spacing."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from custom_components.thessla_green_modbus.const import CONNECTION_TYPE_RTU
+from custom_components.thessla_green_modbus.coordinator import ThesslaGreenModbusCoordinator
+from custom_components.thessla_green_modbus.coordinator.diagnostics import rtu_timing_stats
+from custom_components.thessla_green_modbus.transport import rtu_timing
+from custom_components.thessla_green_modbus.transport.rtu import RtuModbusTransport
+from custom_components.thessla_green_modbus.transport.rtu_timing import (
+    RtuLineTiming,
+    frame_sizes,
+    throughput_table,
+)
+
+
+def test_silent_interval_follows_baud_rate_and_framing():
+    plain = RtuLineTiming(9600, "N", 1)
+    assert plain.bits_per_char == 10
+    assert plain.silent_interval == pytest.approx(3.5 * 10 / 9600)
+    assert plain.inter_char_timeout == pytest.approx(1.5 * 10 / 9600)
+
+    parity = RtuLineTiming(19200, "E", 1)
+    assert parity.bits_per_char == 11
+    assert parity.silent_interval == pytest.approx(3.5 * 11 / 19200)
+
+    fast = RtuLineTiming(115200, "N", 2)
+    assert fast.silent_interval == pytest.approx(0.00175)
+    assert fast.inter_char_timeout == pytest.approx(0.00075)
+
+
+def test_frame_sizes_of_transport_calls():
+    assert frame_sizes("read_holding_registers", count=16) == (8, 37)
+    assert frame_sizes("read_coils", count=9) == (8, 7)
+    assert frame_sizes("write_register", value=1) == (8, 8)
+    assert frame_sizes("write_registers", values=[1, 2, 3]) == (15, 8)
+
+
+def test_throughput_table_reports_reference_baud_rates():
+    table = throughput_table(16)
+
+    # 45 characters of 10 bits plus two t3.5 gaps per 16 registers.
+    expected_9600 = 16 / (45 * 10 / 9600 + 7 * 10 / 9600)
+    assert table[9600]["registers_per_second"] == pytest.approx(expected_9600, abs=0.1)
+    assert table[19200]["registers_per_second"] == pytest.approx(2 * expected_9600, abs=0.1)
+    assert table[9600]["transaction_ms"] == pytest.approx(52 * 10 / 9.6, abs=0.001)
+
+
+async def test_rtu_transport_spaces_requests_by_the_silent_interval(monkeypatch):
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(rtu_timing.asyncio, "sleep", fake_sleep)
+    transport = RtuModbusTransport(
+        serial_port="/dev/ttyUSB0",
+        baudrate=9600,
+        parity="E",
+        stopbits=1,
+        max_retries=1,
+        base_backoff=0.0,
+        max_backoff=0.0,
+        timeout=1.0,
+    )
+    response = MagicMock(registers=[1, 2])
+    response.isError.return_value = False
+    transport.client = MagicMock(connected=True)
+    transport.client.read_holding_registers = AsyncMock(return_value=response)
+
+    await transport.read_holding_registers(1, 0, count=2)
+    await transport.read_holding_registers(1, 2, count=2)
+
+    assert len(sleeps) == 1
+    assert 0 < sleeps[0] <= transport.line_timing.silent_interval
+    stats = transport.gate.statistics()
+    assert stats["transactions"] == 2
+    assert stats["silent_interval_ms"] == pytest.approx(3.5 * 11 / 9.6, abs=0.001)
+    assert stats["registers_per_second"] > 0
+
+
+def test_diagnostics_report_rtu_timing_for_serial_connections():
+    coordinator = ThesslaGreenModbusCoordinator.from_params(
+        hass=MagicMock(),
+        host="localhost",
+        port=502,
+        slave_id=1,
+        name="test",
+        connection_type=CONNECTION_TYPE_RTU,
+        serial_port="/dev/ttyUSB0",
+        baud_rate=19200,
+        parity="even",
+        stop_bits=1,
+    )
+
+    stats = rtu_timing_stats(coordinator)
+
+    assert stats is not None
+    assert set(stats["throughput"]) == {9600, 19200}
+    assert stats["line"] is None
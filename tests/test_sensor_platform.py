@@ -11,12 +11,14 @@ from custom_components.thessla_green_modbus.const import (
     DOMAIN,
     SENSOR_UNAVAILABLE,
 )
+from custom_components.thessla_green_modbus.core.cycle_timing import TIMING_PHASES
 from custom_components.thessla_green_modbus.select import (
     async_setup_entry as select_async_setup_entry,
 )
 from custom_components.thessla_green_modbus.sensor import (
     SENSOR_DEFINITIONS,
     ThesslaGreenActiveErrorsSensor,
+    ThesslaGreenCycleTimingSensor,
     ThesslaGreenErrorCodesSensor,
     ThesslaGreenSensor,
     async_setup_entry,
@@ -49,7 +51,9 @@ def test_async_setup_creates_all_sensors(mock_coordinator, mock_config_entry):
 
         entities = add_entities.call_args[0][0]
         assert any(isinstance(e, ThesslaGreenErrorCodesSensor) for e in entities)  # nosec B101
-        assert len(entities) == len(SENSOR_DEFINITIONS) + 1  # nosec B101
+        timing = [e for e in entities if isinstance(e, ThesslaGreenCycleTimingSensor)]
+        assert len(timing) == len(TIMING_PHASES)  # nosec B101
+        assert len(entities) == len(SENSOR_DEFINITIONS) + 1 + len(TIMING_PHASES)  # nosec B101
 
     asyncio.run(run_test())
 
@@ -77,6 +81,9 @@ def test_sensors_have_native_units(mock_coordinator, mock_config_entry):
         for entity in entities:
             if getattr(entity, "_register_name", None) == "error_codes":
                 continue
+            if isinstance(entity, ThesslaGreenCycleTimingSensor):
+                assert entity._attr_native_unit_of_measurement == "ms"  # nosec B101
+                continue
             expected = SENSOR_DEFINITIONS[entity._register_name].get("unit")
             assert getattr(entity, "_attr_native_unit_of_measurement", None) == expected  # nosec B101
 
@@ -166,6 +166,25 @@ async def test_set_debug_logging(monkeypatch):
         mock_set.assert_called_once_with(logging.DEBUG, 300)
 
 
+@pytest.mark.asyncio
+async def test_capture_frames_starts_and_stops_the_capture(monkeypatch):
+    """capture_frames sizes a new ring buffer; frames=0 stops recording."""
+    from custom_components.thessla_green_modbus.transport.capture import frame_capture
+
+    coord = _Coordinator()
+    hass = _make_hass(coord)
+    handler = await _setup_and_get(hass, "capture_frames", coord, monkeypatch)
+
+    await handler(_make_call({"frames": 200}))
+    frame_capture.record("gateway:502", True, b"\x0a\x04")
+    assert frame_capture.enabled
+    assert frame_capture.dump()["size"] == 200
+
+    await handler(_make_call({"frames": 0}))
+    assert not frame_capture.enabled
+    assert len(frame_capture.dump()["frames"]) == 1
+
+
 # ---------------------------------------------------------------------------
 # set_special_mode
 # ---------------------------------------------------------------------------
@@ -0,0 +1,130 @@
+"""Tests for the process-wide shared Modbus bus registry."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.thessla_green_modbus.const import CONNECTION_MODE_TCP
+from custom_components.thessla_green_modbus.core.client import ThesslaGreenDeviceClient
+from custom_components.thessla_green_modbus.core.models import CoordinatorConfig
+from custom_components.thessla_green_modbus.transport.bus import (
+    BusRegistry,
+    SharedBusTransport,
+    bus_registry,
+    tcp_bus_key,
+)
+
+
+def _inner(max_inflight_requests: int = 1) -> MagicMock:
+    transport = MagicMock(
+        max_retries=3,
+        base_backoff=0.0,
+        max_backoff=0.0,
+        timeout=1.0,
+        offline_state=False,
+        offline=False,
+        max_inflight_requests=max_inflight_requests,
+        close=AsyncMock(),
+        ensure_connected=AsyncMock(),
+    )
+    transport.is_connected.return_value = True
+    return transport
+
+
+async def test_units_on_one_endpoint_share_a_single_connection():
+    registry = BusRegistry()
+    inner = _inner()
+    factory = MagicMock(return_value=inner)
+    key = tcp_bus_key("Gateway.local ", 502, "tcp")
+
+    first = SharedBusTransport(key, factory, slave_id=1, registry=registry)
+    second = SharedBusTransport(
+        tcp_bus_key("gateway.local", 502, "tcp"), factory, slave_id=2, registry=registry
+    )
+
+    factory.assert_called_once()
+    assert first.bus is second.bus
+    assert first.bus.statistics()["units"] == [1, 2]
+
+    await first.close()
+    inner.close.assert_not_awaited()
+    assert not first.is_connected()
+    assert second.is_connected()
+
+    await second.close()
+    inner.close.assert_awaited_once()
+    assert registry.get(key) is None
+
+    # Reconnecting after close leases a fresh bus.
+    await first.ensure_connected()
+    assert factory.call_count == 2
+    assert first.is_connected()
+    assert first.bus is not None
+
+
+async def test_requests_are_granted_round_robin_across_slave_ids():
+    registry = BusRegistry()
+    inner = _inner()
+    order: list[tuple[int, int]] = []
+    gate = asyncio.Event()
+
+    async def read(slave_id, address, **_kwargs):
+        order.append((slave_id, address))
+        if address == 0:
+            await gate.wait()
+
+    inner.read_holding_registers = read
+    key = tcp_bus_key("gateway", 502, "tcp")
+    unit_a = SharedBusTransport(key, lambda: inner, slave_id=1, registry=registry)
+    unit_b = SharedBusTransport(key, lambda: inner, slave_id=2, registry=registry)
+
+    tasks = [asyncio.create_task(unit_a.read_holding_registers(1, 0, count=1))]
+    await asyncio.sleep(0)
+    tasks += [
+        asyncio.create_task(unit_a.read_holding_registers(1, address, count=1))
+        for address in (1, 2)
+    ]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(unit_b.read_holding_registers(2, 10, count=1)))
+    await asyncio.sleep(0)
+    assert unit_a.bus.statistics()["queued"] == 3
+
+    gate.set()
+    await asyncio.gather(*tasks)
+
+    assert order == [(1, 0), (1, 1), (2, 10), (1, 2)]
+    stats = unit_a.bus.statistics()
+    assert stats["requests_per_unit"] == {1: 3, 2: 1}
+    assert stats["in_flight"] == 0
+    assert 0.0 < stats["utilisation"] <= 1.0
+
+
+async def test_multiplexing_transport_keeps_its_in_flight_window():
+    registry = BusRegistry()
+    inner = _inner(max_inflight_requests=4)
+    handle = SharedBusTransport(
+        tcp_bus_key("gateway", 502, "tcp"), lambda: inner, slave_id=1, registry=registry
+    )
+
+    assert handle.max_inflight_requests == 4
+
+
+def _device_client(slave_id: int) -> ThesslaGreenDeviceClient:
+    return ThesslaGreenDeviceClient(
+        CoordinatorConfig(host="192.168.1.1", port=502, slave_id=slave_id),
+        hass=MagicMock(),
+        effective_batch=16,
+        resolved_connection_mode=None,
+        backoff=0.0,
+        backoff_jitter=None,
+    )
+
+
+def test_device_clients_on_one_gateway_lease_the_same_bus():
+    first = _device_client(1)._build_tcp_transport(CONNECTION_MODE_TCP)
+    second = _device_client(2)._build_tcp_transport(CONNECTION_MODE_TCP)
+
+    assert first.bus is second.bus
+    assert bus_registry.statistics()[0]["units"] == [1, 2]
+    assert first.bus_statistics() == bus_registry.statistics()[0]
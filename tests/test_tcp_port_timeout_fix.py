@@ -170,8 +170,8 @@ def test_compute_verify_timeout_auto_includes_buffer():
 
 
 @pytest.mark.asyncio
-async def test_verify_connection_tries_tcp_first_on_port_8899():
-    """PORT 8899 + connection_type=tcp: TCP transport must be attempted before tcp_rtu."""
+async def test_verify_connection_prefers_tcp_on_port_8899():
+    """PORT 8899 + AUTO: both framings are probed at once and TCP wins a tie."""
     scanner = await _make_scanner(port=8899, connection_mode="auto")
 
     tcp_transport = _make_transport()
@@ -196,7 +196,8 @@ async def test_verify_connection_tries_tcp_first_on_port_8899():
         await scanner.verify_connection()
 
     assert call_order[0] == "tcp", "TCP must be the first attempt on port 8899"
-    tcp_rtu_transport.ensure_connected.assert_not_called()
+    assert scanner._resolved_connection_mode == "tcp"
+    tcp_rtu_transport.close.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
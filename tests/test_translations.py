@@ -5,6 +5,7 @@ from importlib import resources
 from pathlib import Path
 
 import yaml
+from custom_components.thessla_green_modbus.core.cycle_timing import TIMING_PHASES
 
 ROOT = Path(__file__).resolve().parent.parent / "custom_components" / "thessla_green_modbus"
 
@@ -54,7 +55,11 @@ def _load_keys(file: Path, var_name: str) -> list[str]:
 
 # Import sensor module to obtain translation keys
 
-SENSOR_KEYS = [*_load_runtime_translation_keys("SENSOR_ENTITY_MAPPINGS"), "error_codes"]
+SENSOR_KEYS = [
+    *_load_runtime_translation_keys("SENSOR_ENTITY_MAPPINGS"),
+    "error_codes",
+    *(f"timing_{phase}" for phase in TIMING_PHASES),
+]
 BINARY_KEYS = _load_runtime_translation_keys("BINARY_SENSOR_ENTITY_MAPPINGS")
 SWITCH_KEYS = _load_runtime_translation_keys("SWITCH_ENTITY_MAPPINGS") + _load_keys(
     ROOT / "const.py", "SPECIAL_FUNCTION_MAP"
@@ -133,7 +138,7 @@ try:
                         BINARY_KEYS.append(_bit_key)
 except Exception:  # pragma: no cover - best-effort extension
     pass
-ISSUE_KEYS = ["modbus_write_failed"]
+ISSUE_KEYS = ["device_unreachable", "modbus_write_failed"]
 
 OPTION_KEYS = [
     "enable_device_scan",
@@ -146,6 +151,7 @@ OPTION_KEYS = [
     "timeout",
     "deep_scan",
     "max_registers_per_request",
+    "max_inflight_requests",
 ]
 
 OPTION_ERROR_KEYS = [
@@ -0,0 +1,199 @@
+"""Tests for concurrent detection of the framing spoken on a TCP endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from custom_components.thessla_green_modbus.const import (
+    CONNECTION_MODE_TCP_RTU,
+)
+from custom_components.thessla_green_modbus.core.transport_select import select_auto_transport
+from custom_components.thessla_green_modbus.scanner import orchestration
+from custom_components.thessla_green_modbus.scanner.core import ThesslaGreenDeviceScanner
+from custom_components.thessla_green_modbus.transport.detection import (
+    detect_mode,
+    detected_modes,
+    race_modes,
+)
+from pymodbus.exceptions import ConnectionException
+
+
+def _transport(name: str) -> MagicMock:
+    transport = MagicMock(name=name)
+    transport.close = AsyncMock()
+    return transport
+
+
+def _probe(behaviour: dict[str, list[object]]):
+    """Return a probe running the next queued behaviour of each mode.
+
+    A number sleeps that long and succeeds, an exception is raised.
+    """
+    calls: list[str] = []
+
+    async def probe(mode: str, _transport: object, _timeout: float) -> None:
+        calls.append(mode)
+        step = behaviour[mode].pop(0)
+        if isinstance(step, BaseException):
+            raise step
+        await asyncio.sleep(float(step))
+
+    probe.calls = calls  # type: ignore[attr-defined]
+    return probe
+
+
+async def test_slow_wrong_framing_does_not_delay_the_winner():
+    tcp, tcp_rtu = _transport("tcp"), _transport("tcp_rtu")
+    probe = _probe({"tcp": [30.0], "tcp_rtu": [0.01]})
+
+    started = time.monotonic()
+    mode, transport = await race_modes([("tcp", tcp, 10.0), ("tcp_rtu", tcp_rtu, 5.0)], probe)
+
+    assert time.monotonic() - started < 1.0
+    assert (mode, transport) == ("tcp_rtu", tcp_rtu)
+    tcp.close.assert_awaited_once()
+    tcp_rtu.close.assert_not_called()
+
+
+async def test_earlier_attempt_wins_a_tie():
+    tcp, tcp_rtu = _transport("tcp"), _transport("tcp_rtu")
+    probe = _probe({"tcp": [0], "tcp_rtu": [0]})
+
+    mode, _ = await race_modes([("tcp", tcp, 1.0), ("tcp_rtu", tcp_rtu, 1.0)], probe)
+
+    assert mode == "tcp"
+    tcp_rtu.close.assert_awaited_once()
+
+
+async def test_all_failed_raises_last_error_and_closes_everything():
+    tcp, tcp_rtu = _transport("tcp"), _transport("tcp_rtu")
+    probe = _probe({"tcp": [TimeoutError("tcp")], "tcp_rtu": [TimeoutError("rtu")]})
+
+    with pytest.raises(TimeoutError, match="rtu"):
+        await race_modes([("tcp", tcp, 1.0), ("tcp_rtu", tcp_rtu, 1.0)], probe)
+
+    tcp.close.assert_awaited_once()
+    tcp_rtu.close.assert_awaited_once()
+
+
+async def test_refused_candidate_gets_a_turn_of_its_own():
+    """A single-client gateway refuses the second socket while the first one probes."""
+    tcp, tcp_rtu = _transport("tcp"), _transport("tcp_rtu")
+    probe = _probe(
+        {"tcp": [TimeoutError("no MBAP answer")], "tcp_rtu": [ConnectionException("refused"), 0]}
+    )
+
+    mode, transport = await race_modes([("tcp", tcp, 1.0), ("tcp_rtu", tcp_rtu, 1.0)], probe)
+
+    assert (mode, transport) == ("tcp_rtu", tcp_rtu)
+    assert probe.calls == ["tcp", "tcp_rtu", "tcp_rtu"]
+
+
+async def test_unreachable_endpoint_is_not_probed_twice():
+    probe = _probe({"tcp": [ConnectionException("a")], "tcp_rtu": [ConnectionException("b")]})
+
+    with pytest.raises(ConnectionException):
+        await race_modes(
+            [("tcp", _transport("tcp"), 1.0), ("tcp_rtu", _transport("tcp_rtu"), 1.0)], probe
+        )
+
+    assert probe.calls == ["tcp", "tcp_rtu"]
+
+
+async def test_cancelled_race_closes_every_transport():
+    tcp, tcp_rtu = _transport("tcp"), _transport("tcp_rtu")
+    probe = _probe({"tcp": [30.0], "tcp_rtu": [30.0]})
+    task = asyncio.create_task(race_modes([("tcp", tcp, 1.0), ("tcp_rtu", tcp_rtu, 1.0)], probe))
+    await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    tcp.close.assert_awaited_once()
+    tcp_rtu.close.assert_awaited_once()
+
+
+async def test_detected_mode_is_tried_alone_next_time():
+    probe = _probe({"tcp": [30.0], "tcp_rtu": [0, 0]})
+
+    def attempts():
+        return [("tcp", _transport("tcp"), 1.0), ("tcp_rtu", _transport("tcp_rtu"), 1.0)]
+
+    assert (await detect_mode("Gateway.local ", 8899, attempts(), probe))[0] == "tcp_rtu"
+    assert detected_modes.get("gateway.local", 8899) == "tcp_rtu"
+
+    assert (await detect_mode("gateway.local", 8899, attempts(), probe))[0] == "tcp_rtu"
+    assert probe.calls == ["tcp", "tcp_rtu", "tcp_rtu"]
+
+
+async def test_stale_detected_mode_falls_back_to_a_race():
+    detected_modes.remember("gateway.local", 502, "tcp_rtu")
+    tcp_rtu = _transport("tcp_rtu")
+    probe = _probe({"tcp": [0], "tcp_rtu": [TimeoutError("gone")]})
+
+    mode, _ = await detect_mode(
+        "gateway.local", 502, [("tcp", _transport("tcp"), 1.0), ("tcp_rtu", tcp_rtu, 1.0)], probe
+    )
+
+    assert mode == "tcp"
+    assert probe.calls == ["tcp_rtu", "tcp"]
+    assert detected_modes.get("gateway.local", 502) == "tcp"
+    tcp_rtu.close.assert_awaited_once()
+
+
+async def test_scanner_auto_detect_caches_the_mode_per_host():
+    scanner = await ThesslaGreenDeviceScanner.create(
+        "192.168.3.12", 8899, 1, connection_mode="auto"
+    )
+    tcp, tcp_rtu = _transport("tcp"), _transport("tcp_rtu")
+
+    async def hang() -> None:
+        await asyncio.sleep(30)
+
+    tcp.ensure_connected = AsyncMock(side_effect=hang)
+    tcp_rtu.ensure_connected = AsyncMock()
+    tcp_rtu.read_input_registers = AsyncMock(return_value=SimpleNamespace(registers=[1, 2]))
+
+    with patch.object(
+        scanner,
+        "_build_auto_tcp_attempts",
+        return_value=[("tcp", tcp, 10.0), ("tcp_rtu", tcp_rtu, 5.0)],
+    ):
+        await orchestration._auto_detect_tcp_transport(scanner)
+
+    assert scanner._transport is tcp_rtu
+    assert scanner._resolved_connection_mode == CONNECTION_MODE_TCP_RTU
+    assert detected_modes.get("192.168.3.12", 8899) == CONNECTION_MODE_TCP_RTU
+    tcp.close.assert_awaited_once()
+
+
+async def test_runtime_selection_tries_the_detected_mode_first():
+    detected_modes.remember("192.168.3.12", 502, CONNECTION_MODE_TCP_RTU)
+    build_calls: list[str] = []
+
+    def build_tcp_transport(mode: str) -> MagicMock:
+        build_calls.append(mode)
+        transport = _transport(mode)
+        transport.ensure_connected = AsyncMock()
+        transport.read_holding_registers = AsyncMock()
+        return transport
+
+    _, mode = await select_auto_transport(
+        resolved_connection_mode=None,
+        build_tcp_transport=build_tcp_transport,
+        try_direct_client_connect=AsyncMock(return_value=False),
+        port=502,
+        timeout=5.0,
+        slave_id=1,
+        host="192.168.3.12",
+        logger=MagicMock(),
+    )
+
+    assert mode == CONNECTION_MODE_TCP_RTU
+    assert build_calls == [CONNECTION_MODE_TCP_RTU]
+    assert detected_modes.get("192.168.3.12", 502) == CONNECTION_MODE_TCP_RTU
@@ -0,0 +1,168 @@
+"""Micro-benchmark: per-request dispatch overhead of ``modbus.call``.
+
+Compares the introspecting dispatch path (signature lookup, keyword-only
+argument mapping, slave keyword and timeout policy resolved on every request,
+behind a per-call closure) with the call adapters compiled once per client
+method by ``modbus.call._call_adapter``.  Requests go to real pymodbus client
+methods whose ``execute`` answers immediately, so only the dispatch cost is
+measured.  A direct call of the client method is the floor.
+
+The serial client is benchmarked only when ``pyserial`` is installed.
+
+Usage::
+
+    python tools/benchmarks/call_dispatch_benchmark.py [--requests N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import logging
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from custom_components.thessla_green_modbus.modbus.call import (  # noqa: E402
+    _call_adapter,
+    _call_modbus,
+    async_maybe_await,
+)
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient  # noqa: E402
+from pymodbus.pdu.register_message import ReadHoldingRegistersResponse  # noqa: E402
+
+
+async def introspecting_dispatch(
+    func: Callable[..., Awaitable[Any]],
+    slave_id: int,
+    *args: Any,
+    timeout: float | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Dispatch ``func`` the way ``_call_modbus`` did before call adapters."""
+    try:
+        signature: inspect.Signature | None = inspect.signature(func)
+    except (TypeError, ValueError):
+        signature = None
+    params = dict(signature.parameters) if signature is not None else {}
+    positional: list[Any] = []
+    param_iter = iter(params.values())
+    for arg in args:
+        param = next(param_iter, None)
+        if param is not None and param.kind is inspect.Parameter.KEYWORD_ONLY:
+            kwargs[param.name] = arg
+        else:
+            positional.append(arg)
+    kwarg = next((name for name in ("device_id", "slave", "unit") if name in params), "")
+
+    async def _invoke() -> Any:
+        if kwarg:
+            return await async_maybe_await(func(*positional, **{kwarg: slave_id}, **kwargs))
+        return await async_maybe_await(func(*positional, **kwargs))
+
+    module = getattr(func, "__module__", "") or ""
+    if timeout is not None and not module.startswith("pymodbus"):
+        return await asyncio.wait_for(_invoke(), timeout=timeout)
+    return await _invoke()
+
+
+async def adapter_dispatch(
+    func: Callable[..., Awaitable[Any]],
+    slave_id: int,
+    *args: Any,
+    timeout: float | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Dispatch ``func`` through its compiled call adapter."""
+    adapter = _call_adapter(func)
+    return await adapter.dispatch(func, adapter.layout(args, kwargs), kwargs, slave_id, timeout)
+
+
+async def direct_call(
+    func: Callable[..., Awaitable[Any]],
+    slave_id: int,
+    *args: Any,
+    timeout: float | None = None,
+    **kwargs: Any,
+) -> Any:
+    return await func(*args, device_id=slave_id, **kwargs)
+
+
+async def full_call(
+    func: Callable[..., Awaitable[Any]],
+    slave_id: int,
+    *args: Any,
+    timeout: float | None = None,
+    **kwargs: Any,
+) -> Any:
+    return await _call_modbus(func, slave_id, *args, timeout=timeout, **kwargs)
+
+
+def _instant_client(factory: Callable[[], Any]) -> Any:
+    client = factory()
+    response = ReadHoldingRegistersResponse(registers=[0] * 16)
+
+    async def execute(_no_response_expected: bool, _request: Any) -> Any:
+        return response
+
+    client.execute = execute
+    return client
+
+
+async def _measure(dispatch: Callable[..., Awaitable[Any]], client: Any, requests: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for address in range(requests):
+            await dispatch(client.read_holding_registers, 10, address & 0xFF, count=16, timeout=1.0)
+        best = min(best, time.perf_counter() - started)
+    return best / requests * 1e6
+
+
+async def _run(requests: int) -> None:
+    clients: list[tuple[str, Callable[[], Any]]] = [
+        ("tcp", lambda: AsyncModbusTcpClient("127.0.0.1")),
+        ("serial", lambda: AsyncModbusSerialClient("/dev/null")),
+    ]
+    paths = (
+        ("direct call", direct_call),
+        ("introspecting", introspecting_dispatch),
+        ("adapter", adapter_dispatch),
+        ("_call_modbus", full_call),
+    )
+    for name, factory in clients:
+        try:
+            client = _instant_client(factory)
+        except RuntimeError as err:  # pymodbus raises this without pyserial
+            print(f"{name}: skipped ({err})")
+            continue
+        print(f"{name} client ({type(client).__name__}):")
+        results = {}
+        for label, dispatch in paths:
+            results[label] = await _measure(dispatch, client, requests)
+            print(f"{label:>15}: {results[label]:6.2f} µs/request")
+        saved = results["introspecting"] - results["adapter"]
+        overhead = results["introspecting"] - results["direct call"]
+        print(
+            f"{'saved':>15}: {saved:6.2f} µs/request ({saved / overhead:.0%} of dispatch overhead)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000, help="requests per measurement")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(_run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Micro-benchmark: Modbus CRC16 throughput.
+
+Compares the bit-by-bit loop the RTU framing used before (eight shift/xor
+steps per byte) with the 256-entry table implementation in
+``transport/crc.py``, on frame sizes the raw transports actually checksum:
+a read request, a 16-register read response and a full 125-register response.
+
+Usage::
+
+    python tools/benchmarks/crc_benchmark.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from custom_components.thessla_green_modbus.transport.crc import crc16  # noqa: E402
+
+FRAME_SIZES = {
+    "read request": 6,
+    "16-register response": 3 + 16 * 2,
+    "125-register response": 3 + 125 * 2,
+}
+
+
+def bitwise_crc16(data: bytes) -> int:
+    """Bit-by-bit CRC16, as computed before the lookup table."""
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc & 0xFFFF
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="checksums per measurement")
+    args = parser.parse_args()
+
+    for label, size in FRAME_SIZES.items():
+        payload = bytes(i & 0xFF for i in range(size))
+        if bitwise_crc16(payload) != crc16(payload):
+            raise SystemExit("table and bitwise CRC16 disagree")
+        print(f"{label} ({size} bytes):")
+        for name, func in (("bitwise", bitwise_crc16), ("table", crc16)):
+            seconds = min(
+                timeit.repeat(lambda f=func, p=payload: f(p), number=args.number, repeat=5)
+            )
+            per_call = seconds / args.number
+            print(f"{name:>10}: {per_call * 1e6:8.2f} µs/frame ({size / per_call / 1e6:6.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
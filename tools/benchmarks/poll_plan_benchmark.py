@@ -0,0 +1,125 @@
+"""Micro-benchmark: per-cycle CPU cost of the poll-plan read loop.
+
+Compares the per-chunk name lookups the batch read loop used to perform on
+every cycle (``_find_register_name`` per offset, a second reverse lookup and an
+``available_registers`` test per returned word) with zipping response words
+against a precompiled poll plan.  No I/O is performed: every chunk "returns"
+zero-filled words, so the numbers isolate the event-loop CPU time spent on
+mapping and decoding one full cycle with every input/holding register polled.
+
+Usage::
+
+    python tools/benchmarks/poll_plan_benchmark.py [--cycles N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from custom_components.thessla_green_modbus.core.client import (  # noqa: E402
+    ThesslaGreenDeviceClient,
+)
+from custom_components.thessla_green_modbus.core.models import CoordinatorConfig  # noqa: E402
+from custom_components.thessla_green_modbus.core.poll_plan import (  # noqa: E402
+    PLANNED_REGISTER_TYPES,
+    poll_plan_for,
+)
+from custom_components.thessla_green_modbus.registers.read_planner import (  # noqa: E402
+    chunk_register_range,
+)
+
+
+def build_client() -> ThesslaGreenDeviceClient:
+    """Return a device client polling every known input and holding register."""
+    client = ThesslaGreenDeviceClient(
+        CoordinatorConfig(host="benchmark", port=502, slave_id=10),
+        hass=MagicMock(),
+        effective_batch=16,
+        resolved_connection_mode=None,
+        backoff=0.0,
+        backoff_jitter=None,
+    )
+    for register_type in PLANNED_REGISTER_TYPES:
+        client.available_registers[register_type] = set(client._register_maps[register_type])
+    client.compute_register_groups()
+    return client
+
+
+def legacy_cycle(client: ThesslaGreenDeviceClient) -> dict[str, Any]:
+    """Replay the pre-plan per-cycle lookup work for one full poll."""
+    data: dict[str, Any] = {}
+    failed = client._failed_registers
+    for register_type in PLANNED_REGISTER_TYPES:
+        available = client.available_registers[register_type]
+        for start, count in client._register_groups.get(register_type, ()):
+            for chunk_start, chunk_count in chunk_register_range(
+                start, count, client.effective_batch
+            ):
+                names = [
+                    client._find_register_name(register_type, chunk_start + i)
+                    for i in range(chunk_count)
+                ]
+                if all(name in failed for name in names if name):
+                    continue
+                for i, value in enumerate([0] * chunk_count):
+                    name = client._find_register_name(register_type, chunk_start + i)
+                    if name and name in available:
+                        processed = client._process_register_value(name, value)
+                        if processed is not None:
+                            data[name] = processed
+    return data
+
+
+def plan_cycle(client: ThesslaGreenDeviceClient) -> dict[str, Any]:
+    """Run one full poll through the precompiled poll plans."""
+    data: dict[str, Any] = {}
+    failed = client._failed_registers
+    for register_type in PLANNED_REGISTER_TYPES:
+        for chunk in poll_plan_for(client, register_type).chunks:
+            if all(name in failed for name in chunk.known):
+                continue
+            for slot, value in zip(chunk.slots, [0] * chunk.count, strict=False):
+                if slot is None:
+                    continue
+                processed = slot.decode(value)
+                if processed is not None:
+                    data[slot.name] = processed
+    return data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=2000, help="cycles per measurement")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    client = build_client()
+    if legacy_cycle(client) != plan_cycle(client):
+        raise SystemExit("poll plan and legacy loop produced different data")
+
+    requests = sum(
+        poll_plan_for(client, register_type).request_count
+        for register_type in PLANNED_REGISTER_TYPES
+    )
+    print(f"registers polled: {len(plan_cycle(client))}, requests per cycle: {requests}")
+    results = {}
+    for label, cycle in (("legacy lookups", legacy_cycle), ("poll plan", plan_cycle)):
+        seconds = min(timeit.repeat(lambda c=cycle: c(client), number=args.cycles, repeat=5))
+        results[label] = seconds / args.cycles * 1e6
+        print(f"{label:>15}: {results[label]:8.1f} µs/cycle")
+    saved = results["legacy lookups"] - results["poll plan"]
+    print(f"{'saved':>15}: {saved:8.1f} µs/cycle ({saved / results['legacy lookups']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
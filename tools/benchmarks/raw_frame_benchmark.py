@@ -0,0 +1,111 @@
+"""Benchmark: RTU-over-TCP response throughput of the raw transport.
+
+Starts a local asyncio stand-in server that answers every FC04 request with a
+pre-built response frame and measures how many request/response round trips
+``RawRtuOverTcpTransport.read_input_registers`` completes per second over the
+loopback socket.  The register payload decode is also timed on its own,
+comparing the per-word ``int.from_bytes`` loop the transport used before with
+the bulk ``struct`` decode over a view of the receive buffer.
+
+Usage::
+
+    python tools/benchmarks/raw_frame_benchmark.py [--frames N] [--count N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from custom_components.thessla_green_modbus.transport.crc import crc16  # noqa: E402
+from custom_components.thessla_green_modbus.transport.tcp_rtu import (  # noqa: E402
+    RawRtuOverTcpTransport,
+)
+
+SLAVE_ID = 10
+REQUEST_LENGTH = 8
+
+
+def build_response(count: int) -> bytes:
+    """Return an FC04 response frame carrying ``count`` registers."""
+    payload = bytes([SLAVE_ID, 4, count * 2]) + b"".join(
+        word.to_bytes(2, "big") for word in range(count)
+    )
+    return payload + crc16(payload).to_bytes(2, "little")
+
+
+async def serve(response: bytes) -> asyncio.Server:
+    """Start a loopback server answering every request with ``response``."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                await reader.readexactly(REQUEST_LENGTH)
+                writer.write(response)
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def measure_round_trips(frames: int, count: int) -> float:
+    """Return frames per second for ``frames`` sequential reads."""
+    server = await serve(build_response(count))
+    port = server.sockets[0].getsockname()[1]
+    transport = RawRtuOverTcpTransport(
+        host="127.0.0.1", port=port, max_retries=1, base_backoff=0, max_backoff=0, timeout=5
+    )
+    try:
+        await transport.ensure_connected()
+        expected = list(range(count))
+        if (await transport.read_input_registers(SLAVE_ID, 0, count=count)).registers != expected:
+            raise SystemExit("stand-in server returned unexpected registers")
+        started = time.perf_counter()
+        for _ in range(frames):
+            await transport.read_input_registers(SLAVE_ID, 0, count=count)
+        return frames / (time.perf_counter() - started)
+    finally:
+        await transport.close()
+        server.close()
+        await server.wait_closed()
+
+
+def legacy_decode(data: bytes, *, count: int) -> list[int]:
+    """Per-word decode of a response payload copied out of the frame."""
+    return [int.from_bytes(data[i : i + 2], "big") for i in range(0, count * 2, 2)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=5000, help="round trips to time")
+    parser.add_argument("--count", type=int, default=16, help="registers per response")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rate = asyncio.run(measure_round_trips(args.frames, args.count))
+    print(f"registers per frame: {args.count}")
+    print(f"{'round trips':>15}: {rate:8.0f} frames/s ({1e6 / rate:.1f} µs/frame)")
+
+    frame = build_response(args.count)
+    view = memoryview(frame)[3:-2]
+    decode = RawRtuOverTcpTransport._decode_register_words
+    number = 20000
+    for label, run in (
+        ("legacy decode", lambda: legacy_decode(bytes(view), count=args.count)),
+        ("bulk decode", lambda: decode(view, count=args.count)),
+    ):
+        seconds = min(timeit.repeat(run, number=number, repeat=5))
+        print(f"{label:>15}: {seconds / number * 1e6:8.2f} µs/frame")
+
+
+if __name__ == "__main__":
+    main()
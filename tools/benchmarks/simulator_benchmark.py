@@ -0,0 +1,126 @@
+"""Benchmark: end-to-end scan and poll times against the local AirPack simulator.
+
+Starts ``tools.simulator`` on the loopback interface in Modbus TCP and
+RTU-over-TCP mode with the given per-request latency and measures
+
+* how long the device scanner takes for a full ``scan_device``, and
+* how long one poll cycle of the grouped register reads takes through the
+  native raw transport of that mode, and how many of its reads the
+  simulated firmware rejected.
+
+Usage::
+
+    python tools/benchmarks/simulator_benchmark.py [--latency-ms MS] [--jitter-ms MS] [--cycles N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from custom_components.thessla_green_modbus.const import (  # noqa: E402
+    CONNECTION_TYPE_TCP,
+    CONNECTION_TYPE_TCP_RTU,
+    DEFAULT_SLAVE_ID,
+)
+from custom_components.thessla_green_modbus.registers.loader import (  # noqa: E402
+    plan_group_reads,
+)
+from custom_components.thessla_green_modbus.scanner.core import (  # noqa: E402
+    ThesslaGreenDeviceScanner,
+)
+from custom_components.thessla_green_modbus.transport.mbap import (  # noqa: E402
+    RawModbusTcpTransport,
+)
+from custom_components.thessla_green_modbus.transport.tcp_rtu import (  # noqa: E402
+    RawRtuOverTcpTransport,
+)
+from pymodbus.exceptions import ModbusException  # noqa: E402
+from tools.simulator import AirPackDevice, AirPackSimulator, SimulatorProfile  # noqa: E402
+
+_READS = {
+    1: "read_coils",
+    2: "read_discrete_inputs",
+    3: "read_holding_registers",
+    4: "read_input_registers",
+}
+
+
+async def measure_scan(mode: str, port: int) -> float:
+    """Return the seconds a full device scan takes."""
+    scanner = await ThesslaGreenDeviceScanner.create(
+        host="127.0.0.1",
+        port=port,
+        slave_id=DEFAULT_SLAVE_ID,
+        timeout=5,
+        retry=1,
+        connection_type=CONNECTION_TYPE_TCP,
+        connection_mode=mode,
+    )
+    try:
+        started = time.perf_counter()
+        await scanner.scan_device()
+        return time.perf_counter() - started
+    finally:
+        await scanner.close()
+
+
+async def measure_poll(mode: str, port: int, cycles: int) -> tuple[float, int, int]:
+    """Return seconds per poll cycle, reads per cycle and rejected reads per cycle."""
+    transport_cls = RawModbusTcpTransport if mode == CONNECTION_TYPE_TCP else RawRtuOverTcpTransport
+    transport = transport_cls(
+        host="127.0.0.1", port=port, max_retries=1, base_backoff=0, max_backoff=0, timeout=5
+    )
+    plans = plan_group_reads()
+    rejected = 0
+    try:
+        started = time.perf_counter()
+        for _ in range(cycles):
+            for plan in plans:
+                read = getattr(transport, _READS[plan.function])
+                try:
+                    await read(DEFAULT_SLAVE_ID, plan.address, count=plan.length)
+                except ModbusException:
+                    rejected += 1
+        elapsed = time.perf_counter() - started
+    finally:
+        await transport.close()
+    return elapsed / cycles, len(plans), rejected // cycles
+
+
+async def run(args: argparse.Namespace) -> None:
+    for mode in (CONNECTION_TYPE_TCP, CONNECTION_TYPE_TCP_RTU):
+        device = AirPackDevice(
+            SimulatorProfile(latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000, seed=1)
+        )
+        async with AirPackSimulator(device, mode=mode) as simulator:
+            scan = await measure_scan(mode, simulator.port)
+            cycle, reads, rejected = await measure_poll(mode, simulator.port, args.cycles)
+        print(
+            f"{mode:>8}: scan {scan * 1000:8.1f} ms | poll cycle {cycle * 1000:8.1f} ms "
+            f"({reads} reads, {rejected} rejected) | {device.requests} requests served"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="per-request latency")
+    parser.add_argument("--jitter-ms", type=float, default=1.0, help="random extra latency")
+    parser.add_argument("--cycles", type=int, default=5, help="poll cycles to time")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    print(f"latency {args.latency_ms} ms + up to {args.jitter_ms} ms jitter per request")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
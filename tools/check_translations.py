@@ -21,6 +21,7 @@ OPTION_KEYS = [
     "timeout",
     "deep_scan",
     "max_registers_per_request",
+    "max_inflight_requests",
     "enable_device_scan",
     "log_level",
     "safe_scan",
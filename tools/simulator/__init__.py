@@ -0,0 +1,25 @@
+"""Local AirPack Modbus simulator for benchmarks and soak tests.
+
+Run ``python -m tools.simulator --help`` for the command line; see
+``tools/README.md``.
+"""
+
+from .device import (
+    ILLEGAL_DATA_ADDRESS,
+    ILLEGAL_DATA_VALUE,
+    ILLEGAL_FUNCTION,
+    SERVER_DEVICE_BUSY,
+    AirPackDevice,
+    SimulatorProfile,
+)
+from .server import AirPackSimulator
+
+__all__ = [
+    "ILLEGAL_DATA_ADDRESS",
+    "ILLEGAL_DATA_VALUE",
+    "ILLEGAL_FUNCTION",
+    "SERVER_DEVICE_BUSY",
+    "AirPackDevice",
+    "AirPackSimulator",
+    "SimulatorProfile",
+]
@@ -0,0 +1,87 @@
+"""Command line entry point: ``python -m tools.simulator``."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from custom_components.thessla_green_modbus.const import (  # noqa: E402
+    CONNECTION_TYPE_TCP,
+    CONNECTION_TYPE_TCP_RTU,
+    DEFAULT_SLAVE_ID,
+)
+
+from tools.simulator.device import (  # noqa: E402
+    SERVER_DEVICE_BUSY,
+    AirPackDevice,
+    SimulatorProfile,
+)
+from tools.simulator.server import AirPackSimulator  # noqa: E402
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--mode", choices=(CONNECTION_TYPE_TCP, CONNECTION_TYPE_TCP_RTU), default="tcp"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5020)
+    parser.add_argument(
+        "--slave-id",
+        type=int,
+        action="append",
+        help=f"unit ID to simulate; repeat for several units (default {DEFAULT_SLAVE_ID})",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--fault-rate", type=float, default=0.0)
+    parser.add_argument("--fault-code", type=int, default=SERVER_DEVICE_BUSY)
+    parser.add_argument(
+        "--no-quirks",
+        action="store_true",
+        help="disable missing registers and FC03 batch boundaries",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> None:
+    devices = [
+        AirPackDevice(
+            SimulatorProfile(
+                slave_id=slave_id,
+                latency=args.latency_ms / 1000,
+                jitter=args.jitter_ms / 1000,
+                fault_rate=args.fault_rate,
+                fault_code=args.fault_code,
+                firmware_quirks=not args.no_quirks,
+                seed=args.seed,
+            )
+        )
+        for slave_id in args.slave_id or [DEFAULT_SLAVE_ID]
+    ]
+    simulator = AirPackSimulator(*devices, mode=args.mode, host=args.host, port=args.port)
+    async with simulator:
+        print(f"Serving {args.mode} on {args.host}:{simulator.port}; Ctrl+C to stop")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            print(f"Requests per unit: {simulator.statistics()}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(run(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""Register bank and firmware behaviour of a simulated AirPack unit.
+
+The registers come from ``registers/thessla_green_registers_full.json`` through
+the integration's own loader.  On top of plain reads and writes the device
+reproduces the firmware quirks the integration works around:
+
+* FC03 reads crossing a ``HOLDING_BATCH_BOUNDARIES`` address (16 and the
+  0x2000 page) are rejected with an illegal-address exception;
+* registers in ``KNOWN_MISSING_REGISTERS`` answer with an illegal-address
+  exception, except absent temperature sensors, which read 0x8000;
+* any register or address can be told to fail with a given exception code,
+  and a share of all requests can fail at random.
+"""
+
+from __future__ import annotations
+
+import random
+import struct
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from custom_components.thessla_green_modbus.const import (
+    DEFAULT_SLAVE_ID,
+    HOLDING_BATCH_BOUNDARIES,
+    KNOWN_MISSING_REGISTERS,
+    SENSOR_UNAVAILABLE,
+    SENSOR_UNAVAILABLE_REGISTERS,
+)
+from custom_components.thessla_green_modbus.registers.loader import get_all_registers
+from custom_components.thessla_green_modbus.registers.register_def import RegisterDef
+
+ILLEGAL_FUNCTION = 1
+ILLEGAL_DATA_ADDRESS = 2
+ILLEGAL_DATA_VALUE = 3
+SERVER_DEVICE_BUSY = 6
+
+_MAX_READ_REGISTERS = 125
+_MAX_READ_BITS = 2000
+_MAX_WRITE_REGISTERS = 123
+
+_FUNCTION_BY_GROUP = {
+    "coil_registers": 1,
+    "discrete_inputs": 2,
+    "holding_registers": 3,
+    "input_registers": 4,
+}
+
+#: Start-up values in user units, so a fresh simulator looks like a running unit.
+DEFAULT_VALUES: dict[str, Any] = {
+    "version_major": 3,
+    "version_minor": 11,
+    "outside_temperature": 8.5,
+    "supply_temperature": 19.5,
+    "exhaust_temperature": 22.0,
+    "fpx_temperature": 6.0,
+    "ambient_temperature": 21.5,
+    "supply_flow_rate": 180,
+    "exhaust_flow_rate": 175,
+    "air_flow_rate_manual": 50,
+    "device_name": "AirPack4",
+}
+
+
+@dataclass(slots=True)
+class SimulatorProfile:
+    """Timing and fault behaviour of a simulated unit."""
+
+    slave_id: int = DEFAULT_SLAVE_ID
+    #: Seconds before each response is sent.
+    latency: float = 0.0
+    #: Up to this many seconds are added to ``latency`` at random.
+    jitter: float = 0.0
+    #: Share of requests answered with ``fault_code`` at random.
+    fault_rate: float = 0.0
+    fault_code: int = SERVER_DEVICE_BUSY
+    #: Exception code per ``(function, address)`` touched by a request.
+    faults: dict[tuple[int, int], int] = field(default_factory=dict)
+    #: Reproduce ``KNOWN_MISSING_REGISTERS`` and the FC03 batch boundaries.
+    firmware_quirks: bool = True
+    seed: int | None = None
+
+
+def _exception(function: int, code: int) -> bytes:
+    return bytes((function | 0x80, code))
+
+
+def _initial_words(definition: RegisterDef) -> list[int]:
+    value = DEFAULT_VALUES.get(definition.name, definition.default)
+    if value is None:
+        return [0] * definition.length
+    raw = definition.encode(value)
+    return list(raw) if isinstance(raw, list) else [int(raw)]
+
+
+class AirPackDevice:
+    """Register tables of one unit and the PDU-level request handler."""
+
+    def __init__(
+        self,
+        profile: SimulatorProfile | None = None,
+        *,
+        registers: Iterable[RegisterDef] | None = None,
+        values: Mapping[str, Any] | None = None,
+    ) -> None:
+        self.profile = profile or SimulatorProfile()
+        self._random = random.Random(self.profile.seed)
+        self.definitions = {
+            definition.name: definition
+            for definition in (get_all_registers() if registers is None else registers)
+        }
+        self.words: dict[int, dict[int, int]] = {3: {}, 4: {}}
+        self.bits: dict[int, dict[int, bool]] = {1: {}, 2: {}}
+        self._writable: set[int] = set()
+        self._missing: dict[int, set[int]] = {function: set() for function in range(1, 5)}
+        self.requests = 0
+        self.exceptions = 0
+        for definition in self.definitions.values():
+            self._load(definition)
+        if self.profile.firmware_quirks:
+            self._apply_known_missing()
+        for name, value in (values or {}).items():
+            self.set_value(name, value)
+
+    def _load(self, definition: RegisterDef) -> None:
+        if definition.function in self.bits:
+            self.bits[definition.function][definition.address] = bool(
+                DEFAULT_VALUES.get(definition.name, 0)
+            )
+            return
+        table = self.words[definition.function]
+        for offset, word in enumerate(_initial_words(definition)):
+            table[definition.address + offset] = word & 0xFFFF
+        if definition.function == 3 and "W" in definition.access:
+            self._writable.update(range(definition.address, definition.address + definition.length))
+
+    def _apply_known_missing(self) -> None:
+        for group, names in KNOWN_MISSING_REGISTERS.items():
+            function = _FUNCTION_BY_GROUP[group]
+            for name in names:
+                definition = self.definitions.get(name)
+                if definition is None:
+                    continue
+                if name in SENSOR_UNAVAILABLE_REGISTERS:
+                    self.words[function][definition.address] = SENSOR_UNAVAILABLE
+                else:
+                    self._missing[function].update(
+                        range(definition.address, definition.address + definition.length)
+                    )
+
+    def set_value(self, name: str, value: Any, *, raw: bool = False) -> None:
+        """Set register ``name`` to ``value`` (user units unless ``raw``)."""
+        definition = self.definitions[name]
+        if definition.function in self.bits:
+            self.bits[definition.function][definition.address] = bool(value)
+            return
+        encoded = value if raw else definition.encode(value)
+        words = list(encoded) if isinstance(encoded, list | tuple) else [int(encoded)]
+        for offset, word in enumerate(words):
+            self.words[definition.function][definition.address + offset] = word & 0xFFFF
+
+    def raw_value(self, name: str) -> int | list[int] | bool:
+        """Return the raw content of register ``name``."""
+        definition = self.definitions[name]
+        if definition.function in self.bits:
+            return self.bits[definition.function].get(definition.address, False)
+        table = self.words[definition.function]
+        words = [table.get(definition.address + offset, 0) for offset in range(definition.length)]
+        return words[0] if definition.length == 1 else words
+
+    def response_delay(self) -> float:
+        """Return how long the next response is held back."""
+        jitter = self.profile.jitter
+        return self.profile.latency + (self._random.uniform(0.0, jitter) if jitter else 0.0)
+
+    def _rejected(
+        self, function: int, start: int, count: int, *, table: int | None = None
+    ) -> int | None:
+        """Return the exception code for ``function`` touching ``count`` addresses.
+
+        ``table`` is the register table the addresses belong to when it is
+        not the function code itself (writes go to the FC03 table).
+        """
+        end = start + count
+        for address in range(start, end):
+            code = self.profile.faults.get((function, address))
+            if code is not None:
+                return code
+        if not self.profile.firmware_quirks:
+            return None
+        if function == 3 and any(start < boundary < end for boundary in HOLDING_BATCH_BOUNDARIES):
+            return ILLEGAL_DATA_ADDRESS
+        if not self._missing[function if table is None else table].isdisjoint(range(start, end)):
+            return ILLEGAL_DATA_ADDRESS
+        return None
+
+    def handle(self, pdu: bytes) -> bytes:
+        """Answer one request PDU with a response or exception PDU."""
+        self.requests += 1
+        response = self._dispatch(pdu)
+        if response[0] & 0x80:
+            self.exceptions += 1
+        return response
+
+    def _dispatch(self, pdu: bytes) -> bytes:
+        function = pdu[0]
+        if self.profile.fault_rate and self._random.random() < self.profile.fault_rate:
+            return _exception(function, self.profile.fault_code)
+        try:
+            if function in (1, 2, 3, 4):
+                start, count = struct.unpack_from(">HH", pdu, 1)
+                return self._read(function, start, count)
+            if function == 6:
+                address, value = struct.unpack_from(">HH", pdu, 1)
+                return self._write(function, address, [value], echo=pdu[1:5])
+            if function == 16:
+                address, count, byte_count = struct.unpack_from(">HHB", pdu, 1)
+                if byte_count != 2 * count or len(pdu) != 6 + byte_count:
+                    return _exception(function, ILLEGAL_DATA_VALUE)
+                values = list(struct.unpack_from(f">{count}H", pdu, 6))
+                return self._write(function, address, values, echo=pdu[1:5])
+        except struct.error:
+            return _exception(function, ILLEGAL_DATA_VALUE)
+        return _exception(function, ILLEGAL_FUNCTION)
+
+    def _read(self, function: int, start: int, count: int) -> bytes:
+        limit = _MAX_READ_BITS if function in self.bits else _MAX_READ_REGISTERS
+        if not 1 <= count <= limit:
+            return _exception(function, ILLEGAL_DATA_VALUE)
+        if start + count > 0x10000:
+            return _exception(function, ILLEGAL_DATA_ADDRESS)
+        code = self._rejected(function, start, count)
+        if code is not None:
+            return _exception(function, code)
+        if function in self.bits:
+            table = self.bits[function]
+            packed = sum(1 << offset for offset in range(count) if table.get(start + offset))
+            data = packed.to_bytes((count + 7) // 8, "little")
+        else:
+            words = self.words[function]
+            data = struct.pack(
+                f">{count}H", *(words.get(address, 0) for address in range(start, start + count))
+            )
+        return bytes((function, len(data))) + data
+
+    def _write(self, function: int, address: int, values: list[int], *, echo: bytes) -> bytes:
+        count = len(values)
+        if not 1 <= count <= _MAX_WRITE_REGISTERS:
+            return _exception(function, ILLEGAL_DATA_VALUE)
+        addresses = range(address, address + count)
+        if not self._writable.issuperset(addresses):
+            return _exception(function, ILLEGAL_DATA_ADDRESS)
+        code = self._rejected(function, address, count, table=3)
+        if code is not None:
+            return _exception(function, code)
+        for target, value in zip(addresses, values, strict=True):
+            self.words[3][target] = value
+        return bytes((function,)) + echo
+
+    def statistics(self) -> dict[str, int]:
+        return {"requests": self.requests, "exceptions": self.exceptions}
+
+
+__all__ = [
+    "DEFAULT_VALUES",
+    "ILLEGAL_DATA_ADDRESS",
+    "ILLEGAL_DATA_VALUE",
+    "ILLEGAL_FUNCTION",
+    "SERVER_DEVICE_BUSY",
+    "AirPackDevice",
+    "SimulatorProfile",
+]
@@ -0,0 +1,129 @@
+"""Asyncio Modbus TCP and RTU-over-TCP front ends for simulated units."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import struct
+from typing import Any
+
+from custom_components.thessla_green_modbus.const import (
+    CONNECTION_TYPE_TCP,
+    CONNECTION_TYPE_TCP_RTU,
+)
+from custom_components.thessla_green_modbus.transport.crc import append_crc, crc16
+
+from .device import AirPackDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+_MBAP_HEADER = struct.Struct(">HHHB")
+# Exception answered by a gateway for a unit ID nobody behind it uses.
+_GATEWAY_TARGET_FAILED = 0x0B
+# Bytes following slave ID and function code in fixed-size RTU requests.
+_RTU_FIXED_BODY = 6
+
+
+class AirPackSimulator:
+    """Modbus server answering for one or more simulated units.
+
+    ``mode`` is ``"tcp"`` (MBAP framing) or ``"tcp_rtu"`` (raw RTU frames
+    over TCP, as sent to a transparent RS485 gateway).  Requests on one
+    connection are answered one at a time, like the serial line behind a
+    gateway, each after the addressed unit's configured latency.
+    """
+
+    def __init__(
+        self,
+        *devices: AirPackDevice,
+        mode: str = CONNECTION_TYPE_TCP,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        if mode not in (CONNECTION_TYPE_TCP, CONNECTION_TYPE_TCP_RTU):
+            raise ValueError(f"Unsupported simulator mode: {mode}")
+        self.devices = {device.profile.slave_id: device for device in devices or (AirPackDevice(),)}
+        self.mode = mode
+        self.host = host
+        self._port = port
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        """The listening port, once started."""
+        if self._server is None or not self._server.sockets:
+            return self._port
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self.handle_connection, self.host, self._port)
+        _LOGGER.info("AirPack simulator (%s) listening on %s:%s", self.mode, self.host, self.port)
+
+    async def close(self) -> None:
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    async def __aenter__(self) -> AirPackSimulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.close()
+
+    def statistics(self) -> dict[int, dict[str, int]]:
+        """Return request and exception counts per slave ID."""
+        return {slave_id: device.statistics() for slave_id, device in self.devices.items()}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: Any) -> None:
+        """Serve one client connection until it closes."""
+        serve = self._serve_tcp if self.mode == CONNECTION_TYPE_TCP else self._serve_rtu
+        try:
+            await serve(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _answer(self, device: AirPackDevice, pdu: bytes) -> bytes:
+        delay = device.response_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return device.handle(pdu)
+
+    async def _serve_tcp(self, reader: asyncio.StreamReader, writer: Any) -> None:
+        while True:
+            header = await reader.readexactly(_MBAP_HEADER.size)
+            transaction_id, protocol_id, length, unit = _MBAP_HEADER.unpack(header)
+            pdu = await reader.readexactly(length - 1)
+            device = self.devices.get(unit)
+            if device is None:
+                response = bytes((pdu[0] | 0x80, _GATEWAY_TARGET_FAILED))
+            else:
+                response = await self._answer(device, pdu)
+            writer.write(_MBAP_HEADER.pack(transaction_id, protocol_id, len(response) + 1, unit))
+            writer.write(response)
+            await writer.drain()
+
+    async def _serve_rtu(self, reader: asyncio.StreamReader, writer: Any) -> None:
+        while True:
+            frame = await reader.readexactly(2)
+            if frame[1] == 16:
+                head = await reader.readexactly(5)
+                frame += head + await reader.readexactly(head[4] + 2)
+            else:
+                frame += await reader.readexactly(_RTU_FIXED_BODY)
+            device = self.devices.get(frame[0])
+            # A unit stays silent on a corrupt frame or one addressed to another unit.
+            if device is None or crc16(frame) != 0:
+                continue
+            response = await self._answer(device, frame[1:-2])
+            writer.write(append_crc(bytes((frame[0],)) + response))
+            await writer.drain()
+
+
+__all__ = ["AirPackSimulator"]